@@ -20,6 +20,9 @@ class Settings(BaseSettings):
 
     # Redis (optional, falls back to in-memory)
     redis_url: str = ""
+    # Host-local SQLite store shared by worker processes when Redis is not configured.
+    # Empty means automatic: used under the runtime root only when crowdcraft_workers > 1.
+    shared_store_path: str = ""
 
     # Application
     qf_frontend_url: str = "https://quipflip.crowdcraftlabs.com"
@@ -40,6 +43,9 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"  # Use HS256 for symmetric signing
     access_token_exp_minutes: int = 120  # Access tokens valid for 2 hours
     refresh_token_exp_days: int = 30  # Longer-lived refresh tokens
+    refresh_session_cache_size: int = 10000  # Refresh-token sessions kept in the in-process LRU
+    refresh_session_cache_ttl_seconds: float = 15.0  # Max age of a cached active session for non-rotating lookups
+    refresh_rotation_grace_seconds: float = 10.0  # Window in which a just-rotated token returns the same replacement
     magic_link_exp_minutes: int = 30
     smtp_host: str = ""
     smtp_port: int = 587
@@ -50,6 +56,11 @@ class Settings(BaseSettings):
     smtp_use_tls: bool = True
     smtp_use_ssl: bool = False
     smtp_timeout_seconds: int = 10
+    email_drop_dir: str = ""  # Write .eml files here when SMTP is not configured (local/test loopback)
+    email_outbox_max_attempts: int = 6
+    email_outbox_retry_base_seconds: int = 30  # Doubles per failed attempt
+    email_outbox_poll_seconds: int = 15
+    email_outbox_retention_hours: int = 24  # Sent and failed rows are deleted after this long
     access_token_cookie_name: str = "quipflip_access_token"
     refresh_token_cookie_name: str = "quipflip_refresh_token"
     auth_emit_legacy_fields: bool = True
@@ -73,7 +84,9 @@ class Settings(BaseSettings):
     ir_non_participant_vote_cap: int = 10  # Max non-participant votes per guest player
     ir_non_participant_votes_per_set: int = 5  # Max non-participant votes per set
     ir_rapid_entry_timeout_minutes: int = 30  # Timeout before old sets are removed from available pool
+    ir_open_set_reconcile_seconds: float = 15.0  # Max age of the in-memory open-set index before it is rebuilt
     ir_ai_backup_delay_minutes: int = 2  # Delay before AI fills stalled backronym sets
+    ir_ai_backup_concurrency: int = 4  # Max concurrent AI requests while filling stalled sets
     ir_rapid_entry_timer_minutes: int = 2  # Rapid mode: minutes after last entry before AI fills slots
     ir_rapid_voting_timer_minutes: int = 2  # Rapid mode: minutes for voting phase before AI fills votes
     ir_standard_voting_timer_minutes: int = 30  # Standard mode: minutes for voting phase before AI fills votes
@@ -125,6 +138,8 @@ class Settings(BaseSettings):
     copy_round_seconds: int = 180
     vote_round_seconds: int = 60
     grace_period_seconds: int = 5
+    party_state_refresh_seconds: float = 2.0  # Max age of in-memory party state before a poll reloads it
+    party_lobby_reconcile_seconds: float = 15.0  # Max age of the in-memory open-party list before it is rebuilt
 
     # Vote finalization thresholds
     vote_max_votes: int = 20  # Maximum votes before auto-finalization
@@ -157,13 +172,42 @@ class Settings(BaseSettings):
     ai_openai_model: str = "gpt-5-nano"  # OpenAI model for copy generation
     ai_gemini_model: str = "gemini-2.5-flash-lite"  # Gemini model for copy generation
     ai_timeout_seconds: int = 90  # Timeout for AI API calls (increased for hint generation)
+    ai_openai_base_url: str = ""  # Override the OpenAI API base URL (proxies, local stub servers)
+    ai_openai_max_concurrency: int = 8  # Max in-flight OpenAI requests per worker (also the pool size)
+    ai_gemini_max_concurrency: int = 4  # Max in-flight Gemini requests per worker
     ai_backup_delay_minutes: int = 30  # Delay before AI provides backup copies/votes
     ai_backup_batch_size: int = 10  # Maximum number of copy or vote rounds to process per backup cycle
     ai_backup_sleep_minutes: int = 30  # Sleep time between backup cycles
+    ai_pregeneration_enabled: bool = True  # Fill impostor/hint caches as soon as a prompt is submitted
+    ai_pregeneration_concurrency: int = 2  # Max concurrent background pre-generations per worker
+    ai_pregeneration_max_pending: int = 100  # Prompt rounds queued for pre-generation before new ones are dropped
     ai_stale_handler_enabled: bool = True  # Feature flag for stale content handler
     ai_stale_threshold_days: int = 2  # Minimum age before content is treated as stale
     ai_stale_check_interval_hours: int = 6 # Interval between stale content sweeps
 
+    # Maintenance jobs (cleanup, party maintenance)
+    cleanup_chunk_size: int = 200  # Rows per chunk; each chunk commits so the SQLite writer lock is released
+    cleanup_time_budget_seconds: float = 30.0  # Per-job run budget; unfinished jobs resume from their cursor
+    cleanup_chunk_pause_seconds: float = 0.05  # Pause between chunks so foreground writes can proceed
+
+    # API access logging
+    api_log_queue_size: int = 10000  # Bounded queue between request handlers and the log writer thread
+    api_log_batch_size: int = 256  # Maximum records written per batch
+    api_log_flush_interval_seconds: float = 0.5  # Maximum time a record waits before being written
+    api_log_polling_sample_rate: float = 0.05  # Fraction of 2xx responses logged for hot polling endpoints
+    api_log_polling_path_suffixes: list[str] = [
+        "/dashboard",
+        "/balance",
+        "/current-round",
+        "/status",
+        "/state",
+        "/online",
+        "/notifications",
+        "/livez",
+        "/readyz",
+        "/health",
+    ]
+
     # Round service tuning
     round_lock_timeout_seconds: int = 30  # Shared timeout for distributed locks in round flows
     copy_round_max_attempts: int = 10  # Attempts to find a valid prompt when starting copy rounds
@@ -8,6 +8,7 @@ from uuid import UUID
 from backend.config import get_settings
 from backend.database import get_db
 from backend.utils.rate_limiter import RateLimiter
+from backend.utils.shared_store import get_shared_store
 from backend.services.auth_service import AuthService, AuthError, GameType
 from backend.models.player import Player
 
@@ -15,7 +16,7 @@ logger = logging.getLogger(__name__)
 
 
 settings = get_settings()
-rate_limiter = RateLimiter(settings.redis_url or None)
+rate_limiter = RateLimiter(settings.redis_url or None, shared_store=get_shared_store())
 
 GENERAL_RATE_LIMIT = 100
 VOTE_RATE_LIMIT = 20
@@ -30,12 +30,14 @@ from contextlib import asynccontextmanager
 from backend.config import get_settings
 from backend.version import APP_VERSION
 from backend.services.qf.prompt_seeder import sync_prompts_with_database
+from backend.services.ai.llm_gateway import get_llm_gateway
 from backend.scripts.tl.seed_prompts import seed_prompts as seed_prompts
 from backend.scripts.tl.seed_answers import seed_answers as seed_answers, cleanup_empty_prompts as cleanup_tl_prompts
 from backend.routers import qf, ir, mm, tl, auth, health, notifications, online_users
 from backend.middleware.deduplication import deduplication_middleware
 from backend.middleware.host_scope import HostScopeMiddleware
 from backend.middleware.online_user_tracking import online_user_tracking_middleware
+from backend.middleware.access_log import AccessLogMiddleware, AccessLogPipeline, route_latency_registry
 
 # Create logs directory if it doesn't exist
 logs_dir = Path("logs")
@@ -69,9 +71,9 @@ sql_rotating_handler = RotatingFileHandler(
 )  # 1 MB
 sql_rotating_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
 
-# Create rotating file handler for API request logs (2MB max size, keep 15 backup files)
+# Create rotating file handler for API request logs (2MB max size, keep 15 backup files).
+# Records reach it as JSON lines written in batches by the access log writer thread.
 api_rotating_handler = RotatingFileHandler(api_log_file, maxBytes=2 * 1024 * 1024, backupCount=15, encoding='utf-8')
-api_rotating_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 
 # Configure logging with both console and rotating file handlers
 # Force=True ensures we override any existing configuration (e.g., from uvicorn)
@@ -89,10 +91,18 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-# Create dedicated API request logger
+# Create dedicated API request logger. Handlers only enqueue; a background thread
+# (started and stopped by the lifespan) drains the bounded queue and writes
+# batched JSON lines to the API log file.
+access_log_pipeline = AccessLogPipeline(
+    api_rotating_handler,
+    queue_size=get_settings().api_log_queue_size,
+    batch_size=get_settings().api_log_batch_size,
+    flush_interval_seconds=get_settings().api_log_flush_interval_seconds,
+)
 api_logger = logging.getLogger("crowdcraft.api")
 api_logger.handlers.clear()  # Remove any existing handlers
-api_logger.addHandler(api_rotating_handler)
+api_logger.addHandler(access_log_pipeline.handler)
 api_logger.setLevel(logging.INFO)
 api_logger.propagate = False  # Prevent propagation to root logger
 
@@ -399,6 +409,31 @@ async def party_maintenance_cycle():
         await asyncio.sleep(maintenance_interval)
 
 
+async def email_outbox_cycle():
+    """
+    Background task to deliver queued outbound email.
+
+    Retries outbox rows whose inline delivery failed (with backoff), picks
+    up rows whose sending worker died, and prunes finished rows.
+    """
+    from backend.database import AsyncSessionLocal
+    from backend.services.email_outbox import EmailOutboxDispatcher
+
+    logger.info("Email outbox cycle starting main loop")
+
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                dispatcher = EmailOutboxDispatcher(db)
+                await dispatcher.dispatch_due()
+                await dispatcher.prune()
+
+        except Exception as e:
+            logger.error(f"Email outbox cycle error: {e}")
+
+        await asyncio.sleep(settings.email_outbox_poll_seconds)
+
+
 async def ir_backup_cycle():
     """
     Background task to fill stalled Initial Reaction game sets.
@@ -454,11 +489,22 @@ async def lifespan(app_instance: FastAPI):
 
     await maybe_run_startup_bootstrap()
 
+    # Reconcile the guest-merge FK plan with the live schema once, not per merge
+    try:
+        from backend.database import AsyncSessionLocal
+        from backend.services.player_merge_plan import validate_player_reassignment_plan
+
+        async with AsyncSessionLocal() as db:
+            await validate_player_reassignment_plan(db)
+    except Exception as e:
+        logger.error(f"Failed to validate guest merge reassignment plan: {e}")
+
     # Start background tasks
     ai_backup_task = None
     stale_handler_task = None
     cleanup_task = None
     party_maintenance_task = None
+    email_outbox_task = None
     ir_backup_task = None
 
     try:
@@ -485,6 +531,12 @@ async def lifespan(app_instance: FastAPI):
     except Exception as e:
         logger.error(f"Failed to start party maintenance cycle: {e}")
 
+    try:
+        email_outbox_task = asyncio.create_task(email_outbox_cycle())
+        logger.info(f"Email outbox cycle task started (runs every {settings.email_outbox_poll_seconds} seconds)")
+    except Exception as e:
+        logger.error(f"Failed to start email outbox cycle: {e}")
+
     # try:
     #     ir_backup_task = asyncio.create_task(ir_backup_cycle())
     #     logger.info(f"IR backup cycle task started (runs every {settings.ir_ai_backup_delay_minutes} minutes)")
@@ -495,6 +547,7 @@ async def lifespan(app_instance: FastAPI):
     logger.info("Crowdcraft Labs API Started")
     logger.info("============================================================")
 
+    access_log_pipeline.start()
     try:
         yield
     finally:
@@ -514,6 +567,9 @@ async def lifespan(app_instance: FastAPI):
         if party_maintenance_task:
             party_maintenance_task.cancel()
             tasks_to_cancel.append(("Party maintenance", party_maintenance_task))
+        if email_outbox_task:
+            email_outbox_task.cancel()
+            tasks_to_cancel.append(("Email outbox", email_outbox_task))
         if ir_backup_task:
             ir_backup_task.cancel()
             tasks_to_cancel.append(("IR backup", ir_backup_task))
@@ -529,7 +585,13 @@ async def lifespan(app_instance: FastAPI):
             except Exception as e:
                 logger.error(f"Error cancelling {task_name} task: {e}")
 
+        try:
+            await get_llm_gateway().aclose()
+        except Exception as e:
+            logger.error(f"Error closing LLM gateway: {e}")
+
         logger.info("Crowdcraft Labs API Shutting Down... Goodbye!")
+        access_log_pipeline.stop()
 
 
 # Create FastAPI app
@@ -577,71 +639,15 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
-# Comprehensive API Request Logging Middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """
-    Comprehensive request logging middleware that captures all API requests and responses.
-    Logs to dedicated API log file with detailed information including timing, status codes,
-    client info, and request/response details.
-    """
-    start_time = time.time()
-    
-    # Extract client information
-    client_ip = request.client.host if request.client else "unknown"
-    user_agent = request.headers.get("user-agent", "unknown")
-    
-    # Extract request details
-    method = request.method
-    url = str(request.url)
-    path = request.url.path
-    query_params = str(request.query_params) if request.query_params else ""
-    
-    # Log request start
-    request_id = f"{method}:{path}:{int(start_time * 1000) % 100000}"  # Simple request ID
-    
-    api_logger.info(f">> {request_id} | START | {method} {path} | IP: {client_ip} | UA: {user_agent[:50]}...")
-    
-    # Add query params if present
-    if query_params:
-        api_logger.info(f">> {request_id} | QUERY | {query_params}")
-    
-    # Process request and measure response time
-    try:
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        
-        # Log successful response
-        api_logger.info(
-            f"<< {request_id} | COMPLETE | {method} {path} | "
-            f"Status: {response.status_code} | "
-            f"Time: {process_time:.3f}s | "
-            f"IP: {client_ip}"
-        )
-        
-        # Add response headers for debugging if needed
-        if response.status_code >= 400:
-            content_type = response.headers.get("content-type", "unknown")
-            api_logger.warning(
-                f"<< {request_id} | ERROR_RESPONSE | "
-                f"Content-Type: {content_type}"
-            )
-        
-        return response
-        
-    except Exception as e:
-        process_time = time.time() - start_time
-        
-        # Log exception
-        api_logger.error(
-            f"<< {request_id} | EXCEPTION | {method} {path} | "
-            f"Error: {str(e)[:100]} | "
-            f"Time: {process_time:.3f}s | "
-            f"IP: {client_ip}"
-        )
-        
-        # Re-raise the exception
-        raise
+# Structured API request logging: one record per request, a single enqueue on the hot path
+app.middleware("http")(
+    AccessLogMiddleware(
+        api_logger,
+        route_latency_registry,
+        polling_path_suffixes=settings.api_log_polling_path_suffixes,
+        polling_sample_rate=settings.api_log_polling_sample_rate,
+    )
+)
 
 
 # CORS middleware with environment-based origins
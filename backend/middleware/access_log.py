@@ -0,0 +1,328 @@
+"""Structured, non-blocking API access logging.
+
+The request middleware builds exactly one record per request and hands it to a
+bounded queue. A background thread drains that queue and writes batched JSON
+lines to the API log file, so the event loop never formats strings or touches
+the filesystem for access logging. Successful responses from hot polling
+endpoints are sampled, and per-route latency histograms are kept in memory.
+"""
+import json
+import logging
+import queue
+import random
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime, UTC
+from logging.handlers import BaseRotatingHandler, QueueHandler
+from typing import Any, Iterable, Optional
+
+from fastapi import Request
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (milliseconds) of the latency histogram buckets; a final
+# overflow bucket catches everything slower than the last bound.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Fixed field order for every access record so each request only fills a tuple.
+ACCESS_LOG_FIELDS: tuple[str, ...] = (
+    "method",
+    "path",
+    "route",
+    "query",
+    "status",
+    "duration_ms",
+    "client_ip",
+    "user_agent",
+    "error",
+)
+
+USER_AGENT_MAX_LENGTH = 80
+ERROR_MAX_LENGTH = 200
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RouteLatencyHistogram:
+    """Fixed-bucket latency histogram for a single route."""
+
+    __slots__ = ("buckets", "count", "total_ms", "max_ms", "errors")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.errors = 0
+
+    def observe(self, duration_ms: float, is_error: bool = False) -> None:
+        """Record one request duration."""
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+        if is_error:
+            self.errors += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the bucket upper bound containing the ``q`` quantile."""
+        if self.count == 0:
+            return None
+        target = q * self.count
+        running = 0
+        for index, bucket_count in enumerate(self.buckets):
+            running += bucket_count
+            if running >= target:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return float(LATENCY_BUCKETS_MS[index])
+                return self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the histogram for diagnostics endpoints."""
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.quantile(0.50),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": {
+                **{f"le_{bound:g}": self.buckets[i] for i, bound in enumerate(LATENCY_BUCKETS_MS)},
+                "overflow": self.buckets[-1],
+            },
+        }
+
+
+class RouteLatencyRegistry:
+    """In-memory per-route latency histograms.
+
+    Observations happen on the event loop thread only, so no locking is needed.
+    """
+
+    def __init__(self):
+        self._histograms: dict[str, RouteLatencyHistogram] = {}
+
+    def observe(self, route_key: str, duration_ms: float, is_error: bool = False) -> None:
+        histogram = self._histograms.get(route_key)
+        if histogram is None:
+            histogram = self._histograms[route_key] = RouteLatencyHistogram()
+        histogram.observe(duration_ms, is_error)
+
+    def get(self, route_key: str) -> Optional[RouteLatencyHistogram]:
+        return self._histograms.get(route_key)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return a serializable copy of every route histogram."""
+        return {key: histogram.to_dict() for key, histogram in sorted(self._histograms.items())}
+
+    def reset(self) -> None:
+        self._histograms.clear()
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks or formats on the caller's thread.
+
+    When the bounded queue is full, records are dropped and counted instead of
+    applying backpressure to request handling.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting happens on the writer thread; hand the record over untouched.
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def format_access_record(record: logging.LogRecord) -> str:
+    """Render a log record as a single JSON line."""
+    timestamp = datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds")
+    fields = getattr(record, "access_fields", None)
+    if fields is not None:
+        payload = {"ts": timestamp, "level": record.levelname, **dict(zip(ACCESS_LOG_FIELDS, fields))}
+    else:
+        payload = {"ts": timestamp, "level": record.levelname, "message": record.getMessage()}
+    return json.dumps(payload, separators=(",", ":"), default=str)
+
+
+class AccessLogPipeline:
+    """Bounded queue plus background writer for the API access log."""
+
+    def __init__(
+        self,
+        target: logging.Handler,
+        queue_size: int = 10000,
+        batch_size: int = 256,
+        flush_interval_seconds: float = 0.5,
+    ):
+        self.target = target
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self.handler = DroppingQueueHandler(self.queue)
+        self.batches_written = 0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the background writer thread (idempotent)."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="api-access-log-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the writer thread after flushing everything already queued."""
+        if not self.running:
+            return
+        self._stop_event.set()
+        self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                first = self.queue.get(timeout=self.flush_interval_seconds)
+            except queue.Empty:
+                continue
+            self._write_batch(self._drain([first]))
+        # Final flush on shutdown
+        self.flush()
+
+    def _drain(self, batch: list[logging.LogRecord]) -> list[logging.LogRecord]:
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def flush(self) -> None:
+        """Synchronously write everything currently queued (used by tests and shutdown)."""
+        while True:
+            batch = self._drain([])
+            if not batch:
+                return
+            self._write_batch(batch)
+
+    def _write_batch(self, records: Iterable[logging.LogRecord]) -> None:
+        try:
+            payload = "".join(format_access_record(record) + "\n" for record in records)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.error(f"Failed to format access log batch: {exc}")
+            return
+
+        target = self.target
+        target.acquire()
+        try:
+            if isinstance(target, BaseRotatingHandler):
+                if target.stream is None:
+                    target.stream = target._open()
+                max_bytes = getattr(target, "maxBytes", 0)
+                if max_bytes and target.stream.tell() + len(payload) >= max_bytes:
+                    target.doRollover()
+            stream = getattr(target, "stream", None)
+            if stream is not None:
+                stream.write(payload)
+                stream.flush()
+            else:
+                for line in payload.splitlines():
+                    target.handle(logging.makeLogRecord({"msg": line, "levelno": logging.INFO}))
+            self.batches_written += 1
+        except Exception as exc:  # pragma: no cover - disk errors must not kill the writer
+            logger.error(f"Failed to write access log batch: {exc}")
+        finally:
+            target.release()
+
+
+class AccessLogMiddleware:
+    """Per-request access logging that costs a single enqueue."""
+
+    def __init__(
+        self,
+        access_logger: logging.Logger,
+        latency_registry: RouteLatencyRegistry,
+        polling_path_suffixes: Iterable[str] = (),
+        polling_sample_rate: float = 1.0,
+    ):
+        self.access_logger = access_logger
+        self.latency_registry = latency_registry
+        self.polling_path_suffixes = tuple(polling_path_suffixes)
+        self.polling_sample_rate = polling_sample_rate
+        self.sampled_out = 0
+
+    def _should_log(self, path: str, status: int) -> bool:
+        if self.polling_sample_rate >= 1.0 or not (200 <= status < 300):
+            return True
+        if not path.endswith(self.polling_path_suffixes):
+            return True
+        if random.random() < self.polling_sample_rate:
+            return True
+        self.sampled_out += 1
+        return False
+
+    def _emit(self, scope: dict, start: float, status: int, error: Optional[str]) -> None:
+        duration_ms = (time.perf_counter() - start) * 1000.0
+        method = scope.get("method", "")
+        path = scope.get("path", "")
+        # Unmatched requests (404 probes, static assets) share one key so the registry stays bounded
+        route_path = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+
+        self.latency_registry.observe(f"{method} {route_path}", duration_ms, status >= 500)
+
+        if not self._should_log(path, status):
+            return
+
+        client = scope.get("client")
+        user_agent = ""
+        for name, value in scope.get("headers", ()):
+            if name == b"user-agent":
+                user_agent = value[:USER_AGENT_MAX_LENGTH].decode("latin-1")
+                break
+        query = scope.get("query_string", b"")
+
+        level = logging.ERROR if error is not None else (logging.WARNING if status >= 400 else logging.INFO)
+        if not self.access_logger.isEnabledFor(level):
+            return
+        record = logging.LogRecord(self.access_logger.name, level, __file__, 0, "access", None, None)
+        record.access_fields = (
+            method,
+            path,
+            route_path,
+            query.decode("latin-1") if query else "",
+            status,
+            round(duration_ms, 3),
+            client[0] if client else "unknown",
+            user_agent,
+            error,
+        )
+        self.access_logger.handle(record)
+
+    async def __call__(self, request: Request, call_next):
+        start = time.perf_counter()
+        try:
+            response = await call_next(request)
+        except Exception as exc:
+            self._emit(request.scope, start, 500, str(exc)[:ERROR_MAX_LENGTH])
+            raise
+        self._emit(request.scope, start, response.status_code, None)
+        return response
+
+
+# Process-wide latency histograms, exposed for diagnostics.
+route_latency_registry = RouteLatencyRegistry()
@@ -4,11 +4,10 @@ from __future__ import annotations
 
 import hashlib
 import logging
-import mimetypes
 from pathlib import Path
 from typing import Any
 
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from starlette.datastructures import Headers
 
 from backend.runtime.config import resolve_runtime_paths
@@ -18,10 +17,10 @@ from backend.runtime.host_scope import (
     game_from_path,
     is_reserved_api_path,
     normalize_host_header,
-    safe_static_candidate,
     static_release_dir,
     resolve_host_scope,
 )
+from backend.runtime.static_assets import StaticAsset, StaticReleaseStore, negotiate_encoding
 
 
 logger = logging.getLogger(__name__)
@@ -43,7 +42,14 @@ def _reject_http(status_code: int, detail: str) -> JSONResponse:
     return response
 
 
-def _add_static_headers(response: FileResponse, *, cache_control: str) -> FileResponse:
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _add_static_headers(response: Response, *, cache_control: str) -> Response:
     response.headers["Cache-Control"] = cache_control
     response.headers["X-Content-Type-Options"] = "nosniff"
     response.headers["X-Frame-Options"] = "DENY"
@@ -65,6 +71,12 @@ class HostScopeMiddleware:
         self.production = getattr(self.settings, "environment", "") == "production"
         self.host_map = build_host_scope_map(self.settings)
         self.runtime_paths = resolve_runtime_paths(self.settings)
+        self.static_store = StaticReleaseStore()
+        if self.production:
+            # Build every release manifest before the first request is served
+            self.static_store.preload(
+                sorted({static_release_dir(self.runtime_paths.static_root, scope) for scope in self.host_map.values()})
+            )
 
     async def __call__(self, scope: dict[str, Any], receive, send) -> None:
         scope_type = scope.get("type")
@@ -101,7 +113,7 @@ class HostScopeMiddleware:
             return
 
         if scope_type == "http" and self.production and scope.get("method") in {"GET", "HEAD"}:
-            static_response = self._maybe_serve_static(scope, headers, host_scope)
+            static_response = await self._maybe_serve_static(scope, headers, host_scope)
             if static_response is not None:
                 await static_response(scope, receive, send)
                 return
@@ -118,12 +130,12 @@ class HostScopeMiddleware:
             },
         )
 
-    def _maybe_serve_static(
+    async def _maybe_serve_static(
         self,
         scope: dict[str, Any],
         headers: Headers,
         host_scope: HostScope | None,
-    ) -> FileResponse | None:
+    ) -> Response | None:
         if host_scope is None:
             return None
 
@@ -131,17 +143,17 @@ class HostScopeMiddleware:
         if is_reserved_api_path(path):
             return None
 
-        static_dir = static_release_dir(self.runtime_paths.static_root, host_scope)
-        index_path = static_dir / "index.html"
-        if not index_path.is_file():
+        manifest = await self.static_store.load(static_release_dir(self.runtime_paths.static_root, host_scope))
+        index_asset = manifest.index
+        if index_asset is None:
             return _reject_http(503, "Static release is unavailable")
 
-        candidate = safe_static_candidate(static_dir, path)
-        if candidate is not None and candidate.is_file():
-            return self._prepare_static_response(candidate, path)
+        asset = manifest.lookup(path)
+        if asset is not None:
+            return self._prepare_static_response(asset, headers)
 
         if self._should_serve_index(path, headers.get("accept")):
-            return self._prepare_static_response(index_path, path, index=True)
+            return self._prepare_static_response(index_asset, headers)
 
         return None
 
@@ -158,22 +170,25 @@ class HostScopeMiddleware:
         accept = accept_header.lower()
         return "text/html" in accept or "application/xhtml+xml" in accept or "*/*" in accept
 
-    def _prepare_static_response(self, file_path: Path, request_path: str, *, index: bool = False) -> FileResponse:
-        response = FileResponse(file_path)
-        filename = file_path.name.lower()
-
-        if index or filename == "index.html" or filename in {"manifest.webmanifest", "manifest.json", "service-worker.js", "sw.js"}:
-            cache_control = _INDEX_CACHE_CONTROL
+    def _prepare_static_response(self, asset: StaticAsset, headers: Headers) -> Response:
+        cache_control = _INDEX_CACHE_CONTROL if asset.revalidate else _ASSET_CACHE_CONTROL
+
+        if not asset.in_memory:
+            # Large file: stream from disk with the cached stat result (Range handled by FileResponse)
+            response = FileResponse(asset.path, media_type=asset.media_type, stat_result=asset.stat_result)
+            response.headers["ETag"] = asset.etag
+            return _add_static_headers(response, cache_control=cache_control)
+
+        encoding = negotiate_encoding(headers.get("accept-encoding"), asset.encoded)
+        body, etag = asset.representation(encoding)
+        response_headers = {"ETag": etag}
+        if asset.encoded:
+            response_headers["Vary"] = "Accept-Encoding"
+        if encoding:
+            response_headers["Content-Encoding"] = encoding
+
+        if _etag_matches(headers.get("if-none-match"), etag):
+            response = Response(status_code=304, headers=response_headers)
         else:
-            cache_control = _ASSET_CACHE_CONTROL
-
-        media_type, _ = mimetypes.guess_type(str(file_path))
-        if media_type:
-            response.media_type = media_type
-
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Cache-Control"] = cache_control
-
-        return response
+            response = Response(content=body, media_type=asset.media_type, headers=response_headers)
+        return _add_static_headers(response, cache_control=cache_control)
@@ -0,0 +1,28 @@
+"""Record derived image variants on Meme Mint images.
+
+Revision ID: 09fb9491cfcb
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "09fb9491cfcb"
+down_revision: Union[str, None] = "c3d4e5f6a7b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("mm_images") as batch_op:
+        batch_op.add_column(sa.Column("variants", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("mm_images") as batch_op:
+        batch_op.drop_column("variants")
@@ -0,0 +1,53 @@
+"""Add email outbox table.
+
+Revision ID: 38507b228a37
+Revises: aade24eb7201
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.migrations.util import get_timestamp_default, get_uuid_type
+
+
+revision: str = "38507b228a37"
+down_revision: Union[str, None] = "aade24eb7201"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "email_outbox",
+        sa.Column("email_id", get_uuid_type(), nullable=False),
+        sa.Column("kind", sa.String(length=50), nullable=False),
+        sa.Column("to_email", sa.String(length=255), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "next_attempt_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=get_timestamp_default(),
+        ),
+        sa.Column("last_error", sa.String(length=255), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=get_timestamp_default(),
+        ),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("email_id"),
+    )
+    op.create_index("ix_email_outbox_due", "email_outbox", ["status", "next_attempt_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_email_outbox_due", table_name="email_outbox")
+    op.drop_table("email_outbox")
@@ -0,0 +1,78 @@
+"""Share versioned answer snapshots across ThinkLink rounds.
+
+Revision ID: 3ae52c81844b
+Revises: fdeaf41e22ae
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.migrations.util import get_timestamp_default, get_uuid_type
+
+
+revision: str = "3ae52c81844b"
+down_revision: Union[str, None] = "fdeaf41e22ae"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    uuid = get_uuid_type()
+    bind = op.get_bind()
+
+    op.create_table(
+        "tl_snapshot",
+        sa.Column("snapshot_id", uuid, nullable=False),
+        sa.Column("prompt_id", uuid, nullable=False),
+        sa.Column("corpus_version", sa.Integer(), nullable=False),
+        sa.Column("answer_ids", sa.JSON(), nullable=False),
+        sa.Column("cluster_weights", sa.JSON(), nullable=False),
+        sa.Column("total_weight", sa.Float(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=get_timestamp_default(),
+        ),
+        sa.PrimaryKeyConstraint("snapshot_id"),
+        sa.ForeignKeyConstraint(["prompt_id"], ["tl_prompt.prompt_id"], ondelete="CASCADE"),
+        sa.UniqueConstraint("prompt_id", "corpus_version", name="uq_tl_snapshot_prompt_version"),
+    )
+    op.create_index("idx_tl_snapshot_prompt", "tl_snapshot", ["prompt_id"], unique=False)
+
+    # Plain ADD COLUMN so SQLite does not rebuild tl_prompt / tl_round
+    op.add_column(
+        "tl_prompt",
+        sa.Column("corpus_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("tl_round", sa.Column("snapshot_id", uuid, nullable=True))
+    op.add_column("tl_round", sa.Column("snapshot_answer_count", sa.Integer(), nullable=True))
+
+    if bind.dialect.name == "postgresql":
+        op.create_foreign_key(
+            "fk_tl_round_snapshot_id",
+            "tl_round",
+            "tl_snapshot",
+            ["snapshot_id"],
+            ["snapshot_id"],
+            ondelete="SET NULL",
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.drop_constraint("fk_tl_round_snapshot_id", "tl_round", type_="foreignkey")
+
+    with op.batch_alter_table("tl_round") as batch_op:
+        batch_op.drop_column("snapshot_answer_count")
+        batch_op.drop_column("snapshot_id")
+    with op.batch_alter_table("tl_prompt") as batch_op:
+        batch_op.drop_column("corpus_version")
+
+    op.drop_index("idx_tl_snapshot_prompt", table_name="tl_snapshot")
+    op.drop_table("tl_snapshot")
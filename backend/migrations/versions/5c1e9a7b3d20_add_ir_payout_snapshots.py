@@ -0,0 +1,40 @@
+"""Add IR payout snapshots table.
+
+Revision ID: 5c1e9a7b3d20
+Revises: 38507b228a37
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.migrations.util import get_timestamp_default, get_uuid_type
+
+
+revision: str = "5c1e9a7b3d20"
+down_revision: Union[str, None] = "38507b228a37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ir_payout_snapshots",
+        sa.Column("set_id", get_uuid_type(), nullable=False),
+        sa.Column("payouts", sa.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=get_timestamp_default(),
+        ),
+        sa.ForeignKeyConstraint(["set_id"], ["ir_backronym_sets.set_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("set_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ir_payout_snapshots")
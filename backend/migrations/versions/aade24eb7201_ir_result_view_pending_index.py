@@ -0,0 +1,30 @@
+"""Index IR result views for per-player pending results.
+
+Revision ID: aade24eb7201
+Revises: 3ae52c81844b
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "aade24eb7201"
+down_revision: Union[str, None] = "3ae52c81844b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_ir_result_view_player_pending",
+        "ir_result_views",
+        ["player_id", "result_viewed"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ir_result_view_player_pending", table_name="ir_result_views")
@@ -0,0 +1,32 @@
+"""Add persisted cursors for chunked maintenance jobs.
+
+Revision ID: c3d4e5f6a7b8
+Revises: b9c8d7e6f5a4
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "c3d4e5f6a7b8"
+down_revision: Union[str, None] = "b9c8d7e6f5a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "maintenance_cursors",
+        sa.Column("job_name", sa.String(length=100), nullable=False),
+        sa.Column("cursor", sa.String(length=255), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("job_name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("maintenance_cursors")
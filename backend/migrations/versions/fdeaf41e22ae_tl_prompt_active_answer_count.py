@@ -0,0 +1,40 @@
+"""Cache active answer counts on ThinkLink prompts.
+
+Revision ID: fdeaf41e22ae
+Revises: 09fb9491cfcb
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "fdeaf41e22ae"
+down_revision: Union[str, None] = "09fb9491cfcb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("tl_prompt") as batch_op:
+        batch_op.add_column(
+            sa.Column("active_answer_count", sa.Integer(), nullable=False, server_default="0")
+        )
+
+    op.execute(
+        """
+        UPDATE tl_prompt
+        SET active_answer_count = (
+            SELECT COUNT(*) FROM tl_answer
+            WHERE tl_answer.prompt_id = tl_prompt.prompt_id AND tl_answer.is_active = true
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("tl_prompt") as batch_op:
+        batch_op.drop_column("active_answer_count")
@@ -4,5 +4,7 @@ from .mm import *
 from .phrase_embedding import PhraseEmbedding
 from .account import Account
 from .magic_link import MagicLink
+from .email_outbox import EmailOutbox
 from .player import Player
 from .refresh_token import RefreshToken
+from .maintenance_cursor import MaintenanceCursor
@@ -0,0 +1,39 @@
+"""Transactional outbox for outbound email."""
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String
+
+from backend.database import Base
+from backend.models.base import get_uuid_column
+
+
+class EmailOutbox(Base):
+    """An email written in the same transaction as the action that triggered it.
+
+    Rows are delivered after commit by ``EmailOutboxDispatcher`` (inline for the
+    first attempt, then by the background cycle with backoff), so no database
+    transaction is held open across the SMTP round trip.
+    """
+
+    __tablename__ = "email_outbox"
+
+    email_id = get_uuid_column(primary_key=True, default=uuid.uuid4)
+    kind = Column(String(50), nullable=False)  # "magic_link" or "message"
+    to_email = Column(String(255), nullable=False)
+    payload = Column(JSON, nullable=False)  # Template arguments; cleared once sent
+    status = Column(String(20), nullable=False, default="pending")  # pending, sending, sent, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False)
+    last_error = Column(String(255), nullable=True)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_email_outbox_due", "status", "next_attempt_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<EmailOutbox(email_id={self.email_id}, kind={self.kind}, status={self.status})>"
@@ -9,6 +9,7 @@ from backend.models.ir.backronym_observer_guard import BackronymObserverGuard
 from backend.models.ir.assignment import IRAssignment
 from backend.models.ir.transaction import IRTransaction
 from backend.models.ir.result_view import IRResultView
+from backend.models.ir.payout_snapshot import IRPayoutSnapshot
 from backend.models.ir.refresh_token import IRRefreshToken
 from backend.models.ir.daily_bonus import IRDailyBonus
 from backend.models.ir.ai_metric import IRAIMetric
@@ -26,6 +27,7 @@ __all__ = [
     "IRAssignment",
     "IRTransaction",
     "IRResultView",
+    "IRPayoutSnapshot",
     "IRRefreshToken",
     "IRDailyBonus",
     "IRAIMetric",
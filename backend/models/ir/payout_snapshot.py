@@ -0,0 +1,26 @@
+"""IR PayoutSnapshot model."""
+from sqlalchemy import JSON, Column, DateTime, ForeignKey
+from datetime import datetime, UTC
+from backend.database import Base
+from backend.models.base import get_uuid_column
+
+
+class IRPayoutSnapshot(Base):
+    """Payouts computed once when a set is finalized.
+
+    ``payouts`` holds the full ``IRScoringService.calculate_payouts`` result
+    (per-creator, per-voter and vault amounts). Rows are written in the same
+    transaction that applies the payouts and never updated, so result views read
+    them by primary key instead of recomputing from entries and votes.
+    """
+
+    __tablename__ = "ir_payout_snapshots"
+
+    set_id = get_uuid_column(
+        ForeignKey("ir_backronym_sets.set_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    payouts = Column(JSON, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False
+    )
@@ -42,6 +42,8 @@ class IRResultView(Base):
         Index("ix_ir_result_view_set", set_id),
         Index("ix_ir_result_view_player", player_id),
         Index("ix_ir_result_view_result_viewed", result_viewed),
+        # Pending results lookup: WHERE player_id = ? AND result_viewed = false
+        Index("ix_ir_result_view_player_pending", player_id, result_viewed),
     )
 
     # Relationships
@@ -0,0 +1,21 @@
+"""Persisted resume point for chunked maintenance jobs."""
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import Column, DateTime, String
+
+from backend.database import Base
+
+
+class MaintenanceCursor(Base):
+    """Last key processed by a chunked maintenance job, so an interrupted run can resume."""
+
+    __tablename__ = "maintenance_cursors"
+
+    job_name = Column(String(100), primary_key=True)
+    cursor = Column(String(255), nullable=True)
+    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<MaintenanceCursor(job_name={self.job_name}, cursor={self.cursor})>"
@@ -19,6 +19,8 @@ class MMImage(Base):
     thumbnail_url = Column(String(500), nullable=True)
     attribution_text = Column(String(255), nullable=True)
     tags = Column(JSON, nullable=True)
+    # Derived WebP/AVIF variants and blur placeholder (see services/mm/image_variants.py)
+    variants = Column(JSON, nullable=True)
     status = Column(String(20), default="active", nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False)
     created_by_player_id = get_uuid_column(
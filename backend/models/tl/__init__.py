@@ -6,6 +6,7 @@ from .daily_bonus import TLDailyBonus
 from .prompt import TLPrompt
 from .answer import TLAnswer
 from .cluster import TLCluster
+from .snapshot import TLSnapshot
 from .round import TLRound
 from .guess import TLGuess
 from .transaction import TLTransaction
@@ -23,6 +24,7 @@ __all__ = [
     "TLPrompt",
     "TLAnswer",
     "TLCluster",
+    "TLSnapshot",
     "TLRound",
     "TLGuess",
     "TLTransaction",
@@ -1,10 +1,11 @@
 """ThinkLink answer model."""
 import uuid
-from sqlalchemy import Column, ForeignKey, String, Integer, DateTime, Boolean, Index
+from sqlalchemy import Column, ForeignKey, String, Integer, DateTime, Boolean, Index, event, inspect, update
 from datetime import datetime, UTC
 from pgvector.sqlalchemy import Vector
 from backend.database import Base
 from backend.models.base import get_uuid_column
+from backend.models.tl.prompt import TLPrompt
 
 
 class TLAnswer(Base):
@@ -44,3 +45,36 @@ class TLAnswer(Base):
 
     def __repr__(self):
         return f"<TLAnswer(answer_id={self.answer_id}, text='{self.text[:30]}...')>"
+
+
+
+
+def _touch_prompt_corpus(connection, prompt_id, count_delta: int = 0) -> None:
+    """Bump the prompt's corpus version (and active answer count) after a corpus change."""
+    prompt_table = TLPrompt.__table__
+    values = {"corpus_version": prompt_table.c.corpus_version + 1}
+    if count_delta:
+        values["active_answer_count"] = prompt_table.c.active_answer_count + count_delta
+    connection.execute(update(prompt_table).where(prompt_table.c.prompt_id == prompt_id).values(**values))
+
+
+@event.listens_for(TLAnswer, "after_insert")
+def _count_inserted_answer(mapper, connection, target: TLAnswer) -> None:
+    """Keep ``TLPrompt.active_answer_count`` current as answers are added."""
+    if target.is_active is not False:
+        _touch_prompt_corpus(connection, target.prompt_id, 1)
+
+
+@event.listens_for(TLAnswer, "after_delete")
+def _count_deleted_answer(mapper, connection, target: TLAnswer) -> None:
+    """Keep ``TLPrompt.active_answer_count`` current as answers are removed."""
+    if target.is_active:
+        _touch_prompt_corpus(connection, target.prompt_id, -1)
+
+
+@event.listens_for(TLAnswer, "after_update")
+def _version_reweighted_answer(mapper, connection, target: TLAnswer) -> None:
+    """Cluster reassignment or a new player count changes snapshot weights."""
+    state = inspect(target)
+    if state.attrs.cluster_id.history.has_changes() or state.attrs.answer_players_count.history.has_changes():
+        _touch_prompt_corpus(connection, target.prompt_id)
@@ -1,6 +1,6 @@
 """ThinkLink prompt model."""
 import uuid
-from sqlalchemy import Column, String, DateTime, Boolean, Index
+from sqlalchemy import Column, String, DateTime, Boolean, Index, Integer
 from sqlalchemy.orm import relationship
 from datetime import datetime, UTC
 from pgvector.sqlalchemy import Vector
@@ -22,6 +22,10 @@ class TLPrompt(Base):
     embedding = Column(Vector(1536), nullable=True)  # For on-topic checks
     is_active = Column(Boolean, default=True, nullable=False)
     ai_seeded = Column(Boolean, default=False, nullable=False)
+    # Cached count of active answers; weights prompt selection without scanning tl_answer
+    active_answer_count = Column(Integer, default=0, server_default="0", nullable=False)
+    # Bumped whenever the scored corpus changes; snapshots are rebuilt per version
+    corpus_version = Column(Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False)
 
     # Relationships
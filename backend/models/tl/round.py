@@ -28,8 +28,13 @@ class TLRound(VersionedBase, Base):
     )
 
     # Snapshot - frozen at round start
-    snapshot_answer_ids = Column(JSON, nullable=False)  # List of answer_ids
-    snapshot_cluster_ids = Column(JSON, nullable=False)  # List of cluster_ids
+    snapshot_id = get_uuid_column(
+        ForeignKey("tl_snapshot.snapshot_id", ondelete="SET NULL"),
+        nullable=True
+    )  # Shared TLSnapshot; legacy rounds carry the id arrays below instead
+    snapshot_answer_ids = Column(JSON, nullable=False)  # List of answer_ids (legacy rounds; [] with snapshot_id)
+    snapshot_cluster_ids = Column(JSON, nullable=False)  # List of cluster_ids (legacy rounds; [] with snapshot_id)
+    snapshot_answer_count = Column(Integer, nullable=True)
     snapshot_total_weight = Column(Float, nullable=False, default=0.0)  # W_total for scoring
 
     # Game state
@@ -69,5 +74,12 @@ class TLRound(VersionedBase, Base):
         Index('idx_tl_round_status', 'status'),
     )
 
+    @property
+    def snapshot_size(self) -> int:
+        """Number of answers in the round's snapshot."""
+        if self.snapshot_answer_count is not None:
+            return self.snapshot_answer_count
+        return len(self.snapshot_answer_ids or [])
+
     def __repr__(self):
         return f"<TLRound(round_id={self.round_id}, player_id={self.player_id}, status={self.status})>"
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""ThinkLink prompt snapshot model."""
+import uuid
+from sqlalchemy import Column, ForeignKey, Integer, DateTime, Float, JSON, Index, UniqueConstraint
+from datetime import datetime, UTC
+from backend.database import Base
+from backend.models.base import get_uuid_column
+
+
+class TLSnapshot(Base):
+    """Immutable answer corpus snapshot for a prompt.
+
+    One row per prompt corpus version. Rounds reference a snapshot instead of
+    copying its answer and cluster ids, and the scoring data (cluster weights,
+    total weight) is computed once when the snapshot is built.
+    """
+
+    __tablename__ = "tl_snapshot"
+
+    snapshot_id = get_uuid_column(primary_key=True, default=uuid.uuid4)
+    prompt_id = get_uuid_column(
+        ForeignKey("tl_prompt.prompt_id", ondelete="CASCADE"),
+        nullable=False
+    )
+    corpus_version = Column(Integer, nullable=False)  # TLPrompt.corpus_version it was built from
+    answer_ids = Column(JSON, nullable=False)  # List of answer_ids
+    cluster_weights = Column(JSON, nullable=False)  # cluster_id -> weight
+    total_weight = Column(Float, nullable=False, default=0.0)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('prompt_id', 'corpus_version', name='uq_tl_snapshot_prompt_version'),
+        Index('idx_tl_snapshot_prompt', 'prompt_id'),
+    )
+
+    def __repr__(self):
+        return f"<TLSnapshot(snapshot_id={self.snapshot_id}, prompt_id={self.prompt_id}, version={self.corpus_version})>"
@@ -333,6 +333,7 @@ async def request_magic_link(
         email=result.email,
         expires_at=result.expires_at,
         message="Check your email for a sign-in link.",
+        delivery_status=result.delivery_status,
     )
 
 
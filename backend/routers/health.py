@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 from sqlalchemy import text
 
 from backend.config import get_settings
 from backend.database import engine
+from backend.dependencies import get_admin_player
+from backend.middleware.access_log import route_latency_registry
+from backend.models.player import Player
 from backend.runtime.readiness import build_readiness_report
 from backend.utils import queue_client
 from backend.version import APP_VERSION
@@ -117,3 +120,13 @@ async def game_status():
             "healthy": validation_healthy,
         },
     }
+
+
+@router.get("/latencyz")
+async def route_latency(player: Player = Depends(get_admin_player)):
+    """In-memory per-route latency histograms collected by the access log middleware."""
+
+    return {
+        "version": APP_VERSION,
+        "routes": route_latency_registry.snapshot(),
+    }
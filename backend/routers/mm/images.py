@@ -1,11 +1,13 @@
 """Image serving router for Meme Mint."""
 
 import logging
+import re
 from pathlib import Path
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException
 from fastapi.responses import FileResponse, RedirectResponse
 
 from backend.config import get_settings
+from backend.services.mm import image_variants
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,35 @@ settings = get_settings()
 # Path to images directory (for local development)
 IMAGES_DIR = Path(__file__).parent.parent.parent / "data" / "mm_images"
 
+_VARIANT_KEY_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+@router.get("/images/variants/{key}/{width}")
+async def get_image_variant(key: str, width: int, accept: str | None = Header(default=None)):
+    """Serve a resized image variant, choosing AVIF or WebP from the Accept header.
+
+    Variant URLs embed a content hash of the original, so responses are immutable.
+
+    Raises:
+        HTTPException: 400 for an invalid key, 404 if the variant does not exist
+    """
+    if not _VARIANT_KEY_RE.match(key):
+        raise HTTPException(status_code=400, detail="Invalid image key")
+
+    fmt = image_variants.negotiate_variant_format(accept, key, width, image_variants.VARIANTS_DIR)
+    if fmt is None:
+        logger.warning(f"Image variant not found: {key}/{width}")
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    return FileResponse(
+        image_variants.variant_path(key, width, fmt, image_variants.VARIANTS_DIR),
+        media_type=image_variants.VARIANT_MEDIA_TYPES[fmt],
+        headers={
+            "Cache-Control": "public, max-age=31536000, immutable",
+            "Vary": "Accept",
+        },
+    )
+
 
 @router.get("/images/{filename}")
 async def get_image(filename: str):
@@ -26,6 +26,7 @@ from backend.services.mm import (
     MMSystemConfigService,
     MMPlayerDailyStateService,
 )
+from backend.services.mm.image_variants import image_display_urls
 from backend.services.mm.vote_service import SYSTEM_PLAYER_ID
 from backend.utils.exceptions import (
     InsufficientBalanceError,
@@ -92,8 +93,7 @@ async def start_vote_round(
         return StartVoteRoundResponse(
             round_id=round_obj.round_id,
             image_id=round_obj.image_id,
-            image_url=round_obj.image.source_url,
-            thumbnail_url=round_obj.image.thumbnail_url,
+            **image_display_urls(round_obj.image),
             attribution_text=round_obj.image.attribution_text,
             captions=captions,
             cost=round_obj.entry_cost,
@@ -357,7 +357,7 @@ async def get_round_details(
         type="vote",
         status=status,
         image_id=round_obj.image_id,
-        image_url=round_obj.image.source_url,
+        image_url=image_display_urls(round_obj.image)["image_url"],
         cost=round_obj.entry_cost,
         captions=captions,
         chosen_caption_id=round_obj.chosen_caption_id,
@@ -656,14 +656,15 @@ async def get_party_session_status(
         404: Session not found
     """
     try:
+        # Served from the in-memory session state; no per-poll participant queries
         party_service = PartySessionService(db)
-        session = await party_service.get_session_by_id(session_id)
-        if not session:
+        state = await party_service.get_session_state(session_id)
+        if not state:
             raise SessionNotFoundError(f"Session {session_id} not found")
-        await _require_party_member(party_service, session_id, player)
-        status_data = await party_service.get_session_status(session_id)
+        if not state.has_player(player.player_id):
+            raise HTTPException(status_code=403, detail="Not a participant in this session")
 
-        return PartySessionStatusResponse(**status_data)
+        return PartySessionStatusResponse(**state.to_status())
 
     except SessionNotFoundError:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -1089,6 +1090,53 @@ async def leave_party_session(
         raise HTTPException(status_code=500, detail="Failed to leave session")
 
 
+@router.websocket("/lobby/ws")
+async def party_lobby_websocket_endpoint(websocket: WebSocket):
+    """WebSocket endpoint pushing party list changes to players browsing the lobby.
+
+    Sends ``lobby_update`` messages (``upsert``/``remove``) as parties are created,
+    joined, left, started or abandoned. Requires authentication like the session socket.
+    """
+    token = websocket.query_params.get("token")
+    if not token:
+        token = websocket.cookies.get(settings.access_token_cookie_name)
+
+    if not token:
+        logger.warning("Party lobby WebSocket connection attempted without token")
+        await websocket.close(code=4001, reason="No authentication token")
+        return
+
+    try:
+        from backend.database import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as db:
+            payload = AuthService(db, game_type=GameType.QF).decode_access_token(token)
+        player_id_str = payload.get("sub")
+        if not player_id_str:
+            logger.warning("Party lobby WebSocket token missing player_id")
+            await websocket.close(code=4002, reason="Invalid token")
+            return
+        player_id = UUID(player_id_str)
+    except Exception as e:
+        logger.warning(f"Party lobby WebSocket authentication failed: {e}")
+        try:
+            await websocket.close(code=4000, reason="Authentication failed")
+        except Exception:
+            pass  # Connection may already be closed
+        return
+
+    await ws_manager.connect_lobby(player_id, websocket)
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"Party lobby WebSocket error for {player_id=}: {e}", exc_info=True)
+    finally:
+        await ws_manager.disconnect_lobby(player_id)
+
+
 @router.websocket("/{session_id}/ws")
 async def party_websocket_endpoint(
     websocket: WebSocket,
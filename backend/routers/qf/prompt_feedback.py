@@ -91,16 +91,14 @@ async def submit_prompt_feedback(
                 last_updated_at=datetime.now(UTC),
             )
             db.add(feedback)
-            await db.commit()
-            logger.info(f"Created feedback for player {player.player_id}, round {round_id}: {request.feedback_type}")
 
             # Track quest progress for feedback contributions (only for new feedback, not updates)
             from backend.services import QuestService
-            quest_service = QuestService(db)
-            try:
-                await quest_service.increment_feedback_count(player.player_id)
-            except Exception as e:
-                logger.error(f"Failed to update quest progress for feedback: {e}", exc_info=True)
+            from backend.services.qf.quest_events import FeedbackSubmitted
+            await QuestService(db).record_events([FeedbackSubmitted(player.player_id)])
+
+            await db.commit()
+            logger.info(f"Created feedback for player {player.player_id}, round {round_id}: {request.feedback_type}")
 
         return PromptFeedbackResponse(
             success=True,
@@ -115,7 +115,7 @@ async def start_round(
         return StartRoundResponse(
             round_id=round_obj.round_id,
             prompt_text=prompt_text or "",
-            snapshot_answer_count=len(round_obj.snapshot_answer_ids or []),
+            snapshot_answer_count=round_obj.snapshot_size,
             snapshot_total_weight=round_obj.snapshot_total_weight,
             created_at=round_obj.created_at,
         )
@@ -387,7 +387,7 @@ async def get_round(
         return RoundDetails(
             round_id=round_obj.round_id,
             prompt_text=round_obj.prompt.text if round_obj.prompt else "",
-            snapshot_answer_count=len(round_obj.snapshot_answer_ids or []),
+            snapshot_answer_count=round_obj.snapshot_size,
             snapshot_total_weight=round_obj.snapshot_total_weight,
             matched_cluster_count=len(round_obj.matched_clusters or []),
             strikes=round_obj.strikes,
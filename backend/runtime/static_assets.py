@@ -0,0 +1,265 @@
+"""In-memory manifest of a static frontend release.
+
+A release directory is walked once (at startup, or when the ``current``
+pointer is switched to another release) into a ``StaticReleaseManifest``.
+Rebuilds triggered by a request run in a worker thread, so the compression
+work never blocks the event loop.
+Small files such as ``index.html``, manifests and hashed JS/CSS chunks are held
+in memory with gzip and brotli variants and strong ETags, so requests are
+served from a dict lookup without filesystem syscalls or compression work.
+Larger files keep their cached ``stat`` result and are streamed from disk with
+``Range`` support.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import brotli
+
+
+logger = logging.getLogger(__name__)
+
+MEMORY_MAX_FILE_BYTES = 512 * 1024
+MEMORY_MAX_TOTAL_BYTES = 64 * 1024 * 1024
+MIN_COMPRESS_BYTES = 256
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+RELEASE_REVALIDATE_SECONDS = 5.0
+
+# Files that must be revalidated on every load (no content hash in the name)
+REVALIDATED_FILENAMES = frozenset({"index.html", "manifest.webmanifest", "manifest.json", "service-worker.js", "sw.js"})
+
+_COMPRESSIBLE_MEDIA_TYPES = frozenset({
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/wasm",
+    "application/xml",
+    "image/svg+xml",
+})
+_PRECOMPRESSED_SUFFIXES = {".br": "br", ".gz": "gzip"}
+
+
+def _is_compressible(media_type: str) -> bool:
+    return media_type.startswith("text/") or media_type in _COMPRESSIBLE_MEDIA_TYPES
+
+
+def _guess_media_type(path: Path) -> str:
+    if path.suffix == ".webmanifest":
+        return "application/manifest+json"
+    media_type, _ = mimetypes.guess_type(path.name)
+    if media_type == "text/javascript":
+        return "application/javascript"
+    return media_type or "application/octet-stream"
+
+
+@dataclass(frozen=True, slots=True)
+class StaticAsset:
+    """One file of a release, with its in-memory representations when small enough."""
+
+    path: Path
+    size: int
+    media_type: str
+    revalidate: bool
+    etag: str
+    stat_result: os.stat_result
+    body: bytes | None = None
+    # Content-Encoding -> compressed body
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def in_memory(self) -> bool:
+        return self.body is not None
+
+    def representation(self, encoding: str | None) -> tuple[bytes, str]:
+        """Return the body and strong ETag for the negotiated encoding."""
+        if encoding and encoding in self.encoded:
+            return self.encoded[encoding], f'{self.etag[:-1]}-{encoding}"'
+        return self.body or b"", self.etag
+
+
+@dataclass(slots=True)
+class StaticReleaseManifest:
+    """Request path -> asset map for one release directory."""
+
+    root: Path
+    assets: dict[str, StaticAsset]
+    memory_bytes: int = 0
+
+    @property
+    def index(self) -> StaticAsset | None:
+        return self.assets.get("index.html")
+
+    def lookup(self, request_path: str) -> StaticAsset | None:
+        return self.assets.get(request_path.lstrip("/"))
+
+
+def _read_precompressed(path: Path) -> dict[str, bytes]:
+    """Pick up ``.br``/``.gz`` siblings emitted by the frontend build."""
+    encoded = {}
+    for suffix, encoding in _PRECOMPRESSED_SUFFIXES.items():
+        sibling = path.with_name(path.name + suffix)
+        if sibling.is_file():
+            encoded[encoding] = sibling.read_bytes()
+    return encoded
+
+
+def _compress_variants(body: bytes) -> dict[str, bytes]:
+    return {
+        "gzip": gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0),
+        "br": brotli.compress(body, quality=BROTLI_QUALITY),
+    }
+
+
+def build_release_manifest(static_dir: Path) -> StaticReleaseManifest:
+    """Walk a release directory and build its manifest (startup / release switch only)."""
+    root = static_dir.resolve(strict=False)
+    manifest = StaticReleaseManifest(root=root, assets={})
+    if not root.is_dir():
+        return manifest
+
+    started = time.perf_counter()
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            path = Path(dirpath) / filename
+            if path.suffix in _PRECOMPRESSED_SUFFIXES and path.with_suffix("").is_file():
+                continue  # Served as an encoding of its source file
+
+            resolved = path.resolve(strict=False)
+            try:
+                resolved.relative_to(root)
+                stat_result = resolved.stat()
+            except (ValueError, OSError):
+                continue  # Symlink escaping the release, or vanished mid-walk
+
+            relative = path.relative_to(root).as_posix()
+            media_type = _guess_media_type(path)
+            body = None
+            encoded: dict[str, bytes] = {}
+            in_memory = (
+                stat_result.st_size <= MEMORY_MAX_FILE_BYTES
+                and manifest.memory_bytes + stat_result.st_size <= MEMORY_MAX_TOTAL_BYTES
+            )
+            if in_memory:
+                body = resolved.read_bytes()
+                digest = hashlib.sha256(body).hexdigest()[:32]
+                if _is_compressible(media_type) and len(body) >= MIN_COMPRESS_BYTES:
+                    encoded = _read_precompressed(path) or _compress_variants(body)
+                    # Keep only variants that actually save bytes
+                    encoded = {name: data for name, data in encoded.items() if len(data) < len(body)}
+                manifest.memory_bytes += len(body) + sum(len(data) for data in encoded.values())
+            else:
+                digest = hashlib.sha256(
+                    f"{relative}:{stat_result.st_size}:{stat_result.st_mtime_ns}".encode("utf-8")
+                ).hexdigest()[:32]
+
+            manifest.assets[relative] = StaticAsset(
+                path=resolved,
+                size=stat_result.st_size,
+                media_type=media_type,
+                revalidate=filename.lower() in REVALIDATED_FILENAMES,
+                etag=f'"{digest}"',
+                stat_result=stat_result,
+                body=body,
+                encoded=encoded,
+            )
+
+    logger.info(
+        f"Built static manifest for {root}: {len(manifest.assets)} files, "
+        f"{manifest.memory_bytes / 1024:.0f} KiB in memory, {(time.perf_counter() - started) * 1000:.0f}ms"
+    )
+    return manifest
+
+
+class StaticReleaseStore:
+    """Manifests per release directory, rebuilt only when the release pointer moves."""
+
+    def __init__(self, revalidate_seconds: float = RELEASE_REVALIDATE_SECONDS):
+        self.revalidate_seconds = revalidate_seconds
+        self._manifests: dict[Path, StaticReleaseManifest] = {}
+        self._checked_at: dict[Path, float] = {}
+        self._build_locks: dict[Path, asyncio.Lock] = {}
+
+    def preload(self, static_dirs: list[Path]) -> None:
+        """Build manifests synchronously (startup only, before requests are served)."""
+        for static_dir in static_dirs:
+            self.get(static_dir)
+
+    def get(self, static_dir: Path) -> StaticReleaseManifest:
+        """Return the manifest for a release directory, checking for a release switch at most every few seconds."""
+        manifest = self._manifests.get(static_dir)
+        if manifest is not None and not self._due_for_check(static_dir):
+            return manifest
+
+        self._checked_at[static_dir] = time.monotonic()
+        if self._is_stale(static_dir, manifest):
+            manifest = self._manifests[static_dir] = build_release_manifest(static_dir)
+        return manifest
+
+    async def load(self, static_dir: Path) -> StaticReleaseManifest:
+        """Request-path variant of ``get``: rebuilds run in a thread, one at a time per directory."""
+        manifest = self._manifests.get(static_dir)
+        if manifest is not None and not self._due_for_check(static_dir):
+            return manifest
+
+        async with self._build_locks.setdefault(static_dir, asyncio.Lock()):
+            manifest = self._manifests.get(static_dir)
+            if manifest is not None and not self._due_for_check(static_dir):
+                return manifest  # Checked or rebuilt while this request waited
+
+            if self._is_stale(static_dir, manifest):
+                manifest = self._manifests[static_dir] = await asyncio.to_thread(build_release_manifest, static_dir)
+            self._checked_at[static_dir] = time.monotonic()
+        return manifest
+
+    def _due_for_check(self, static_dir: Path) -> bool:
+        return time.monotonic() - self._checked_at.get(static_dir, 0.0) >= self.revalidate_seconds
+
+    @staticmethod
+    def _is_stale(static_dir: Path, manifest: StaticReleaseManifest | None) -> bool:
+        return manifest is None or static_dir.resolve(strict=False) != manifest.root or not manifest.assets
+
+    def clear(self) -> None:
+        self._manifests.clear()
+        self._checked_at.clear()
+        self._build_locks.clear()
+
+
+def negotiate_encoding(accept_encoding: str | None, available: dict[str, bytes]) -> str | None:
+    """Pick the best available Content-Encoding for an Accept-Encoding header (None = identity)."""
+    if not accept_encoding or not available:
+        return None
+
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[coding] = quality
+
+    best, best_quality = None, 0.0
+    # Brotli first so it wins ties with gzip
+    for coding in ("br", "gzip"):
+        if coding not in available:
+            continue
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
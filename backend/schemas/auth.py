@@ -120,6 +120,7 @@ class MagicLinkRequestResponse(BaseModel):
     email: EmailLike
     expires_at: datetime
     message: str
+    delivery_status: str = "sent"  # "pending" while the email is being retried
 
 
 class MagicLinkConsumeRequest(BaseModel):
@@ -29,6 +29,8 @@ class StartVoteRoundResponse(BaseSchema):
     image_id: UUID
     image_url: str
     thumbnail_url: str | None
+    image_srcset: str | None = None  # Width-described variant URLs for <img srcset>
+    image_placeholder: str | None = None  # Inline blurred data URL shown while loading
     attribution_text: str | None
     captions: list[VoteRoundCaption]
     cost: int
@@ -40,6 +42,8 @@ class StartCaptionRoundResponse(BaseSchema):
     image_id: UUID
     image_url: str
     thumbnail_url: str | None
+    image_srcset: str | None = None  # Width-described variant URLs for <img srcset>
+    image_placeholder: str | None = None  # Inline blurred data URL shown while loading
     attribution_text: str | None
     cost: int  # 0 if using free quota, otherwise caption_submission_cost
     used_free_slot: bool
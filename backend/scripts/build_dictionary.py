@@ -0,0 +1,19 @@
+"""Compile backend/data/dictionary.txt into the memory-mapped dictionary index.
+
+Run at build time so worker processes map a ready index on startup:
+
+    python -m backend.scripts.build_dictionary
+"""
+
+import logging
+
+from backend.services.dictionary import DICTIONARY_INDEX, DICTIONARY_SOURCE, build_dictionary_index
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    build_dictionary_index(DICTIONARY_SOURCE, DICTIONARY_INDEX)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,9 @@
 This script:
 1. Scans backend/data/mm_images/ for image files (jpg, jpeg, png, gif, webp)
 2. Creates MMImage records for each new image
-3. Reads seed captions from mm_seed_captions.csv
-4. Creates MMCaption records for seed captions
+3. Builds resized WebP/AVIF variants for images that have none yet
+4. Reads seed captions from mm_seed_captions.csv
+5. Creates MMCaption records for seed captions
 """
 
 import asyncio
@@ -22,6 +23,7 @@ from sqlalchemy import select
 from backend.config import get_settings
 from backend.models.mm.image import MMImage
 from backend.models.mm.caption import MMCaption
+from backend.services.mm.image_variants import build_image_variants, pillow_available
 from backend.utils.sqlite import configure_sqlite_engine
 
 logging.basicConfig(level=logging.INFO)
@@ -77,11 +79,36 @@ def find_image_files() -> list[Path]:
     return image_files
 
 
-async def import_images(db: AsyncSession):
+async def attach_image_variants(image: MMImage, image_path: Path, rebuild: bool = False) -> bool:
+    """Build derived variants for an image and record them on the row.
+
+    Encoding runs in a worker thread; images that already have variants are
+    skipped unless ``rebuild`` is set.
+
+    Returns:
+        True if the image row was updated
+    """
+    if (image.variants and not rebuild) or not pillow_available():
+        return False
+
+    try:
+        variants = await asyncio.to_thread(build_image_variants, image_path, rebuild=rebuild)
+    except Exception as e:
+        logger.error(f"Failed to build variants for {image_path.name}: {e}")
+        return False
+    if not variants:
+        return False
+
+    image.variants = variants
+    return True
+
+
+async def import_images(db: AsyncSession, rebuild_variants: bool = False):
     """Import images and seed captions into the database.
 
     Args:
         db: Database session
+        rebuild_variants: Regenerate derived variants even for images that have them
     """
     # Find image files
     image_files = find_image_files()
@@ -93,6 +120,9 @@ async def import_images(db: AsyncSession):
     # Process each image
     images_created = 0
     captions_created = 0
+    variants_built = 0
+    if not pillow_available():
+        logger.warning("Pillow is not installed; skipping image variant generation")
 
     for image_path in image_files:
         filename = image_path.name
@@ -106,6 +136,7 @@ async def import_images(db: AsyncSession):
         existing_image = result.scalar_one_or_none()
 
         if existing_image:
+            image = existing_image
             image_id = existing_image.image_id
         else:
             # Create new image record
@@ -125,6 +156,9 @@ async def import_images(db: AsyncSession):
             images_created += 1
             logger.info(f"Created image: {filename} (ID: {image_id})")
 
+        if await attach_image_variants(image, image_path, rebuild=rebuild_variants):
+            variants_built += 1
+
         # Check existing captions for this image
         stmt = select(MMCaption).where(MMCaption.image_id == image_id)
         result = await db.execute(stmt)
@@ -164,10 +198,10 @@ async def import_images(db: AsyncSession):
     # Commit all changes
     await db.commit()
 
-    logger.info(f"Import complete: {images_created=} {captions_created=} {len(image_files)=}")
+    logger.info(f"Import complete: {images_created=} {captions_created=} {variants_built=} {len(image_files)=}")
 
 
-async def main():
+async def main(rebuild_variants: bool = False):
     """Main entry point."""
     logger.info("Starting MM image import...")
 
@@ -176,11 +210,15 @@ async def main():
     async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
     async with async_session() as session:
-        await import_images(session)
+        await import_images(session, rebuild_variants=rebuild_variants)
 
     await engine.dispose()
     logger.info("Done!")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rebuild-variants", action="store_true", help="Regenerate derived image variants")
+    asyncio.run(main(rebuild_variants=parser.parse_args().rebuild_variants))
\ No newline at end of file
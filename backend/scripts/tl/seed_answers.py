@@ -16,6 +16,7 @@ from backend.config import get_settings
 from backend.models.tl import TLPrompt, TLAnswer
 from backend.services.tl.matching_service import TLMatchingService
 from backend.services.tl.clustering_service import TLClusteringService
+from backend.services.tl.prompt_service import TLPromptService
 from backend.utils.sqlite import configure_sqlite_engine
 
 logging.basicConfig(level=logging.INFO)
@@ -145,6 +146,8 @@ async def seed_answers(db: AsyncSession, force: bool = False):
         created = 0
         skipped = 0
         failed = 0
+        # Prompts whose answers were bulk-deleted (bypasses the answer count hooks)
+        recount_prompt_ids = set()
 
         for prompt_text, completions in completions_map.items():
             prompt_id = prompts_by_text.get(prompt_text)
@@ -172,6 +175,7 @@ async def seed_answers(db: AsyncSession, force: bool = False):
                             )
                         )
                         await db.flush()
+                        recount_prompt_ids.add(prompt_id)
 
                     # Generate embedding (pass db for transaction control)
                     embedding = await matching_service.generate_embedding(completion_text, db=db)
@@ -208,6 +212,8 @@ async def seed_answers(db: AsyncSession, force: bool = False):
                     logger.warning(f"Failed to seed answer '{completion_text[:30]}...': {e}")
                     failed += 1
 
+        await TLPromptService.refresh_answer_counts(db, recount_prompt_ids)
+
         # Final commit for any remaining answers
         await db.commit()
         if created > 0:
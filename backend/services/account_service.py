@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Literal
 
-from sqlalchemy import bindparam, inspect, select, text, update
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.config import get_settings
@@ -20,8 +20,11 @@ from backend.models.magic_link import MagicLink
 from backend.models.player import Player
 from backend.models.refresh_token import RefreshToken
 from backend.services.auth_service import AuthService
-from backend.services.magic_link_mailer import MagicLinkMailer, MagicLinkMailerError
+from backend.services.email_outbox import MAGIC_LINK_EMAIL, EmailOutboxDispatcher, enqueue_email
+from backend.services.magic_link_mailer import MagicLinkMailer
+from backend.services.player_merge_plan import get_player_reassignment_plan
 from backend.services.player_service import PlayerService
+from backend.services.refresh_session_cache import get_refresh_session_cache
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +44,8 @@ class MagicLinkRequestResult:
     magic_link_id: uuid.UUID
     email: str
     expires_at: datetime
+    # "sent", "pending" (retrying in the background) or "sending"
+    delivery_status: str = "sent"
 
 
 @dataclass(slots=True)
@@ -129,6 +134,7 @@ class AccountService:
         return account
 
     async def _revoke_refresh_tokens_for_player(self, player_id: uuid.UUID) -> None:
+        get_refresh_session_cache().revoke_player(player_id)
         await self.db.execute(
             update(RefreshToken)
             .where(RefreshToken.player_id == player_id)
@@ -333,49 +339,13 @@ class AccountService:
     ) -> None:
         """Move player-owned history rows from a guest to the saved account."""
 
-        skipped_tables = {
-            "accounts",
-            "magic_links",
-            "refresh_tokens",
-            "qf_daily_bonuses",
-            "mm_daily_bonuses",
-            "ir_daily_bonuses",
-            "tl_daily_bonuses",
-            "mm_player_daily_states",
-            "tl_player_daily_states",
-        }
-
-        def _sync_reassign(sync_session) -> None:
-            conn = sync_session.connection()
-            inspector = inspect(conn)
-            player_id_type = Player.__table__.c.player_id.type
-
-            for table_name in inspector.get_table_names():
-                if table_name in skipped_tables or table_name.endswith("_player_data"):
-                    continue
-
-                for fk in inspector.get_foreign_keys(table_name):
-                    if fk.get("referred_table") != "players":
-                        continue
-
-                    for column_name in fk.get("constrained_columns", []):
-                        statement = text(
-                            f'UPDATE "{table_name}" '
-                            f'SET "{column_name}" = :target_player_id '
-                            f'WHERE "{column_name}" = :source_player_id'
-                        ).bindparams(
-                            bindparam("target_player_id", type_=player_id_type),
-                            bindparam("source_player_id", type_=player_id_type),
-                        )
-                        sync_session.execute(
-                            statement,
-                            {
-                                "target_player_id": target_player_id,
-                                "source_player_id": source_player_id,
-                            },
-                        )
-
-        await self.db.run_sync(_sync_reassign)
+        tables = await get_player_reassignment_plan().execute(self.db, source_player_id, target_player_id)
+        logger.info(
+            "Reassigned guest %s rows in %d tables: %s",
+            source_player_id,
+            len(tables),
+            ", ".join(tables) or "none",
+        )
 
     async def _merge_guest_into_saved_player(
         self,
@@ -476,6 +446,9 @@ class AccountService:
             if guest_player is None:
                 raise MagicLinkError("guest_player_not_found")
 
+        if frontend_origin is None:
+            raise MagicLinkError("invalid_frontend_origin")
+
         raw_token = secrets.token_urlsafe(48)
         link = MagicLink(
             magic_link_id=uuid.uuid4(),
@@ -485,38 +458,34 @@ class AccountService:
             redirect_path=normalized_redirect_path,
             expires_at=datetime.now(UTC) + timedelta(minutes=self.settings.magic_link_exp_minutes),
         )
-        self.db.add(link)
-        await self.db.flush()
-
-        if frontend_origin is None:
-            await self.db.rollback()
-            raise MagicLinkError("invalid_frontend_origin")
-
         link_url = self._build_magic_link_url(frontend_origin, normalized_redirect_path, raw_token)
-
-        try:
-            await self.mailer.send_magic_link(
-                to_email=normalized_email,
-                link_url=link_url,
-                expires_at=link.expires_at,
-            )
-        except MagicLinkMailerError as exc:
-            await self.db.rollback()
-            raise MagicLinkError("magic_link_email_failed") from exc
-
+        self.db.add(link)
+        outbox_email = enqueue_email(
+            self.db,
+            kind=MAGIC_LINK_EMAIL,
+            to_email=normalized_email,
+            payload={"link_url": link_url, "expires_at": link.expires_at.isoformat()},
+        )
+        # Link and outbox row commit together; the send happens after the writer lock is released
         await self.db.commit()
 
+        delivery_status = await EmailOutboxDispatcher(self.db, self.mailer).deliver(outbox_email.email_id)
+        if delivery_status == "failed":
+            raise MagicLinkError("magic_link_email_failed")
+
         logger.info(
-            "Requested magic link %s for %s (guest=%s)",
+            "Requested magic link %s for %s (guest=%s, delivery=%s)",
             link.magic_link_id,
             normalized_email,
             bool(guest_player_id),
+            delivery_status,
         )
 
         return MagicLinkRequestResult(
             magic_link_id=link.magic_link_id,
             email=normalized_email,
             expires_at=link.expires_at,
+            delivery_status=delivery_status,
         )
 
     async def consume_magic_link(
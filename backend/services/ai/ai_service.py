@@ -23,6 +23,7 @@ from backend.models.qf.round import Round
 from backend.models.qf.phraseset import Phraseset
 from backend.models.qf.ai_phrase_cache import QFAIPhraseCache
 from backend.models.qf.ai_quip_cache import QFAIQuipCache, QFAIQuipPhrase, QFAIQuipPhraseUsage
+from backend.services.ai.llm_gateway import get_llm_gateway
 from backend.services.ai.metrics_service import AIMetricsService, MetricsTracker
 from backend.services.ai.prompt_builder import build_impostor_prompt
 from backend.utils.model_registry import GameType, AIPlayerType
@@ -34,7 +35,8 @@ logger = logging.getLogger(__name__)
 
 
 AI_PLAYER_EMAIL_DOMAIN = "@quipflip.internal"
-IR_AI_PLAYER_EMAIL = "ai_backronym_001@initialreaction.internal"
+# Entries and votes are unique per (player, set), so filling a set needs several IR AI accounts
+IR_AI_PLAYER_EMAIL_PATTERN = "ai_backronym_%@initialreaction.internal"
 
 
 class AIServiceError(RuntimeError):
@@ -133,15 +135,9 @@ class AIService:
 
         logger.info(f"Sending {prompt_text=} to AI provider {self.provider} {self.ai_model}")
         start_time = datetime.now(UTC)
-        if self.provider == "openai":
-            from backend.services.ai.openai_api import generate_copy
-        elif self.provider == "gemini":
-            from backend.services.ai.gemini_api import generate_copy
-        else:
-            raise ValueError(f"Unknown AI provider: {self.provider}")
-
-        response = await generate_copy(
+        response = await get_llm_gateway().complete(
             prompt_text,
+            provider=self.provider,
             model=self.ai_model,
             timeout=self.settings.ai_timeout_seconds,
         )
@@ -192,7 +188,7 @@ class AIService:
             AIPlayerType.QF_IMPOSTOR: f"ai_impostor_%{AI_PLAYER_EMAIL_DOMAIN}",
             AIPlayerType.QF_VOTER: f"ai_voter_%{AI_PLAYER_EMAIL_DOMAIN}",
             AIPlayerType.QF_PARTY: f"ai_party_%{AI_PLAYER_EMAIL_DOMAIN}",
-            AIPlayerType.IR_PLAYER: IR_AI_PLAYER_EMAIL,
+            AIPlayerType.IR_PLAYER: IR_AI_PLAYER_EMAIL_PATTERN,
         }
         target_email = email_patterns.get(ai_player_type)
         if target_email is None:
@@ -1113,6 +1109,32 @@ class AIService:
         orchestrator = QFBackupOrchestrator(self)
         await orchestrator.run_backup_cycle()
 
+    @staticmethod
+    def _normalize_backronym(word_upper: str, words: list[str]) -> list[str]:
+        """Coerce raw AI words into one valid 2-15 letter word per letter of ``word_upper``."""
+        letter_count = len(word_upper)
+
+        # Validate we got the right number of words
+        if len(words) != letter_count:
+            logger.warning(
+                f"AI generated {len(words)} words for {word_upper} "
+                f"(expected {letter_count}), truncating/padding"
+            )
+            words = words[:letter_count]
+            while len(words) < letter_count:
+                words.append("WORD")
+
+        # Validate each word is 2-15 chars
+        validated_words = []
+        for w in words:
+            w_clean = w.upper().replace(".", "").replace(",", "").strip()
+            if 2 <= len(w_clean) <= 15 and w_clean.isalpha():
+                validated_words.append(w_clean)
+            else:
+                logger.warning(f"Invalid word in backronym: {w}")
+                validated_words.append("WORD")
+        return validated_words
+
     async def generate_backronym(self, word: str) -> list[str]:
         """
         Generate a clever backronym for a word.
@@ -1130,7 +1152,6 @@ class AIService:
 
         try:
             word_upper = word.upper()
-            letter_count = len(word_upper)
 
             # Build prompt
             prompt = build_backronym_prompt(word_upper, count=1)
@@ -1139,27 +1160,7 @@ class AIService:
             response_text = await self._prompt_ai(prompt)
 
             # Parse response - should be words separated by spaces
-            words = response_text.strip().split()
-
-            # Validate we got the right number of words
-            if len(words) != letter_count:
-                logger.warning(
-                    f"AI generated {len(words)} words for {word} "
-                    f"(expected {letter_count}), truncating/padding"
-                )
-                words = words[:letter_count]
-                while len(words) < letter_count:
-                    words.append("WORD")
-
-            # Validate each word is 2-15 chars
-            validated_words = []
-            for w in words:
-                w_clean = w.upper().replace(".", "").replace(",", "").strip()
-                if 2 <= len(w_clean) <= 15 and w_clean.isalpha():
-                    validated_words.append(w_clean)
-                else:
-                    logger.warning(f"Invalid word in backronym: {w}")
-                    validated_words.append("WORD")
+            validated_words = self._normalize_backronym(word_upper, response_text.strip().split())
 
             logger.info(f"Generated backronym for {word}: {' '.join(validated_words)}")
             return validated_words
@@ -1168,6 +1169,59 @@ class AIService:
             logger.error(f"Failed to generate backronym for {word}: {e}")
             raise AICopyError(f"Backronym generation failed: {e!s}") from e
 
+    async def generate_backronyms(self, word: str, count: int) -> list[list[str]]:
+        """
+        Generate several distinct backronyms for a word with a single AI request.
+
+        Falls back to one request per missing backronym when the multi-candidate
+        response yields fewer usable options than requested.
+
+        Args:
+            word: The target word
+            count: Number of backronyms needed
+
+        Returns:
+            list[list[str]]: ``count`` backronym word arrays
+
+        Raises:
+            AICopyError: If backronym generation fails
+        """
+        from backend.services.ai.prompt_builder import build_backronym_prompt
+
+        if count <= 0:
+            return []
+        if count == 1:
+            return [await self.generate_backronym(word)]
+
+        word_upper = word.upper()
+        try:
+            response_text = await self._prompt_ai(build_backronym_prompt(word_upper, count=count))
+        except Exception as e:
+            logger.error(f"Failed to generate {count} backronyms for {word}: {e}")
+            raise AICopyError(f"Backronym generation failed: {e!s}") from e
+
+        backronyms: list[list[str]] = []
+        for option in response_text.replace("\n", ",").split(","):
+            words = option.strip().strip('"').split()
+            if len(words) != len(word_upper):
+                continue
+            candidate = self._normalize_backronym(word_upper, words)
+            if candidate not in backronyms:
+                backronyms.append(candidate)
+            if len(backronyms) == count:
+                break
+
+        if len(backronyms) < count:
+            logger.info(
+                f"Multi-candidate request for {word} yielded {len(backronyms)}/{count} backronyms; topping up"
+            )
+            backronyms.extend(
+                await asyncio.gather(*(self.generate_backronym(word) for _ in range(count - len(backronyms))))
+            )
+
+        logger.info(f"Generated {len(backronyms)} backronyms for {word}")
+        return backronyms
+
     async def generate_backronym_vote(self, word: str, backronyms: list[list[str]]) -> int:
         """
         Generate AI vote on backronym entries.
@@ -2,11 +2,13 @@
 Helper for interacting with the Gemini generative API.
 
 Provides structured gameplay decisions with error handling and fallback logic
-for the Think Alike bot system.
+for the Think Alike bot system. Async calls go through the shared
+``LLMGateway``, which runs the synchronous SDK off the event loop.
 """
 
 import sys
 from backend.config import get_settings
+from backend.services.ai.llm_gateway import GeminiError, get_llm_gateway
 
 try:
     from google import genai
@@ -20,10 +22,6 @@ __all__ = ["GeminiError", "generate", "generate_response", "generate_copy"]
 settings = get_settings()
 
 
-class GeminiError(RuntimeError):
-    """Raised when the Gemini API cannot be contacted or returns an error."""
-
-
 async def generate_response(
         prompt: str,
         model: str = "gemini-2.5-flash-lite",
@@ -35,7 +33,7 @@ async def generate_response(
     Args:
         prompt: Prompt to send to the Gemini API
         model: Gemini model to use (default: gemini-2.5-flash-lite)
-        timeout: Request timeout in seconds (currently unused, reserved for future)
+        timeout: Request timeout in seconds
 
     Returns:
         The generated string
@@ -43,45 +41,7 @@ async def generate_response(
     Raises:
         GeminiError: If API key is missing or API call fails
     """
-    if genai is None:
-        raise GeminiError("google-genai package not installed. Install with: pip install google-genai")
-
-    if not settings.gemini_api_key:
-        raise GeminiError("GEMINI_API_KEY environment variable must be set")
-
-    try:
-        client = genai.Client(api_key=settings.gemini_api_key)
-
-        contents = [
-            types.Content(
-                role="user",
-                parts=[types.Part.from_text(text=prompt)],
-            ),
-        ]
-
-        generate_content_config = types.GenerateContentConfig(
-            thinking_config=types.ThinkingConfig(thinking_budget=0),
-        )
-
-        output_text = ""
-        for chunk in client.models.generate_content_stream(
-            model=model,
-            contents=contents,
-            config=generate_content_config,
-        ):
-            if chunk.text is not None:
-                output_text += chunk.text
-
-        if not output_text:
-            raise GeminiError("Gemini API returned empty response")
-
-        # Clean and return the generated phrase
-        return output_text.strip()
-
-    except Exception as exc:
-        if isinstance(exc, GeminiError):
-            raise
-        raise GeminiError(f"Failed to contact Gemini API: {exc}") from exc
+    return await get_llm_gateway().complete(prompt, provider="gemini", model=model, timeout=timeout)
 
 
 # Backwards-compatible alias used by older AIService tests and call sites.
@@ -3,17 +3,56 @@ Initial Reaction Backup Orchestrator for AI-generated backronyms and votes.
 
 This module handles the backup cycle logic for Initial Reaction game, finding stalled
 backronym sets and generating AI entries and votes to keep the game moving.
+
+Each cycle runs as a batched pipeline: every stalled set's deficit is computed up
+front, all backronyms and votes are generated concurrently under a semaphore (one
+multi-candidate request per set for entries), and the results are applied to each
+set in a single transaction. Cycle time therefore tracks the slowest set rather
+than the sum of every provider call.
 """
 
+import asyncio
 import logging
+from dataclasses import dataclass, field
+from uuid import UUID
 from sqlalchemy import select
 
 from backend.services.ir.backronym_set_service import BackronymSetService
 from backend.models.ir.backronym_entry import BackronymEntry
+from backend.models.ir.backronym_vote import BackronymVote
 from backend.utils.model_registry import AIPlayerType
 
 logger = logging.getLogger(__name__)
 
+SET_SIZE = 5
+
+
+@dataclass
+class _EntryFill:
+    """Open set waiting for AI entries."""
+
+    set_id: str
+    word: str
+    deficit: int
+    participant_ids: set = field(default_factory=set)
+    backronyms: list[list[str]] = field(default_factory=list)
+
+
+@dataclass
+class _VoteFill:
+    """Voting set waiting for AI votes."""
+
+    set_id: str
+    word: str
+    deficit: int
+    entries: list[BackronymEntry]
+    voter_ids: set = field(default_factory=set)
+    choices: list[int] = field(default_factory=list)
+
+    @property
+    def participant_ids(self) -> set:
+        return {entry.player_id for entry in self.entries}
+
 
 class IRBackupOrchestrator:
     """
@@ -34,6 +73,97 @@ class IRBackupOrchestrator:
         self.db = ai_service.db
         self.settings = ai_service.settings
 
+    async def _plan_entry_fills(self, set_service: BackronymSetService) -> list[_EntryFill]:
+        """Compute the entry deficit of every stalled open set."""
+        stalled_open = await set_service.get_stalled_open_sets(minutes=self.settings.ir_ai_backup_delay_minutes)
+        if not stalled_open:
+            return []
+
+        fills = {
+            str(set_obj.set_id): _EntryFill(str(set_obj.set_id), set_obj.word, SET_SIZE - set_obj.entry_count)
+            for set_obj in stalled_open
+        }
+        result = await self.db.execute(
+            select(BackronymEntry.set_id, BackronymEntry.player_id)
+            .where(BackronymEntry.set_id.in_([set_obj.set_id for set_obj in stalled_open]))
+        )
+        for set_id, player_id in result.all():
+            fills[str(set_id)].participant_ids.add(player_id)
+        return [fill for fill in fills.values() if fill.deficit > 0]
+
+    async def _plan_vote_fills(self, set_service: BackronymSetService) -> list[_VoteFill]:
+        """Compute the vote deficit of every stalled voting set that has a full slate of entries."""
+        stalled_voting = await set_service.get_stalled_voting_sets(minutes=self.settings.ir_ai_backup_delay_minutes)
+        if not stalled_voting:
+            return []
+
+        set_ids = [set_obj.set_id for set_obj in stalled_voting]
+        entries_by_set: dict[str, list[BackronymEntry]] = {}
+        entries_result = await self.db.execute(
+            select(BackronymEntry)
+            .where(BackronymEntry.set_id.in_(set_ids))
+            .order_by(BackronymEntry.submitted_at)
+        )
+        for entry in entries_result.scalars().all():
+            entries_by_set.setdefault(str(entry.set_id), []).append(entry)
+
+        voters_by_set: dict[str, set] = {}
+        voters_result = await self.db.execute(
+            select(BackronymVote.set_id, BackronymVote.player_id).where(BackronymVote.set_id.in_(set_ids))
+        )
+        for set_id, player_id in voters_result.all():
+            voters_by_set.setdefault(str(set_id), set()).add(player_id)
+
+        fills = []
+        for set_obj in stalled_voting:
+            set_id = str(set_obj.set_id)
+            entries = entries_by_set.get(set_id, [])
+            if len(entries) < SET_SIZE:
+                logger.warning(f"Set {set_id} has < 5 entries, skipping voting fill")
+                continue
+            fills.append(_VoteFill(
+                set_id=set_id,
+                word=set_obj.word,
+                deficit=SET_SIZE - set_obj.vote_count,
+                entries=entries,
+                voter_ids=voters_by_set.get(set_id, set()),
+            ))
+        return [fill for fill in fills if fill.deficit > 0]
+
+    async def _generate(self, entry_fills: list[_EntryFill], vote_fills: list[_VoteFill]) -> None:
+        """Run every provider call for this cycle concurrently, bounded by a semaphore."""
+        semaphore = asyncio.Semaphore(max(1, self.settings.ir_ai_backup_concurrency))
+
+        async def _fill_entries(fill: _EntryFill) -> None:
+            async with semaphore:
+                fill.backronyms = await self.ai_service.generate_backronyms(fill.word, fill.deficit)
+
+        async def _fill_vote(fill: _VoteFill, backronyms: list[list[str]]) -> None:
+            async with semaphore:
+                fill.choices.append(await self.ai_service.generate_backronym_vote(fill.word, backronyms))
+
+        tasks = [_fill_entries(fill) for fill in entry_fills]
+        for fill in vote_fills:
+            backronyms = [entry.backronym_text for entry in fill.entries]
+            tasks.extend(_fill_vote(fill, backronyms) for _ in range(fill.deficit))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"AI generation failed during IR backup cycle: {result}")
+
+    async def _pick_ai_players(self, count: int, excluded: set) -> list[str]:
+        """Choose ``count`` distinct AI accounts not already present in the set."""
+        excluded = set(excluded)
+        player_ids = []
+        for _ in range(count):
+            ai_player = await self.ai_service.get_or_create_ai_player(
+                AIPlayerType.IR_PLAYER, excluded=list(excluded)
+            )
+            excluded.add(ai_player.player_id)
+            player_ids.append(str(ai_player.player_id))
+        return player_ids
+
     async def run_backup_cycle(self) -> None:
         """
         Run backup cycle for Initial Reaction game.
@@ -48,87 +178,58 @@ class IRBackupOrchestrator:
         }
 
         try:
-            # Get or create IR AI player
-            ai_player = await self.ai_service.get_or_create_ai_player(AIPlayerType.IR_PLAYER)
-
             set_service = BackronymSetService(self.db)
 
-            # Get stalled open sets
-            stalled_open = await set_service.get_stalled_open_sets(
-                minutes=self.settings.ir_ai_backup_delay_minutes
-            )
-            stats["sets_checked"] = len(stalled_open)
+            # 1. Plan: compute every set's deficit up front
+            entry_fills = await self._plan_entry_fills(set_service)
+            vote_fills = await self._plan_vote_fills(set_service)
+            stats["sets_checked"] = len(entry_fills)
 
-            # Fill stalled open sets
-            for set_obj in stalled_open:
-                try:
-                    while set_obj.entry_count < 5:
-                        # Generate backronym
-                        backronym = await self.ai_service.generate_backronym(set_obj.word)
-
-                        # Add entry
-                        entry = await set_service.add_entry(
-                            set_id=str(set_obj.set_id),
-                            player_id=str(ai_player.player_id),
-                            backronym_text=backronym,
-                            is_ai=True,
-                        )
-                        stats["entries_generated"] += 1
-                        logger.info(
-                            f"AI entry {entry.entry_id} added to set {set_obj.set_id}"
-                        )
-
-                        # Refresh set to get updated count
-                        set_obj = await set_service.get_set_by_id(str(set_obj.set_id))
-                        if not set_obj:
-                            break
+            # 2. Generate: all provider calls concurrently
+            await self._generate(entry_fills, vote_fills)
 
+            # 3. Apply: one transaction per set
+            # AI accounts that wrote an entry this cycle, so they never vote on the same set
+            entry_authors: dict[str, set] = {}
+            for fill in entry_fills:
+                if not fill.backronyms:
+                    stats["errors"] += 1
+                    continue
+                try:
+                    player_ids = await self._pick_ai_players(len(fill.backronyms), fill.participant_ids)
+                    entries = await set_service.add_entries(
+                        set_id=fill.set_id,
+                        player_backronyms=list(zip(player_ids, fill.backronyms)),
+                        is_ai=True,
+                    )
+                    entry_authors[fill.set_id] = {UUID(str(entry.player_id)) for entry in entries}
+                    stats["entries_generated"] += len(entries)
+                    logger.info(f"AI added {len(entries)} entries to set {fill.set_id}")
                 except Exception as e:
-                    logger.error(f"Error filling set {set_obj.set_id}: {e}")
+                    logger.error(f"Error filling set {fill.set_id}: {e}")
                     stats["errors"] += 1
 
-            # Get stalled voting sets
-            stalled_voting = await set_service.get_stalled_voting_sets(minutes=self.settings.ir_ai_backup_delay_minutes)
-
-            # Fill voting for stalled sets
-            for set_obj in stalled_voting:
+            for fill in vote_fills:
+                if not fill.choices:
+                    stats["errors"] += 1
+                    continue
                 try:
-                    # Get entries for this set
-                    entries_stmt = select(BackronymEntry).where(BackronymEntry.set_id == str(set_obj.set_id))
-                    entries_result = await self.db.execute(entries_stmt)
-                    entries = entries_result.scalars().all()
-
-                    if len(entries) < 5:
-                        logger.warning(f"Set {set_obj.set_id} has < 5 entries, skipping voting fill")
-                        continue
-
-                    # Generate votes until we have 5
-                    while set_obj.vote_count < 5:
-                        # Get backronym texts as word arrays
-                        backronym_strs = [e.backronym_text for e in entries]
-
-                        # Generate vote
-                        chosen_index = await self.ai_service.generate_backronym_vote(set_obj.word, backronym_strs)
-                        chosen_entry_id = entries[chosen_index].entry_id
-
-                        # Add vote
-                        vote = await set_service.add_vote(
-                            set_id=str(set_obj.set_id),
-                            player_id=str(ai_player.player_id),
-                            chosen_entry_id=str(chosen_entry_id),
-                            is_participant_voter=False,
-                            is_ai=True,
-                        )
-                        stats["votes_generated"] += 1
-                        logger.info(f"AI vote {vote.vote_id} added to set {set_obj.set_id}")
-
-                        # Refresh set
-                        set_obj = await set_service.get_set_by_id(str(set_obj.set_id))
-                        if not set_obj:
-                            break
-
+                    # Authors may not cast non-participant votes on their own set
+                    excluded = fill.participant_ids | fill.voter_ids | entry_authors.get(fill.set_id, set())
+                    player_ids = await self._pick_ai_players(len(fill.choices), excluded)
+                    votes = await set_service.add_votes(
+                        set_id=fill.set_id,
+                        player_choices=[
+                            (player_id, str(fill.entries[choice].entry_id))
+                            for player_id, choice in zip(player_ids, fill.choices)
+                        ],
+                        is_participant_voter=False,
+                        is_ai=True,
+                    )
+                    stats["votes_generated"] += len(votes)
+                    logger.info(f"AI added {len(votes)} votes to set {fill.set_id}")
                 except Exception as e:
-                    logger.error(f"Error filling votes for set {set_obj.set_id}: {e}")
+                    logger.error(f"Error filling votes for set {fill.set_id}: {e}")
                     stats["errors"] += 1
 
             await self.db.commit()
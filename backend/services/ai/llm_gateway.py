@@ -0,0 +1,321 @@
+"""
+Unified async gateway to the LLM providers.
+
+Owns one long-lived client per provider so HTTP connection pools and TLS
+sessions are reused across calls, runs the synchronous Gemini SDK off the event
+loop (with the timeout applied to the request itself, so abandoned worker
+threads do not outlive their provider slot), and applies per-provider
+concurrency limits and timeouts. Callers use
+``complete()`` for text generation and ``embed()`` for embeddings instead of
+constructing SDK clients themselves.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from backend.config import get_settings
+
+try:
+    import httpx
+    from openai import AsyncOpenAI, OpenAIError
+except ImportError:
+    httpx = None  # type: ignore
+    AsyncOpenAI = None  # type: ignore
+    OpenAIError = Exception  # type: ignore
+
+try:
+    from google import genai
+    from google.genai import types
+except ImportError:
+    genai = None  # type: ignore
+    types = None  # type: ignore
+
+__all__ = [
+    "LLMGatewayError",
+    "OpenAIAPIError",
+    "GeminiError",
+    "LLMGateway",
+    "get_llm_gateway",
+]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SYSTEM_PROMPT = "Play a creative word game."
+DEFAULT_EMBEDDING_TIMEOUT_SECONDS = 30
+DEFAULT_MODERATION_TIMEOUT_SECONDS = 10
+
+
+class LLMGatewayError(RuntimeError):
+    """Raised when an LLM provider cannot be contacted or returns an error."""
+
+
+class OpenAIAPIError(LLMGatewayError):
+    """Raised when the OpenAI API cannot be contacted or returns an error."""
+
+
+class GeminiError(LLMGatewayError):
+    """Raised when the Gemini API cannot be contacted or returns an error."""
+
+
+class LLMGateway:
+    """Pooled provider clients behind a single ``complete()`` / ``embed()`` API."""
+
+    def __init__(self, openai_http_client: Optional["httpx.AsyncClient"] = None):
+        # Injected transport (tests point this at a stub server)
+        self._openai_http_client_override = openai_http_client
+        self._openai_client: Optional["AsyncOpenAI"] = None
+        self._gemini_client = None
+        self._limits: dict[str, asyncio.Semaphore] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _bind_loop(self) -> None:
+        """Rebuild loop-bound resources when called from a different event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._limits = {}
+        # httpx connection pools cannot be shared across event loops
+        self._openai_client = None
+
+    def _limit(self, provider: str) -> asyncio.Semaphore:
+        semaphore = self._limits.get(provider)
+        if semaphore is None:
+            settings = get_settings()
+            max_concurrency = (
+                settings.ai_openai_max_concurrency if provider == "openai" else settings.ai_gemini_max_concurrency
+            )
+            semaphore = self._limits[provider] = asyncio.Semaphore(max(1, max_concurrency))
+        return semaphore
+
+    def _openai(self) -> "AsyncOpenAI":
+        if AsyncOpenAI is None:
+            raise OpenAIAPIError("openai package not installed. Install with: pip install openai")
+
+        settings = get_settings()
+        if not settings.openai_api_key:
+            raise OpenAIAPIError("OPENAI_API_KEY environment variable must be set")
+
+        if self._openai_client is None:
+            http_client = self._openai_http_client_override
+            if http_client is None:
+                max_concurrency = max(1, settings.ai_openai_max_concurrency)
+                http_client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=max_concurrency,
+                        max_keepalive_connections=max_concurrency,
+                    ),
+                )
+            self._openai_client = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                base_url=settings.ai_openai_base_url or None,
+                timeout=settings.ai_timeout_seconds,
+                http_client=http_client,
+            )
+        return self._openai_client
+
+    def _gemini(self):
+        if genai is None:
+            raise GeminiError("google-genai package not installed. Install with: pip install google-genai")
+
+        settings = get_settings()
+        if not settings.gemini_api_key:
+            raise GeminiError("GEMINI_API_KEY environment variable must be set")
+
+        if self._gemini_client is None:
+            # The sync client owns a thread-safe connection pool; calls run in worker threads
+            self._gemini_client = genai.Client(api_key=settings.gemini_api_key)
+        return self._gemini_client
+
+    async def complete(
+            self,
+            prompt: str,
+            *,
+            provider: Optional[str] = None,
+            model: Optional[str] = None,
+            system_prompt: str = DEFAULT_SYSTEM_PROMPT,
+            timeout: Optional[float] = None,
+    ) -> str:
+        """
+        Generate a text completion.
+
+        Args:
+            prompt: User prompt to send
+            provider: "openai" or "gemini" (default: settings.ai_provider)
+            model: Model name (default: the provider's configured model)
+            system_prompt: System instruction (OpenAI only; Gemini receives the prompt alone)
+            timeout: Overall timeout in seconds (default: settings.ai_timeout_seconds)
+
+        Returns:
+            The stripped response text
+
+        Raises:
+            OpenAIAPIError / GeminiError: If the provider call fails or returns nothing
+        """
+        settings = get_settings()
+        provider = (provider or settings.ai_provider).lower()
+        timeout = timeout or settings.ai_timeout_seconds
+        self._bind_loop()
+
+        if provider == "openai":
+            call = self._complete_openai(prompt, model or settings.ai_openai_model, system_prompt, timeout)
+            error_type = OpenAIAPIError
+        elif provider == "gemini":
+            call = self._complete_gemini(prompt, model or settings.ai_gemini_model, timeout)
+            error_type = GeminiError
+        else:
+            raise LLMGatewayError(f"Unknown AI provider: {provider}")
+
+        return await self._run(provider, call, timeout, error_type)
+
+    async def embed(
+            self,
+            text: str,
+            *,
+            model: Optional[str] = None,
+            dimensions: Optional[int] = None,
+            timeout: Optional[float] = None,
+    ) -> list[float]:
+        """Generate an embedding vector with OpenAI."""
+        settings = get_settings()
+        timeout = timeout or DEFAULT_EMBEDDING_TIMEOUT_SECONDS
+        self._bind_loop()
+        call = self._embed_openai(text, model or settings.embedding_model, dimensions, timeout)
+        return await self._run("openai", call, timeout, OpenAIAPIError)
+
+    async def moderate(self, text: str, *, timeout: Optional[float] = None) -> bool:
+        """Return True when OpenAI's moderation endpoint does not flag the text."""
+        timeout = timeout or DEFAULT_MODERATION_TIMEOUT_SECONDS
+        self._bind_loop()
+        return await self._run("openai", self._moderate_openai(text, timeout), timeout, OpenAIAPIError)
+
+    async def _run(self, provider: str, call, timeout: float, error_type: type[LLMGatewayError]):
+        """Run a provider call under its concurrency limit and timeout, normalising errors."""
+        try:
+            async with self._limit(provider):
+                return await asyncio.wait_for(call, timeout=timeout)
+        except LLMGatewayError:
+            raise
+        except asyncio.TimeoutError as exc:
+            raise error_type(f"{provider} request timed out after {timeout}s") from exc
+        except OpenAIError as exc:
+            raise error_type(f"OpenAI API error: {exc}") from exc
+        except Exception as exc:
+            raise error_type(f"Failed to contact {provider} API: {exc}") from exc
+        finally:
+            call.close()
+
+    async def _complete_openai(self, prompt: str, model: str, system_prompt: str, timeout: float) -> str:
+        client = self._openai()
+        response = await client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            timeout=timeout,
+        )
+
+        if not response.choices:
+            raise OpenAIAPIError("OpenAI API returned no choices")
+
+        choice = response.choices[0]
+        if not choice.message:
+            raise OpenAIAPIError("OpenAI API returned choice without message")
+
+        output_text = choice.message.content
+        if not output_text or not output_text.strip():
+            logger.warning(f"OpenAI returned empty content. Model: {model}, "
+                           f"Finish reason: {choice.finish_reason}, "
+                           f"Prompt: '{prompt}', "
+                           f"Response: {response}")
+            raise OpenAIAPIError("OpenAI API returned empty response content")
+
+        return output_text.strip()
+
+    async def _complete_gemini(self, prompt: str, model: str, timeout: float) -> str:
+        client = self._gemini()
+        deadline = time.monotonic() + timeout
+
+        def _generate() -> str:
+            contents = [
+                types.Content(
+                    role="user",
+                    parts=[types.Part.from_text(text=prompt)],
+                ),
+            ]
+            config = types.GenerateContentConfig(
+                thinking_config=types.ThinkingConfig(thinking_budget=0),
+                # Milliseconds; bounds the HTTP request itself, not just the awaiting coroutine
+                http_options=types.HttpOptions(timeout=max(1, int(timeout * 1000))),
+            )
+            output_text = ""
+            for chunk in client.models.generate_content_stream(model=model, contents=contents, config=config):
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"gemini stream exceeded {timeout}s")
+                if chunk.text is not None:
+                    output_text += chunk.text
+            return output_text
+
+        worker = asyncio.ensure_future(asyncio.to_thread(_generate))
+        try:
+            output_text = await asyncio.shield(worker)
+        except asyncio.CancelledError:
+            # Timed out: keep the provider slot until the worker thread has actually stopped
+            await asyncio.wait({worker})
+            if not worker.cancelled():
+                worker.exception()
+            raise
+        if not output_text or not output_text.strip():
+            raise GeminiError("Gemini API returned empty response")
+        return output_text.strip()
+
+    async def _embed_openai(self, text: str, model: str, dimensions: Optional[int], timeout: float) -> list[float]:
+        client = self._openai()
+        kwargs = {"dimensions": dimensions} if dimensions else {}
+        response = await client.embeddings.create(model=model, input=[text], timeout=timeout, **kwargs)
+
+        if not response.data:
+            raise OpenAIAPIError("OpenAI API returned no embedding data")
+
+        embedding = response.data[0].embedding
+        if not embedding:
+            raise OpenAIAPIError("OpenAI API returned empty embedding vector")
+        return embedding
+
+    async def _moderate_openai(self, text: str, timeout: float) -> bool:
+        client = self._openai()
+        response = await client.moderations.create(model="omni-moderation-latest", input=text, timeout=timeout)
+
+        if not response.results:
+            raise OpenAIAPIError("OpenAI API returned no moderation results")
+        return not getattr(response.results[0], "flagged", False)
+
+    def reset(self) -> None:
+        """Drop cached clients so the next call picks up current settings (tests only)."""
+        self._openai_client = None
+        self._gemini_client = None
+        self._limits = {}
+        self._loop = None
+
+    async def aclose(self) -> None:
+        """Close pooled connections (application shutdown)."""
+        if self._openai_client is not None:
+            await self._openai_client.close()
+            self._openai_client = None
+        if self._gemini_client is not None:
+            close = getattr(self._gemini_client, "close", None)
+            if close is not None:
+                await asyncio.to_thread(close)
+            self._gemini_client = None
+
+
+# Global singleton instance
+_llm_gateway = LLMGateway()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Get the global LLMGateway singleton."""
+    return _llm_gateway
@@ -2,15 +2,15 @@
 Helper for interacting with the OpenAI API.
 
 Provides copy phrase generation with error handling and fallback logic
-for the Think Alike AI backup system.
+for the Think Alike AI backup system. Calls go through the shared
+``LLMGateway`` so every request reuses one pooled client.
 """
 
-from backend.config import get_settings
+from backend.services.ai.llm_gateway import OpenAIAPIError, get_llm_gateway
 
 try:
-    from openai import AsyncOpenAI, OpenAIError
+    from openai import OpenAIError
 except ImportError:
-    AsyncOpenAI = None  # type: ignore
     OpenAIError = Exception  # type: ignore
 
 __all__ = [
@@ -22,12 +22,6 @@ __all__ = [
     "moderate_text",
 ]
 
-settings = get_settings()
-
-
-class OpenAIAPIError(RuntimeError):
-    """Raised when the OpenAI API cannot be contacted or returns an error."""
-
 
 async def generate_response(
         prompt: str,
@@ -48,53 +42,7 @@ async def generate_response(
     Raises:
         OpenAIAPIError: If API key is missing or API call fails
     """
-    if AsyncOpenAI is None:
-        raise OpenAIAPIError("openai package not installed. Install with: pip install openai")
-
-    if not settings.openai_api_key:
-        raise OpenAIAPIError("OPENAI_API_KEY environment variable must be set")
-
-    try:
-        client = AsyncOpenAI(api_key=settings.openai_api_key, timeout=timeout)
-
-        response = await client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": "Play a creative word game."},
-                {"role": "user", "content": prompt}
-            ])
-
-        if not response.choices:
-            raise OpenAIAPIError("OpenAI API returned no choices")
-
-        choice = response.choices[0]
-        if not choice.message:
-            raise OpenAIAPIError("OpenAI API returned choice without message")
-
-        output_text = choice.message.content
-        if not output_text or not output_text.strip():
-            # Log additional debugging info
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"OpenAI returned empty content. Model: {model}, "
-                           f"Finish reason: {choice.finish_reason}, "
-                           f"Prompt: '{prompt}', "
-                           f"Response: {response}")
-            raise OpenAIAPIError("OpenAI API returned empty response content")
-
-        # Clean and return the generated phrase
-        cleaned_phrase = output_text.strip()
-        if not cleaned_phrase:
-            raise OpenAIAPIError("OpenAI API returned only whitespace")
-
-        return cleaned_phrase
-
-    except OpenAIError as exc:
-        raise OpenAIAPIError(f"OpenAI API error: {exc}") from exc
-    except Exception as exc:
-        if isinstance(exc, OpenAIAPIError):
-            raise
-        raise OpenAIAPIError(f"Failed to contact OpenAI API: {exc}") from exc
+    return await get_llm_gateway().complete(prompt, provider="openai", model=model, timeout=timeout)
 
 
 # Backwards-compatible alias used by older AIService tests and call sites.
@@ -107,38 +55,7 @@ async def generate_embedding(
         timeout: int = 30,
 ) -> list[float]:
     """Generate a sentence embedding using the OpenAI API."""
-
-    if AsyncOpenAI is None:
-        raise OpenAIAPIError("openai package not installed. Install with: pip install openai")
-
-    model_name = model or settings.embedding_model
-
-    if not settings.openai_api_key:
-        raise OpenAIAPIError("OPENAI_API_KEY environment variable must be set")
-
-    try:
-        client = AsyncOpenAI(api_key=settings.openai_api_key, timeout=timeout)
-
-        response = await client.embeddings.create(
-            model=model_name,
-            input=[input_text],
-        )
-
-        if not response.data:
-            raise OpenAIAPIError("OpenAI API returned no embedding data")
-
-        embedding = response.data[0].embedding
-        if not embedding:
-            raise OpenAIAPIError("OpenAI API returned empty embedding vector")
-
-        return embedding
-
-    except OpenAIError as exc:
-        raise OpenAIAPIError(f"OpenAI API error: {exc}") from exc
-    except Exception as exc:
-        if isinstance(exc, OpenAIAPIError):
-            raise
-        raise OpenAIAPIError(f"Failed to contact OpenAI API: {exc}") from exc
+    return await get_llm_gateway().embed(input_text, model=model, timeout=timeout)
 
 
 async def moderate_text(input_text: str, timeout: int = 10) -> bool:
@@ -154,29 +71,4 @@ async def moderate_text(input_text: str, timeout: int = 10) -> bool:
     Raises:
         OpenAIAPIError: If the moderation request cannot be completed.
     """
-
-    if AsyncOpenAI is None:
-        raise OpenAIAPIError("openai package not installed. Install with: pip install openai")
-
-    if not settings.openai_api_key:
-        raise OpenAIAPIError("OPENAI_API_KEY environment variable must be set")
-
-    try:
-        client = AsyncOpenAI(api_key=settings.openai_api_key, timeout=timeout)
-        response = await client.moderations.create(
-            model="omni-moderation-latest",
-            input=input_text,
-        )
-
-        if not response.results:
-            raise OpenAIAPIError("OpenAI API returned no moderation results")
-
-        result = response.results[0]
-        return not getattr(result, "flagged", False)
-
-    except OpenAIError as exc:
-        raise OpenAIAPIError(f"OpenAI API error: {exc}") from exc
-    except Exception as exc:
-        if isinstance(exc, OpenAIAPIError):
-            raise
-        raise OpenAIAPIError(f"Failed to contact OpenAI API: {exc}") from exc
+    return await get_llm_gateway().moderate(input_text, timeout=timeout)
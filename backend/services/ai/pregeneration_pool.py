@@ -0,0 +1,120 @@
+"""Speculative pre-generation of QF impostor phrases and hints.
+
+As soon as a prompt phrase is submitted, its round is handed to this pool so the
+``QFAIPhraseCache`` row (which serves both hints and backup copies) is filled
+long before a player asks for hints or the backup cycle reaches the prompt.
+Work runs at low priority: at most ``concurrency`` generations are in flight,
+at most ``max_pending`` rounds are tracked, and anything beyond that budget is
+dropped and left to the on-demand path. A round's job is cancelled once humans
+fill both copy slots, since no hint or backup copy will be needed.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+GenerateFn = Callable[[UUID], Awaitable[None]]
+
+
+async def _default_generate(prompt_round_id: UUID) -> None:
+    from backend.services.qf.round_service_helpers import generate_ai_hints_background
+
+    await generate_ai_hints_background(prompt_round_id)
+
+
+class ImpostorPregenerationPool:
+    """Bounded, cancellable background generation of impostor phrase caches."""
+
+    def __init__(
+        self,
+        concurrency: int = 2,
+        max_pending: int = 100,
+        generate: GenerateFn = _default_generate,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.max_pending = max(1, max_pending)
+        self._generate = generate
+        self._tasks: dict[UUID, asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.dropped = 0
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._tasks = {}
+
+    def enqueue(self, prompt_round_id: UUID) -> bool:
+        """Schedule cache generation for a prompt round; False when over budget."""
+        self._bind_loop()
+        if prompt_round_id in self._tasks:
+            return True
+        if len(self._tasks) >= self.max_pending:
+            self.dropped += 1
+            logger.debug(f"Pre-generation budget full; leaving {prompt_round_id=} to on-demand generation")
+            return False
+
+        task = asyncio.create_task(self._run(prompt_round_id))
+        self._tasks[prompt_round_id] = task
+        task.add_done_callback(lambda _task, round_id=prompt_round_id: self._forget(round_id, _task))
+        return True
+
+    def cancel(self, prompt_round_id: UUID) -> bool:
+        """Cancel pending or running generation for a round that no longer needs it."""
+        task = self._tasks.pop(prompt_round_id, None)
+        if task is None or task.done():
+            return False
+        task.cancel()
+        logger.debug(f"Cancelled impostor pre-generation for {prompt_round_id=}")
+        return True
+
+    def pending_count(self) -> int:
+        return len(self._tasks)
+
+    def _forget(self, prompt_round_id: UUID, task: asyncio.Task) -> None:
+        if self._tasks.get(prompt_round_id) is task:
+            del self._tasks[prompt_round_id]
+
+    async def _run(self, prompt_round_id: UUID) -> None:
+        try:
+            async with self._semaphore:
+                await self._generate(prompt_round_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # Catch-all to avoid unhandled background task errors
+            logger.warning(f"Impostor pre-generation failed for {prompt_round_id=}: {exc}")
+
+    def reset(self) -> None:
+        """Cancel all outstanding work (tests and shutdown)."""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+        self._tasks = {}
+        self._semaphore = None
+        self._loop = None
+        self.dropped = 0
+
+
+def _build_pool() -> ImpostorPregenerationPool:
+    from backend.config import get_settings
+
+    settings = get_settings()
+    return ImpostorPregenerationPool(
+        concurrency=settings.ai_pregeneration_concurrency,
+        max_pending=settings.ai_pregeneration_max_pending,
+    )
+
+
+# Global singleton instance
+_pregeneration_pool = _build_pool()
+
+
+def get_pregeneration_pool() -> ImpostorPregenerationPool:
+    """Get the global ImpostorPregenerationPool singleton."""
+    return _pregeneration_pool
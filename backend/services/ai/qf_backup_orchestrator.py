@@ -21,6 +21,7 @@ from backend.models.qf.ai_metric import QFAIMetric
 from backend.services.qf import QFQueueService
 from backend.utils.model_registry import AIPlayerType, GameType
 from backend.services.ai.ai_service import AI_PLAYER_EMAIL_DOMAIN
+from backend.services.ai.pregeneration_pool import get_pregeneration_pool
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +71,38 @@ class QFBackupOrchestrator:
 
         return result.scalar_one_or_none() is not None
 
+    async def _pregenerate_upcoming_prompts(self, cutoff_time: datetime) -> int:
+        """
+        Queue pre-generation for prompts that will reach the backup delay soon.
+
+        Covers prompts the submission-time hook missed (worker restarts, dropped
+        over budget) so that the next cycle reads a ready-made phrase cache.
+
+        Returns:
+            Number of prompt rounds handed to the pre-generation pool
+        """
+        if not self.settings.ai_pregeneration_enabled:
+            return 0
+
+        from backend.models.qf.player import QFPlayer
+
+        result = await self.db.execute(
+            select(Round.round_id)
+            .join(QFPlayer, QFPlayer.player_id == Round.player_id)
+            .outerjoin(QFAIPhraseCache, QFAIPhraseCache.prompt_round_id == Round.round_id)
+            .where(Round.round_type == 'prompt')
+            .where(Round.status == 'submitted')
+            .where(Round.created_at > cutoff_time)
+            .where(Round.copy2_player_id.is_(None))
+            .where(QFPlayer.email.notlike(f"%{AI_PLAYER_EMAIL_DOMAIN}"))
+            .where(QFAIPhraseCache.cache_id.is_(None))
+            .order_by(Round.created_at.asc())
+            .limit(self.settings.ai_backup_batch_size)
+        )
+
+        pool = get_pregeneration_pool()
+        return sum(1 for prompt_round_id in result.scalars().all() if pool.enqueue(prompt_round_id))
+
     async def run_backup_cycle(self) -> None:
         """
         Run a backup cycle to provide AI copies for waiting prompts and AI votes for waiting phrasesets.
@@ -89,6 +122,7 @@ class QFBackupOrchestrator:
         stats = {
             "prompts_checked": 0,
             "prompts_filtered_already_attempted": 0,
+            "prompts_pregenerating": 0,
             "copies_generated": 0,
             "phrasesets_checked": 0,
             "votes_generated": 0,
@@ -104,6 +138,7 @@ class QFBackupOrchestrator:
 
             # Determine backup delay
             cutoff_time = datetime.now(UTC) - timedelta(minutes=self.settings.ai_backup_delay_minutes)
+            stats["prompts_pregenerating"] = await self._pregenerate_upcoming_prompts(cutoff_time)
 
             # Get all prompt rounds that meet our basic criteria
             from backend.models.qf.player import QFPlayer
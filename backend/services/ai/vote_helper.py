@@ -7,31 +7,56 @@ which phrase in a phraseset is the original.
 
 import random
 
-from backend.config import get_settings
+from .llm_gateway import LLMGatewayError, get_llm_gateway
 from .prompt_builder import build_vote_prompt
 
-try:
-    from openai import AsyncOpenAI, OpenAIError
-except ImportError:
-    AsyncOpenAI = None  # type: ignore
-    OpenAIError = Exception  # type: ignore
-
-try:
-    from google import genai
-    from google.genai import types
-except ImportError:
-    genai = None  # type: ignore
-    types = None  # type: ignore
-
 __all__ = ["AIVoteError", "generate_vote_choice"]
 
-settings = get_settings()
+VOTE_SYSTEM_PROMPT = "Identify whether phrases in word games are original or copied."
 
 
 class AIVoteError(RuntimeError):
     """Raised when AI vote generation fails."""
 
 
+async def _request_vote_choice(
+        provider: str,
+        prompt_text: str,
+        phrases: list[str],
+        seed: int,
+        model: str,
+        timeout: int,
+) -> int:
+    """Ask the provider through the shared gateway and parse its 1-3 answer."""
+    if len(phrases) != 3:
+        raise AIVoteError(f"Expected 3 phrases, got {len(phrases)}")
+
+    prompt = build_vote_prompt(prompt_text, phrases, seed)
+    try:
+        output_text = await get_llm_gateway().complete(
+            prompt,
+            provider=provider,
+            model=model,
+            system_prompt=VOTE_SYSTEM_PROMPT,
+            timeout=timeout,
+        )
+    except LLMGatewayError as exc:
+        raise AIVoteError(str(exc)) from exc
+
+    try:
+        # Parse the choice (should be 1, 2, or 3)
+        choice = int(output_text.strip())
+    except ValueError:
+        # If parsing failed, return random choice
+        return random.randint(0, 2)
+
+    if choice < 1 or choice > 3:
+        raise AIVoteError(f"Invalid choice: {choice}")
+
+    # Convert to 0-based index
+    return choice - 1
+
+
 async def generate_vote_choice_openai(
         prompt_text: str,
         phrases: list[str],
@@ -55,52 +80,7 @@ async def generate_vote_choice_openai(
     Raises:
         AIVoteError: If generation fails
     """
-    if AsyncOpenAI is None:
-        raise AIVoteError("openai package not installed. Install with: pip install openai")
-
-    if not settings.openai_api_key:
-        raise AIVoteError("OPENAI_API_KEY environment variable must be set")
-
-    if len(phrases) != 3:
-        raise AIVoteError(f"Expected 3 phrases, got {len(phrases)}")
-
-    try:
-        client = AsyncOpenAI(api_key=settings.openai_api_key, timeout=timeout)
-        prompt = build_vote_prompt(prompt_text, phrases, seed)
-
-        response = await client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system",
-                 "content": "Identify whether phrases in word games are original or copied."},
-                {"role": "user", "content": prompt}
-            ],
-        )
-
-        if not response.choices:
-            raise AIVoteError("OpenAI API returned no choices")
-
-        output_text = response.choices[0].message.content
-        if not output_text:
-            raise AIVoteError(f"OpenAI API returned empty {response=} for {prompt=}")
-
-        # Parse the choice (should be 1, 2, or 3)
-        choice = int(output_text.strip())
-        if choice < 1 or choice > 3:
-            raise AIVoteError(f"Invalid choice: {choice}")
-
-        # Convert to 0-based index
-        return choice - 1
-
-    except OpenAIError as exc:
-        raise AIVoteError(f"OpenAI API error: {exc}") from exc
-    except ValueError as exc:
-        # If parsing failed, return random choice
-        return random.randint(0, 2)
-    except Exception as exc:
-        if isinstance(exc, AIVoteError):
-            raise
-        raise AIVoteError(f"Failed to contact OpenAI API: {exc}") from exc
+    return await _request_vote_choice("openai", prompt_text, phrases, seed, model, timeout)
 
 
 async def generate_vote_choice_gemini(
@@ -118,7 +98,7 @@ async def generate_vote_choice_gemini(
         phrases: List of 3 phrases to choose from
         seed: Random seed for prompt generation
         model: Gemini model to use
-        timeout: Request timeout in seconds (currently unused)
+        timeout: Request timeout in seconds
 
     Returns:
         Index (0-2) of the chosen phrase
@@ -126,57 +106,7 @@ async def generate_vote_choice_gemini(
     Raises:
         AIVoteError: If generation fails
     """
-    if genai is None:
-        raise AIVoteError("google-genai package not installed. Install with: pip install google-genai")
-
-    if not settings.gemini_api_key:
-        raise AIVoteError("GEMINI_API_KEY environment variable must be set")
-
-    if len(phrases) != 3:
-        raise AIVoteError(f"Expected 3 phrases, got {len(phrases)}")
-
-    try:
-        client = genai.Client(api_key=settings.gemini_api_key)
-        prompt = build_vote_prompt(prompt_text, phrases, seed)
-
-        contents = [
-            types.Content(
-                role="user",
-                parts=[types.Part.from_text(text=prompt)],
-            ),
-        ]
-
-        generate_content_config = types.GenerateContentConfig(
-            thinking_config=types.ThinkingConfig(thinking_budget=0),
-        )
-
-        output_text = ""
-        for chunk in client.models.generate_content_stream(
-            model=model,
-            contents=contents,
-            config=generate_content_config,
-        ):
-            if chunk.text is not None:
-                output_text += chunk.text
-
-        if not output_text:
-            raise AIVoteError(f"Gemini API returned empty response for {prompt=}")
-
-        # Parse the choice (should be 1, 2, or 3)
-        choice = int(output_text.strip())
-        if choice < 1 or choice > 3:
-            raise AIVoteError(f"Invalid choice: {choice}")
-
-        # Convert to 0-based index
-        return choice - 1
-
-    except ValueError as exc:
-        # If parsing failed, return random choice
-        return random.randint(0, 2)
-    except Exception as exc:
-        if isinstance(exc, AIVoteError):
-            raise
-        raise AIVoteError(f"Failed to contact Gemini API: {exc}") from exc
+    return await _request_vote_choice("gemini", prompt_text, phrases, seed, model, timeout)
 
 
 async def generate_vote_choice(
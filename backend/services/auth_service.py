@@ -1,7 +1,6 @@
 """Authentication and authorization helpers."""
 from __future__ import annotations
 
-import hashlib
 import logging
 import secrets
 import uuid
@@ -15,6 +14,13 @@ from backend.models.player import Player
 from backend.models.player_base import PlayerBase
 from backend.models.refresh_token import RefreshToken
 from backend.services.player_service import PlayerService, PlayerServiceError
+from backend.services.refresh_session_cache import (
+    RefreshSession,
+    RotatedTo,
+    get_refresh_session_cache,
+    hash_refresh_token,
+)
+from backend.utils.datetime_helpers import ensure_utc
 from backend.utils.passwords import PasswordValidationError, hash_password, validate_password_strength
 from backend.services.username_service import UsernameService
 from backend.utils.simple_jwt import (
@@ -277,7 +283,7 @@ class AuthService:
         return token, expires_seconds
 
     async def _store_refresh_token(self, player: Player, raw_token: str, expires_at: datetime) -> RefreshToken:
-        token_hash = hashlib.sha256(raw_token.encode("utf-8")).hexdigest()
+        token_hash = hash_refresh_token(raw_token)
         refresh_token = self.refresh_token_model(
             token_id=uuid.uuid4(),
             player_id=player.player_id,
@@ -288,42 +294,60 @@ class AuthService:
         return refresh_token
 
     async def revoke_refresh_token(self, raw_token: str) -> None:
-        token_hash = hashlib.sha256(raw_token.encode("utf-8")).hexdigest()
+        token_hash = hash_refresh_token(raw_token)
+        get_refresh_session_cache().mark_revoked(token_hash)
         result = await self.db.execute(
-            select(self.refresh_token_model).where(self.refresh_token_model.token_hash == token_hash)
+            update(self.refresh_token_model)
+            .where(self.refresh_token_model.token_hash == token_hash)
+            .where(self.refresh_token_model.revoked_at.is_(None))
+            .values(revoked_at=datetime.now(UTC))
         )
-        refresh_token = result.scalar_one_or_none()
-        if refresh_token:
-            refresh_token.revoked_at = datetime.now(UTC)
+        if result.rowcount:
             await self.db.commit()
 
-    async def revoke_all_refresh_tokens(self, player_id: uuid.UUID) -> None:
+    async def _stage_revoke_all_refresh_tokens(self, player_id: uuid.UUID) -> None:
+        get_refresh_session_cache().revoke_player(player_id)
         await self.db.execute(
             update(self.refresh_token_model)
             .where(self.refresh_token_model.player_id == player_id)
             .where(self.refresh_token_model.revoked_at.is_(None))
             .values(revoked_at=datetime.now(UTC))
         )
+
+    async def revoke_all_refresh_tokens(self, player_id: uuid.UUID) -> None:
+        await self._stage_revoke_all_refresh_tokens(player_id)
         await self.db.commit()
 
     async def get_player_from_refresh_token(self, raw_token: str) -> Player | None:
-        """Return the unified player linked to the given refresh token without rotating it."""
+        """Return the unified player linked to the given refresh token without rotating it.
+
+        Recently seen tokens are answered from the refresh session cache, leaving
+        only the primary-key player read.
+        """
         if not raw_token:
             return None
 
-        token_hash = hashlib.sha256(raw_token.encode("utf-8")).hexdigest()
-        result = await self.db.execute(
-            select(self.refresh_token_model).where(self.refresh_token_model.token_hash == token_hash)
-        )
-        refresh_token = result.scalar_one_or_none()
-        if not refresh_token or not refresh_token.is_active():
+        cache = get_refresh_session_cache()
+        token_hash = hash_refresh_token(raw_token)
+        session = cache.get_fresh(token_hash)
+        if session is None:
+            result = await self.db.execute(
+                select(self.refresh_token_model).where(self.refresh_token_model.token_hash == token_hash)
+            )
+            refresh_token = result.scalar_one_or_none()
+            if not refresh_token:
+                return None
+            session = cache.put(
+                token_hash,
+                refresh_token.player_id,
+                refresh_token.expires_at,
+                revoked=refresh_token.revoked_at is not None,
+            )
+        if not session.is_active():
             return None
 
         # Query unified Player model
-        result = await self.db.execute(
-            select(Player).where(Player.player_id == refresh_token.player_id)
-        )
-        player = result.scalar_one_or_none()
+        player = await self.db.get(Player, session.player_id)
         return self.player_service.apply_admin_status(player)
 
     async def refresh_tokens(self, raw_token: str) -> Player:
@@ -371,14 +395,16 @@ class AuthService:
         return subject
 
     async def issue_tokens(self, player: Player, *, rotate_existing: bool = True) -> tuple[str, str, int]:
+        # Revocation of the old tokens and the new token are written in one commit
         if rotate_existing:
-            await self.revoke_all_refresh_tokens(player.player_id)
+            await self._stage_revoke_all_refresh_tokens(player.player_id)
 
         access_token, expires_in = self.create_access_token(player)
         refresh_expires_at = datetime.now(UTC) + timedelta(days=self.settings.refresh_token_exp_days)
         raw_refresh_token = secrets.token_urlsafe(48)
         await self._store_refresh_token(player, raw_refresh_token, refresh_expires_at)
         await self.db.commit()
+        get_refresh_session_cache().put(hash_refresh_token(raw_refresh_token), player.player_id, refresh_expires_at)
         return access_token, raw_refresh_token, expires_in
 
     def decode_access_token(self, token: str) -> dict[str, str]:
@@ -394,36 +420,90 @@ class AuthService:
         except InvalidTokenError as exc:
             raise AuthError("Invalid token error, please try again") from exc
 
-    async def exchange_refresh_token(self, raw_token: str) -> tuple[Player, str, str, int]:
-        try:
-            token_hash = hashlib.sha256(raw_token.encode("utf-8")).hexdigest()
-            result = await self.db.execute(
-                select(self.refresh_token_model).where(self.refresh_token_model.token_hash == token_hash)
-            )
-            refresh_token = result.scalar_one_or_none()
-            if not refresh_token or not refresh_token.is_active():
-                raise AuthError("Token could not be refreshed, please log in again")
+    async def _load_grace_replacement_player(self, session: RefreshSession, replacement: RotatedTo) -> Player:
+        """Confirm in the database that a grace-window replacement may still be handed out.
 
-            # Query unified Player model
-            result = await self.db.execute(
-                select(Player).where(Player.player_id == refresh_token.player_id)
-            )
-            player = self.player_service.apply_admin_status(result.scalar_one_or_none())
-            if not player:
-                raise AuthError("Token could not be refreshed, please log in again")
+        The cache only knows this worker's revocations, so the replacement row and
+        the player are re-read: a logout, revoke-all or lock written by any worker
+        ends the grace window immediately.
+        """
+        cache = get_refresh_session_cache()
+        row = (await self.db.execute(
+            select(self.refresh_token_model.revoked_at, self.refresh_token_model.expires_at)
+            .where(self.refresh_token_model.token_hash == replacement.token_hash)
+            .where(self.refresh_token_model.player_id == session.player_id)
+        )).first()
+        if row is None or row.revoked_at is not None:
+            cache.mark_revoked(replacement.token_hash)
+            session.rotated_to = None
+            raise AuthError("Token could not be refreshed, please log in again")
+        if not cache.put(replacement.token_hash, session.player_id, row.expires_at).is_active():
+            raise AuthError("Token could not be refreshed, please log in again")
 
-            refresh_token.revoked_at = datetime.now(UTC)
+        player = await self.db.get(Player, session.player_id, populate_existing=True)
+        locked_until = ensure_utc(player.locked_until) if player and player.locked_until else None
+        if not player or (locked_until and locked_until > datetime.now(UTC)):
+            raise AuthError("Token could not be refreshed, please log in again")
+        return self.player_service.apply_admin_status(player)
 
-            access_token, expires_in = self.create_access_token(player)
-            new_refresh_token_value = secrets.token_urlsafe(48)
-            new_refresh_expires = datetime.now(UTC) + timedelta(days=self.settings.refresh_token_exp_days)
-            await self._store_refresh_token(player, new_refresh_token_value, new_refresh_expires)
-            await self.db.commit()
-            return player, access_token, new_refresh_token_value, expires_in
-        except AuthError:
-            await self.db.rollback()
-            raise
-        except Exception:  # pragma: no cover - defensive logging
-            await self.db.rollback()
-            logger.error("Unexpected error exchanging refresh token", exc_info=True)
-            raise
+    async def exchange_refresh_token(self, raw_token: str) -> tuple[Player, str, str, int]:
+        """Rotate a refresh token, returning the player and a new access/refresh token pair.
+
+        The old token is revoked by a single conditional UPDATE, so exactly one
+        caller (on any worker) can rotate it. A concurrent refresh with the same
+        token on this worker within ``refresh_rotation_grace_seconds`` gets the
+        same replacement token instead of an error, provided the database still
+        shows the replacement active.
+        """
+        cache = get_refresh_session_cache()
+        token_hash = hash_refresh_token(raw_token)
+        async with cache.lock(token_hash):
+            try:
+                session = cache.get(token_hash)
+                replacement = cache.grace_replacement(session)
+                if replacement:
+                    player = await self._load_grace_replacement_player(session, replacement)
+                    access_token, expires_in = self.create_access_token(player)
+                    return player, access_token, replacement.raw_token, expires_in
+                if session is not None and session.revoked:
+                    # Revocation seen by this process: no database round trip needed
+                    raise AuthError("Token could not be refreshed, please log in again")
+
+                now = datetime.now(UTC)
+                result = await self.db.execute(
+                    update(self.refresh_token_model)
+                    .where(self.refresh_token_model.token_hash == token_hash)
+                    .where(self.refresh_token_model.revoked_at.is_(None))
+                    .values(revoked_at=now)
+                    .returning(self.refresh_token_model.player_id, self.refresh_token_model.expires_at)
+                    .execution_options(synchronize_session=False)
+                )
+                row = result.first()
+                if not row:
+                    raise AuthError("Token could not be refreshed, please log in again")
+                session = cache.put(token_hash, row.player_id, row.expires_at)
+                if not session.is_active(now):
+                    raise AuthError("Token could not be refreshed, please log in again")
+
+                # Query unified Player model
+                player = self.player_service.apply_admin_status(await self.db.get(Player, row.player_id))
+                if not player:
+                    raise AuthError("Token could not be refreshed, please log in again")
+
+                access_token, expires_in = self.create_access_token(player)
+                new_refresh_token_value = secrets.token_urlsafe(48)
+                new_refresh_expires = now + timedelta(days=self.settings.refresh_token_exp_days)
+                await self._store_refresh_token(player, new_refresh_token_value, new_refresh_expires)
+                await self.db.commit()
+
+                new_hash = hash_refresh_token(new_refresh_token_value)
+                cache.put(new_hash, player.player_id, new_refresh_expires)
+                cache.note_rotation(session, new_refresh_token_value, new_hash)
+                return player, access_token, new_refresh_token_value, expires_in
+            except AuthError:
+                await self.db.rollback()
+                raise
+            except Exception:  # pragma: no cover - defensive logging
+                await self.db.rollback()
+                logger.error("Unexpected error exchanging refresh token", exc_info=True)
+                raise
@@ -0,0 +1,153 @@
+"""Chunked, resumable execution for maintenance jobs.
+
+Bulk cleanup statements on SQLite hold the single writer lock for as long as
+their transaction runs, stalling gameplay writes. Jobs built on
+``ChunkedJobRunner`` instead process a fixed number of rows per chunk, commit
+after every chunk together with a persisted cursor, pause briefly so
+foreground writers can take the lock, and stop once the per-run time budget is
+spent. The next run resumes from the stored cursor.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import get_settings
+from backend.models.maintenance_cursor import MaintenanceCursor
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ChunkOutcome:
+    """Result of processing one chunk."""
+
+    processed: int
+    # Key to resume after; None once the job has nothing left to do
+    next_cursor: Optional[str]
+
+
+@dataclass
+class ChunkedJobStats:
+    """Timing and progress metrics for one run of a chunked job."""
+
+    job_name: str
+    resumed_from: Optional[str] = None
+    processed: int = 0
+    chunks: int = 0
+    completed: bool = False
+    elapsed_seconds: float = 0.0
+    chunk_seconds: list[float] = field(default_factory=list)
+
+    @property
+    def max_chunk_seconds(self) -> float:
+        return max(self.chunk_seconds, default=0.0)
+
+    @property
+    def mean_chunk_seconds(self) -> float:
+        return sum(self.chunk_seconds) / len(self.chunk_seconds) if self.chunk_seconds else 0.0
+
+
+ChunkFn = Callable[[Optional[str], int], Awaitable[ChunkOutcome]]
+
+
+class ChunkedJobRunner:
+    """Run a job chunk by chunk with a commit, cursor save and pause between chunks."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        *,
+        chunk_size: Optional[int] = None,
+        time_budget_seconds: Optional[float] = None,
+        pause_seconds: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self.db = db
+        self.chunk_size = max(1, chunk_size or settings.cleanup_chunk_size)
+        self.time_budget_seconds = (
+            time_budget_seconds if time_budget_seconds is not None else settings.cleanup_time_budget_seconds
+        )
+        self.pause_seconds = pause_seconds if pause_seconds is not None else settings.cleanup_chunk_pause_seconds
+
+    async def _load_cursor(self, job_name: str) -> Optional[str]:
+        row = await self.db.get(MaintenanceCursor, job_name)
+        return row.cursor if row else None
+
+    async def _store_cursor(self, job_name: str, cursor: Optional[str]) -> None:
+        row = await self.db.get(MaintenanceCursor, job_name)
+        if row is None:
+            if cursor is None:
+                return
+            row = MaintenanceCursor(job_name=job_name)
+            self.db.add(row)
+        row.cursor = cursor
+        row.updated_at = datetime.now(UTC)
+
+    async def run(self, job_name: str, chunk_fn: ChunkFn, *, resumable: bool = True) -> ChunkedJobStats:
+        """
+        Run ``chunk_fn`` until it reports no further cursor or the time budget is spent.
+
+        ``chunk_fn(cursor, limit)`` performs one chunk of writes without
+        committing and returns how many rows it handled plus the cursor to
+        continue from. The runner commits each chunk (with the persisted cursor
+        when ``resumable``) so a crash or budget stop loses at most one chunk.
+        The time budget only applies to resumable jobs.
+
+        Args:
+            job_name: Stable identifier used for the persisted cursor and metrics
+            chunk_fn: Coroutine processing one chunk
+            resumable: Persist the cursor between runs (False for in-memory work lists)
+
+        Returns:
+            ChunkedJobStats for this run
+        """
+        cursor = await self._load_cursor(job_name) if resumable else None
+        stats = ChunkedJobStats(job_name=job_name, resumed_from=cursor)
+        started = time.monotonic()
+
+        while True:
+            chunk_started = time.perf_counter()
+            try:
+                outcome = await chunk_fn(cursor, self.chunk_size)
+                if resumable:
+                    await self._store_cursor(job_name, outcome.next_cursor)
+                await self.db.commit()
+            except Exception:
+                await self.db.rollback()
+                logger.error(f"Maintenance job {job_name} failed after {stats.chunks} chunk(s)", exc_info=True)
+                raise
+            chunk_elapsed = time.perf_counter() - chunk_started
+
+            stats.chunks += 1
+            stats.processed += outcome.processed
+            stats.chunk_seconds.append(chunk_elapsed)
+            logger.debug(
+                f"Maintenance job {job_name} chunk {stats.chunks}: {outcome.processed} rows in {chunk_elapsed * 1000:.1f}ms"
+            )
+
+            cursor = outcome.next_cursor
+            if cursor is None:
+                stats.completed = True
+                break
+            # Only resumable jobs can stop early; in-memory work lists must finish
+            if resumable and time.monotonic() - started >= self.time_budget_seconds:
+                logger.info(f"Maintenance job {job_name} paused at cursor {cursor} (time budget spent)")
+                break
+            # Let foreground requests take the writer lock between chunks
+            await asyncio.sleep(self.pause_seconds)
+
+        stats.elapsed_seconds = time.monotonic() - started
+        if stats.processed or not stats.completed:
+            logger.info(
+                f"Maintenance job {job_name}: {stats.processed} rows in {stats.chunks} chunk(s), "
+                f"{stats.elapsed_seconds:.2f}s total, chunk mean {stats.mean_chunk_seconds * 1000:.1f}ms / "
+                f"max {stats.max_chunk_seconds * 1000:.1f}ms, completed={stats.completed}"
+            )
+        return stats
@@ -0,0 +1,229 @@
+"""Compact, memory-mapped word dictionary shared by every worker process.
+
+``backend/data/dictionary.txt`` is compiled once (at image build time via
+``python -m backend.scripts.build_dictionary``, or lazily on first use) into a
+binary index next to it. Workers ``mmap`` the index read-only, so its pages
+live once in the OS page cache instead of as a Python ``set`` per process.
+
+Index layout (little-endian):
+
+    header      magic, word count, slot count, short-word count, source digest
+    offsets     uint32[word_count + 1]  start of each word in the blob (sorted order)
+    slots       uint32[slot_count]      open-addressing hash table of word index + 1
+    short_ids   uint32[short_count]     indices of 3-5 letter words (backronym pool)
+    blob        concatenated uppercase ASCII words
+
+Membership hashes the word with FNV-1a and probes the table, so a lookup costs
+O(len(word)) and never parses the file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+DICTIONARY_SOURCE = DATA_DIR / "dictionary.txt"
+DICTIONARY_INDEX = DATA_DIR / "dictionary.idx"
+
+SHORT_WORD_MIN_LENGTH = 3
+SHORT_WORD_MAX_LENGTH = 5
+
+_MAGIC = b"CCDICT01"
+_HEADER = struct.Struct("<8sIII16s")
+_FNV_OFFSET = 0x811C9DC5
+_FNV_PRIME = 0x01000193
+
+
+def _fnv1a(word: bytes) -> int:
+    value = _FNV_OFFSET
+    for byte in word:
+        value = ((value ^ byte) * _FNV_PRIME) & 0xFFFFFFFF
+    return value
+
+
+def _source_digest(source: Path) -> bytes:
+    return hashlib.sha256(source.read_bytes()).digest()[:16]
+
+
+def _uint32_array(values) -> array:
+    data = array("I", values)
+    if data.itemsize != 4:
+        raise RuntimeError("uint32 arrays are not 4 bytes wide on this platform")
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data
+
+
+def build_dictionary_index(source: Path = DICTIONARY_SOURCE, target: Path = DICTIONARY_INDEX) -> Path:
+    """Compile the word list into the binary index and atomically replace ``target``."""
+    words = sorted({line.strip().upper() for line in source.read_text().splitlines() if line.strip()})
+    encoded = [word.encode("ascii", "ignore") for word in words]
+
+    offsets = [0]
+    for word in encoded:
+        offsets.append(offsets[-1] + len(word))
+
+    slot_count = 1
+    while slot_count < len(encoded) * 2:
+        slot_count <<= 1
+    mask = slot_count - 1
+    slots = [0] * slot_count
+    for index, word in enumerate(encoded):
+        slot = _fnv1a(word) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = index + 1
+
+    short_ids = [
+        index for index, word in enumerate(encoded)
+        if SHORT_WORD_MIN_LENGTH <= len(word) <= SHORT_WORD_MAX_LENGTH
+    ]
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, len(encoded), slot_count, len(short_ids), _source_digest(source)))
+        _uint32_array(offsets).tofile(f)
+        _uint32_array(slots).tofile(f)
+        _uint32_array(short_ids).tofile(f)
+        f.write(b"".join(encoded))
+    os.replace(tmp_path, target)
+
+    logger.info(f"Built dictionary index {target} ({len(encoded)} words, {target.stat().st_size // 1024} KiB)")
+    return target
+
+
+class CompactDictionary:
+    """Read-only, mmap-backed set of uppercase words (``in``, ``len``, sorted iteration)."""
+
+    def __init__(self, source: Path = DICTIONARY_SOURCE, index_path: Path = DICTIONARY_INDEX):
+        self.source = source
+        self.index_path = index_path
+        self._mmap: Optional[mmap.mmap] = None
+        self._offsets = None
+        self._slots = None
+        self._short_ids = None
+        self._blob_start = 0
+        self._count = 0
+        self._mask = 0
+
+    def _resolve_index(self) -> Path:
+        """Return an up-to-date index, rebuilding it when missing or stale."""
+        if not self.source.exists():
+            if self.index_path.exists():
+                return self.index_path
+            logger.error(f"Dictionary file not found at: {self.source}")
+            logger.error("Run: python scripts/download_dictionary.py")
+            raise FileNotFoundError(f"Dictionary file not found: {self.source}")
+
+        digest = _source_digest(self.source)
+        for candidate in (self.index_path, Path(tempfile.gettempdir()) / f"crowdcraft-dictionary-{digest.hex()}.idx"):
+            if candidate.exists():
+                with open(candidate, "rb") as f:
+                    header = f.read(_HEADER.size)
+                if len(header) == _HEADER.size and _HEADER.unpack(header)[0] == _MAGIC \
+                        and _HEADER.unpack(header)[4] == digest:
+                    return candidate
+            try:
+                return build_dictionary_index(self.source, candidate)
+            except OSError as exc:
+                logger.warning(f"Could not write dictionary index to {candidate}: {exc}")
+        raise RuntimeError("Unable to build dictionary index")
+
+    def _ensure_loaded(self) -> None:
+        if self._mmap is not None:
+            return
+
+        path = self._resolve_index()
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count, slot_count, short_count, _digest = _HEADER.unpack_from(mapped, 0)
+        if magic != _MAGIC:
+            mapped.close()
+            raise RuntimeError(f"Invalid dictionary index: {path}")
+        if sys.byteorder == "big":
+            mapped.close()
+            raise RuntimeError("Dictionary index is little-endian; big-endian hosts are not supported")
+
+        view = memoryview(mapped)
+        position = _HEADER.size
+        self._offsets = view[position:position + 4 * (count + 1)].cast("I")
+        position += 4 * (count + 1)
+        self._slots = view[position:position + 4 * slot_count].cast("I")
+        position += 4 * slot_count
+        self._short_ids = view[position:position + 4 * short_count].cast("I")
+        position += 4 * short_count
+        self._blob_start = position
+        self._count = count
+        self._mask = slot_count - 1
+        self._mmap = mapped
+        logger.info(f"Mapped dictionary index {path} ({count} words)")
+
+    def _word_bytes(self, index: int) -> bytes:
+        start = self._blob_start + self._offsets[index]
+        end = self._blob_start + self._offsets[index + 1]
+        return self._mmap[start:end]
+
+    def word(self, index: int) -> str:
+        """Return the word at ``index`` in sorted order."""
+        self._ensure_loaded()
+        return self._word_bytes(index).decode("ascii")
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or not word:
+            return False
+        self._ensure_loaded()
+        try:
+            key = word.encode("ascii")
+        except UnicodeEncodeError:
+            return False
+
+        slot = _fnv1a(key) & self._mask
+        while True:
+            entry = self._slots[slot]
+            if not entry:
+                return False
+            if self._word_bytes(entry - 1) == key:
+                return True
+            slot = (slot + 1) & self._mask
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        self._ensure_loaded()
+        for index in range(self._count):
+            yield self._word_bytes(index).decode("ascii")
+
+    @property
+    def short_word_count(self) -> int:
+        """Number of 3-5 letter words available for backronyms."""
+        self._ensure_loaded()
+        return len(self._short_ids)
+
+    def short_word(self, position: int) -> str:
+        """Return the ``position``-th 3-5 letter word."""
+        self._ensure_loaded()
+        return self._word_bytes(self._short_ids[position]).decode("ascii")
+
+
+# Global singleton instance
+_dictionary = CompactDictionary()
+
+
+def get_dictionary() -> CompactDictionary:
+    """Get the global CompactDictionary singleton."""
+    return _dictionary
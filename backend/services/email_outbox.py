@@ -0,0 +1,185 @@
+"""Outbox delivery for account emails.
+
+Callers stage an ``EmailOutbox`` row with ``enqueue_email`` in the same short
+transaction as the row that needs the email (e.g. a ``MagicLink``) and commit.
+``EmailOutboxDispatcher`` then delivers it with no transaction open during the
+mail round trip: it claims the row (status ``sending`` with a lease), commits,
+sends, and records the outcome in a second short transaction. Failed attempts
+are retried by the background cycle with exponential backoff.
+
+A magic-link payload carries a usable login URL, so it is cleared as soon as the
+row is sent or gives up, and a link past its ``expires_at`` is never (re)sent.
+Finished rows are pruned after ``email_outbox_retention_hours``.
+"""
+from __future__ import annotations
+
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import get_settings
+from backend.models.email_outbox import EmailOutbox
+from backend.services.magic_link_mailer import MagicLinkMailer, MagicLinkMailerError
+from backend.utils.datetime_helpers import ensure_utc
+
+logger = logging.getLogger(__name__)
+
+MAGIC_LINK_EMAIL = "magic_link"
+PLAIN_EMAIL = "message"
+
+# A claimed row whose worker died is retried after this long
+SENDING_LEASE = timedelta(minutes=5)
+MAX_RETRY_DELAY = timedelta(hours=1)
+
+
+def enqueue_email(db: AsyncSession, *, kind: str, to_email: str, payload: dict[str, Any]) -> EmailOutbox:
+    """Stage an email in the caller's transaction (delivered after it commits)."""
+    email = EmailOutbox(kind=kind, to_email=to_email, payload=payload, status="pending", attempts=0)
+    db.add(email)
+    return email
+
+
+class EmailOutboxDispatcher:
+    """Delivers outbox rows with retries; never holds a transaction across a send."""
+
+    def __init__(self, db: AsyncSession, mailer: MagicLinkMailer | None = None):
+        self.db = db
+        self.settings = get_settings()
+        self.mailer = mailer or MagicLinkMailer(self.settings)
+
+    async def _claim(self, email_id: UUID | None = None, limit: int = 1) -> list[EmailOutbox]:
+        """Mark due rows as sending and commit, so other workers skip them."""
+        now = datetime.now(UTC)
+        stmt = (
+            update(EmailOutbox)
+            .where(
+                or_(EmailOutbox.status == "pending", EmailOutbox.status == "sending"),
+                EmailOutbox.next_attempt_at <= now,
+            )
+            .values(
+                status="sending",
+                attempts=EmailOutbox.attempts + 1,
+                next_attempt_at=now + SENDING_LEASE,
+            )
+            .returning(EmailOutbox)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        if email_id is not None:
+            stmt = stmt.where(EmailOutbox.email_id == email_id)
+        else:
+            due = (
+                select(EmailOutbox.email_id)
+                .where(
+                    or_(EmailOutbox.status == "pending", EmailOutbox.status == "sending"),
+                    EmailOutbox.next_attempt_at <= now,
+                )
+                .order_by(EmailOutbox.next_attempt_at)
+                .limit(limit)
+            )
+            stmt = stmt.where(EmailOutbox.email_id.in_(due.scalar_subquery()))
+
+        claimed = list((await self.db.scalars(stmt)).all())
+        await self.db.commit()
+        return claimed
+
+    @staticmethod
+    def _is_expired(email: EmailOutbox, now: datetime) -> bool:
+        expires_at = (email.payload or {}).get("expires_at")
+        return bool(expires_at) and ensure_utc(datetime.fromisoformat(expires_at)) <= now
+
+    async def _send(self, email: EmailOutbox) -> None:
+        payload = email.payload or {}
+        if email.kind == MAGIC_LINK_EMAIL:
+            await self.mailer.send_magic_link(
+                to_email=email.to_email,
+                link_url=payload["link_url"],
+                expires_at=datetime.fromisoformat(payload["expires_at"]),
+            )
+        elif email.kind == PLAIN_EMAIL:
+            await self.mailer.send_email(to_email=email.to_email, subject=payload["subject"], body=payload["body"])
+        else:
+            raise MagicLinkMailerError(f"unknown_email_kind:{email.kind}", retryable=False)
+
+    async def _attempt(self, email: EmailOutbox) -> str:
+        """Send one claimed row (outside any transaction) and record the outcome."""
+        error: MagicLinkMailerError | None = None
+        if self._is_expired(email, datetime.now(UTC)):
+            # Mailing a dead link helps nobody; give up without sending
+            error = MagicLinkMailerError("link_expired", retryable=False)
+        else:
+            try:
+                await self._send(email)
+            except MagicLinkMailerError as exc:
+                error = exc
+            except Exception as exc:  # Transport or template failure; retry like an SMTP error
+                error = MagicLinkMailerError(str(exc) or exc.__class__.__name__)
+
+        now = datetime.now(UTC)
+        if error is None:
+            values = {"status": "sent", "sent_at": now, "payload": {}, "last_error": None}
+        elif (
+            error.retryable
+            and email.attempts < self.settings.email_outbox_max_attempts
+            and not self._is_expired(email, now)
+        ):
+            delay = timedelta(seconds=self.settings.email_outbox_retry_base_seconds * 2 ** (email.attempts - 1))
+            values = {
+                "status": "pending",
+                "next_attempt_at": now + min(delay, MAX_RETRY_DELAY),
+                "last_error": str(error)[:255],
+            }
+        else:
+            values = {"status": "failed", "payload": {}, "last_error": str(error)[:255]}
+
+        await self.db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.email_id == email.email_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+
+        if error is None:
+            logger.info(f"Delivered {email.kind} email {email.email_id} (attempt {email.attempts})")
+        else:
+            logger.warning(
+                f"Email {email.email_id} attempt {email.attempts} failed ({error}); status={values['status']}"
+            )
+        return values["status"]
+
+    async def deliver(self, email_id: UUID) -> str:
+        """Try to deliver one committed row now.
+
+        Returns:
+            ``sent``, ``pending`` (will be retried in the background), ``failed``,
+            or ``sending`` when another worker already holds the row
+        """
+        claimed = await self._claim(email_id)
+        if not claimed:
+            return "sending"
+        return await self._attempt(claimed[0])
+
+    async def dispatch_due(self, limit: int = 50) -> int:
+        """Deliver up to ``limit`` due rows; returns how many were sent."""
+        sent = 0
+        for email in await self._claim(limit=limit):
+            if await self._attempt(email) == "sent":
+                sent += 1
+        return sent
+
+    async def prune(self) -> int:
+        """Delete sent and failed rows older than the retention window; returns how many."""
+        cutoff = datetime.now(UTC) - timedelta(hours=self.settings.email_outbox_retention_hours)
+        result = await self.db.execute(
+            delete(EmailOutbox)
+            .where(EmailOutbox.status.in_(("sent", "failed")), EmailOutbox.created_at < cutoff)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        if result.rowcount:
+            logger.info(f"Pruned {result.rowcount} finished outbox email(s)")
+        return result.rowcount
@@ -14,9 +14,13 @@ from backend.models.ir.backronym_set import BackronymSet
 from backend.models.ir.enums import Mode, SetStatus
 from backend.services.auth_service import GameType
 from backend.services.ir.backronym_set_service import BackronymSetService
+from backend.services.ir.open_set_index import get_ir_open_set_index
 from backend.services.phrase_validator import PhraseValidator
 from backend.services.transaction_service import TransactionService
 
+# Open sets tried before starting a new one when other workers keep winning the last slot
+RESERVE_ATTEMPTS = 3
+
 
 class IRAssignmentError(RuntimeError):
     """Raised when an assignment command cannot be completed."""
@@ -80,28 +84,61 @@ class IRAssignmentService:
             if set_obj:
                 return existing, set_obj
 
-        set_obj = await self.set_service.get_available_set_for_entry(
-            exclude_player_id=str(player_uuid)
-        )
-        if not set_obj:
-            set_obj = await self.set_service.create_set(mode=mode)
-
+        index = get_ir_open_set_index()
+        for _ in range(RESERVE_ATTEMPTS):
+            set_obj = await self.set_service.reserve_set_for_entry(player_uuid)
+            if not set_obj:
+                break
+            set_id = set_obj.set_id
+            result = await self._persist_assignment(player_uuid, set_obj)
+            if result:
+                return result
+            # Another worker took the last slot first; refresh that set and pick again
+            await index.resync(self.db, set_id)
+
+        set_obj = await self.set_service.create_set(mode=mode)
+        index.note_reserved(set_obj.set_id, player_uuid)
+        result = await self._persist_assignment(player_uuid, set_obj)
+        if not result:
+            raise IRAssignmentError("assignment_conflict")
+        return result
+
+    async def _persist_assignment(
+        self,
+        player_uuid: uuid.UUID,
+        set_obj: BackronymSet,
+    ) -> tuple[IRAssignment, BackronymSet] | None:
+        """Insert the assignment for a reserved slot and commit it.
+
+        The slot is re-checked in the database inside the insert transaction, so
+        a stale index on another worker cannot overfill the set. Returns None,
+        with nothing written, when the set filled up or closed meanwhile.
+        """
+        index = get_ir_open_set_index()
+        # Read before any rollback expires set_obj
+        set_id = set_obj.set_id
         assignment = IRAssignment(
             assignment_id=uuid.uuid4(),
             assignment_token=uuid.uuid4(),
             player_id=player_uuid,
-            set_id=set_obj.set_id,
+            set_id=set_id,
             status="assigned",
             assigned_at=datetime.now(UTC),
         )
         self.db.add(assignment)
 
         try:
+            await self.db.flush([assignment])
+            if not await self.set_service.confirm_reservation(set_id):
+                await self.db.rollback()
+                index.release(set_id, player_uuid)
+                return None
             await self.db.commit()
             await self.db.refresh(assignment)
             return assignment, set_obj
         except IntegrityError:
             await self.db.rollback()
+            index.release(set_id, player_uuid)
             existing = await self.get_active_assignment(player_uuid)
             if not existing:
                 raise IRAssignmentError("assignment_conflict")
@@ -109,6 +146,10 @@ class IRAssignmentService:
             if not existing_set:
                 raise IRAssignmentError("assignment_set_not_found")
             return existing, existing_set
+        except Exception:
+            await self.db.rollback()
+            index.release(set_id, player_uuid)
+            raise
 
     async def submit(
         self,
@@ -193,6 +234,7 @@ class IRAssignmentService:
         except Exception:
             await self.db.rollback()
             raise
+        get_ir_open_set_index().note_entries(set_uuid, [player_uuid])
 
         set_obj = await self.set_service.get_set_by_id(set_uuid)
         if set_obj and set_obj.entry_count >= 5 and set_obj.status == SetStatus.OPEN:
@@ -4,7 +4,7 @@ import logging
 import uuid
 from datetime import datetime, UTC, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import func, select, and_, or_, update
+from sqlalchemy import select, and_, func, or_, update
 
 from backend.config import get_settings
 from backend.models.ir.backronym_set import BackronymSet
@@ -14,6 +14,7 @@ from backend.models.ir.backronym_observer_guard import BackronymObserverGuard
 from backend.models.ir.enums import SetStatus, Mode
 from backend.services.ir.word_service import WordService, WordError
 from backend.services.ir.queue_service import QueueService
+from backend.services.ir.open_set_index import get_ir_open_set_index
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +69,7 @@ class BackronymSetService:
             # Now commit everything together
             await self.db.commit()
             await self.db.refresh(set_obj)
+            get_ir_open_set_index().add_set(set_obj.set_id, set_obj.created_at)
             await self.queue_service.enqueue_entry_set(set_id_str)
 
             logger.info(f"Created IR backronym set {set_obj.set_id} with word {word}")
@@ -98,7 +100,8 @@ class BackronymSetService:
         """Get an open set for a player to join.
 
         Prioritizes recently created open sets to avoid spreading players across
-        multiple sets.
+        multiple sets. Served from the in-memory open-set index; does not reserve
+        a slot (see ``reserve_set_for_entry``).
 
         Args:
             exclude_player_id: Optional player ID to exclude (if player already
@@ -108,47 +111,69 @@ class BackronymSetService:
             BackronymSet or None if no available sets
         """
         try:
-            from backend.models.ir.assignment import IRAssignment
+            set_id = await get_ir_open_set_index().find(self.db, exclude_player_id)
+            return await self.get_set_by_id(set_id) if set_id else None
 
-            # Find open sets that are not too old
-            age_limit = datetime.now(UTC) - timedelta(
-                minutes=self.settings.ir_rapid_entry_timeout_minutes * 2
-            )
-            reserved_assignments = (
-                select(func.count(IRAssignment.assignment_id))
-                .where(
-                    IRAssignment.set_id == BackronymSet.set_id,
-                    IRAssignment.status.in_(("assigned", "submitting")),
-                )
-                .correlate(BackronymSet)
-                .scalar_subquery()
-            )
-            stmt = select(BackronymSet).where(
-                and_(
-                    BackronymSet.status == SetStatus.OPEN,
-                    BackronymSet.created_at >= age_limit,
-                    BackronymSet.entry_count + reserved_assignments < 5,
-                )
-            )
+        except Exception as e:
+            logger.error(f"Error getting available set: {e}")
+            return None
 
-            # If player specified, exclude sets where they already have entry
-            if exclude_player_id:
-                existing_entries = select(BackronymEntry.set_id).where(
-                    BackronymEntry.player_id == exclude_player_id
-                )
-                stmt = stmt.where(
-                    ~BackronymSet.set_id.in_(existing_entries)
-                )
+    async def reserve_set_for_entry(self, player_id: uuid.UUID) -> BackronymSet | None:
+        """Reserve a slot for the player in an open set.
 
-            # Order by created_at DESC (most recent first)
-            stmt = stmt.order_by(BackronymSet.created_at.desc()).limit(1)
+        The reservation is held in the open-set index; the caller persists it as
+        an assignment and releases it via the index if that fails.
 
-            result = await self.db.execute(stmt)
-            return result.scalars().first()
+        Args:
+            player_id: Player UUID
 
-        except Exception as e:
-            logger.error(f"Error getting available set: {e}")
+        Returns:
+            BackronymSet or None if no set has a free slot for the player
+        """
+        index = get_ir_open_set_index()
+        set_id = await index.reserve(self.db, player_id)
+        if not set_id:
+            return None
+        set_obj = await self.get_set_by_id(set_id)
+        if not set_obj or set_obj.status != SetStatus.OPEN:
+            # Closed by another worker since the index was built
+            index.release(set_id, player_id)
+            index.close(set_id)
             return None
+        return set_obj
+
+    async def confirm_reservation(self, set_id: uuid.UUID) -> bool:
+        """Check in the database that a just-flushed assignment fits in its set.
+
+        Must run in the transaction that inserted the assignment, before commit.
+        The set row is locked (``FOR NO KEY UPDATE`` on PostgreSQL; SQLite already
+        holds the write lock after the insert), so concurrent reservations for
+        one set are counted one after another and at most five can commit.
+
+        Args:
+            set_id: Set UUID
+
+        Returns:
+            True if the set is still open and entries plus reservations fit
+        """
+        from backend.models.ir.assignment import IRAssignment
+        from backend.services.ir.open_set_index import RESERVED_STATUSES, SET_CAPACITY
+
+        row = (await self.db.execute(
+            select(BackronymSet.status, BackronymSet.entry_count)
+            .where(BackronymSet.set_id == set_id)
+            .with_for_update(key_share=True)
+        )).first()
+        if not row or row.status != SetStatus.OPEN:
+            return False
+
+        reserved = await self.db.scalar(
+            select(func.count(IRAssignment.assignment_id)).where(
+                IRAssignment.set_id == set_id,
+                IRAssignment.status.in_(RESERVED_STATUSES),
+            )
+        )
+        return row.entry_count + reserved <= SET_CAPACITY
 
     async def add_entry(
         self,
@@ -182,6 +207,9 @@ class BackronymSetService:
             if set_obj.status != SetStatus.OPEN:
                 raise BackronymSetError("set_not_open")
 
+            if set_obj.entry_count >= 5:
+                raise BackronymSetError("set_full")
+
             # Create entry
             entry = BackronymEntry(
                 entry_id=uuid.uuid4(),
@@ -223,6 +251,7 @@ class BackronymSetService:
             if auto_commit:
                 await self.db.commit()
                 await self.db.refresh(entry)
+                get_ir_open_set_index().note_entries(set_id, [player_id])
             else:
                 await self.db.flush([entry])
 
@@ -242,6 +271,70 @@ class BackronymSetService:
             await self.db.rollback()
             raise BackronymSetError(f"Failed to add entry: {str(e)}") from e
 
+    async def add_entries(
+        self,
+        set_id: str,
+        player_backronyms: list[tuple[str, list[str]]],
+        is_ai: bool = True,
+    ) -> list[BackronymEntry]:
+        """Add several backronym entries to a set in one transaction.
+
+        Used by the AI backup cycle to fill a set's remaining slots at once.
+        Entries beyond the set's free slots are ignored.
+
+        Args:
+            set_id: Set UUID
+            player_backronyms: (player_id, backronym word array) pairs
+            is_ai: Whether these are AI-generated entries
+
+        Returns:
+            list[BackronymEntry]: Created entries
+
+        Raises:
+            BackronymSetError: If entry creation fails
+        """
+        try:
+            set_obj = await self.get_set_by_id(set_id)
+            if not set_obj:
+                raise BackronymSetError("set_not_found")
+
+            if set_obj.status != SetStatus.OPEN:
+                raise BackronymSetError("set_not_open")
+
+            now = datetime.now(UTC)
+            free_slots = max(0, 5 - set_obj.entry_count)
+            entries = [
+                BackronymEntry(
+                    entry_id=uuid.uuid4(),
+                    set_id=set_id,
+                    player_id=player_id,
+                    backronym_text=backronym_text,
+                    is_ai=is_ai,
+                    submitted_at=now,
+                )
+                for player_id, backronym_text in player_backronyms[:free_slots]
+            ]
+            if not entries:
+                return []
+
+            self.db.add_all(entries)
+            set_obj.entry_count += len(entries)
+            await self.db.commit()
+            get_ir_open_set_index().note_entries(set_id, [entry.player_id for entry in entries])
+
+            logger.info(f"Added {len(entries)} entries to set {set_id}")
+
+            if set_obj.entry_count >= 5:
+                await self.transition_to_voting(set_id)
+
+            return entries
+
+        except BackronymSetError:
+            raise
+        except Exception as e:
+            await self.db.rollback()
+            raise BackronymSetError(f"Failed to add entries: {str(e)}") from e
+
     async def transition_to_voting(self, set_id: str) -> BackronymSet:
         """Transition set from open to voting phase.
 
@@ -268,7 +361,7 @@ class BackronymSetService:
             now = datetime.now(UTC)
             from backend.models.ir.assignment import IRAssignment
 
-            await self.db.execute(
+            expired = await self.db.execute(
                 update(IRAssignment)
                 .where(
                     IRAssignment.set_id == set_obj.set_id,
@@ -279,7 +372,10 @@ class BackronymSetService:
                     expired_at=now,
                     version=IRAssignment.version + 1,
                 )
+                .returning(IRAssignment.player_id)
+                .execution_options(synchronize_session=False)
             )
+            expired_player_ids = expired.scalars().all()
             if set_obj.mode == Mode.RAPID:
                 set_obj.voting_finalized_at = now + timedelta(
                     minutes=self.settings.ir_rapid_voting_timer_minutes
@@ -291,6 +387,9 @@ class BackronymSetService:
 
             await self.db.commit()
             await self.db.refresh(set_obj)
+            index = get_ir_open_set_index()
+            index.expire(set_id, expired_player_ids)
+            index.close(set_id)
             await self.queue_service.dequeue_entry_set(set_id)
             await self.queue_service.enqueue_voting_set(set_id)
 
@@ -370,37 +469,117 @@ class BackronymSetService:
                 f"Added vote {vote.vote_id} to set {set_id} from {player_id=}"
             )
 
-            # Check if we should finalize:
-            # Finalize when all 5 participant creators have voted
-            # Non-participant votes are "up to 5" but not required for finalization
-            participant_votes = (
-                await self.db.execute(
-                    select(BackronymVote).where(
-                        and_(
-                            BackronymVote.set_id == set_id,
-                            BackronymVote.is_participant_voter == True,
-                        )
-                    )
+            await self._finalize_if_participants_voted(set_obj)
+
+            return vote
+
+        except BackronymSetError:
+            raise
+        except Exception as e:
+            await self.db.rollback()
+            raise BackronymSetError(f"Failed to add vote: {str(e)}") from e
+
+    async def add_votes(
+        self,
+        set_id: str,
+        player_choices: list[tuple[str, str]],
+        is_participant_voter: bool = False,
+        is_ai: bool = True,
+    ) -> list[BackronymVote]:
+        """Add several votes to a set in one transaction.
+
+        Args:
+            set_id: Set UUID
+            player_choices: (player_id, chosen_entry_id) pairs
+            is_participant_voter: Whether the voters participated in entry creation
+            is_ai: Whether these are AI votes
+
+        Returns:
+            list[BackronymVote]: Created votes
+
+        Raises:
+            BackronymSetError: If vote addition fails
+        """
+        if not player_choices:
+            return []
+
+        try:
+            set_obj = await self.get_set_by_id(set_id)
+            if not set_obj:
+                raise BackronymSetError("set_not_found")
+
+            if set_obj.status != SetStatus.VOTING:
+                raise BackronymSetError("set_not_in_voting_phase")
+
+            now = datetime.now(UTC)
+            votes = [
+                BackronymVote(
+                    set_id=set_id,
+                    player_id=player_id,
+                    chosen_entry_id=chosen_entry_id,
+                    is_participant_voter=is_participant_voter,
+                    is_ai=is_ai,
+                    created_at=now,
                 )
-            ).scalars().all()
+                for player_id, chosen_entry_id in player_choices
+            ]
+            self.db.add_all(votes)
 
-            participant_vote_count = len(participant_votes)
+            set_obj.vote_count += len(votes)
+            if not is_ai:
+                set_obj.last_human_vote_at = now
+            if not is_participant_voter:
+                set_obj.non_participant_vote_count += len(votes)
 
-            # Finalize if all 5 participant creators have voted
-            if participant_vote_count >= 5:
-                await self.finalize_set(set_id)
-                logger.info(
-                    f"Set {set_id} finalized after {participant_vote_count} participant votes "
-                    f"and {set_obj.non_participant_vote_count} non-participant votes"
+            votes_per_entry: dict[str, int] = {}
+            for _, chosen_entry_id in player_choices:
+                votes_per_entry[str(chosen_entry_id)] = votes_per_entry.get(str(chosen_entry_id), 0) + 1
+            entries = (
+                await self.db.execute(
+                    select(BackronymEntry).where(BackronymEntry.entry_id.in_(list(votes_per_entry)))
                 )
+            ).scalars().all()
+            for entry in entries:
+                entry.received_votes += votes_per_entry[str(entry.entry_id)]
 
-            return vote
+            await self.db.commit()
+            logger.debug(f"Added {len(votes)} votes to set {set_id}")
+
+            await self._finalize_if_participants_voted(set_obj)
+            return votes
 
         except BackronymSetError:
             raise
         except Exception as e:
             await self.db.rollback()
-            raise BackronymSetError(f"Failed to add vote: {str(e)}") from e
+            raise BackronymSetError(f"Failed to add votes: {str(e)}") from e
+
+    async def _finalize_if_participants_voted(self, set_obj: BackronymSet) -> None:
+        """Finalize the set once all 5 participant creators have voted.
+
+        Non-participant votes are "up to 5" but not required for finalization.
+        """
+        set_id = str(set_obj.set_id)
+        participant_votes = (
+            await self.db.execute(
+                select(BackronymVote).where(
+                    and_(
+                        BackronymVote.set_id == set_id,
+                        BackronymVote.is_participant_voter == True,
+                    )
+                )
+            )
+        ).scalars().all()
+
+        participant_vote_count = len(participant_votes)
+
+        # Finalize if all 5 participant creators have voted
+        if participant_vote_count >= 5:
+            await self.finalize_set(set_id)
+            logger.info(
+                f"Set {set_id} finalized after {participant_vote_count} participant votes "
+                f"and {set_obj.non_participant_vote_count} non-participant votes"
+            )
 
     async def finalize_set(self, set_id: str) -> BackronymSet:
         """Finalize a set after voting period ends.
@@ -0,0 +1,229 @@
+"""In-memory matchmaking index of open IR backronym sets.
+
+Keeps every open set with its filled and reserved slot counts and the players
+who already entered or reserved it, so picking a set for ``/ir/start`` is a
+walk over the (few) open sets instead of a correlated assignment count plus a
+scan of every entry the player ever wrote. Reservations are taken under one
+lock, so concurrent starts on this worker never pick the same last slot; the
+assignment insert then confirms the slot against the database (see
+``BackronymSetService.confirm_reservation``), which settles races between
+workers whose indexes are stale.
+
+The index is updated by set creation, assignment, entry submission and the move
+to voting, and rebuilt from the database when older than
+``ir_open_set_reconcile_seconds`` (which also picks up other workers' changes).
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, UTC
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import get_settings
+from backend.models.ir.assignment import IRAssignment
+from backend.models.ir.backronym_entry import BackronymEntry
+from backend.models.ir.backronym_set import BackronymSet
+from backend.models.ir.enums import SetStatus
+from backend.utils.datetime_helpers import ensure_utc
+
+logger = logging.getLogger(__name__)
+
+SET_CAPACITY = 5
+RESERVED_STATUSES = ("assigned", "submitting")
+
+
+def _as_uuid(value) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+class OpenSetSlots:
+    """Slot usage of one open set."""
+
+    __slots__ = ("set_id", "created_at", "entry_count", "reserved", "players")
+
+    def __init__(self, set_id: UUID, created_at: datetime, entry_count: int = 0):
+        self.set_id = set_id
+        self.created_at = ensure_utc(created_at)
+        self.entry_count = entry_count
+        # Players holding an unsubmitted assignment
+        self.reserved: set[UUID] = set()
+        # Players who entered or reserved the set (never matched to it again)
+        self.players: set[UUID] = set()
+
+    @property
+    def free_slots(self) -> int:
+        return SET_CAPACITY - self.entry_count - len(self.reserved)
+
+
+class IROpenSetIndex:
+    """Process-wide index of open sets, newest last."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all state; the index is rebuilt from the database on next use."""
+        self._sets: OrderedDict[UUID, OpenSetSlots] = OrderedDict()
+        self._reconciled_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def peek(self, set_id) -> Optional[OpenSetSlots]:
+        return self._sets.get(_as_uuid(set_id))
+
+    def _age_limit(self) -> datetime:
+        settings = get_settings()
+        return datetime.now(UTC) - timedelta(minutes=settings.ir_rapid_entry_timeout_minutes * 2)
+
+    def _is_fresh(self) -> bool:
+        if self._reconciled_at is None:
+            return False
+        return time.monotonic() - self._reconciled_at < get_settings().ir_open_set_reconcile_seconds
+
+    def _pick(self, player_id: Optional[UUID]) -> Optional[OpenSetSlots]:
+        """Newest open set that is young enough, has a free slot and is new to the player."""
+        age_limit = self._age_limit()
+        for slots in reversed(self._sets.values()):
+            if slots.created_at < age_limit:
+                # Older sets only get older; the rest are past the limit too
+                break
+            if slots.free_slots > 0 and (player_id is None or player_id not in slots.players):
+                return slots
+        return None
+
+    async def find(self, db: AsyncSession, player_id=None) -> Optional[UUID]:
+        """Return an available set id without reserving it."""
+        async with self._lock:
+            if not self._is_fresh():
+                await self.reconcile(db)
+            slots = self._pick(_as_uuid(player_id) if player_id else None)
+            return slots.set_id if slots else None
+
+    async def reserve(self, db: AsyncSession, player_id) -> Optional[UUID]:
+        """Reserve a slot for the player in the best open set; None if none is available.
+
+        The caller persists the assignment and calls ``release`` if that fails.
+        """
+        player_uuid = _as_uuid(player_id)
+        async with self._lock:
+            if not self._is_fresh():
+                await self.reconcile(db)
+            slots = self._pick(player_uuid)
+            if slots is None:
+                return None
+            slots.reserved.add(player_uuid)
+            slots.players.add(player_uuid)
+            return slots.set_id
+
+    def add_set(self, set_id, created_at: datetime) -> None:
+        """Register a newly created open set."""
+        set_uuid = _as_uuid(set_id)
+        if set_uuid not in self._sets:
+            self._sets[set_uuid] = OpenSetSlots(set_uuid, created_at)
+
+    def note_reserved(self, set_id, player_id) -> None:
+        """Record a reservation made outside ``reserve`` (e.g. on a set just created)."""
+        slots = self.peek(set_id)
+        if slots:
+            player_uuid = _as_uuid(player_id)
+            slots.reserved.add(player_uuid)
+            slots.players.add(player_uuid)
+
+    def release(self, set_id, player_id) -> None:
+        """Undo a reservation whose assignment was not persisted."""
+        slots = self.peek(set_id)
+        if slots:
+            player_uuid = _as_uuid(player_id)
+            slots.reserved.discard(player_uuid)
+            slots.players.discard(player_uuid)
+
+    def note_entries(self, set_id, player_ids: Iterable) -> None:
+        """Committed entries fill slots (converting their players' reservations)."""
+        slots = self.peek(set_id)
+        if not slots:
+            return
+        for player_id in player_ids:
+            player_uuid = _as_uuid(player_id)
+            slots.reserved.discard(player_uuid)
+            slots.players.add(player_uuid)
+            slots.entry_count += 1
+
+    def close(self, set_id) -> None:
+        """The set left OPEN (moved to voting)."""
+        self._sets.pop(_as_uuid(set_id), None)
+
+    def expire(self, set_id, player_ids: Iterable) -> None:
+        """Expired assignments give their slots back (the players stay excluded)."""
+        slots = self.peek(set_id)
+        if slots:
+            for player_id in player_ids:
+                slots.reserved.discard(_as_uuid(player_id))
+
+    async def resync(self, db: AsyncSession, set_id) -> None:
+        """Reload one set's slots, e.g. after another worker took its last slot."""
+        set_uuid = _as_uuid(set_id)
+        loaded = await self._load(db, BackronymSet.set_id == set_uuid)
+        if set_uuid not in loaded:
+            self._sets.pop(set_uuid, None)
+        elif set_uuid in self._sets:
+            # Replace in place to keep the newest-last order
+            self._sets[set_uuid] = loaded[set_uuid]
+
+    async def reconcile(self, db: AsyncSession) -> int:
+        """Rebuild from the database; returns the number of open sets indexed."""
+        self._sets = await self._load(db, BackronymSet.created_at >= self._age_limit())
+        self._reconciled_at = time.monotonic()
+        logger.debug(f"IR open set index reconciled: {len(self._sets)} open set(s)")
+        return len(self._sets)
+
+    async def _load(self, db: AsyncSession, set_filter) -> OrderedDict[UUID, OpenSetSlots]:
+        """Slots of the OPEN sets matching ``set_filter``, oldest first."""
+        open_sets = (
+            select(BackronymSet.set_id)
+            .where(BackronymSet.status == SetStatus.OPEN, set_filter)
+        )
+        set_rows = (await db.execute(
+            select(BackronymSet.set_id, BackronymSet.created_at, BackronymSet.entry_count)
+            .where(BackronymSet.status == SetStatus.OPEN, set_filter)
+            .order_by(BackronymSet.created_at)
+        )).all()
+        sets: OrderedDict[UUID, OpenSetSlots] = OrderedDict(
+            (row.set_id, OpenSetSlots(row.set_id, row.created_at, row.entry_count))
+            for row in set_rows
+        )
+
+        if sets:
+            reserved_rows = await db.execute(
+                select(IRAssignment.set_id, IRAssignment.player_id)
+                .where(IRAssignment.set_id.in_(open_sets), IRAssignment.status.in_(RESERVED_STATUSES))
+            )
+            for set_id, player_id in reserved_rows.all():
+                slots = sets.get(set_id)
+                if slots:
+                    slots.reserved.add(player_id)
+                    slots.players.add(player_id)
+
+            entry_rows = await db.execute(
+                select(BackronymEntry.set_id, BackronymEntry.player_id)
+                .where(BackronymEntry.set_id.in_(open_sets))
+            )
+            for set_id, player_id in entry_rows.all():
+                slots = sets.get(set_id)
+                if slots:
+                    slots.players.add(player_id)
+        return sets
+
+
+# Global singleton instance
+_ir_open_set_index = IROpenSetIndex()
+
+
+def get_ir_open_set_index() -> IROpenSetIndex:
+    """Get the global IROpenSetIndex singleton."""
+    return _ir_open_set_index
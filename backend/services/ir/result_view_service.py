@@ -68,10 +68,10 @@ class IRResultViewService:
             result_view = result_view_result.scalars().first()
 
             if not result_view:
-                # First time viewing result
-                # Try to calculate payout
+                # First time viewing result (no row recorded at finalization)
+                # Look up the payout in the set's snapshot
                 try:
-                    payouts = await self.scoring_service.calculate_payouts(set_id)
+                    payouts = await self.scoring_service.get_payouts(set_id)
 
                     payout_amount = 0
                     payout_source = None
@@ -107,10 +107,15 @@ class IRResultViewService:
                     f"Claimed result for {player_id=} on set {set_id}, payout: {payout_amount}"
                 )
             else:
-                # Already claimed, just update last viewed
+                # Already claimed or recorded at finalization: flip the flag
+                now = datetime.now(UTC)
                 payout_amount = result_view.payout_amount
                 result_view.result_viewed = True
-                result_view.viewed_at = datetime.now(UTC)
+                result_view.viewed_at = now
+                if not result_view.first_viewed_at:
+                    result_view.first_viewed_at = now
+                if not result_view.result_viewed_at:
+                    result_view.result_viewed_at = now
                 await self.db.commit()
 
             # Get set details for display
@@ -139,6 +144,9 @@ class IRResultViewService:
     async def get_pending_results(self, player_id: str) -> list[dict]:
         """Get unclaimed/pending results for a player.
 
+        Payouts are recorded per player as ``IRResultView`` rows when a set is
+        finalized, so this is a single indexed lookup on (player_id, result_viewed).
+
         Args:
             player_id: Player UUID
 
@@ -146,52 +154,33 @@ class IRResultViewService:
             list[dict]: Pending results
         """
         try:
-            # Get all finalized sets
-            sets_stmt = select(BackronymSet).where(
-                BackronymSet.status == SetStatus.FINALIZED
-            )
-            sets_result = await self.db.execute(sets_stmt)
-            finalized_sets = sets_result.scalars().all()
-
-            pending = []
-
-            for set_obj in finalized_sets:
-                # Check if player has result view record
-                result_view_stmt = select(IRResultView).where(
-                    (IRResultView.set_id == str(set_obj.set_id))
-                    & (IRResultView.player_id == player_id)
+            stmt = (
+                select(
+                    IRResultView.set_id,
+                    IRResultView.payout_amount,
+                    BackronymSet.word,
+                    BackronymSet.finalized_at,
+                )
+                .join(BackronymSet, BackronymSet.set_id == IRResultView.set_id)
+                .where(
+                    IRResultView.player_id == player_id,
+                    IRResultView.result_viewed == False,
+                    IRResultView.payout_amount > 0,
+                    BackronymSet.status == SetStatus.FINALIZED,
                 )
-                result_view_result = await self.db.execute(result_view_stmt)
-                result_view = result_view_result.scalars().first()
-
-                # Show as pending if no result view or not fully viewed
-                if not result_view or not result_view.result_viewed:
-                    try:
-                        payouts = await self.scoring_service.calculate_payouts(
-                            str(set_obj.set_id)
-                        )
-
-                        payout_amount = 0
-
-                        if str(player_id) in payouts.get("voter_payouts", {}):
-                            payout_amount = payouts["voter_payouts"][str(player_id)]
-                        elif str(player_id) in payouts.get("creator_payouts", {}):
-                            payout_info = payouts["creator_payouts"][str(player_id)]
-                            payout_amount = payout_info.get("amount", 0)
-
-                        if payout_amount > 0:
-                            pending.append(
-                                {
-                                    "set_id": str(set_obj.set_id),
-                                    "word": set_obj.word,
-                                    "payout_amount": payout_amount,
-                                    "finalized_at": set_obj.finalized_at.isoformat(),
-                                }
-                            )
-                    except IRScoringError:
-                        logger.warning(f"Could not calculate payouts for set {set_obj.set_id}")
-
-            return pending
+                .order_by(BackronymSet.finalized_at.desc())
+            )
+            result = await self.db.execute(stmt)
+
+            return [
+                {
+                    "set_id": str(row.set_id),
+                    "word": row.word,
+                    "payout_amount": row.payout_amount,
+                    "finalized_at": row.finalized_at.isoformat() if row.finalized_at else None,
+                }
+                for row in result.all()
+            ]
 
         except Exception as e:
             logger.error(f"Error getting pending results: {e}")
@@ -216,7 +205,7 @@ class IRResultViewService:
 
             # Get more details
             try:
-                payouts = await self.scoring_service.calculate_payouts(set_id)
+                payouts = await self.scoring_service.get_payouts(set_id)
                 result["full_payouts"] = payouts
             except IRScoringError:
                 pass
@@ -238,7 +227,7 @@ class IRResultViewService:
             dict: Set result details
         """
         try:
-            payouts = await self.scoring_service.calculate_payouts(set_id)
+            payouts = await self.scoring_service.get_payouts(set_id)
 
             winning_entry_id = payouts.get("winning_entry_id")
 
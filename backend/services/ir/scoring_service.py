@@ -8,10 +8,10 @@ from backend.config import get_settings
 from backend.models.ir.backronym_set import BackronymSet
 from backend.models.ir.backronym_entry import BackronymEntry
 from backend.models.ir.backronym_vote import BackronymVote
+from backend.models.ir.payout_snapshot import IRPayoutSnapshot
 from backend.models.ir.result_view import IRResultView
-from backend.services.transaction_service import TransactionService
+from backend.services.transaction_service import LedgerMovement, TransactionService
 from backend.utils.model_registry import GameType
-from backend.utils.exceptions import InsufficientBalanceError
 
 logger = logging.getLogger(__name__)
 
@@ -33,9 +33,33 @@ class IRScoringService:
         self.settings = get_settings()
         self.transaction_service = TransactionService(db, game_type=GameType.IR)
 
+    async def get_payouts(self, set_id: str) -> dict:
+        """Get the payouts of a finalized set from its snapshot (primary-key read).
+
+        Sets finalized before snapshots existed have none; their payouts are
+        recomputed (read-only callers do not persist the result).
+
+        Args:
+            set_id: Set UUID
+
+        Returns:
+            dict: Payout information, as returned by ``calculate_payouts``
+
+        Raises:
+            IRScoringError: If the set does not exist or calculation fails
+        """
+        snapshot = await self.db.get(IRPayoutSnapshot, set_id)
+        if snapshot:
+            return snapshot.payouts
+        logger.debug(f"No payout snapshot for set {set_id}; recomputing")
+        return await self.calculate_payouts(set_id)
+
     async def calculate_payouts(self, set_id: str) -> dict:
         """Calculate all payouts for a finalized set.
 
+        Runs once, from ``process_payouts`` at finalization; read paths use
+        ``get_payouts``. Entries and votes are each aggregated in a single pass.
+
         Enforces creator vote requirement: creators must vote to receive payout.
         Otherwise, their share is forfeited to the vault.
 
@@ -80,104 +104,86 @@ class IRScoringService:
             votes_result = await self.db.execute(votes_stmt)
             votes = votes_result.scalars().all()
 
-            # Calculate entry costs (100 IC per human entry)
-            human_entries = [e for e in entries if not e.is_ai]
-            entry_costs = len(human_entries) * self.settings.ir_backronym_entry_cost
-
-            # Calculate vote costs (10 IC per non-participant vote)
-            non_participant_votes = [
-                v for v in votes if not v.is_participant_voter and not v.is_ai
-            ]
-            vote_contributions = len(non_participant_votes) * self.settings.ir_vote_cost
-
-            # Total pool = entry costs + vote costs from non-participants
-            total_pool = entry_costs + vote_contributions
-
-            # Find winning entry (most votes)
-            winning_entry = max(entries, key=lambda e: e.received_votes)
+            # One pass over entries: human entry count, winner, total votes received
+            human_entries_count = 0
+            winning_entry = None
+            total_votes_for_creators = 0
+            for entry in entries:
+                if not entry.is_ai:
+                    human_entries_count += 1
+                if winning_entry is None or entry.received_votes > winning_entry.received_votes:
+                    winning_entry = entry
+                total_votes_for_creators += entry.received_votes
+            if winning_entry is None:
+                raise IRScoringError("no_entries")
             vote_winner_count = winning_entry.received_votes
 
-            # Get all voters and determine winners
+            # One pass over votes: non-participant contributions and correct
+            # voters, and which creators cast a vote
+            non_participant_payout_per_winner = self.settings.ir_vote_reward_correct
+            non_participant_votes_count = 0
             voter_payouts = {}
+            creator_votes = set()
+            for vote in votes:
+                if vote.is_participant_voter:
+                    creator_votes.add(str(vote.player_id))
+                elif not vote.is_ai:
+                    non_participant_votes_count += 1
+                    # Correct non-participant voters get 20 IC each
+                    if vote.chosen_entry_id == winning_entry.entry_id:
+                        voter_payouts[str(vote.player_id)] = non_participant_payout_per_winner
+                        vote.is_correct_popular = True
 
-            # Process non-participant voters (correct voters get 20 IC each)
-            non_participant_correct_voters = [
-                v for v in non_participant_votes
-                if v.chosen_entry_id == winning_entry.entry_id
-            ]
+            # Total pool = entry costs (100 IC per human entry) + vote costs
+            # (10 IC per non-participant vote)
+            entry_costs = human_entries_count * self.settings.ir_backronym_entry_cost
+            vote_contributions = non_participant_votes_count * self.settings.ir_vote_cost
+            total_pool = entry_costs + vote_contributions
 
-            non_participant_payout_per_winner = self.settings.ir_vote_reward_correct
+            non_participant_correct_voters = len(voter_payouts)
             non_participant_payouts_paid = (
-                len(non_participant_correct_voters) * non_participant_payout_per_winner
+                non_participant_correct_voters * non_participant_payout_per_winner
             )
 
-            for voter in non_participant_correct_voters:
-                voter_payouts[str(voter.player_id)] = non_participant_payout_per_winner
-                # Mark vote as correct for non-participants
-                for vote in votes:
-                    if (
-                        str(vote.player_id) == str(voter.player_id)
-                        and not vote.is_participant_voter
-                    ):
-                        vote.is_correct_popular = True
-
             # Remaining pool for creators (after non-participant payouts)
             creator_final_pool = total_pool - non_participant_payouts_paid
 
-            # Check which creators voted
-            creator_votes = {}
-            for vote in votes:
-                if vote.is_participant_voter:
-                    creator_votes[str(vote.player_id)] = True
-
             # Distribute creator pool pro-rata based on votes received
             # BUT only to creators who cast votes
-            total_votes_for_creators = sum(e.received_votes for e in entries)
             creator_payouts_dict = {}
             forfeited_entries = []
             total_forfeited = 0
+            vault_rake_pct = self.settings.ir_vault_rake_percent  # 30%
 
             if total_votes_for_creators > 0:
                 for entry in entries:
                     creator_id = str(entry.player_id)
-                    share_pct = (
-                        (entry.received_votes / total_votes_for_creators) * 100
-                        if total_votes_for_creators > 0
-                        else 0
-                    )
+                    vote_share = entry.received_votes / total_votes_for_creators
+                    share_pct = vote_share * 100
 
                     # Update entry with vote share percentage
                     entry.vote_share_pct = int(share_pct)
 
-                    # Check if creator voted
-                    creator_voted = creator_id in creator_votes
-
-                    if entry.received_votes > 0 and creator_voted:
-                        creator_payout = int(
-                            creator_final_pool * (entry.received_votes / total_votes_for_creators)
-                        )
+                    if entry.received_votes <= 0:
+                        continue
 
+                    creator_payout = int(creator_final_pool * vote_share)
+                    if creator_id in creator_votes:
                         # Apply 30% vault rake to creator payout
-                        vault_rake_pct = self.settings.ir_vault_rake_percent  # 30%
                         vault_rake = int(creator_payout * (vault_rake_pct / 100))
-                        net_payout = creator_payout - vault_rake
-
                         creator_payouts_dict[creator_id] = {
-                            "amount": net_payout,
+                            "amount": creator_payout - vault_rake,
                             "vault_contribution": vault_rake,
                             "vote_share_pct": int(share_pct),
                         }
-                    elif entry.received_votes > 0 and not creator_voted:
+                    else:
                         # Creator didn't vote - forfeit to vault
                         entry.forfeited_to_vault = True
                         forfeited_entries.append(str(entry.entry_id))
-                        forfeited_amount = int(
-                            creator_final_pool * (entry.received_votes / total_votes_for_creators)
-                        )
-                        total_forfeited += forfeited_amount
+                        total_forfeited += creator_payout
                         logger.info(
                             f"Creator {creator_id} for entry {entry.entry_id} did not vote - "
-                            f"forfeiting {forfeited_amount} to vault"
+                            f"forfeiting {creator_payout} to vault"
                         )
 
             # Update set with pool totals
@@ -191,7 +197,7 @@ class IRScoringService:
             await self.db.flush()
 
             return {
-                "set_id": set_id,
+                "set_id": str(set_id),
                 "total_pool": total_pool,
                 "entry_costs": entry_costs,
                 "vote_contributions": vote_contributions,
@@ -200,9 +206,9 @@ class IRScoringService:
                 "winning_entry_id": str(winning_entry.entry_id),
                 "winning_entry_creator": str(winning_entry.player_id),
                 "vote_winner_count": vote_winner_count,
-                "human_entries_count": len(human_entries),
-                "non_participant_votes_count": len(non_participant_votes),
-                "non_participant_correct_voters": len(non_participant_correct_voters),
+                "human_entries_count": human_entries_count,
+                "non_participant_votes_count": non_participant_votes_count,
+                "non_participant_correct_voters": non_participant_correct_voters,
                 "non_participant_payout_each": non_participant_payout_per_winner,
                 "voter_payouts": voter_payouts,
                 "creator_payouts": creator_payouts_dict,
@@ -233,8 +239,10 @@ class IRScoringService:
             IRScoringError: If payout processing fails
         """
         try:
-            # Calculate payouts
+            # Calculate payouts and snapshot them for every later read. The
+            # snapshot's primary key also stops a set from being paid twice.
             payouts = await self.calculate_payouts(set_id)
+            self.db.add(IRPayoutSnapshot(set_id=set_id, payouts=payouts))
 
             results = {
                 "set_id": set_id,
@@ -243,124 +251,86 @@ class IRScoringService:
                 "vault_transactions": [],
             }
 
-            # Process non-participant voter payouts
-            for voter_id, amount in payouts["voter_payouts"].items():
-                try:
-                    txn = await self.transaction_service.process_vote_payout(
-                        player_id=voter_id,
-                        amount=amount,
-                        set_id=set_id,
-                        auto_commit=False,
+            # Credit every voter payout, creator payout and vault contribution
+            # with one balance update and one ledger insert
+            movements = [
+                LedgerMovement(voter_id, amount, self.transaction_service.VOTE_PAYOUT, set_id)
+                for voter_id, amount in payouts["voter_payouts"].items()
+            ]
+            for creator_id, payout_info in payouts["creator_payouts"].items():
+                movements.append(
+                    LedgerMovement(creator_id, payout_info["amount"], self.transaction_service.CREATOR_PAYOUT, set_id)
+                )
+                # Note: The vault rake was already subtracted from the net amount,
+                # so we just credit the vault directly (not debit wallet again)
+                if payout_info["vault_contribution"] > 0:
+                    movements.append(
+                        LedgerMovement(
+                            creator_id,
+                            payout_info["vault_contribution"],
+                            self.transaction_service.VAULT_CONTRIBUTION,
+                            set_id,
+                            wallet_type="vault",
+                        )
                     )
+            transactions = await self.transaction_service.apply_movements(movements)
+
+            for movement, txn in zip(movements, transactions):
+                if movement.trans_type == self.transaction_service.VOTE_PAYOUT:
                     results["voter_transactions"].append(
                         {
-                            "player_id": voter_id,
-                            "amount": amount,
+                            "player_id": movement.player_id,
+                            "amount": movement.amount,
                             "transaction_id": str(txn.transaction_id),
                         }
                     )
-                except InsufficientBalanceError as e:
-                    logger.error(f"Failed to process voter payout: {e}")
-                    results["voter_transactions"].append(
+                elif movement.wallet_type == "vault":
+                    results["vault_transactions"].append(
                         {
-                            "player_id": voter_id,
-                            "amount": amount,
-                            "error": str(e),
-                        }
-                    )
-
-            # Process creator payouts (net after vault rake)
-            for creator_id, payout_info in payouts["creator_payouts"].items():
-                net_amount = payout_info["amount"]
-                vault_contribution = payout_info["vault_contribution"]
-
-                try:
-                    # Pay creator the net amount
-                    txn = await self.transaction_service.process_creator_payout(
-                        player_id=creator_id,
-                        amount=net_amount,
-                        set_id=set_id,
-                        auto_commit=False,
-                    )
-                    results["creator_transactions"].append(
-                        {
-                            "player_id": creator_id,
-                            "amount": net_amount,
-                            "vault_contribution": vault_contribution,
+                            "player_id": movement.player_id,
+                            "amount": movement.amount,
                             "transaction_id": str(txn.transaction_id),
                         }
                     )
-
-                    # Record vault contribution from this creator
-                    # Note: The vault rake was already subtracted from net_amount,
-                    # so we just credit the vault directly (not debit wallet again)
-                    if vault_contribution > 0:
-                        vault_txn = await self.transaction_service.credit_vault(
-                            player_id=creator_id,
-                            amount=vault_contribution,
-                            transaction_type=self.transaction_service.VAULT_CONTRIBUTION,
-                            reference_id=set_id,
-                            auto_commit=False,
-                        )
-                        results["vault_transactions"].append(
-                            {
-                                "player_id": creator_id,
-                                "amount": vault_contribution,
-                                "transaction_id": str(vault_txn.transaction_id),
-                            }
-                        )
-
-                except InsufficientBalanceError as e:
-                    logger.error(f"Failed to process creator payout: {e}")
+                else:
                     results["creator_transactions"].append(
                         {
-                            "player_id": creator_id,
-                            "amount": net_amount,
-                            "vault_contribution": vault_contribution,
-                            "error": str(e),
+                            "player_id": movement.player_id,
+                            "amount": movement.amount,
+                            "vault_contribution": payouts["creator_payouts"][movement.player_id]["vault_contribution"],
+                            "transaction_id": str(txn.transaction_id),
                         }
                     )
 
-            # Emit ResultView records per creator for claim flow
-            # This ensures that creators can view their results
-            entries_stmt = select(BackronymEntry).where(
+            # Persist each recipient's payout as a ResultView so the pending
+            # results list and the claim flow never have to recompute payouts
+            recipients = {}
+            entries_stmt = select(BackronymEntry.player_id).where(
                 BackronymEntry.set_id == set_id
             )
-            entries_result = await self.db.execute(entries_stmt)
-            entries = entries_result.scalars().all()
-
-            for entry in entries:
-                creator_id = str(entry.player_id)
-
-                # Check if ResultView already exists for this creator
-                result_view_stmt = select(IRResultView).where(
-                    (IRResultView.set_id == set_id)
-                    & (IRResultView.player_id == creator_id)
-                )
-                result_view_result = await self.db.execute(result_view_stmt)
-                existing_view = result_view_result.scalars().first()
-
-                if not existing_view:
-                    # Get payout amount for this creator
-                    payout_amount = 0
-                    if creator_id in payouts.get("creator_payouts", {}):
-                        payout_amount = payouts["creator_payouts"][creator_id]["amount"]
+            for (creator_id,) in (await self.db.execute(entries_stmt)).all():
+                creator_payout = payouts["creator_payouts"].get(str(creator_id))
+                recipients[str(creator_id)] = creator_payout["amount"] if creator_payout else 0
+            recipients.update(payouts["voter_payouts"])
+
+            existing_stmt = select(IRResultView.player_id).where(IRResultView.set_id == set_id)
+            existing_viewers = {
+                str(player_id) for player_id in (await self.db.execute(existing_stmt)).scalars()
+            }
 
-                    # Create ResultView record
-                    result_view = IRResultView(
+            new_viewers = [player_id for player_id in recipients if player_id not in existing_viewers]
+            for player_id in new_viewers:
+                self.db.add(
+                    IRResultView(
                         set_id=set_id,
-                        player_id=creator_id,
+                        player_id=player_id,
                         result_viewed=False,  # Not viewed yet
-                        payout_amount=payout_amount,
+                        payout_amount=recipients[player_id],
                         viewed_at=None,
                         first_viewed_at=None,
                     )
-                    self.db.add(result_view)
-
-                    logger.info(
-                        f"Created ResultView for creator {creator_id} on set {set_id}, "
-                        f"payout: {payout_amount}"
-                    )
+                )
+            logger.info(f"Recorded pending results for {len(new_viewers)} players on set {set_id}")
 
             await self.db.commit()
 
@@ -388,7 +358,7 @@ class IRScoringService:
             dict: Summary of all payouts
         """
         try:
-            payouts = await self.calculate_payouts(set_id)
+            payouts = await self.get_payouts(set_id)
 
             total_payouts = payouts.get("total_distributed", 0)
             total_vault = payouts.get("vault_rake_amount", 0)
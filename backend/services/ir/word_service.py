@@ -3,48 +3,45 @@
 import logging
 import random
 from datetime import datetime, UTC, timedelta
-from pathlib import Path
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from backend.config import get_settings
 from backend.models.ir.ai_phrase_cache import IRAIPhraseCache
+from backend.services.dictionary import get_dictionary
 
 logger = logging.getLogger(__name__)
 
 
-def _load_dictionary_words() -> list[str]:
-    """Load and filter dictionary words for backronym generation.
+def _load_dictionary_words() -> list[str] | None:
+    """Return the backronym word pool, or the fallback list if the dictionary is unavailable.
 
-    Loads words from backend/data/dictionary.txt and filters to 3-5 letters.
-    Words are cached at module load time for efficient access.
+    The 3-5 letter words are served straight from the shared mmap-backed
+    dictionary index (see backend/services/dictionary.py), so no per-process
+    list is built. Returns None when that index is usable.
 
     Returns:
-        list[str]: List of 3-5 letter words from dictionary, uppercase
+        list[str] | None: Fallback words, or None to sample from the dictionary index
     """
-    dictionary_path = Path(__file__).parent.parent.parent / "data" / "dictionary.txt"
-
-    if not dictionary_path.exists():
-        logger.warning(f"Dictionary file not found at {dictionary_path}, using fallback list")
-        return _get_fallback_words()
-
     try:
-        words = []
-        with open(dictionary_path, 'r') as f:
-            for line in f:
-                word = line.strip().upper()
-                if any([letter in word for letter in ['x', 'q']]):
-                    continue  # Exclude words with 'x', 'q'
-                # Filter to 3-5 letter words
-                if 3 <= len(word) <= 5:
-                    words.append(word)
-
-        logger.info(f"Loaded {len(words)} 3-5 letter words from dictionary")
-        return words
-
+        dictionary = get_dictionary()
+        if dictionary.short_word_count:
+            logger.info(f"Using {dictionary.short_word_count} 3-5 letter words from dictionary index")
+            return None
+        logger.warning("Dictionary index has no 3-5 letter words, using fallback list")
+    except FileNotFoundError:
+        logger.warning("Dictionary file not found, using fallback list")
     except Exception as e:
         logger.error(f"Error loading dictionary: {e}, using fallback list")
-        return _get_fallback_words()
+    return _get_fallback_words()
+
+
+def _random_dictionary_word() -> str:
+    """Pick a random 3-5 letter word."""
+    if _FALLBACK_WORDS is not None:
+        return random.choice(_FALLBACK_WORDS)
+    dictionary = get_dictionary()
+    return dictionary.short_word(random.randrange(dictionary.short_word_count))
 
 
 def _get_fallback_words() -> list[str]:
@@ -115,8 +112,8 @@ class WordError(RuntimeError):
     """Raised when word service fails."""
 
 
-# Module-level cache: Load dictionary once at import time
-_DICTIONARY_WORDS = _load_dictionary_words()
+# Module-level: decide once at import time whether the dictionary index is usable
+_FALLBACK_WORDS = _load_dictionary_words()
 
 
 RECENT_WORD_LOOKBACK_MINUTES = 30
@@ -151,13 +148,13 @@ class WordService:
             IRWordError: If word generation fails
         """
         try:
-            if not _DICTIONARY_WORDS:
+            if _FALLBACK_WORDS is not None and not _FALLBACK_WORDS:
                 raise WordError("No words available in dictionary")
 
             # Avoid getting same word twice in quick succession
             current_time = datetime.now(UTC)
             attempts = 0
-            word = random.choice(_DICTIONARY_WORDS)
+            word = _random_dictionary_word()
 
             while attempts < MAX_RECENT_WORD_ATTEMPTS:
                 if (
@@ -166,7 +163,7 @@ class WordService:
                     and (current_time - self._last_word_time) < timedelta(seconds=10)
                     and word == self._last_word
                 ):
-                    word = random.choice(_DICTIONARY_WORDS)
+                    word = _random_dictionary_word()
                     attempts += 1
                     continue
 
@@ -174,7 +171,7 @@ class WordService:
                     word, RECENT_WORD_LOOKBACK_MINUTES
                 )
                 if recently_used:
-                    word = random.choice(_DICTIONARY_WORDS)
+                    word = _random_dictionary_word()
                     attempts += 1
                     continue
                 break
@@ -1,13 +1,15 @@
-"""Helpers for sending magic-link emails."""
+"""Helpers for sending magic-link and other account emails."""
 from __future__ import annotations
 
 import asyncio
 import logging
 import smtplib
 import ssl
+import uuid
 from dataclasses import dataclass
 from datetime import datetime
 from email.message import EmailMessage
+from pathlib import Path
 
 from backend.config import Settings
 
@@ -17,46 +19,72 @@ logger = logging.getLogger(__name__)
 class MagicLinkMailerError(RuntimeError):
     """Raised when a magic-link email cannot be delivered."""
 
+    def __init__(self, message: str, *, retryable: bool = True):
+        super().__init__(message)
+        # False when retrying cannot help (e.g. SMTP is not configured)
+        self.retryable = retryable
+
 
 @dataclass(slots=True)
 class MagicLinkMailer:
-    """Minimal SMTP mailer for magic-link delivery."""
+    """Minimal SMTP mailer for magic-link delivery.
+
+    Without an SMTP host, messages are written as ``.eml`` files to
+    ``email_drop_dir`` when it is set (a loopback stand-in for local runs and
+    tests), otherwise skipped outside production.
+    """
 
     settings: Settings
 
     async def send_magic_link(self, *, to_email: str, link_url: str, expires_at: datetime) -> None:
+        body = (
+            "Here is your Crowdcraft account link:\n\n"
+            f"{link_url}\n\n"
+            f"This link expires at {expires_at.isoformat()}.\n"
+            "If you did not request this email, you can ignore it."
+        )
+        await self.send_email(to_email=to_email, subject="Your Crowdcraft sign-in link", body=body)
+
+    async def send_email(self, *, to_email: str, subject: str, body: str) -> None:
+        message = self._build_message(to_email, subject, body)
+
         if not self.settings.smtp_host:
+            if self.settings.email_drop_dir:
+                await asyncio.to_thread(self._write_drop_file, message)
+                return
+
             if self.settings.environment == "production":
-                raise MagicLinkMailerError("smtp_not_configured")
+                raise MagicLinkMailerError("smtp_not_configured", retryable=False)
 
             logger.info(
-                "SMTP is not configured; skipping magic-link email delivery to %s",
+                "SMTP is not configured; skipping email delivery to %s",
                 to_email,
             )
             return
 
-        await asyncio.to_thread(self._send_magic_link_sync, to_email, link_url, expires_at)
+        await asyncio.to_thread(self._send_message_sync, message)
 
-    def _send_magic_link_sync(self, to_email: str, link_url: str, expires_at: datetime) -> None:
-        subject = "Your Crowdcraft sign-in link"
+    def _build_message(self, to_email: str, subject: str, body: str) -> EmailMessage:
         from_name = self.settings.smtp_from_name.strip() or "Crowdcraft"
         from_address = self.settings.smtp_from_address.strip() or self.settings.smtp_username.strip()
         if not from_address:
             from_address = "no-reply@localhost"
 
-        body = (
-            "Here is your Crowdcraft account link:\n\n"
-            f"{link_url}\n\n"
-            f"This link expires at {expires_at.isoformat()}.\n"
-            "If you did not request this email, you can ignore it."
-        )
-
         message = EmailMessage()
         message["Subject"] = subject
         message["From"] = f"{from_name} <{from_address}>"
         message["To"] = to_email
         message.set_content(body)
+        return message
+
+    def _write_drop_file(self, message: EmailMessage) -> None:
+        drop_dir = Path(self.settings.email_drop_dir)
+        drop_dir.mkdir(parents=True, exist_ok=True)
+        target = drop_dir / f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}.eml"
+        target.write_bytes(bytes(message))
+        logger.info("Wrote email to %s to %s", message["To"], target)
 
+    def _send_message_sync(self, message: EmailMessage) -> None:
         if self.settings.smtp_use_ssl:
             smtp_factory = smtplib.SMTP_SSL
             smtp_kwargs = {
@@ -0,0 +1,184 @@
+"""Derived, display-sized variants of Meme Mint images.
+
+The originals in ``backend/data/mm_images`` are multi-megabyte PNGs. At import
+time each original is resized to a few widths and encoded as AVIF (when the
+installed Pillow supports it) and WebP, plus a tiny blurred WebP placeholder
+that is inlined as a data URL. Variant files are named by a content hash of the
+original, so their URLs are immutable and can be cached forever; the format is
+chosen per request from the ``Accept`` header.
+
+Variants are build artefacts of the deploy that ran the import, not part of the
+repository. Payloads only point at them once they are present on disk here;
+otherwise the original ``source_url`` is used, which follows the same
+GitHub/local switch as every other image.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import logging
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from PIL import Image, ImageFilter, ImageOps, features
+except ImportError:
+    Image = None  # type: ignore
+    ImageFilter = None  # type: ignore
+    ImageOps = None  # type: ignore
+    features = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+VARIANTS_DIR = Path(__file__).resolve().parents[2] / "data" / "mm_image_variants"
+VARIANT_URL_PREFIX = "/api/mm/images/variants"
+VARIANT_WIDTHS = (320, 640, 1280)
+# Preference order when the client accepts several formats
+VARIANT_FORMATS = ("avif", "webp")
+VARIANT_MEDIA_TYPES = {"avif": "image/avif", "webp": "image/webp"}
+PLACEHOLDER_WIDTH = 16
+
+_ENCODER_OPTIONS = {
+    "avif": {"quality": 55},
+    "webp": {"quality": 80, "method": 6},
+}
+
+
+def pillow_available() -> bool:
+    return Image is not None
+
+
+def supported_formats() -> tuple[str, ...]:
+    """Variant formats the installed Pillow can encode."""
+    if Image is None:
+        return ()
+    return tuple(fmt for fmt in VARIANT_FORMATS if fmt != "avif" or features.check("avif"))
+
+
+def variant_key(source: Path) -> str:
+    """Stable, content-addressed key for an original image."""
+    digest = hashlib.sha256(source.read_bytes()).hexdigest()[:12]
+    return f"{source.stem}-{digest}"
+
+
+def variant_path(key: str, width: int, fmt: str, output_dir: Path = VARIANTS_DIR) -> Path:
+    return output_dir / key / f"{width}.{fmt}"
+
+
+def variant_url(key: str, width: int) -> str:
+    return f"{VARIANT_URL_PREFIX}/{key}/{width}"
+
+
+def _placeholder_data_url(image: "Image.Image") -> str:
+    height = max(1, round(image.height * PLACEHOLDER_WIDTH / image.width))
+    tiny = image.resize((PLACEHOLDER_WIDTH, height), Image.Resampling.LANCZOS).filter(ImageFilter.GaussianBlur(1))
+    buffer = io.BytesIO()
+    tiny.save(buffer, format="WEBP", quality=30)
+    return f"data:image/webp;base64,{base64.b64encode(buffer.getvalue()).decode('ascii')}"
+
+
+def build_image_variants(
+    source: Path,
+    output_dir: Path = VARIANTS_DIR,
+    rebuild: bool = False,
+) -> Optional[dict[str, Any]]:
+    """
+    Write resized variants of ``source`` and return the manifest stored on ``MMImage.variants``.
+
+    Existing variant files are kept unless ``rebuild`` is set, so re-running the
+    import is cheap. Returns None when Pillow is not installed.
+
+    Returns:
+        Dict with ``key``, original ``width``/``height``, generated ``widths``,
+        ``formats`` and the inline blur ``placeholder``
+    """
+    formats = supported_formats()
+    if not formats:
+        return None
+
+    key = variant_key(source)
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+    widths = sorted({min(width, image.width) for width in VARIANT_WIDTHS})
+    (output_dir / key).mkdir(parents=True, exist_ok=True)
+    for width in widths:
+        height = max(1, round(image.height * width / image.width))
+        resized = None
+        for fmt in formats:
+            target = variant_path(key, width, fmt, output_dir)
+            if target.is_file() and not rebuild:
+                continue
+            if resized is None:
+                resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS)
+            resized.save(target, format=fmt.upper(), **_ENCODER_OPTIONS[fmt])
+
+    logger.info(f"Built {len(widths) * len(formats)} variants for {source.name} ({key})")
+    return {
+        "key": key,
+        "width": image.width,
+        "height": image.height,
+        "widths": widths,
+        "formats": list(formats),
+        "placeholder": _placeholder_data_url(image),
+    }
+
+
+def negotiate_variant_format(accept: Optional[str], key: str, width: int, output_dir: Path = VARIANTS_DIR) -> Optional[str]:
+    """Pick the best variant format on disk for an Accept header (WebP when nothing is advertised)."""
+    accept = (accept or "").lower()
+    available = [fmt for fmt in VARIANT_FORMATS if variant_path(key, width, fmt, output_dir).is_file()]
+    for fmt in available:
+        if VARIANT_MEDIA_TYPES[fmt] in accept:
+            return fmt
+    # Every browser that sends no explicit image types still decodes WebP
+    return "webp" if "webp" in available else None
+
+
+# (output_dir, key) pairs whose variant files were all found; files are never removed at runtime
+_variants_on_disk: set[tuple[Path, str]] = set()
+
+
+def variants_available(key: str, widths: list[int], output_dir: Optional[Path] = None) -> bool:
+    """True if the WebP variant of every width exists on this deploy."""
+    output_dir = output_dir or VARIANTS_DIR
+    if (output_dir, key) in _variants_on_disk:
+        return True
+    if not all(variant_path(key, width, "webp", output_dir).is_file() for width in widths):
+        return False
+    _variants_on_disk.add((output_dir, key))
+    return True
+
+
+def image_display_urls(image) -> dict[str, Optional[str]]:
+    """
+    URLs for presenting an ``MMImage`` in round payloads.
+
+    Uses the largest variant as the main image and the smallest as the
+    thumbnail when the variant files exist here, otherwise the original source
+    URL (served locally or from GitHub like any other image).
+    """
+    variants = image.variants or {}
+    widths = variants.get("widths") or []
+    if not variants.get("key") or not widths or not variants_available(variants["key"], widths):
+        thumbnail_url = image.thumbnail_url
+        if thumbnail_url and thumbnail_url.startswith(VARIANT_URL_PREFIX):
+            # Rows imported before variants were checked on disk stored a variant thumbnail
+            thumbnail_url = None
+        return {
+            "image_url": image.source_url,
+            "thumbnail_url": thumbnail_url,
+            "image_srcset": None,
+            "image_placeholder": None,
+        }
+
+    key = variants["key"]
+    return {
+        "image_url": variant_url(key, widths[-1]),
+        "thumbnail_url": variant_url(key, widths[0]),
+        "image_srcset": ", ".join(f"{variant_url(key, width)} {width}w" for width in widths),
+        "image_placeholder": variants.get("placeholder"),
+    }
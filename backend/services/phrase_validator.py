@@ -1,6 +1,5 @@
 """Phrase validation service with similarity checking."""
 import asyncio
-import os
 import re
 import math
 import logging
@@ -14,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.config import get_settings
 from backend.database import AsyncSessionLocal
 from backend.models.phrase_embedding import PhraseEmbedding
+from backend.services.dictionary import CompactDictionary, get_dictionary
 from backend.services.tl.matching_service import TLMatchingService
 
 logger = logging.getLogger(__name__)
@@ -30,26 +30,12 @@ def _parse_phrase(phrase: str) -> list[str]:
     return words
 
 
-def _load_dictionary() -> Set[str]:
-    """Load word list from file."""
-    # Path relative to this file
-    data_path = os.path.join(os.path.dirname(__file__), "../data/dictionary.txt")
-
-    if not os.path.exists(data_path):
-        logger.error(f"Dictionary file not found at: {data_path}")
-        logger.error("Run: python scripts/download_dictionary.py")
-        raise FileNotFoundError(f"Dictionary file not found: {data_path}")
-
-    with open(data_path, "r") as f:
-        return {line.strip().upper() for line in f if line.strip()}
-
-
 async def generate_embedding(text: str, model: str | None = None, timeout: int = 30) -> list[float]:
     """Compatibility shim for tests that patch the legacy module-level helper."""
 
-    from backend.services.ai.openai_api import generate_embedding as openai_generate_embedding
+    from backend.services.ai.llm_gateway import get_llm_gateway
 
-    return await openai_generate_embedding(text, model=model, timeout=timeout)
+    return await get_llm_gateway().embed(text, model=model, timeout=timeout)
 
 
 class PhraseValidator:
@@ -73,7 +59,8 @@ class PhraseValidator:
         # Lazy-loaded matching service - only initialized when needed
         self._matching: Optional[TLMatchingService] = None
 
-        self.dictionary: Set[str] = _load_dictionary()
+        # Shared mmap-backed index; pages are shared across workers via the page cache
+        self.dictionary: CompactDictionary = get_dictionary()
         logger.info(f"Loaded dictionary with {len(self.dictionary)} words")
 
         logger.info(f"Using OpenAI embedding model: {self.settings.embedding_model}")
@@ -0,0 +1,196 @@
+"""Foreign-key reassignment plan used when a guest player merges into a saved one.
+
+The plan lists every ``(table, column)`` referencing ``players.player_id`` that
+holds player-owned history. It is derived once from model metadata (ordered by
+table name, so concurrent merges lock tables in the same order), checked against
+the live schema at startup, and reused by every merge, so a merge never reflects
+the schema. Executing it costs one probe query plus one UPDATE per table the
+guest actually has rows in.
+"""
+from __future__ import annotations
+
+import logging
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import bindparam, inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database import Base
+from backend.models.player import Player
+
+logger = logging.getLogger(__name__)
+
+# Rows that are merged (or deliberately left behind) by AccountService itself
+SKIPPED_TABLES = frozenset({
+    "accounts",
+    "magic_links",
+    "refresh_tokens",
+    "qf_daily_bonuses",
+    "mm_daily_bonuses",
+    "ir_daily_bonuses",
+    "tl_daily_bonuses",
+    "mm_player_daily_states",
+    "tl_player_daily_states",
+})
+
+
+def _is_skipped(table_name: str) -> bool:
+    return table_name in SKIPPED_TABLES or table_name.endswith("_player_data")
+
+
+@dataclass(frozen=True, slots=True)
+class ReassignmentTarget:
+    """One column whose values are rewritten from the guest to the saved player."""
+
+    table: str
+    column: str
+
+
+class PlayerReassignmentPlan:
+    """Ordered FK columns to rewrite on a guest merge, with precompiled statements."""
+
+    def __init__(self, targets: list[ReassignmentTarget]):
+        self.targets: tuple[ReassignmentTarget, ...] = ()
+        self.validated = False
+        self._probe = None
+        self._updates: dict[str, object] = {}
+        self._set_targets(targets)
+
+    @classmethod
+    def from_metadata(cls, metadata=Base.metadata) -> PlayerReassignmentPlan:
+        """Collect FK columns to ``players`` from model metadata, ordered by table name."""
+        targets = []
+        for table in sorted(metadata.tables.values(), key=lambda table: table.name):
+            if _is_skipped(table.name):
+                continue
+            columns = sorted({
+                fk.parent.name
+                for fk in table.foreign_keys
+                if fk.column.table.name == Player.__tablename__
+            })
+            targets.extend(ReassignmentTarget(table.name, column) for column in columns)
+        return cls(targets)
+
+    def _set_targets(self, targets: list[ReassignmentTarget]) -> None:
+        player_id_type = Player.__table__.c.player_id.type
+        self.targets = tuple(targets)
+
+        # Probe: which targets hold at least one guest row (index scans, no table locks)
+        probe_sql = " UNION ALL ".join(
+            f'SELECT {index} AS target WHERE EXISTS '
+            f'(SELECT 1 FROM "{target.table}" WHERE "{target.column}" = :source_player_id)'
+            for index, target in enumerate(self.targets)
+        )
+        self._probe = (
+            text(probe_sql).bindparams(bindparam("source_player_id", type_=player_id_type))
+            if probe_sql
+            else None
+        )
+
+        # One UPDATE per table, covering all of its player columns
+        by_table: dict[str, list[str]] = {}
+        for target in self.targets:
+            by_table.setdefault(target.table, []).append(target.column)
+        self._updates = {}
+        for table_name, columns in by_table.items():
+            # Single-column tables are the common case; multi-column tables use CASE
+            if len(columns) == 1:
+                column = columns[0]
+                sql = (
+                    f'UPDATE "{table_name}" SET "{column}" = :target_player_id '
+                    f'WHERE "{column}" = :source_player_id'
+                )
+            else:
+                assignments = ", ".join(
+                    f'"{column}" = CASE WHEN "{column}" = :source_player_id '
+                    f'THEN :target_player_id ELSE "{column}" END'
+                    for column in columns
+                )
+                condition = " OR ".join(f'"{column}" = :source_player_id' for column in columns)
+                sql = f'UPDATE "{table_name}" SET {assignments} WHERE {condition}'
+            self._updates[table_name] = text(sql).bindparams(
+                bindparam("target_player_id", type_=player_id_type),
+                bindparam("source_player_id", type_=player_id_type),
+            )
+
+    def validate(self, sync_connection) -> list[str]:
+        """Reconcile the plan with the live schema; returns human-readable mismatches.
+
+        Targets whose table or column is missing from the database are dropped so
+        merges cannot fail on them. Live FKs to ``players`` that the models do not
+        declare are reported (and added) so no guest history is left behind.
+        """
+        inspector = inspect(sync_connection)
+        live_tables = set(inspector.get_table_names())
+        problems: list[str] = []
+        targets: list[ReassignmentTarget] = []
+
+        for target in self.targets:
+            if target.table not in live_tables:
+                problems.append(f"table {target.table} is missing from the database")
+                continue
+            live_columns = {column["name"] for column in inspector.get_columns(target.table)}
+            if target.column not in live_columns:
+                problems.append(f"column {target.table}.{target.column} is missing from the database")
+                continue
+            targets.append(target)
+
+        planned = set(targets)
+        for table_name in sorted(live_tables):
+            if _is_skipped(table_name):
+                continue
+            for fk in inspector.get_foreign_keys(table_name):
+                if fk.get("referred_table") != Player.__tablename__:
+                    continue
+                for column_name in fk.get("constrained_columns", []):
+                    target = ReassignmentTarget(table_name, column_name)
+                    if target not in planned:
+                        problems.append(f"live foreign key {table_name}.{column_name} is not declared on a model")
+                        targets.append(target)
+                        planned.add(target)
+
+        self._set_targets(sorted(targets, key=lambda target: (target.table, target.column)))
+        self.validated = True
+        return problems
+
+    async def execute(
+        self,
+        db: AsyncSession,
+        source_player_id: uuid.UUID,
+        target_player_id: uuid.UUID,
+    ) -> list[str]:
+        """Move the guest's rows to the saved player; returns the tables updated."""
+        if not self.validated:
+            # Startup validation did not run (e.g. scripts); reconcile once per process
+            await db.run_sync(lambda sync_session: self.validate(sync_session.connection()))
+        if self._probe is None:
+            return []
+
+        result = await db.execute(self._probe, {"source_player_id": source_player_id})
+        tables = list(dict.fromkeys(self.targets[index].table for index in sorted(result.scalars())))
+
+        params = {"target_player_id": target_player_id, "source_player_id": source_player_id}
+        for table_name in tables:
+            await db.execute(self._updates[table_name], params)
+        return tables
+
+
+_reassignment_plan = PlayerReassignmentPlan.from_metadata()
+
+
+def get_player_reassignment_plan() -> PlayerReassignmentPlan:
+    """Get the global PlayerReassignmentPlan singleton."""
+    return _reassignment_plan
+
+
+async def validate_player_reassignment_plan(db: AsyncSession) -> list[str]:
+    """Check the global plan against the live schema (run once at startup)."""
+
+    def _validate(sync_session) -> list[str]:
+        return get_player_reassignment_plan().validate(sync_session.connection())
+
+    problems = await db.run_sync(_validate)
+    for problem in problems:
+        logger.warning(f"Guest merge reassignment plan: {problem}")
+    return problems
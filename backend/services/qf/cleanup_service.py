@@ -32,8 +32,10 @@ from backend.models.qf import (
     QFQuest,
 )
 from backend.models.refresh_token import RefreshToken
+from backend.services.chunked_job_runner import ChunkedJobRunner, ChunkOutcome
 from backend.services.username_service import canonicalize_username
 from backend.services.qf.queue_service import QFQueueService
+from backend.services.qf.copy_assignment_index import get_copy_assignment_index
 from backend.services.qf.party_session_service import PartySessionService
 
 logger = logging.getLogger(__name__)
@@ -167,14 +169,11 @@ class QFCleanupService:
         """
         now = datetime.now(UTC)
 
-        result = await self.db.execute(
-            delete(RefreshToken).where(
-                (RefreshToken.expires_at < now) | (RefreshToken.revoked_at.is_not(None))
-            )
+        deleted_count = await self._delete_in_chunks(
+            "qf_expired_refresh_tokens",
+            RefreshToken.token_id,
+            (RefreshToken.expires_at < now) | (RefreshToken.revoked_at.is_not(None)),
         )
-        await self.db.commit()
-
-        deleted_count = self._normalize_rowcount(result.rowcount)
         if deleted_count > 0:
             logger.info(f"Cleaned up {deleted_count} expired/revoked refresh tokens")
 
@@ -192,14 +191,11 @@ class QFCleanupService:
         """
         cutoff_date = datetime.now(UTC) - timedelta(days=days_old)
 
-        result = await self.db.execute(
-            delete(RefreshToken).where(
-                (RefreshToken.revoked_at.is_not(None)) & (RefreshToken.revoked_at < cutoff_date)
-            )
+        deleted_count = await self._delete_in_chunks(
+            "qf_old_revoked_tokens",
+            RefreshToken.token_id,
+            (RefreshToken.revoked_at.is_not(None)) & (RefreshToken.revoked_at < cutoff_date),
         )
-        await self.db.commit()
-
-        deleted_count = self._normalize_rowcount(result.rowcount)
         if deleted_count > 0:
             logger.info(f"Cleaned up {deleted_count} old revoked tokens (>{days_old} days)")
 
@@ -267,6 +263,7 @@ class QFCleanupService:
         # Remove deleted prompt rounds from queue
         if orphaned_prompt_ids:
             removed_from_queue = QFQueueService.remove_prompt_rounds_from_queue(orphaned_prompt_ids)
+            get_copy_assignment_index().discard(orphaned_prompt_ids)
             logger.info(f"Removed {removed_from_queue} orphaned prompt rounds from queue")
 
         return deleted_count
@@ -306,140 +303,143 @@ class QFCleanupService:
 
         return list(unique_players.values())
 
+    # Per-player tables cleared before anonymization (in order to respect foreign keys)
+    _PLAYER_DATA_TABLES = (
+        ('votes', Vote),
+        ('transactions', QFTransaction),
+        ('daily_bonuses', QFDailyBonus),
+        ('result_views', QFResultView),
+        ('abandoned_prompts', PlayerAbandonedPrompt),
+        ('prompt_feedback', PromptFeedback),
+        ('phraseset_activities', PhrasesetActivity),
+        ('refresh_tokens', RefreshToken),
+        ('quests', QFQuest),
+    )
+
+    def _job_runner(self) -> ChunkedJobRunner:
+        return ChunkedJobRunner(self.db)
+
+    async def _delete_in_chunks(self, job_name: str, key_column, condition) -> int:
+        """Delete rows matching ``condition`` in key-ordered chunks, one commit per chunk."""
+        model = key_column.class_
+        deleted_count = 0
+
+        async def delete_chunk(cursor: str | None, limit: int) -> ChunkOutcome:
+            nonlocal deleted_count
+            stmt = select(key_column).where(condition).order_by(key_column).limit(limit)
+            if cursor:
+                stmt = stmt.where(key_column > cursor)
+            keys = list((await self.db.execute(stmt)).scalars())
+            if keys:
+                result = await self.db.execute(delete(model).where(key_column.in_(keys)))
+                deleted_count += self._normalize_rowcount(result.rowcount)
+            return ChunkOutcome(
+                processed=len(keys),
+                next_cursor=str(keys[-1]) if len(keys) == limit else None,
+            )
+
+        await self._job_runner().run(job_name, delete_chunk)
+        return deleted_count
+
     async def _delete_players_by_ids(self, player_ids: list[UUID]) -> dict[str, int]:
         """Anonymize players and delete related non-essential data for the provided IDs.
 
         Players are anonymized (not deleted) to preserve game history and prevent
         data integrity violations. Submitted rounds are preserved as they are
-        referenced by phrasesets.
+        referenced by phrasesets. Players are processed in chunks with a commit
+        between chunks so the writer lock is never held for the whole batch.
         """
         if not player_ids:
             return {}
 
-        deletion_counts: dict[str, int] = {}
-
-        # Delete related data first (in order to respect foreign keys)
-
-        # 1. Votes (references player_id)
-        result = await self.db.execute(
-            delete(Vote).where(Vote.player_id.in_(player_ids))
-        )
-        deletion_counts['votes'] = self._normalize_rowcount(result.rowcount)
-
-        # 2. Transactions (references player_id)
-        result = await self.db.execute(
-            delete(QFTransaction).where(QFTransaction.player_id.in_(player_ids))
-        )
-        deletion_counts['transactions'] = self._normalize_rowcount(result.rowcount)
-
-        # 3. Daily bonuses (references player_id)
-        result = await self.db.execute(
-            delete(QFDailyBonus).where(QFDailyBonus.player_id.in_(player_ids))
-        )
-        deletion_counts['daily_bonuses'] = self._normalize_rowcount(result.rowcount)
-
-        # 4. Result views (references player_id)
-        result = await self.db.execute(
-            delete(QFResultView).where(QFResultView.player_id.in_(player_ids))
-        )
-        deletion_counts['result_views'] = self._normalize_rowcount(result.rowcount)
-
-        # 5. Abandoned prompts (references player_id)
-        result = await self.db.execute(
-            delete(PlayerAbandonedPrompt).where(PlayerAbandonedPrompt.player_id.in_(player_ids))
-        )
-        deletion_counts['abandoned_prompts'] = self._normalize_rowcount(result.rowcount)
-
-        # 6. Prompt feedback (references player_id)
-        result = await self.db.execute(
-            delete(PromptFeedback).where(PromptFeedback.player_id.in_(player_ids))
-        )
-        deletion_counts['prompt_feedback'] = self._normalize_rowcount(result.rowcount)
-
-        # 7. Phraseset activities (references player_id)
-        result = await self.db.execute(
-            delete(PhrasesetActivity).where(PhrasesetActivity.player_id.in_(player_ids))
-        )
-        deletion_counts['phraseset_activities'] = self._normalize_rowcount(result.rowcount)
-
-        # 8. Refresh tokens (references player_id)
-        result = await self.db.execute(
-            delete(RefreshToken).where(RefreshToken.player_id.in_(player_ids))
-        )
-        deletion_counts['refresh_tokens'] = self._normalize_rowcount(result.rowcount)
-
-        # 9. Quests (references player_id)
-        result = await self.db.execute(
-            delete(QFQuest).where(QFQuest.player_id.in_(player_ids))
-        )
-        deletion_counts['quests'] = self._normalize_rowcount(result.rowcount)
-
-        # 10. Get IDs of prompt rounds to be deleted from queue (for abandoned prompts only)
-        # Note: We do NOT delete submitted rounds as they are part of phrasesets and game history
-        prompt_rounds_result = await self.db.execute(
-            select(Round.round_id)
-            .where(Round.player_id.in_(player_ids))
-            .where(Round.round_type == "prompt")
-            .where(Round.status != "submitted")  # Only queue cleanup for non-submitted
-        )
-        prompt_round_ids = [row[0] for row in prompt_rounds_result]
-
-        # 11. Delete ONLY abandoned/incomplete rounds (not submitted rounds)
-        # Submitted rounds must be preserved because:
-        # - They are referenced by phrasesets
-        # - They are part of game history
-        # - Deleting them causes data integrity violations
-        result = await self.db.execute(
-            delete(Round).where(
-                Round.player_id.in_(player_ids),
-                Round.status != "submitted"  # Preserve submitted rounds
+        deletion_counts: dict[str, int] = {name: 0 for name, _ in self._PLAYER_DATA_TABLES}
+        deletion_counts['rounds'] = 0
+        deletion_counts['players_anonymized'] = 0
+        prompt_round_ids: list[UUID] = []
+
+        async def delete_chunk(cursor: str | None, limit: int) -> ChunkOutcome:
+            offset = int(cursor or 0)
+            chunk_ids = player_ids[offset:offset + limit]
+
+            # 1-9. Related rows that reference player_id
+            for name, model in self._PLAYER_DATA_TABLES:
+                result = await self.db.execute(delete(model).where(model.player_id.in_(chunk_ids)))
+                deletion_counts[name] += self._normalize_rowcount(result.rowcount)
+
+            # 10. Get IDs of prompt rounds to be deleted from queue (for abandoned prompts only)
+            # Note: We do NOT delete submitted rounds as they are part of phrasesets and game history
+            prompt_rounds_result = await self.db.execute(
+                select(Round.round_id)
+                .where(Round.player_id.in_(chunk_ids))
+                .where(Round.round_type == "prompt")
+                .where(Round.status != "submitted")  # Only queue cleanup for non-submitted
             )
-        )
-        deletion_counts['rounds'] = self._normalize_rowcount(result.rowcount)
+            prompt_round_ids.extend(row[0] for row in prompt_rounds_result)
 
-        # Count submitted rounds that were NOT deleted (for logging)
-        submitted_rounds_result = await self.db.execute(
-            select(func.count(Round.round_id))
-            .where(Round.player_id.in_(player_ids))
-            .where(Round.status == "submitted")
-        )
-        preserved_rounds = submitted_rounds_result.scalar() or 0
-        if preserved_rounds > 0:
-            deletion_counts['rounds_preserved'] = preserved_rounds
-            logger.info(f"Preserved {preserved_rounds} submitted rounds (needed for phrasesets)")
-
-        # 12. Anonymize players instead of deleting them
-        # This preserves game history and prevents data integrity violations
-        anonymized_count = 0
-        for player_id in player_ids:
-            # Generate unique anonymous username
-            anon_username, anon_canonical = await self._generate_anonymous_username()
-
-            # Anonymize the player
+            # 11. Delete ONLY abandoned/incomplete rounds (not submitted rounds)
+            # Submitted rounds must be preserved because:
+            # - They are referenced by phrasesets
+            # - They are part of game history
+            # - Deleting them causes data integrity violations
             result = await self.db.execute(
-                update(QFPlayer)
-                .where(QFPlayer.player_id == player_id)
-                .values(
-                    username=anon_username,
-                    username_canonical=anon_canonical,
-                    email=f"deleted_{player_id}@deleted.local",  # Unique email to avoid conflicts
-                    password_hash="",  # Clear password (prevents login)
-                    is_guest=True,  # Mark as guest (additional login prevention)
-                    locked_until=datetime(2099, 12, 31, tzinfo=UTC),  # Lock account permanently
+                delete(Round).where(
+                    Round.player_id.in_(chunk_ids),
+                    Round.status != "submitted"  # Preserve submitted rounds
                 )
             )
-            if result.rowcount:
-                anonymized_count += 1
+            deletion_counts['rounds'] += self._normalize_rowcount(result.rowcount)
+
+            # Count submitted rounds that were NOT deleted (for logging)
+            submitted_rounds_result = await self.db.execute(
+                select(func.count(Round.round_id))
+                .where(Round.player_id.in_(chunk_ids))
+                .where(Round.status == "submitted")
+            )
+            preserved_rounds = submitted_rounds_result.scalar() or 0
+            if preserved_rounds > 0:
+                deletion_counts['rounds_preserved'] = deletion_counts.get('rounds_preserved', 0) + preserved_rounds
+
+            # 12. Anonymize players instead of deleting them
+            # This preserves game history and prevents data integrity violations
+            for player_id in chunk_ids:
+                # Generate unique anonymous username
+                anon_username, anon_canonical = await self._generate_anonymous_username()
+
+                # Anonymize the player
+                result = await self.db.execute(
+                    update(QFPlayer)
+                    .where(QFPlayer.player_id == player_id)
+                    .values(
+                        username=anon_username,
+                        username_canonical=anon_canonical,
+                        email=f"deleted_{player_id}@deleted.local",  # Unique email to avoid conflicts
+                        password_hash="",  # Clear password (prevents login)
+                        is_guest=True,  # Mark as guest (additional login prevention)
+                        locked_until=datetime(2099, 12, 31, tzinfo=UTC),  # Lock account permanently
+                    )
+                )
+                if result.rowcount:
+                    deletion_counts['players_anonymized'] += 1
 
-        deletion_counts['players_anonymized'] = anonymized_count
-        logger.info(f"Anonymized {anonymized_count} player(s) (preserved for game history)")
+            next_offset = offset + len(chunk_ids)
+            return ChunkOutcome(
+                processed=len(chunk_ids),
+                next_cursor=str(next_offset) if next_offset < len(player_ids) else None,
+            )
 
-        # Commit the transaction
-        await self.db.commit()
+        # The ID list lives only in memory, so the job runs to completion rather than resuming
+        await self._job_runner().run("qf_delete_players", delete_chunk, resumable=False)
+
+        if deletion_counts.get('rounds_preserved'):
+            logger.info(f"Preserved {deletion_counts['rounds_preserved']} submitted rounds (needed for phrasesets)")
+        logger.info(
+            f"Anonymized {deletion_counts['players_anonymized']} player(s) (preserved for game history)"
+        )
 
         # Remove deleted prompt rounds from queue (after commit to ensure consistency)
         if prompt_round_ids:
             removed_from_queue = QFQueueService.remove_prompt_rounds_from_queue(prompt_round_ids)
+            get_copy_assignment_index().discard(prompt_round_ids)
             deletion_counts['queue_cleanup'] = removed_from_queue
             logger.info(f"Removed {removed_from_queue} prompt rounds from queue after player deletion")
 
@@ -503,6 +503,10 @@ class QFCleanupService:
         For guests WITH activity who are being deleted elsewhere, they get anonymized
         with a random username (handled by _delete_players_by_ids).
 
+        Candidates are paged by player_id in fixed-size chunks (IDs only, no ORM
+        loads) and each chunk is committed on its own; an interrupted run resumes
+        from the persisted cursor.
+
         Args:
             hours_old: Delete guests who haven't logged in for this many hours (default: 1)
 
@@ -510,129 +514,87 @@ class QFCleanupService:
             Number of inactive guest players deleted
         """
         cutoff_date = datetime.now(UTC) - timedelta(hours=hours_old)
-
-        # Find guests who haven't logged in recently
-        # For guests with NULL last_login_date, also check created_at to avoid deleting new accounts
-        stmt = select(QFPlayer).where(
-            QFPlayer.is_guest == True,  # noqa: E712
-            or_(
-                QFPlayer.last_login_date < cutoff_date,
-                # Never logged in AND old enough (prevents deleting newly-created accounts)
-                (QFPlayer.last_login_date.is_(None) & (QFPlayer.created_at < cutoff_date))
-            )
-        )
-        result = await self.db.execute(stmt)
-        all_old_guests = result.scalars().all()
-
-        if not all_old_guests:
-            logger.info("No inactive guest players found")
-            return 0
-
-        # Get all player IDs for batch queries
-        guest_ids = [guest.player_id for guest in all_old_guests]
-
-        guests_with_activity = set()
-        if guest_ids:
-            # Check for rounds
-            rounds_result = await self.db.execute(
-                select(Round.player_id)
-                .where(Round.player_id.in_(guest_ids))
-                .distinct()
-            )
-            guests_with_activity.update(row[0] for row in rounds_result)
-
-            # Check for phraseset activities
-            phraseset_result = await self.db.execute(
-                select(PhrasesetActivity.player_id)
-                .where(PhrasesetActivity.player_id.in_(guest_ids))
-                .distinct()
+        deleted_count = 0
+
+        async def delete_chunk(cursor: str | None, limit: int) -> ChunkOutcome:
+            nonlocal deleted_count
+
+            # Find guests who haven't logged in recently
+            # For guests with NULL last_login_date, also check created_at to avoid deleting new accounts
+            stmt = (
+                select(QFPlayer.player_id)
+                .where(
+                    QFPlayer.is_guest == True,  # noqa: E712
+                    or_(
+                        QFPlayer.last_login_date < cutoff_date,
+                        # Never logged in AND old enough (prevents deleting newly-created accounts)
+                        (QFPlayer.last_login_date.is_(None) & (QFPlayer.created_at < cutoff_date))
+                    )
+                )
+                .order_by(QFPlayer.player_id)
+                .limit(limit)
             )
-            guests_with_activity.update(row[0] for row in phraseset_result)
+            if cursor:
+                stmt = stmt.where(QFPlayer.player_id > UUID(cursor))
+            guest_ids = list((await self.db.execute(stmt)).scalars())
+            if not guest_ids:
+                return ChunkOutcome(processed=0, next_cursor=None)
+
+            guests_with_activity = set()
+            for activity_column in (Round.player_id, PhrasesetActivity.player_id, QFTransaction.player_id):
+                activity_result = await self.db.execute(
+                    select(activity_column).where(activity_column.in_(guest_ids)).distinct()
+                )
+                guests_with_activity.update(activity_result.scalars())
+
+            # Filter to guests with NO activity
+            inactive_guest_ids = [guest_id for guest_id in guest_ids if guest_id not in guests_with_activity]
+            if inactive_guest_ids:
+                # Delete the players - related data will be deleted automatically via CASCADE
+                # All related tables have ondelete="CASCADE" configured on their foreign keys
+                result = await self.db.execute(
+                    delete(QFPlayer).where(QFPlayer.player_id.in_(inactive_guest_ids))
+                )
+                deleted_count += self._normalize_rowcount(result.rowcount)
 
-            # Check for transactions
-            transactions_result = await self.db.execute(
-                select(QFTransaction.player_id)
-                .where(QFTransaction.player_id.in_(guest_ids))
-                .distinct()
+            return ChunkOutcome(
+                processed=len(guest_ids),
+                next_cursor=str(guest_ids[-1]) if len(guest_ids) == limit else None,
             )
-            guests_with_activity.update(row[0] for row in transactions_result)
-
-        # Filter to guests with NO activity
-        inactive_guest_ids = [guest_id for guest_id in guest_ids if guest_id not in guests_with_activity]
-
-        if not inactive_guest_ids:
-            return 0
-
-        logger.info(f"Found {len(inactive_guest_ids)} inactive guest player(s) to clean up")
-
-        # Delete the players - related data will be deleted automatically via CASCADE
-        # All related tables have ondelete="CASCADE" configured on their foreign keys
-        result = await self.db.execute(
-            delete(QFPlayer).where(QFPlayer.player_id.in_(inactive_guest_ids))
-        )
-        deleted_count = self._normalize_rowcount(result.rowcount)
 
-        # Commit the transaction
-        await self.db.commit()
+        await self._job_runner().run("qf_inactive_guest_cleanup", delete_chunk)
 
         if deleted_count > 0:
             logger.info(f"Deleted {deleted_count} inactive guest player(s) completely from database")
+        else:
+            logger.info("No inactive guest players found")
 
         return deleted_count
 
-    async def recycle_inactive_guest_usernames(self, days_old: int = 30) -> int:
-        """
-        Recycle usernames from guest accounts that haven't logged in for 30+ days
-        by appending " X" (and numeric suffixes if needed) while ensuring the
-        canonical username remains unique.
-
-        This allows those usernames to be reused by new players.
-
-        Args:
-            days_old: Recycle usernames for guests inactive for this many days (default: 30)
-
-        Returns:
-            Number of guest usernames recycled
-        """
-        cutoff_date = datetime.now(UTC) - timedelta(days=days_old)
-
-        stmt = select(QFPlayer).where(
-            QFPlayer.is_guest == True,  # noqa: E712
-            QFPlayer.last_login_date < cutoff_date,
-            or_(
-                QFPlayer.username.is_(None),
-                ~QFPlayer.username.like("% X%"),
-            ),
-        )
-
-        result = await self.db.execute(stmt)
-        raw_candidates = [player for player in result.scalars() if player]
-
-        candidates: list[QFPlayer] = [
-            player for player in raw_candidates if not self._has_recycled_suffix(player.username)
+    async def _recycle_guest_username_chunk(self, guests: list[tuple[UUID, str | None]]) -> int:
+        """Apply the " X" recycling suffix to one chunk of (player_id, username) pairs."""
+        candidates = [
+            (player_id, username) for player_id, username in guests if not self._has_recycled_suffix(username)
         ]
 
-        if not candidates:
-            return 0
-
-        processed_candidates: list[tuple[QFPlayer, str]] = []
+        processed_candidates: list[tuple[UUID, str]] = []
         conflict_prefixes: set[str] = set()
 
-        for guest in candidates:
-            base_username = guest.username or ""
+        for player_id, username in candidates:
+            base_username = username or ""
 
             if not base_username.strip():
-                logger.info(f"Skipping guest {guest.player_id} with empty username")
+                logger.info(f"Skipping guest {player_id} with empty username")
                 continue
 
             first_username = f"{base_username} X"
             first_canonical = canonicalize_username(first_username)
 
             if not first_canonical:
-                logger.info(f"Skipping guest {guest.player_id} due to empty canonical for candidate '{first_username}'")
+                logger.info(f"Skipping guest {player_id} due to empty canonical for candidate '{first_username}'")
                 continue
 
-            processed_candidates.append((guest, base_username))
+            processed_candidates.append((player_id, base_username))
             conflict_prefixes.add(first_canonical.rstrip("0123456789"))
 
         if not processed_candidates:
@@ -652,7 +614,7 @@ class QFCleanupService:
         updates: list[dict[str, str | UUID]] = []
         updated_player_ids: set[UUID] = set()
 
-        for guest, base_username in processed_candidates:
+        for player_id, base_username in processed_candidates:
             suffix_index = 1
 
             while suffix_index < 1000:  # reasonable guard to avoid infinite loops
@@ -665,7 +627,7 @@ class QFCleanupService:
 
                 if not canonical:
                     logger.info(
-                        f"Skipping candidate username '{new_username}' for guest {guest.player_id} due to empty canonical")
+                        f"Skipping candidate username '{new_username}' for guest {player_id} due to empty canonical")
                     break
 
                 if canonical in reserved_canonicals:
@@ -675,17 +637,17 @@ class QFCleanupService:
                 reserved_canonicals.add(canonical)
                 updates.append(
                     {
-                        "player_id": guest.player_id,
+                        "player_id": player_id,
                         "username": new_username,
                         "username_canonical": canonical,
                     }
                 )
-                updated_player_ids.add(guest.player_id)
+                updated_player_ids.add(player_id)
                 break
 
-            if guest.player_id not in updated_player_ids:
+            if player_id not in updated_player_ids:
                 logger.warning(
-                    f"Unable to recycle username for guest {guest.player_id} after exhausting suffix attempts")
+                    f"Unable to recycle username for guest {player_id} after exhausting suffix attempts")
 
         if not updates:
             return 0
@@ -717,13 +679,60 @@ class QFCleanupService:
             .values(username=username_case, username_canonical=canonical_case)
             .execution_options(synchronize_session=False)
         )
-        await self.db.commit()
+        return len(updates)
+
+    async def recycle_inactive_guest_usernames(self, days_old: int = 30) -> int:
+        """
+        Recycle usernames from guest accounts that haven't logged in for 30+ days
+        by appending " X" (and numeric suffixes if needed) while ensuring the
+        canonical username remains unique.
+
+        This allows those usernames to be reused by new players. Guests are
+        paged by player_id and each chunk commits separately, so suffixes
+        reserved by earlier chunks are visible to the conflict check of later ones.
+
+        Args:
+            days_old: Recycle usernames for guests inactive for this many days (default: 30)
 
-        await self.db.run_sync(lambda sync_session: sync_session.expire_all())
+        Returns:
+            Number of guest usernames recycled
+        """
+        cutoff_date = datetime.now(UTC) - timedelta(days=days_old)
+        recycled_count = 0
+
+        async def recycle_chunk(cursor: str | None, limit: int) -> ChunkOutcome:
+            nonlocal recycled_count
+
+            stmt = (
+                select(QFPlayer.player_id, QFPlayer.username)
+                .where(
+                    QFPlayer.is_guest == True,  # noqa: E712
+                    QFPlayer.last_login_date < cutoff_date,
+                    or_(
+                        QFPlayer.username.is_(None),
+                        ~QFPlayer.username.like("% X%"),
+                    ),
+                )
+                .order_by(QFPlayer.player_id)
+                .limit(limit)
+            )
+            if cursor:
+                stmt = stmt.where(QFPlayer.player_id > UUID(cursor))
+            guests = [tuple(row) for row in (await self.db.execute(stmt)).all()]
+            if not guests:
+                return ChunkOutcome(processed=0, next_cursor=None)
+
+            recycled_count += await self._recycle_guest_username_chunk(guests)
+            return ChunkOutcome(
+                processed=len(guests),
+                next_cursor=str(guests[-1][0]) if len(guests) == limit else None,
+            )
 
-        recycled_count = len(updates)
+        await self._job_runner().run("qf_guest_username_recycle", recycle_chunk)
 
-        logger.info(f"Recycled {recycled_count} guest username(s)")
+        if recycled_count:
+            await self.db.run_sync(lambda sync_session: sync_session.expire_all())
+            logger.info(f"Recycled {recycled_count} guest username(s)")
 
         return recycled_count
 
@@ -0,0 +1,248 @@
+"""In-memory copy-assignment index for QF prompt rounds waiting on copies.
+
+Waiting prompt rounds are kept in FIFO order together with their owner, the
+players who already submitted copies, and recent abandonments. "Next eligible
+prompt for player X" becomes a walk over this index that skips ineligible
+entries without touching the shared queue; only the chosen entry is claimed
+(removed from ``queue:prompts``, which arbitrates between workers). The index
+is rebuilt from the database on a timer so drift from other workers or
+out-of-band changes is bounded.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, UTC
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import get_settings
+from backend.models.qf.player_abandoned_prompt import PlayerAbandonedPrompt
+from backend.models.qf.round import Round
+from backend.services.qf.round_service_helpers import PromptQueryBuilder
+from backend.utils import ensure_utc
+
+logger = logging.getLogger(__name__)
+
+
+class WaitingPromptRound:
+    """Index entry for one prompt round that still needs copies."""
+
+    __slots__ = ("prompt_round_id", "owner_id", "copy_player_ids", "abandoned_at", "queued")
+
+    def __init__(self, prompt_round_id: UUID, owner_id: Optional[UUID] = None, queued: bool = True):
+        self.prompt_round_id = prompt_round_id
+        # None until the owner is known (entries pushed without one are resolved lazily)
+        self.owner_id = owner_id
+        self.copy_player_ids: set[UUID] = set()
+        self.abandoned_at: dict[UUID, datetime] = {}
+        # Whether the entry is currently claimable (present in the shared queue)
+        self.queued = queued
+
+    def is_eligible_for(self, player_id: UUID, cooldown_cutoff: datetime) -> bool:
+        if player_id == self.owner_id or player_id in self.copy_player_ids:
+            return False
+        abandoned_at = self.abandoned_at.get(player_id)
+        return abandoned_at is None or abandoned_at < cooldown_cutoff
+
+
+class CopyAssignmentIndex:
+    """Process-wide ordered index of prompt rounds waiting for copy players."""
+
+    def __init__(self, reconcile_interval_seconds: float = 30.0):
+        self.reconcile_interval_seconds = reconcile_interval_seconds
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all in-memory state; the next call reloads from the database."""
+        self._entries: OrderedDict[UUID, WaitingPromptRound] = OrderedDict()
+        self._last_reconcile: Optional[float] = None
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Event hooks (called after the corresponding queue/DB change)
+    # ------------------------------------------------------------------
+
+    def note_queued(self, prompt_round_id: UUID, owner_id: Optional[UUID] = None) -> None:
+        """A prompt round was pushed to the shared queue (moves to the back)."""
+        entry = self._entries.get(prompt_round_id)
+        if entry is None:
+            entry = self._entries[prompt_round_id] = WaitingPromptRound(prompt_round_id, owner_id)
+        else:
+            entry.queued = True
+            if owner_id is not None:
+                entry.owner_id = owner_id
+            self._entries.move_to_end(prompt_round_id)
+
+    def note_dequeued(self, prompt_round_ids: Iterable[UUID]) -> None:
+        """Prompt rounds left the shared queue but may still be waiting (copy in progress)."""
+        for prompt_round_id in prompt_round_ids:
+            entry = self._entries.get(prompt_round_id)
+            if entry is not None:
+                entry.queued = False
+
+    def note_all_dequeued(self) -> None:
+        """The shared queue was cleared."""
+        for entry in self._entries.values():
+            entry.queued = False
+
+    def note_copy_submitted(self, prompt_round_id: UUID, player_id: UUID) -> None:
+        entry = self._entries.get(prompt_round_id)
+        if entry is not None:
+            entry.copy_player_ids.add(player_id)
+
+    def note_abandoned(self, prompt_round_id: UUID, player_id: UUID, abandoned_at: Optional[datetime] = None) -> None:
+        entry = self._entries.get(prompt_round_id)
+        if entry is not None:
+            entry.abandoned_at[player_id] = abandoned_at or datetime.now(UTC)
+
+    def discard(self, prompt_round_ids: Iterable[UUID]) -> None:
+        """Prompt rounds no longer wait for copies (phraseset created, flagged, deleted)."""
+        for prompt_round_id in prompt_round_ids:
+            self._entries.pop(prompt_round_id, None)
+
+    # ------------------------------------------------------------------
+    # Database synchronisation
+    # ------------------------------------------------------------------
+
+    async def _load(self, db: AsyncSession, prompt_round_ids: Optional[list[UUID]] = None
+                    ) -> OrderedDict[UUID, WaitingPromptRound]:
+        """Load waiting prompt rounds (optionally a subset) with their copy and abandon history."""
+        waiting_query = PromptQueryBuilder.build_queue_rehydration_query().add_columns(Round.player_id)
+        if prompt_round_ids is not None:
+            waiting_query = waiting_query.where(Round.round_id.in_(prompt_round_ids))
+
+        loaded: OrderedDict[UUID, WaitingPromptRound] = OrderedDict()
+        for prompt_round_id, owner_id in (await db.execute(waiting_query)).all():
+            loaded[prompt_round_id] = WaitingPromptRound(prompt_round_id, owner_id)
+        if not loaded:
+            return loaded
+
+        waiting_ids = list(loaded)
+        copy_rows = await db.execute(
+            select(Round.prompt_round_id, Round.player_id, Round.status)
+            .where(Round.round_type == "copy")
+            .where(Round.prompt_round_id.in_(waiting_ids))
+            .where(Round.status.in_(["active", "submitted"]))
+        )
+        for prompt_round_id, player_id, status in copy_rows.all():
+            entry = loaded.get(prompt_round_id)
+            if entry is None:
+                continue
+            if status == "submitted":
+                entry.copy_player_ids.add(player_id)
+            else:
+                # A live copy holds the claim
+                entry.queued = False
+
+        cutoff = datetime.now(UTC) - timedelta(hours=get_settings().abandoned_prompt_cooldown_hours)
+        abandon_rows = await db.execute(
+            select(
+                PlayerAbandonedPrompt.prompt_round_id,
+                PlayerAbandonedPrompt.player_id,
+                PlayerAbandonedPrompt.abandoned_at,
+            )
+            .where(PlayerAbandonedPrompt.prompt_round_id.in_(waiting_ids))
+            .where(PlayerAbandonedPrompt.abandoned_at >= cutoff)
+        )
+        for prompt_round_id, player_id, abandoned_at in abandon_rows.all():
+            entry = loaded.get(prompt_round_id)
+            if entry is not None:
+                abandoned_at = ensure_utc(abandoned_at)
+                previous = entry.abandoned_at.get(player_id)
+                if previous is None or abandoned_at > previous:
+                    entry.abandoned_at[player_id] = abandoned_at
+
+        return loaded
+
+    async def reconcile(self, db: AsyncSession) -> None:
+        """Rebuild the index from the database."""
+        self._entries = await self._load(db)
+        self._last_reconcile = time.monotonic()
+        logger.debug(f"Copy assignment index reconciled: {len(self._entries)} waiting prompt rounds")
+
+    async def ensure_fresh(self, db: AsyncSession) -> list[UUID]:
+        """Reconcile when stale and resolve entries pushed without an owner.
+
+        Returns ids that were pushed to the queue but no longer wait for copies,
+        so the caller can drop them from the shared queue.
+        """
+        if self._last_reconcile is None or time.monotonic() - self._last_reconcile >= self.reconcile_interval_seconds:
+            await self.reconcile(db)
+            return []
+
+        pending = [entry.prompt_round_id for entry in self._entries.values() if entry.owner_id is None]
+        if not pending:
+            return []
+
+        resolved = await self._load(db, pending)
+        stale_ids = []
+        for prompt_round_id in pending:
+            entry = self._entries.get(prompt_round_id)
+            if entry is None:
+                continue
+            loaded = resolved.get(prompt_round_id)
+            if loaded is None:
+                del self._entries[prompt_round_id]
+                stale_ids.append(prompt_round_id)
+                continue
+            entry.owner_id = loaded.owner_id
+            entry.copy_player_ids |= loaded.copy_player_ids
+            for player_id, abandoned_at in loaded.abandoned_at.items():
+                entry.abandoned_at.setdefault(player_id, abandoned_at)
+        return stale_ids
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _cooldown_cutoff(self) -> datetime:
+        return datetime.now(UTC) - timedelta(hours=get_settings().abandoned_prompt_cooldown_hours)
+
+    def next_eligible(
+        self,
+        player_id: UUID,
+        exclude: Optional[set[UUID]] = None,
+        exclude_owners: Optional[set[UUID]] = None,
+    ) -> Optional[UUID]:
+        """Return the oldest claimable prompt round the player may copy, without claiming it.
+
+        ``exclude_owners`` skips prompts written by any of those players (party mode
+        keeps a session's own prompts out of the global fallback).
+        """
+        cutoff = self._cooldown_cutoff()
+        for prompt_round_id, entry in self._entries.items():
+            if not entry.queued or entry.owner_id is None:
+                continue
+            if exclude and prompt_round_id in exclude:
+                continue
+            if exclude_owners and entry.owner_id in exclude_owners:
+                continue
+            if entry.is_eligible_for(player_id, cutoff):
+                return prompt_round_id
+        return None
+
+    def count_eligible(self, player_id: UUID) -> int:
+        """Number of waiting prompt rounds the player could copy (claimed or not)."""
+        cutoff = self._cooldown_cutoff()
+        return sum(
+            1
+            for entry in self._entries.values()
+            if entry.owner_id is not None and entry.is_eligible_for(player_id, cutoff)
+        )
+
+
+# Global singleton instance
+_copy_assignment_index = CopyAssignmentIndex()
+
+
+def get_copy_assignment_index() -> CopyAssignmentIndex:
+    """Get the global CopyAssignmentIndex singleton."""
+    return _copy_assignment_index
@@ -13,6 +13,7 @@ from backend.models.qf.flagged_prompt import FlaggedPrompt
 from backend.models.qf.player import QFPlayer
 from backend.models.qf.round import Round
 from backend.services.qf.queue_service import QFQueueService
+from backend.services.qf.copy_assignment_index import get_copy_assignment_index
 from backend.services.transaction_service import TransactionService
 from backend.config import get_settings
 
@@ -106,6 +107,7 @@ class FlaggedPromptService:
             if prompt_round:
                 prompt_round.phraseset_status = "flagged_removed"
                 QFQueueService.remove_prompt_round_from_queue(prompt_round.round_id)
+                get_copy_assignment_index().discard([prompt_round.round_id])
 
             if reporter and flag.penalty_kept > 0:
                 await transaction_service.create_transaction(
@@ -1,6 +1,6 @@
 """Party Mode coordination service for managing party-scoped rounds."""
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func, not_
+from sqlalchemy import select, and_, or_, not_
 from typing import Optional, List, Callable, TypeVar, Any
 from uuid import UUID
 import asyncio
@@ -11,8 +11,6 @@ from sqlalchemy.exc import OperationalError
 from backend.models.qf.player import QFPlayer
 from backend.models.qf.party_session import PartySession
 from backend.models.qf.party_participant import PartyParticipant
-from backend.models.qf.party_round import PartyRound
-from backend.models.qf.party_phraseset import PartyPhraseset
 from backend.models.qf.round import Round
 from backend.models.qf.phraseset import Phraseset
 from backend.models.qf.prompt import Prompt
@@ -29,6 +27,9 @@ from backend.services.qf.party_session_service import (
 )
 from backend.services.qf.party_websocket_manager import get_party_websocket_manager
 from backend.services.qf.queue_service import QFQueueService
+from backend.services.qf.copy_assignment_index import get_copy_assignment_index
+from backend.services.qf.party_eligibility_index import get_party_eligibility_index
+from backend.services.qf.party_state import PHASE_REQUIREMENTS
 from backend.config import get_settings
 from backend.utils.exceptions import NoPromptsAvailableError, NoPhrasesetsAvailableError
 from backend.services.ai.ai_service import AI_PLAYER_EMAIL_DOMAIN
@@ -204,12 +205,13 @@ class PartyCoordinationService:
             round_id, phrase, player, transaction_service
         )
 
-        # Increment participant progress counter (only on successful submission)
-        participant = await self.party_session_service.increment_participant_progress(
+        # Count the submission and advance the phase if it completed it, in one write
+        submission = await self.party_session_service.record_submission(
             session_id=session_id,
             player_id=player.player_id,
             round_type='prompt',
         )
+        participant = submission.participant
 
         # Broadcast progress update
         await self.ws_manager.notify_player_progress(
@@ -225,16 +227,13 @@ class PartyCoordinationService:
             session_progress=await self._get_session_progress_summary(session_id),
         )
 
-        # Advance the phase atomically if this submission completed the phase.
-        old_session = await self.party_session_service.get_session_by_id(session_id)
-        advanced_session = await self.party_session_service.advance_phase_atomic(session_id)
-        if advanced_session and old_session and advanced_session.current_phase != old_session.current_phase:
-            logger.info(f"Advancing phase for session {session_id} from PROMPT to COPY")
+        if submission.advanced_to:
+            logger.info(f"Advanced phase for session {session_id} from {submission.phase} to {submission.advanced_to}")
 
             await self.ws_manager.notify_phase_transition(
                 session_id=session_id,
-                old_phase=old_session.current_phase,
-                new_phase=advanced_session.current_phase,
+                old_phase=submission.phase,
+                new_phase=submission.advanced_to,
                 message="All prompts submitted! Time to write copies.",
             )
 
@@ -311,6 +310,9 @@ class PartyCoordinationService:
             force_prompt_round=True,
             prompt_from_queue=prompt_from_queue,
         )
+        eligibility = get_party_eligibility_index().peek(session_id)
+        if eligibility:
+            eligibility.note_taken(player.player_id, eligible_prompt_round_id)
 
         # Link round to party (without incrementing counter yet)
         party_round = await self.party_session_service.link_round_to_party(
@@ -353,14 +355,8 @@ class PartyCoordinationService:
             round_id, phrase, player, transaction_service
         )
 
-        # Increment participant progress counter (only on successful submission)
-        participant = await self.party_session_service.increment_participant_progress(
-            session_id=session_id,
-            player_id=player.player_id,
-            round_type='copy',
-        )
-
-        # If phraseset was created, link it to party
+        # If phraseset was created, link it to party (before a possible move to VOTE
+        # marks the session's phrasesets available)
         if result.get('phraseset_created') and result.get('phraseset_id'):
             await self.party_session_service.link_phraseset_to_party(
                 session_id=session_id,
@@ -371,6 +367,14 @@ class PartyCoordinationService:
                 f"Linked phraseset {result['phraseset_id']} to party session {session_id}"
             )
 
+        # Count the submission and advance the phase if it completed it, in one write
+        submission = await self.party_session_service.record_submission(
+            session_id=session_id,
+            player_id=player.player_id,
+            round_type='copy',
+        )
+        participant = submission.participant
+
         await self.ws_manager.notify_player_progress(
             session_id=session_id,
             player_id=player.player_id,
@@ -384,13 +388,11 @@ class PartyCoordinationService:
             session_progress=await self._get_session_progress_summary(session_id),
         )
 
-        old_session = await self.party_session_service.get_session_by_id(session_id)
-        advanced_session = await self.party_session_service.advance_phase_atomic(session_id)
-        if advanced_session and old_session and advanced_session.current_phase != old_session.current_phase:
+        if submission.advanced_to:
             await self.ws_manager.notify_phase_transition(
                 session_id=session_id,
-                old_phase=old_session.current_phase,
-                new_phase=advanced_session.current_phase,
+                old_phase=submission.phase,
+                new_phase=submission.advanced_to,
                 message="All copies submitted! Time to vote.",
             )
 
@@ -411,6 +413,7 @@ class PartyCoordinationService:
         session_id: UUID,
         player: QFPlayer,
         transaction_service: TransactionService,
+        phraseset_id: Optional[UUID] = None,
     ) -> tuple[Round, UUID]:
         """Start a vote round within party context.
 
@@ -418,6 +421,8 @@ class PartyCoordinationService:
             session_id: UUID of the party session
             player: Player object
             transaction_service: Transaction service instance
+            phraseset_id: Phraseset already chosen by the caller (AI players pick
+                before generating their vote); defaults to the next eligible one
 
         Returns:
             tuple: (Round object, party_round_id UUID)
@@ -451,7 +456,7 @@ class PartyCoordinationService:
             )
 
         # Get eligible phrasesets (party-first, excluding self-content)
-        eligible_phraseset_id = await self._get_eligible_phraseset_for_vote(
+        eligible_phraseset_id = phraseset_id or await self._get_eligible_phraseset_for_vote(
             session_id, player.player_id
         )
 
@@ -459,11 +464,20 @@ class PartyCoordinationService:
             raise NoPhrasesetsAvailableError("No eligible phrasesets available for voting")
 
         # Start vote round with specific phraseset
-        round_obj = await self.vote_service.start_vote_round(
-            player=player,
-            transaction_service=transaction_service,
-            phraseset_id=eligible_phraseset_id,
-        )
+        eligibility = get_party_eligibility_index().peek(session_id)
+        try:
+            round_obj, _ = await self.vote_service.start_vote_round(
+                player=player,
+                transaction_service=transaction_service,
+                phraseset_id=eligible_phraseset_id,
+            )
+        except NoPhrasesetsAvailableError:
+            # The phraseset stopped accepting votes; nobody in the party can take it
+            if eligibility:
+                eligibility.discard_candidate(eligible_phraseset_id)
+            raise
+        if eligibility:
+            eligibility.note_taken(player.player_id, eligible_phraseset_id)
 
         # Link round to party (without incrementing counter yet)
         party_round = await self.party_session_service.link_round_to_party(
@@ -519,12 +533,13 @@ class PartyCoordinationService:
             transaction_service=transaction_service,
         )
 
-        # Increment participant progress counter (only on successful submission)
-        participant = await self.party_session_service.increment_participant_progress(
+        # Count the submission and advance the phase if it completed it, in one write
+        submission = await self.party_session_service.record_submission(
             session_id=session_id,
             player_id=player.player_id,
             round_type='vote',
         )
+        participant = submission.participant
 
         await self.ws_manager.notify_player_progress(
             session_id=session_id,
@@ -539,13 +554,11 @@ class PartyCoordinationService:
             session_progress=await self._get_session_progress_summary(session_id),
         )
 
-        old_session = await self.party_session_service.get_session_by_id(session_id)
-        advanced_session = await self.party_session_service.advance_phase_atomic(session_id)
-        if advanced_session and old_session and advanced_session.current_phase != old_session.current_phase:
+        if submission.advanced_to:
             await self.ws_manager.notify_phase_transition(
                 session_id=session_id,
-                old_phase=old_session.current_phase,
-                new_phase=advanced_session.current_phase,
+                old_phase=submission.phase,
+                new_phase=submission.advanced_to,
                 message="All votes submitted! Check out the results.",
             )
 
@@ -569,6 +582,10 @@ class PartyCoordinationService:
         - Prompts already copied by this player
         - Prompts player abandoned
 
+        Party prompts come from the session's in-memory eligibility, and the global
+        fallback walks the copy assignment index, so neither path queries per
+        candidate or cycles the shared prompt queue.
+
         Args:
             session_id: UUID of the party session
             player_id: UUID of the player
@@ -576,80 +593,30 @@ class PartyCoordinationService:
         Returns:
             Tuple of (eligible prompt round ID or None, whether the prompt originated from the global queue)
         """
-        # Prompts this player has already copied
-        result = await self.db.execute(
-            select(Round.prompt_round_id)
-            .where(Round.player_id == player_id)
-            .where(Round.round_type == 'copy')
-            .distinct()
-        )
-        already_copied = {row[0] for row in result.all() if row[0]}
-
-        # Party prompts (PROMPT phase only)
-        result = await self.db.execute(
-            select(PartyRound)
-            .where(PartyRound.session_id == session_id)
-            .where(PartyRound.round_type == 'prompt')
-            .where(PartyRound.phase == 'PROMPT')
-        )
-        party_prompt_rounds = result.scalars().all()
-        party_prompt_round_ids = [pr.round_id for pr in party_prompt_rounds]
-
-        if party_prompt_round_ids:
-            result = await self.db.execute(
-                select(Round.round_id, Round.player_id)
-                .where(Round.round_id.in_(party_prompt_round_ids))
-            )
-            prompt_players = {round_id: prompt_player_id for round_id, prompt_player_id in result.all()}
+        eligibility = await get_party_eligibility_index().get(self.db, session_id, 'COPY', player_id)
+        prompt_round_id = eligibility.next_for(player_id)
+        if prompt_round_id:
+            return prompt_round_id, False
 
-            eligible_party_prompts = [
-                pr
-                for pr in party_prompt_rounds
-                if pr.round_id not in already_copied
-                and prompt_players.get(pr.round_id) not in {player_id, None}
-            ]
-
-            if eligible_party_prompts:
-                return eligible_party_prompts[0].round_id, False
-
-        # Fallback: reuse prompt rounds from the global queue that are not authored by
+        # Fallback: claim a prompt round from the global queue that is not authored by
         # anyone currently in the party session.
-        participants = await self.party_session_service.get_participants(session_id)
-        party_player_ids = {p.player_id for p in participants if p.player_id}
-        skipped_prompt_ids: list[UUID] = []
-        queue_length = QFQueueService.get_prompt_rounds_waiting()
-
-        for _ in range(queue_length):
-            prompt_round_id = QFQueueService.get_next_prompt_round()
-            if not prompt_round_id:
-                break
-
-            prompt_round = await self.db.get(Round, prompt_round_id)
-            if not prompt_round or prompt_round.round_type != 'prompt':
-                continue
-
-            if prompt_round.player_id in party_player_ids:
-                skipped_prompt_ids.append(prompt_round_id)
-                continue
-
-            if prompt_round.round_id in already_copied:
-                skipped_prompt_ids.append(prompt_round_id)
-                continue
-
-            if prompt_round.status != 'submitted':
-                continue
-
-            # Found an eligible prompt; requeue skipped prompts before returning
-            for skipped_id in skipped_prompt_ids:
-                QFQueueService.add_prompt_round_to_queue(skipped_id)
-
-            return prompt_round.round_id, True
-
-        # Requeue any skipped prompts if no eligible option was found
-        for skipped_id in skipped_prompt_ids:
-            QFQueueService.add_prompt_round_to_queue(skipped_id)
+        index = get_copy_assignment_index()
+        stale_ids = await index.ensure_fresh(self.db)
+        if stale_ids:
+            QFQueueService.remove_prompt_rounds_from_queue(stale_ids)
+
+        tried_prompt_ids: set[UUID] = set()
+        while True:
+            prompt_round_id = index.next_eligible(
+                player_id, tried_prompt_ids, exclude_owners=eligibility.player_ids
+            )
+            if prompt_round_id is None:
+                return None, False
+            tried_prompt_ids.add(prompt_round_id)
 
-        return None, False
+            # Removing it from the shared queue claims it; a lost claim moves on
+            if QFQueueService.remove_prompt_round_from_queue(prompt_round_id):
+                return prompt_round_id, True
 
     async def _get_eligible_phraseset_for_vote(
         self,
@@ -663,6 +630,9 @@ class PartyCoordinationService:
         - Phrasesets where player contributed (prompt or copy)
         - Phrasesets player already voted on
 
+        Answered from the session's in-memory eligibility (built once per phase),
+        so concurrent AI voters do not each run a query per candidate.
+
         Args:
             session_id: UUID of the party session
             player_id: UUID of the player
@@ -670,57 +640,8 @@ class PartyCoordinationService:
         Returns:
             UUID of eligible phraseset, or None if none available
         """
-        # Get party phrasesets available for voting
-        result = await self.db.execute(
-            select(PartyPhraseset, Phraseset)
-            .join(Phraseset, PartyPhraseset.phraseset_id == Phraseset.phraseset_id)
-            .where(PartyPhraseset.session_id == session_id)
-            .where(PartyPhraseset.available_for_voting == True)
-            .where(Phraseset.status == 'voting')
-        )
-        party_phrasesets_data = result.all()
-
-        if not party_phrasesets_data:
-            return None
-
-        # Get player's party rounds to check contribution
-        result = await self.db.execute(
-            select(PartyRound.round_id)
-            .where(PartyRound.session_id == session_id)
-            .join(PartyParticipant, PartyRound.participant_id == PartyParticipant.participant_id)
-            .where(PartyParticipant.player_id == player_id)
-        )
-        player_round_ids = {row[0] for row in result.all()}
-
-        # Filter out phrasesets where player contributed
-        eligible_phrasesets = []
-        for party_phraseset, phraseset in party_phrasesets_data:
-            # Check if player contributed to this phraseset
-            contributed = (
-                phraseset.prompt_round_id in player_round_ids or
-                phraseset.copy_round_1_id in player_round_ids or
-                (phraseset.copy_round_2_id and phraseset.copy_round_2_id in player_round_ids)
-            )
-
-            if not contributed:
-                # Check if player already voted on this phraseset
-                result = await self.db.execute(
-                    select(func.count())
-                    .select_from(Round)
-                    .where(Round.player_id == player_id)
-                    .where(Round.round_type == 'vote')
-                    .where(Round.phraseset_id == phraseset.phraseset_id)
-                )
-                already_voted = result.scalar() > 0
-
-                if not already_voted:
-                    eligible_phrasesets.append(phraseset.phraseset_id)
-
-        if eligible_phrasesets:
-            # Return first eligible phraseset
-            return eligible_phrasesets[0]
-
-        return None
+        eligibility = await get_party_eligibility_index().get(self.db, session_id, 'VOTE', player_id)
+        return eligibility.next_for(player_id)
 
     async def _get_session_progress_summary(self, session_id: UUID) -> dict:
         """Get summary of session progress.
@@ -731,29 +652,16 @@ class PartyCoordinationService:
         Returns:
             dict: Progress summary
         """
-        session = await self.party_session_service.get_session_by_id(session_id)
-        if not session:
+        state = await self.party_session_service.get_session_state(session_id)
+        if not state:
             return {}
 
-        # Get participants
-        participants = await self.party_session_service.get_participants(session_id)
-
         # Count completed players for current phase
-        if session.current_phase == 'PROMPT':
-            required = session.prompts_per_player
-            done = sum(1 for p in participants if p.prompts_submitted >= required)
-        elif session.current_phase == 'COPY':
-            required = session.copies_per_player
-            done = sum(1 for p in participants if p.copies_submitted >= required)
-        elif session.current_phase == 'VOTE':
-            required = session.votes_per_player
-            done = sum(1 for p in participants if p.votes_submitted >= required)
-        else:
-            done = 0
+        done = state.players_done_with_phase() if state.current_phase in PHASE_REQUIREMENTS else 0
 
         return {
             'players_done_with_phase': done,
-            'total_players': len(participants),
+            'total_players': state.participant_count,
         }
 
     async def _process_single_ai_prompt_submission(
@@ -959,6 +867,7 @@ class PartyCoordinationService:
                     session_id=session_id,
                     player=participant.player,
                     transaction_service=transaction_service,
+                    phraseset_id=phraseset_id,
                 ),
                 operation_name=f"start_vote_round for AI {participant.player.username}",
             )
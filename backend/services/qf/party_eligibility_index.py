@@ -0,0 +1,245 @@
+"""In-memory per-session eligibility for party copy and vote assignment.
+
+When a party session enters COPY or VOTE, the party prompts (or phrasesets) each
+participant may still take are loaded with a few set-based queries and kept as
+an ordered set per player. Picking the next item is then a constant-time look
+at the head of that set, and starting a round removes the item for that player.
+Entries are rebuilt when the session's phase changes or after a short interval,
+which bounds drift from rounds started on other workers; round services still
+revalidate the chosen item at write time.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.qf.party_participant import PartyParticipant
+from backend.models.qf.party_phraseset import PartyPhraseset
+from backend.models.qf.party_round import PartyRound
+from backend.models.qf.phraseset import Phraseset
+from backend.models.qf.round import Round
+from backend.services.qf.vote_service import ACCEPTING_VOTE_STATUSES
+
+logger = logging.getLogger(__name__)
+
+INDEXED_PHASES = frozenset({"COPY", "VOTE"})
+
+
+class PartySessionEligibility:
+    """Remaining copy or vote candidates for every participant of one session."""
+
+    __slots__ = ("session_id", "phase", "player_ids", "pending", "built_at")
+
+    def __init__(self, session_id: UUID, phase: str, player_ids: set[UUID]):
+        self.session_id = session_id
+        self.phase = phase
+        self.player_ids = player_ids
+        # player_id -> ordered prompt round ids (COPY) or phraseset ids (VOTE)
+        self.pending: dict[UUID, OrderedDict[UUID, None]] = {player_id: OrderedDict() for player_id in player_ids}
+        self.built_at = time.monotonic()
+
+    def add_candidate(self, candidate_id: UUID, excluded_player_ids: set[UUID]) -> None:
+        for player_id, pending in self.pending.items():
+            if player_id not in excluded_player_ids:
+                pending[candidate_id] = None
+
+    def next_for(self, player_id: UUID) -> Optional[UUID]:
+        pending = self.pending.get(player_id)
+        if not pending:
+            return None
+        return next(iter(pending))
+
+    def remaining_for(self, player_id: UUID) -> int:
+        return len(self.pending.get(player_id, ()))
+
+    def note_taken(self, player_id: UUID, candidate_id: UUID) -> None:
+        """The player started a round on this candidate, so it is no longer eligible."""
+        pending = self.pending.get(player_id)
+        if pending is not None:
+            pending.pop(candidate_id, None)
+
+    def discard_candidate(self, candidate_id: UUID) -> None:
+        """The candidate is no longer open for anyone (e.g. phraseset closed)."""
+        for pending in self.pending.values():
+            pending.pop(candidate_id, None)
+
+
+class PartyEligibilityIndex:
+    """Process-wide registry of per-session eligibility, keyed by session id."""
+
+    def __init__(self, reconcile_interval_seconds: float = 30.0):
+        self.reconcile_interval_seconds = reconcile_interval_seconds
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all in-memory state; sessions are rebuilt on next use."""
+        self._sessions: dict[UUID, PartySessionEligibility] = {}
+        self._build_locks: dict[UUID, asyncio.Lock] = {}
+
+    def discard(self, session_id: UUID) -> None:
+        self._sessions.pop(session_id, None)
+        self._build_locks.pop(session_id, None)
+
+    def peek(self, session_id: UUID) -> Optional[PartySessionEligibility]:
+        return self._sessions.get(session_id)
+
+    def _is_fresh(self, entry: Optional[PartySessionEligibility], phase: str, player_id: Optional[UUID]) -> bool:
+        if entry is None or entry.phase != phase:
+            return False
+        if time.monotonic() - entry.built_at >= self.reconcile_interval_seconds:
+            return False
+        return player_id is None or player_id in entry.player_ids
+
+    async def get(
+        self,
+        db: AsyncSession,
+        session_id: UUID,
+        phase: str,
+        player_id: Optional[UUID] = None,
+    ) -> Optional[PartySessionEligibility]:
+        """Return the session's eligibility for ``phase``, building it if missing or stale.
+
+        Concurrent callers (e.g. parallel AI submissions) share a single build.
+        """
+        if phase not in INDEXED_PHASES:
+            self.discard(session_id)
+            return None
+
+        entry = self._sessions.get(session_id)
+        if self._is_fresh(entry, phase, player_id):
+            return entry
+
+        lock = self._build_locks.setdefault(session_id, asyncio.Lock())
+        async with lock:
+            entry = self._sessions.get(session_id)
+            if self._is_fresh(entry, phase, player_id):
+                return entry
+            entry = await self._build(db, session_id, phase)
+            self._sessions[session_id] = entry
+            self._prune()
+            return entry
+
+    def _prune(self) -> None:
+        """Forget sessions nobody has touched for a while (finished or abandoned)."""
+        cutoff = time.monotonic() - 10 * self.reconcile_interval_seconds
+        for session_id in [sid for sid, entry in self._sessions.items() if entry.built_at < cutoff]:
+            self.discard(session_id)
+
+    async def _build(self, db: AsyncSession, session_id: UUID, phase: str) -> PartySessionEligibility:
+        participants = await db.execute(
+            select(PartyParticipant.participant_id, PartyParticipant.player_id)
+            .where(PartyParticipant.session_id == session_id)
+        )
+        player_by_participant = {
+            participant_id: player_id for participant_id, player_id in participants.all() if player_id
+        }
+        entry = PartySessionEligibility(session_id, phase, set(player_by_participant.values()))
+
+        if phase == "COPY":
+            await self._load_copy_candidates(db, entry)
+        else:
+            await self._load_vote_candidates(db, entry, player_by_participant)
+
+        logger.debug(
+            f"Party eligibility built for session {session_id} ({phase}): "
+            f"{sum(len(pending) for pending in entry.pending.values())} player/candidate pairs"
+        )
+        return entry
+
+    async def _load_copy_candidates(self, db: AsyncSession, entry: PartySessionEligibility) -> None:
+        """Party prompts each participant may copy: not their own, not already copied."""
+        prompt_rows = (await db.execute(
+            select(PartyRound.round_id, Round.player_id)
+            .join(Round, Round.round_id == PartyRound.round_id)
+            .where(PartyRound.session_id == entry.session_id)
+            .where(PartyRound.round_type == 'prompt')
+            .where(PartyRound.phase == 'PROMPT')
+            .order_by(PartyRound.created_at)
+        )).all()
+        if not prompt_rows:
+            return
+
+        prompt_round_ids = [prompt_round_id for prompt_round_id, _ in prompt_rows]
+        copied: dict[UUID, set[UUID]] = {}
+        if entry.player_ids:
+            copy_rows = await db.execute(
+                select(Round.prompt_round_id, Round.player_id)
+                .where(Round.round_type == 'copy')
+                .where(Round.prompt_round_id.in_(prompt_round_ids))
+                .where(Round.player_id.in_(list(entry.player_ids)))
+            )
+            for prompt_round_id, player_id in copy_rows.all():
+                copied.setdefault(prompt_round_id, set()).add(player_id)
+
+        for prompt_round_id, owner_id in prompt_rows:
+            excluded = copied.get(prompt_round_id, set()) | {owner_id}
+            entry.add_candidate(prompt_round_id, excluded)
+
+    async def _load_vote_candidates(
+        self,
+        db: AsyncSession,
+        entry: PartySessionEligibility,
+        player_by_participant: dict[UUID, UUID],
+    ) -> None:
+        """Open party phrasesets each participant may vote on: not contributed to, not voted on."""
+        phraseset_rows = (await db.execute(
+            select(
+                Phraseset.phraseset_id,
+                Phraseset.prompt_round_id,
+                Phraseset.copy_round_1_id,
+                Phraseset.copy_round_2_id,
+            )
+            .join(PartyPhraseset, PartyPhraseset.phraseset_id == Phraseset.phraseset_id)
+            .where(PartyPhraseset.session_id == entry.session_id)
+            .where(PartyPhraseset.available_for_voting == True)
+            .where(Phraseset.status.in_(ACCEPTING_VOTE_STATUSES))
+            .order_by(PartyPhraseset.created_at)
+        )).all()
+        if not phraseset_rows:
+            return
+
+        # Contribution is judged by the rounds each participant played in this session
+        round_rows = await db.execute(
+            select(PartyRound.round_id, PartyRound.participant_id)
+            .where(PartyRound.session_id == entry.session_id)
+        )
+        player_by_round = {
+            round_id: player_by_participant.get(participant_id)
+            for round_id, participant_id in round_rows.all()
+        }
+
+        phraseset_ids = [row.phraseset_id for row in phraseset_rows]
+        voted: dict[UUID, set[UUID]] = {}
+        if entry.player_ids:
+            vote_rows = await db.execute(
+                select(Round.phraseset_id, Round.player_id)
+                .where(Round.round_type == 'vote')
+                .where(Round.phraseset_id.in_(phraseset_ids))
+                .where(Round.player_id.in_(list(entry.player_ids)))
+            )
+            for phraseset_id, player_id in vote_rows.all():
+                voted.setdefault(phraseset_id, set()).add(player_id)
+
+        for phraseset_id, prompt_round_id, copy_round_1_id, copy_round_2_id in phraseset_rows:
+            contributors = {
+                player_by_round.get(round_id)
+                for round_id in (prompt_round_id, copy_round_1_id, copy_round_2_id)
+                if round_id
+            }
+            entry.add_candidate(phraseset_id, voted.get(phraseset_id, set()) | contributors)
+
+
+# Global singleton instance
+_party_eligibility_index = PartyEligibilityIndex()
+
+
+def get_party_eligibility_index() -> PartyEligibilityIndex:
+    """Get the global PartyEligibilityIndex singleton."""
+    return _party_eligibility_index
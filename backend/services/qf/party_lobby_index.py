@@ -0,0 +1,214 @@
+"""In-memory index of open party lobbies.
+
+The party list is served from a process-wide map of OPEN sessions (code, host,
+capacity, human/AI counts) instead of aggregating participants across every
+open session on each lobby refresh. Session lifecycle events (create, join,
+leave, start, cleanup) update single entries and push the change to lobby
+viewers; the whole index is reconciled against the database when it is older
+than ``party_lobby_reconcile_seconds``, which also picks up changes made by
+other workers.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import get_settings
+from backend.models.qf.party_participant import PartyParticipant
+from backend.models.qf.party_session import PartySession
+from backend.models.qf.player import QFPlayer
+from backend.services.ai.ai_service import AI_PLAYER_EMAIL_DOMAIN
+from backend.services.qf.party_state import PartySessionState
+from backend.services.qf.party_websocket_manager import get_party_websocket_manager
+
+logger = logging.getLogger(__name__)
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+@dataclass(slots=True)
+class PartyLobbyEntry:
+    """Listing data for one OPEN party session."""
+
+    session_id: UUID
+    party_code: str
+    host_player_id: UUID
+    host_username: str
+    min_players: int
+    max_players: int
+    participant_count: int
+    human_count: int
+    created_at: datetime
+
+    @classmethod
+    def from_state(cls, state: PartySessionState) -> PartyLobbyEntry:
+        host = state.participant(state.host_player_id) or next(
+            (p for p in state.participants.values() if p.is_host), None
+        )
+        return cls(
+            session_id=state.session_id,
+            party_code=state.party_code,
+            host_player_id=state.host_player_id,
+            host_username=host.username if host else "Unknown",
+            min_players=state.min_players,
+            max_players=state.max_players,
+            participant_count=state.participant_count,
+            human_count=state.human_participant_count,
+            created_at=state.created_at,
+        )
+
+    @property
+    def is_joinable(self) -> bool:
+        """Listed only while it has room and at least one human player."""
+        return self.participant_count < self.max_players and self.human_count > 0
+
+    def to_summary(self) -> Dict:
+        return {
+            'session_id': str(self.session_id),
+            'host_username': self.host_username or "Unknown",
+            'participant_count': self.participant_count,
+            'min_players': self.min_players,
+            'max_players': self.max_players,
+            'created_at': self.created_at,
+            'is_full': False,  # Full sessions are not listed
+        }
+
+
+class PartyLobbyIndex:
+    """Process-wide map of OPEN party sessions, keyed by session id."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all entries; the index is rebuilt from the database on next use."""
+        self._entries: Dict[UUID, PartyLobbyEntry] = {}
+        self._reconciled_at: Optional[float] = None
+        self._reconcile_lock = asyncio.Lock()
+
+    def peek(self, session_id: UUID) -> Optional[PartyLobbyEntry]:
+        return self._entries.get(session_id)
+
+    def _is_fresh(self) -> bool:
+        if self._reconciled_at is None:
+            return False
+        return time.monotonic() - self._reconciled_at < get_settings().party_lobby_reconcile_seconds
+
+    async def list_open(self, db: AsyncSession) -> List[Dict]:
+        """Joinable parties, newest first (reconciling first if the index is stale)."""
+        if not self._is_fresh():
+            async with self._reconcile_lock:
+                if not self._is_fresh():
+                    await self.reconcile(db)
+
+        entries = sorted(
+            (entry for entry in self._entries.values() if entry.is_joinable),
+            key=lambda entry: entry.created_at,
+            reverse=True,
+        )
+        return [entry.to_summary() for entry in entries]
+
+    async def reconcile(self, db: AsyncSession) -> int:
+        """Rebuild every entry from the database; returns the number of open sessions."""
+        counts = (
+            select(
+                PartyParticipant.session_id,
+                func.count(PartyParticipant.participant_id).label("participant_count"),
+                func.sum(
+                    case((QFPlayer.email.ilike(f'%{AI_PLAYER_EMAIL_DOMAIN}'), 0), else_=1)
+                ).label("human_count"),
+            )
+            .join(QFPlayer, PartyParticipant.player_id == QFPlayer.player_id)
+            .join(PartySession, PartySession.session_id == PartyParticipant.session_id)
+            .where(PartySession.status == "OPEN")
+            .group_by(PartyParticipant.session_id)
+            .subquery()
+        )
+        stmt = (
+            select(
+                PartySession.session_id,
+                PartySession.party_code,
+                PartySession.host_player_id,
+                PartySession.min_players,
+                PartySession.max_players,
+                PartySession.created_at,
+                QFPlayer.username.label("host_username"),
+                func.coalesce(counts.c.participant_count, 0).label("participant_count"),
+                func.coalesce(counts.c.human_count, 0).label("human_count"),
+            )
+            .outerjoin(QFPlayer, PartySession.host_player_id == QFPlayer.player_id)
+            .outerjoin(counts, PartySession.session_id == counts.c.session_id)
+            .where(PartySession.status == "OPEN")
+        )
+        rows = (await db.execute(stmt)).all()
+
+        self._entries = {
+            row.session_id: PartyLobbyEntry(
+                session_id=row.session_id,
+                party_code=row.party_code,
+                host_player_id=row.host_player_id,
+                host_username=row.host_username or "Unknown",
+                min_players=row.min_players,
+                max_players=row.max_players,
+                participant_count=row.participant_count,
+                human_count=row.human_count,
+                created_at=row.created_at,
+            )
+            for row in rows
+        }
+        self._reconciled_at = time.monotonic()
+        logger.debug(f"Party lobby index reconciled: {len(self._entries)} open session(s)")
+        return len(self._entries)
+
+    async def apply(self, session_id: UUID, state: Optional[PartySessionState]) -> None:
+        """Update one session's entry from its current state and notify lobby viewers."""
+        if state is None or state.status != 'OPEN':
+            await self.remove(session_id)
+            return
+
+        entry = PartyLobbyEntry.from_state(state)
+        was_listed = self._is_listed(session_id)
+        self._entries[session_id] = entry
+        if entry.is_joinable:
+            summary = entry.to_summary()
+            await self._publish('upsert', {**summary, 'created_at': _isoformat(summary['created_at'])})
+        elif was_listed:
+            await self._publish('remove', {'session_id': str(session_id)})
+
+    async def remove(self, session_id: UUID) -> None:
+        """Drop a session that left the lobby (started, abandoned or deleted)."""
+        was_listed = self._is_listed(session_id)
+        self._entries.pop(session_id, None)
+        if was_listed:
+            await self._publish('remove', {'session_id': str(session_id)})
+
+    def _is_listed(self, session_id: UUID) -> bool:
+        entry = self._entries.get(session_id)
+        return entry is not None and entry.is_joinable
+
+    @staticmethod
+    async def _publish(action: str, party: Dict) -> None:
+        # Lobby pushes are best-effort; viewers also get reconciled data on refresh
+        try:
+            await get_party_websocket_manager().notify_lobby_update(action, party)
+        except Exception as e:
+            logger.warning(f"Failed to push party lobby update: {e}")
+
+
+# Global singleton instance
+_party_lobby_index = PartyLobbyIndex()
+
+
+def get_party_lobby_index() -> PartyLobbyIndex:
+    """Get the global PartyLobbyIndex singleton."""
+    return _party_lobby_index
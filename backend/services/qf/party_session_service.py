@@ -1,7 +1,6 @@
 """Party Mode service for managing party sessions."""
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy import select, func, update
 from datetime import datetime, UTC, timedelta
 from typing import Optional, List, Dict
 from uuid import UUID
@@ -18,6 +17,14 @@ from backend.models.qf.party_phraseset import PartyPhraseset
 from backend.models.qf.round import Round
 from backend.config import get_settings
 from backend.services.ai.ai_service import AI_PLAYER_EMAIL_DOMAIN
+from backend.services.chunked_job_runner import ChunkedJobRunner, ChunkOutcome
+from backend.services.qf.party_lobby_index import get_party_lobby_index
+from backend.services.qf.party_state import (
+    PROGRESS_COLUMNS,
+    PartySessionState,
+    SubmissionRecord,
+    get_party_state_store,
+)
 from backend.utils.exceptions import QuipflipException
 from backend.utils.model_registry import GameType, AIPlayerType
 
@@ -178,6 +185,7 @@ class PartySessionService:
         self.db.add(participant)
         await self.db.commit()
         await self.db.refresh(session)
+        await self._sync_lobby_entry(session.session_id)
 
         logger.info(f"Created party session {session.session_id} with code {party_code}")
         return session
@@ -254,77 +262,18 @@ class PartySessionService:
         - Have at least one human player (AI players don't count)
         - Ordered by created_at desc (newest first)
 
+        Served from the in-memory lobby index, which is reconciled against the
+        database periodically.
+
         Returns:
             List[Dict]: List of party session summaries
         """
-        # Subquery to get participant counts for all sessions
-        participant_counts = (
-            select(
-                PartyParticipant.session_id,
-                func.count(PartyParticipant.participant_id).label("participant_count"),
-            )
-            .group_by(PartyParticipant.session_id)
-            .subquery()
-        )
+        return await get_party_lobby_index().list_open(self.db)
 
-        # Subquery to count human participants (non-AI) per session
-        human_participant_counts = (
-            select(
-                PartyParticipant.session_id,
-                func.count(PartyParticipant.participant_id).label("human_count"),
-            )
-            .join(QFPlayer, PartyParticipant.player_id == QFPlayer.player_id)
-            .where(~QFPlayer.email.ilike(f'%{AI_PLAYER_EMAIL_DOMAIN}'))
-            .group_by(PartyParticipant.session_id)
-            .subquery()
-        )
-
-        # A single query to fetch all required data for open, non-full parties with human players
-        stmt = (
-            select(
-                PartySession.session_id,
-                PartySession.max_players,
-                PartySession.min_players,
-                PartySession.created_at,
-                QFPlayer.username.label("host_username"),
-                func.coalesce(participant_counts.c.participant_count, 0).label("participant_count"),
-            )
-            .join(QFPlayer, PartySession.host_player_id == QFPlayer.player_id)
-            .outerjoin(
-                participant_counts,
-                PartySession.session_id == participant_counts.c.session_id,
-            )
-            .outerjoin(
-                human_participant_counts,
-                PartySession.session_id == human_participant_counts.c.session_id,
-            )
-            .where(PartySession.status == "OPEN")
-            .where(
-                func.coalesce(participant_counts.c.participant_count, 0)
-                < PartySession.max_players
-            )
-            .where(
-                func.coalesce(human_participant_counts.c.human_count, 0) > 0
-            )
-            .order_by(PartySession.created_at.desc())
-        )
-
-        result = await self.db.execute(stmt)
-
-        parties = [
-            {
-                'session_id': str(session.session_id),
-                'host_username': session.host_username or "Unknown",
-                'participant_count': session.participant_count,
-                'min_players': session.min_players,
-                'max_players': session.max_players,
-                'created_at': session.created_at,
-                'is_full': False,  # Already filtered by the query
-            }
-            for session in result.all()
-        ]
-
-        return parties
+    async def _sync_lobby_entry(self, session_id: UUID) -> None:
+        """Refresh a session's lobby listing after a join, leave or host change."""
+        state = await get_party_state_store().get(self.db, session_id)
+        await get_party_lobby_index().apply(session_id, state)
 
     async def add_participant(
         self,
@@ -387,6 +336,8 @@ class PartySessionService:
         self.db.add(participant)
         await self.db.commit()
         await self.db.refresh(participant)
+        get_party_state_store().invalidate(session_id)
+        await self._sync_lobby_entry(session_id)
 
         logger.info(f"Player {player_id} joined session {session_id}")
         return participant
@@ -461,6 +412,8 @@ class PartySessionService:
         self.db.add(participant)
         await self.db.commit()
         await self.db.refresh(participant)
+        get_party_state_store().invalidate(session_id)
+        await self._sync_lobby_entry(session_id)
 
         # Load the player relationship
         await self.db.refresh(participant, attribute_names=['player'])
@@ -505,6 +458,7 @@ class PartySessionService:
 
             await self.db.delete(participant)
             await self.db.commit()
+            get_party_state_store().invalidate(session_id)
 
             logger.info(f"Player {player_id} left session {session_id}")
 
@@ -521,6 +475,7 @@ class PartySessionService:
                 # Host left but others remain - reassign host to another human if possible
                 await self._reassign_host(session_id)
 
+            await self._sync_lobby_entry(session_id)
             return False
 
         return False
@@ -557,26 +512,9 @@ class PartySessionService:
             if new_host:
                 new_host.is_host = True
                 await self.db.commit()
+                get_party_state_store().invalidate(session_id)
                 logger.info(f"Reassigned host to player {new_host.player_id} in session {session_id}")
 
-    async def _get_participant_count(self, session_id: UUID) -> int:
-        """Get count of participants in a session.
-
-        Args:
-            session_id: UUID of the session
-
-        Returns:
-            int: Number of participants
-        """
-        from sqlalchemy import func
-
-        result = await self.db.execute(
-            select(func.count(PartyParticipant.participant_id))
-            .where(PartyParticipant.session_id == session_id)
-        )
-        count = result.scalar()
-        return count or 0
-
     async def _delete_empty_session(self, session_id: UUID) -> None:
         """Delete a party session when it becomes empty.
 
@@ -590,6 +528,8 @@ class PartySessionService:
         if session:
             await self.db.delete(session)
             await self.db.commit()
+            get_party_state_store().forget(session_id)
+            await get_party_lobby_index().remove(session_id)
             logger.info(f"Deleted empty party session {session_id}")
 
     async def remove_inactive_participants(self, session_id: UUID) -> List[Dict]:
@@ -661,6 +601,7 @@ class PartySessionService:
             participant.last_activity_at = datetime.now(UTC)
             await self.db.commit()
             await self.db.refresh(participant)
+            get_party_state_store().invalidate(session_id)
             logger.info(f"Player {player_id} already ready in session {session_id}")
             return participant
 
@@ -669,6 +610,7 @@ class PartySessionService:
         participant.last_activity_at = datetime.now(UTC)
         await self.db.commit()
         await self.db.refresh(participant)
+        get_party_state_store().invalidate(session_id)
 
         logger.info(f"Player {player_id} marked ready in session {session_id}")
         return participant
@@ -731,6 +673,8 @@ class PartySessionService:
 
         await self.db.commit()
         await self.db.refresh(session)
+        get_party_state_store().invalidate(session_id)
+        await get_party_lobby_index().remove(session_id)
 
         logger.info(f"Started session {session_id} with {ready_count} ready players")
         return session
@@ -780,6 +724,7 @@ class PartySessionService:
 
         await self.db.commit()
         await self.db.refresh(session)
+        get_party_state_store().invalidate(session_id)
 
         logger.info(f"Advanced session {session_id} to phase {new_phase}")
         return session
@@ -799,60 +744,87 @@ class PartySessionService:
     async def can_advance_phase(self, session_id: UUID) -> bool:
         """Check if all participants have completed current phase.
 
+        Answered from the in-memory session state.
+
         Args:
             session_id: UUID of the session
 
         Returns:
             bool: True if all participants done with current phase
         """
-        session = await self.get_session_by_id(session_id)
-        if not session:
+        state = await get_party_state_store().get(self.db, session_id)
+        if not state:
             return False
 
-        # Get all participants
-        result = await self.db.execute(
-            select(PartyParticipant)
-            .where(PartyParticipant.session_id == session_id)
-            .where(PartyParticipant.status == 'ACTIVE')
+        result = state.can_advance()
+        logger.debug(
+            f"can_advance_phase({state.current_phase}): {state.participant_count} participants, result={result}"
         )
-        participants = result.scalars().all()
+        return result
+
+    async def _claim_state_version(self, state: PartySessionState) -> bool:
+        """Bump the session version if it still matches the in-memory state.
 
-        if not participants:
+        Staged in the caller's transaction. Returns False when another worker has
+        written the session since the state was loaded.
+        """
+        result = await self.db.execute(
+            update(PartySession)
+            .where(PartySession.session_id == state.session_id)
+            .where(PartySession.version == state.version)
+            .values(version=state.version + 1, updated_at=datetime.now(UTC))
+            .returning(PartySession.version)
+        )
+        new_version = result.scalar_one_or_none()
+        if new_version is None:
             return False
+        state.version = new_version
+        return True
 
-        # Check completion based on phase
-        if session.current_phase == 'PROMPT':
-            required = session.prompts_per_player
-            result = all(p.prompts_submitted >= required for p in participants)
-            logger.info(
-                f"can_advance_phase(PROMPT): {len(participants)} participants, "
-                f"required={required}, result={result}, "
-                f"progress={[(p.player_id, p.prompts_submitted) for p in participants]}"
-            )
-            return result
-
-        elif session.current_phase == 'COPY':
-            required = session.copies_per_player
-            result = all(p.copies_submitted >= required for p in participants)
-            logger.info(
-                f"can_advance_phase(COPY): {len(participants)} participants, "
-                f"required={required}, result={result}"
-            )
-            return result
-
-        elif session.current_phase == 'VOTE':
-            required = session.votes_per_player
-            result = all(p.votes_submitted >= required for p in participants)
-            logger.info(
-                f"can_advance_phase(VOTE): {len(participants)} participants, "
-                f"required={required}, result={result}"
+    async def _stage_phase_advance(self, state: PartySessionState) -> Optional[str]:
+        """Stage the move to the next phase in the caller's transaction and apply it to ``state``."""
+        new_phase = self._next_phase(state.current_phase)
+        if not new_phase:
+            return None
+
+        now = datetime.now(UTC)
+        values = {'current_phase': new_phase, 'phase_started_at': now}
+        if new_phase in {'PROMPT', 'COPY', 'VOTE'}:
+            duration = self._phase_duration_seconds(new_phase)
+            values.update(
+                status='IN_PROGRESS',
+                phase_expires_at=now + timedelta(seconds=duration) if duration else None,
+                completed_at=None,
             )
-            return result
+        else:
+            values.update(status='COMPLETED', phase_expires_at=None, completed_at=now)
 
-        return False
+        result = await self.db.execute(
+            update(PartySession)
+            .where(PartySession.session_id == state.session_id)
+            .where(PartySession.version == state.version)
+            .values(**values, version=state.version + 1, updated_at=now)
+            .returning(PartySession.version)
+        )
+        new_version = result.scalar_one_or_none()
+        if new_version is None:
+            return None
+
+        # If moving to VOTE, mark all party phrasesets as available for voting
+        if new_phase == 'VOTE':
+            await self._mark_phrasesets_available_for_voting(state.session_id)
+
+        for field, value in values.items():
+            setattr(state, field, value)
+        state.version = new_version
+        return new_phase
 
     async def advance_phase_atomic(self, session_id: UUID) -> Optional[PartySession]:
-        """Advance phase with optimistic concurrency.
+        """Advance phase if every participant is done, serialized per session.
+
+        Readiness comes from the in-memory state (reloaded once if it says not
+        ready, in case another worker recorded the final submission). The write
+        is a compare-and-set on the session version.
 
         Args:
             session_id: UUID of the session
@@ -863,42 +835,120 @@ class PartySessionService:
         Raises:
             SessionNotFoundError: If session doesn't exist
         """
-        session = await self.get_session_by_id(session_id)
-        if not session:
-            raise SessionNotFoundError(f"Session {session_id} not found")
+        store = get_party_state_store()
+        async with store.lock(session_id):
+            state = await store.get(self.db, session_id)
+            if state and not state.can_advance():
+                state = await store.load(self.db, session_id)
+            if not state:
+                raise SessionNotFoundError(f"Session {session_id} not found")
+
+            if not state.can_advance():
+                logger.debug(f"Phase already advanced or not ready for session {session_id}")
+                return None
 
-        if not await self.can_advance_phase(session_id):
-            logger.debug(f"Phase already advanced or not ready for session {session_id}")
-            return None
+            original_phase = state.current_phase
+            original_version = state.version
+            try:
+                new_phase = await self._stage_phase_advance(state)
+                if not new_phase:
+                    await self.db.rollback()
+                    store.invalidate(session_id)
+                    logger.debug(
+                        "Party session %s stale during phase advance at version %s",
+                        session_id,
+                        original_version,
+                    )
+                    return None
+                await self.db.commit()
+            except Exception:
+                await self.db.rollback()
+                store.invalidate(session_id)
+                raise
 
-        original_phase = session.current_phase
-        original_version = session.version
+        store.retire_if_finished(session_id)
+        logger.info(
+            "Advanced party session %s atomically from %s to %s at version %s",
+            session_id,
+            original_phase,
+            new_phase,
+            original_version,
+        )
+        return await self.db.get(PartySession, session_id, populate_existing=True)
 
-        try:
-            advanced_session = await self.advance_phase(session_id)
-            logger.info(
-                "Advanced party session %s atomically from %s at version %s",
-                session_id,
-                original_phase,
-                original_version,
-            )
-            return advanced_session
-        except StaleDataError:
-            await self.db.rollback()
-            current_session = await self.get_session_by_id(session_id)
-            if current_session and current_session.current_phase != original_phase:
-                logger.debug(
-                    "Party session %s already advanced to %s by another writer",
-                    session_id,
-                    current_session.current_phase,
+    async def record_submission(
+        self,
+        session_id: UUID,
+        player_id: UUID,
+        round_type: str,
+        advance: bool = True,
+    ) -> SubmissionRecord:
+        """Count a successful round submission and advance the phase if it completed it.
+
+        Runs under the session's lock: the progress increment, the version bump
+        and any phase change are written in one commit and applied to the
+        in-memory state, so phase transitions need no lock-retry loop.
+
+        Args:
+            session_id: UUID of the session
+            player_id: UUID of the player
+            round_type: Type of round ('prompt', 'copy', 'vote')
+            advance: Whether to advance the phase when this completes it
+
+        Returns:
+            SubmissionRecord: Updated participant state and the phase it moved to, if any
+        """
+        counter = PROGRESS_COLUMNS.get(round_type)
+        if counter is None:
+            raise PartyModeError(f"Unknown round type {round_type}")
+
+        store = get_party_state_store()
+        async with store.lock(session_id):
+            state = await store.get(self.db, session_id)
+            try:
+                for _ in range(2):
+                    if not state:
+                        raise SessionNotFoundError(f"Session {session_id} not found")
+                    if not state.has_player(player_id):
+                        raise PartyModeError(f"Player {player_id} not in session {session_id}")
+                    if await self._claim_state_version(state):
+                        break
+                    # Another worker wrote this session since the state was loaded
+                    state = await store.load(self.db, session_id)
+                else:
+                    raise PartyModeError(f"Session {session_id} changed concurrently; try again")
+
+                participant = state.participant(player_id)
+                now = datetime.now(UTC)
+                await self.db.execute(
+                    update(PartyParticipant)
+                    .where(PartyParticipant.participant_id == participant.participant_id)
+                    .values({counter: getattr(PartyParticipant, counter) + 1, 'last_activity_at': now})
                 )
-                return None
-            logger.debug(
-                "Party session %s stale during phase advance at version %s",
-                session_id,
-                original_version,
-            )
-            return None
+                setattr(participant, counter, getattr(participant, counter) + 1)
+                participant.last_activity_at = now
+
+                phase = state.current_phase
+                advanced_to = None
+                if advance and state.can_advance():
+                    advanced_to = await self._stage_phase_advance(state)
+
+                await self.db.commit()
+            except PartyModeError:
+                await self.db.rollback()
+                raise
+            except Exception:
+                await self.db.rollback()
+                store.invalidate(session_id)
+                raise
+
+        store.retire_if_finished(session_id)
+        logger.info(
+            f"Recorded {round_type} submission for {player_id=} in session {session_id} "
+            f"(now {participant.prompts_submitted}/{participant.copies_submitted}/{participant.votes_submitted})"
+            + (f"; advanced {phase} -> {advanced_to}" if advanced_to else "")
+        )
+        return SubmissionRecord(participant=participant, phase=phase, advanced_to=advanced_to)
 
     async def get_participant(
         self,
@@ -944,11 +994,8 @@ class PartySessionService:
         Returns:
             int: Number of participants
         """
-        result = await self.db.execute(
-            select(func.count(PartyParticipant.participant_id))
-            .where(PartyParticipant.session_id == session_id)
-        )
-        return result.scalar() or 0
+        state = await get_party_state_store().get(self.db, session_id)
+        return state.participant_count if state else 0
 
     async def _get_human_participant_count(self, session_id: UUID) -> int:
         """Get count of human (non-AI) participants in session.
@@ -959,13 +1006,8 @@ class PartySessionService:
         Returns:
             int: Number of human participants
         """
-        result = await self.db.execute(
-            select(func.count(PartyParticipant.participant_id))
-            .join(QFPlayer, PartyParticipant.player_id == QFPlayer.player_id)
-            .where(PartyParticipant.session_id == session_id)
-            .where(~QFPlayer.email.ilike(f'%{AI_PLAYER_EMAIL_DOMAIN}'))
-        )
-        return result.scalar() or 0
+        state = await get_party_state_store().get(self.db, session_id)
+        return state.human_participant_count if state else 0
 
     async def get_participants(self, session_id: UUID) -> List[PartyParticipant]:
         """Get all participants in session.
@@ -989,9 +1031,22 @@ class PartySessionService:
 
         return participants
 
+    async def get_session_state(self, session_id: UUID) -> Optional[PartySessionState]:
+        """Get the in-memory state of a session (reloaded when older than the refresh window).
+
+        Args:
+            session_id: UUID of the session
+
+        Returns:
+            PartySessionState or None if not found
+        """
+        return await get_party_state_store().get(self.db, session_id)
+
     async def get_session_status(self, session_id: UUID) -> Dict:
         """Get full session status including participants and progress.
 
+        Served from the in-memory session state.
+
         Args:
             session_id: UUID of the session
 
@@ -1001,84 +1056,10 @@ class PartySessionService:
         Raises:
             SessionNotFoundError: If session doesn't exist
         """
-        session = await self.get_session_by_id(session_id)
-        if not session:
+        state = await self.get_session_state(session_id)
+        if not state:
             raise SessionNotFoundError(f"Session {session_id} not found")
-
-        # Get participants with player info
-        result = await self.db.execute(
-            select(PartyParticipant, QFPlayer)
-            .join(QFPlayer, PartyParticipant.player_id == QFPlayer.player_id)
-            .where(PartyParticipant.session_id == session_id)
-            .order_by(PartyParticipant.joined_at)
-        )
-        participants_data = result.all()
-
-        participants_info = []
-        for participant, player in participants_data:
-            participants_info.append({
-                'participant_id': str(participant.participant_id),
-                'player_id': str(participant.player_id),
-                'username': player.username,
-                'is_ai': self._is_ai_player(player),
-                'is_host': participant.is_host,
-                'status': participant.status,
-                'connection_status': participant.connection_status,
-                'prompts_submitted': participant.prompts_submitted,
-                'copies_submitted': participant.copies_submitted,
-                'votes_submitted': participant.votes_submitted,
-                'prompts_required': session.prompts_per_player,
-                'copies_required': session.copies_per_player,
-                'votes_required': session.votes_per_player,
-                'joined_at': participant.joined_at.isoformat() if participant.joined_at else None,
-                'ready_at': participant.ready_at.isoformat() if participant.ready_at else None,
-                'last_activity_at': participant.last_activity_at.isoformat() if participant.last_activity_at else None,
-                'disconnected_at': participant.disconnected_at.isoformat() if participant.disconnected_at else None,
-            })
-
-        # Calculate progress
-        total_prompts = sum(p['prompts_submitted'] for p in participants_info)
-        total_copies = sum(p['copies_submitted'] for p in participants_info)
-        total_votes = sum(p['votes_submitted'] for p in participants_info)
-
-        required_prompts = session.prompts_per_player * len(participants_info)
-        required_copies = session.copies_per_player * len(participants_info)
-        required_votes = session.votes_per_player * len(participants_info)
-
-        players_ready_for_next = sum(
-            1 for p in participants_info
-            if (session.current_phase == 'PROMPT' and p['prompts_submitted'] >= session.prompts_per_player) or
-               (session.current_phase == 'COPY' and p['copies_submitted'] >= session.copies_per_player) or
-               (session.current_phase == 'VOTE' and p['votes_submitted'] >= session.votes_per_player) or
-               (session.current_phase == 'LOBBY' and p['status'] == 'READY')
-        )
-
-        return {
-            'session_id': str(session.session_id),
-            'party_code': session.party_code,
-            'host_player_id': str(session.host_player_id),
-            'status': session.status,
-            'current_phase': session.current_phase,
-            'version': session.version,
-            'min_players': session.min_players,
-            'max_players': session.max_players,
-            'phase_started_at': session.phase_started_at.isoformat() if session.phase_started_at else None,
-            'phase_expires_at': session.phase_expires_at.isoformat() if session.phase_expires_at else None,
-            'created_at': session.created_at.isoformat() if session.created_at else None,
-            'started_at': session.started_at.isoformat() if session.started_at else None,
-            'completed_at': session.completed_at.isoformat() if session.completed_at else None,
-            'participants': participants_info,
-            'progress': {
-                'total_prompts': total_prompts,
-                'total_copies': total_copies,
-                'total_votes': total_votes,
-                'required_prompts': required_prompts,
-                'required_copies': required_copies,
-                'required_votes': required_votes,
-                'players_ready_for_next_phase': players_ready_for_next,
-                'total_players': len(participants_info),
-            },
-        }
+        return state.to_status()
 
     async def link_round_to_party(
         self,
@@ -1132,6 +1113,9 @@ class PartySessionService:
 
         await self.db.commit()
         await self.db.refresh(party_round)
+        get_party_state_store().apply_participant(
+            session_id, player_id, last_activity_at=participant.last_activity_at
+        )
 
         logger.info(f"Linked {round_type} round {round_id} to party session {session_id}")
         return party_round
@@ -1141,10 +1125,11 @@ class PartySessionService:
         session_id: UUID,
         player_id: UUID,
         round_type: str,
-    ) -> PartyParticipant:
+    ):
         """Increment participant progress counter after successful round submission.
 
-        Use this when a round is successfully submitted.
+        Use this when a round is successfully submitted. Does not advance the
+        phase; see ``record_submission`` to do both in one commit.
 
         Args:
             session_id: UUID of the session
@@ -1152,31 +1137,10 @@ class PartySessionService:
             round_type: Type of round ('prompt', 'copy', 'vote')
 
         Returns:
-            PartyParticipant: Updated participant
+            ParticipantState: Updated participant state
         """
-        # Get participant
-        participant = await self.get_participant(session_id, player_id)
-        if not participant:
-            raise PartyModeError(f"Player {player_id} not in session {session_id}")
-
-        # Increment appropriate counter
-        if round_type == 'prompt':
-            participant.prompts_submitted += 1
-        elif round_type == 'copy':
-            participant.copies_submitted += 1
-        elif round_type == 'vote':
-            participant.votes_submitted += 1
-
-        participant.last_activity_at = datetime.now(UTC)
-
-        await self.db.commit()
-        await self.db.refresh(participant)
-
-        logger.info(
-            f"Incremented {round_type} progress for {player_id=} in session {session_id} "
-            f"(now {participant.prompts_submitted}/{participant.copies_submitted}/{participant.votes_submitted})"
-        )
-        return participant
+        record = await self.record_submission(session_id, player_id, round_type, advance=False)
+        return record.participant
 
     async def link_phraseset_to_party(
         self,
@@ -1250,6 +1214,8 @@ class PartySessionService:
 
         if session_count > 0:
             await self.db.commit()
+            for _, session_id in participants:
+                get_party_state_store().invalidate(session_id)
 
         if session_count > 0:
             logger.info(f"Updated presence for {player_id=} in {session_count} party session(s)")
@@ -1273,60 +1239,65 @@ class PartySessionService:
             dict with counts of cleaned sessions by status
         """
         cutoff_time = datetime.now(UTC) - timedelta(hours=max_session_age_hours)
+        abandoned_open_ids: list[UUID] = []
         stats = {
             'expired_open_sessions': 0,
             'expired_in_progress_sessions': 0,
             'removed_participants': 0,
         }
 
-        try:
-            # Clean up OPEN sessions that have been waiting too long
-            result = await self.db.execute(
-                select(PartySession)
-                .where(PartySession.status == 'OPEN')
-                .where(PartySession.created_at < cutoff_time)
-            )
-            open_sessions = result.scalars().all()
-
-            for session in open_sessions:
-                try:
-                    session.status = 'ABANDONED'
-                    session.phase_expires_at = None
-                    session.updated_at = datetime.now(UTC)
-                    stats['expired_open_sessions'] += 1
-
+        def abandon_chunk(status: str, age_column, stat_key: str):
+            async def run_chunk(cursor: Optional[str], limit: int) -> ChunkOutcome:
+                stmt = (
+                    select(PartySession.session_id, PartySession.party_code)
+                    .where(PartySession.status == status)
+                    .where(age_column < cutoff_time)
+                    .order_by(PartySession.session_id)
+                    .limit(limit)
+                )
+                if cursor:
+                    stmt = stmt.where(PartySession.session_id > UUID(cursor))
+                rows = (await self.db.execute(stmt)).all()
+                if rows:
+                    now = datetime.now(UTC)
+                    await self.db.execute(
+                        update(PartySession)
+                        .where(PartySession.session_id.in_([row.session_id for row in rows]))
+                        .where(PartySession.status == status)
+                        .values(status='ABANDONED', phase_expires_at=None, updated_at=now)
+                        .execution_options(synchronize_session=False)
+                    )
+                    stats[stat_key] += len(rows)
+                    for row in rows:
+                        get_party_state_store().invalidate(row.session_id)
+                    if status == 'OPEN':
+                        abandoned_open_ids.extend(row.session_id for row in rows)
                     logger.info(
-                        f"Abandoned OPEN session {session.party_code} "
-                        f"(created {(datetime.now(UTC) - session.created_at).total_seconds() / 3600:.1f}h ago)"
+                        f"Abandoned {len(rows)} {status} session(s): "
+                        f"{', '.join(row.party_code for row in rows)}"
                     )
-                except Exception as e:
-                    logger.error(f"Error expiring OPEN session {session.session_id}: {e}")
+                return ChunkOutcome(
+                    processed=len(rows),
+                    next_cursor=str(rows[-1].session_id) if len(rows) == limit else None,
+                )
+            return run_chunk
 
+        try:
+            runner = ChunkedJobRunner(self.db)
+            # Clean up OPEN sessions that have been waiting too long
+            await runner.run(
+                'party_expire_open_sessions',
+                abandon_chunk('OPEN', PartySession.created_at, 'expired_open_sessions'),
+            )
             # Clean up IN_PROGRESS sessions that have been stalled too long
-            result = await self.db.execute(
-                select(PartySession)
-                .where(PartySession.status == 'IN_PROGRESS')
-                .where(PartySession.updated_at < cutoff_time)
+            await runner.run(
+                'party_expire_in_progress_sessions',
+                abandon_chunk('IN_PROGRESS', PartySession.updated_at, 'expired_in_progress_sessions'),
             )
-            in_progress_sessions = result.scalars().all()
-
-            for session in in_progress_sessions:
-                try:
-                    last_updated = session.updated_at or session.created_at
-                    session.status = 'ABANDONED'
-                    session.phase_expires_at = None
-                    session.updated_at = datetime.now(UTC)
-                    stats['expired_in_progress_sessions'] += 1
-
-                    logger.info(
-                        f"Abandoned IN_PROGRESS session {session.party_code} "
-                        f"(inactive for {(datetime.now(UTC) - last_updated).total_seconds() / 3600:.1f}h)"
-                    )
-                except Exception as e:
-                    logger.error(f"Error expiring IN_PROGRESS session {session.session_id}: {e}")
-
-            # Commit all changes
-            await self.db.commit()
+            await self.db.run_sync(lambda sync_session: sync_session.expire_all())
+            for session_id in abandoned_open_ids:
+                await get_party_lobby_index().remove(session_id)
+            get_party_state_store().prune()
 
             total_expired = stats['expired_open_sessions'] + stats['expired_in_progress_sessions']
             if total_expired > 0:
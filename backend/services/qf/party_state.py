@@ -0,0 +1,309 @@
+"""In-memory party session state with write-through persistence.
+
+Each party session has a ``PartySessionState`` snapshot (session row plus its
+participants) and an asyncio lock that serializes this worker's mutations of
+that session. Status polls and phase-advance checks are answered from the
+snapshot; submissions update it and the database together in one commit.
+
+Every write made through the state bumps ``party_sessions.version`` with a
+compare-and-set on the version the snapshot was built from, so a worker whose
+snapshot is behind another worker's writes notices and reloads before acting.
+Read-only callers reload snapshots older than ``party_state_refresh_seconds``;
+on restart, snapshots are rebuilt from the database on first use.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import get_settings
+from backend.models.qf.party_participant import PartyParticipant
+from backend.models.qf.party_session import PartySession
+from backend.models.qf.player import QFPlayer
+from backend.services.ai.ai_service import AI_PLAYER_EMAIL_DOMAIN
+
+logger = logging.getLogger(__name__)
+
+# Sessions in these statuses take no more writes and are not kept in memory
+FINISHED_STATUSES = frozenset({'COMPLETED', 'ABANDONED'})
+# Snapshots nobody reloaded for this long are dropped by PartySessionStateStore.prune
+IDLE_STATE_SECONDS = 3600
+
+# Participant counter advanced by each round type
+PROGRESS_COLUMNS = {
+    'prompt': 'prompts_submitted',
+    'copy': 'copies_submitted',
+    'vote': 'votes_submitted',
+}
+
+# Counter and per-player requirement checked for each gameplay phase
+PHASE_REQUIREMENTS = {
+    'PROMPT': ('prompts_submitted', 'prompts_per_player'),
+    'COPY': ('copies_submitted', 'copies_per_player'),
+    'VOTE': ('votes_submitted', 'votes_per_player'),
+}
+
+_SESSION_FIELDS = (
+    'session_id', 'party_code', 'host_player_id', 'status', 'current_phase', 'version',
+    'min_players', 'max_players', 'prompts_per_player', 'copies_per_player', 'votes_per_player',
+    'phase_started_at', 'phase_expires_at', 'created_at', 'started_at', 'completed_at',
+)
+
+_PARTICIPANT_FIELDS = (
+    'participant_id', 'player_id', 'is_host', 'status', 'connection_status',
+    'prompts_submitted', 'copies_submitted', 'votes_submitted',
+    'joined_at', 'ready_at', 'last_activity_at', 'disconnected_at',
+)
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+class ParticipantState:
+    """Snapshot of one participant; attribute names mirror ``PartyParticipant``."""
+
+    __slots__ = _PARTICIPANT_FIELDS + ('username', 'is_ai')
+
+    def __init__(self, participant: PartyParticipant, player: QFPlayer):
+        for field in _PARTICIPANT_FIELDS:
+            setattr(self, field, getattr(participant, field))
+        self.username = player.username
+        email = (player.email or '').lower()
+        self.is_ai = bool(email) and email.endswith(AI_PLAYER_EMAIL_DOMAIN)
+
+    def to_status(self, session: 'PartySessionState') -> Dict:
+        return {
+            'participant_id': str(self.participant_id),
+            'player_id': str(self.player_id),
+            'username': self.username,
+            'is_ai': self.is_ai,
+            'is_host': self.is_host,
+            'status': self.status,
+            'connection_status': self.connection_status,
+            'prompts_submitted': self.prompts_submitted,
+            'copies_submitted': self.copies_submitted,
+            'votes_submitted': self.votes_submitted,
+            'prompts_required': session.prompts_per_player,
+            'copies_required': session.copies_per_player,
+            'votes_required': session.votes_per_player,
+            'joined_at': _isoformat(self.joined_at),
+            'ready_at': _isoformat(self.ready_at),
+            'last_activity_at': _isoformat(self.last_activity_at),
+            'disconnected_at': _isoformat(self.disconnected_at),
+        }
+
+
+class PartySessionState:
+    """Snapshot of a party session and its participants (ordered by join time)."""
+
+    __slots__ = _SESSION_FIELDS + ('participants', 'loaded_at')
+
+    def __init__(self, session: PartySession, participants: list[ParticipantState]):
+        for field in _SESSION_FIELDS:
+            setattr(self, field, getattr(session, field))
+        self.participants: Dict[UUID, ParticipantState] = {p.player_id: p for p in participants}
+        self.loaded_at = time.monotonic()
+
+    def apply_session(self, session: PartySession) -> None:
+        """Copy the session row's current values (after an ORM write)."""
+        for field in _SESSION_FIELDS:
+            setattr(self, field, getattr(session, field))
+
+    def participant(self, player_id: UUID) -> Optional[ParticipantState]:
+        return self.participants.get(player_id)
+
+    def has_player(self, player_id: UUID) -> bool:
+        return player_id in self.participants
+
+    @property
+    def participant_count(self) -> int:
+        return len(self.participants)
+
+    @property
+    def human_participant_count(self) -> int:
+        return sum(1 for p in self.participants.values() if not p.is_ai)
+
+    def players_done_with_phase(self) -> int:
+        if self.current_phase == 'LOBBY':
+            return sum(1 for p in self.participants.values() if p.status == 'READY')
+        requirement = PHASE_REQUIREMENTS.get(self.current_phase)
+        if requirement is None:
+            return 0
+        counter, required_field = requirement
+        required = getattr(self, required_field)
+        return sum(1 for p in self.participants.values() if getattr(p, counter) >= required)
+
+    def can_advance(self) -> bool:
+        """Whether every ACTIVE participant has completed the current phase."""
+        requirement = PHASE_REQUIREMENTS.get(self.current_phase)
+        if requirement is None:
+            return False
+        active = [p for p in self.participants.values() if p.status == 'ACTIVE']
+        if not active:
+            return False
+        counter, required_field = requirement
+        required = getattr(self, required_field)
+        return all(getattr(p, counter) >= required for p in active)
+
+    def to_status(self) -> Dict:
+        """Build the ``/party/{id}/status`` payload."""
+        participants_info = [p.to_status(self) for p in self.participants.values()]
+        count = len(participants_info)
+        return {
+            'session_id': str(self.session_id),
+            'party_code': self.party_code,
+            'host_player_id': str(self.host_player_id),
+            'status': self.status,
+            'current_phase': self.current_phase,
+            'version': self.version,
+            'min_players': self.min_players,
+            'max_players': self.max_players,
+            'phase_started_at': _isoformat(self.phase_started_at),
+            'phase_expires_at': _isoformat(self.phase_expires_at),
+            'created_at': _isoformat(self.created_at),
+            'started_at': _isoformat(self.started_at),
+            'completed_at': _isoformat(self.completed_at),
+            'participants': participants_info,
+            'progress': {
+                'total_prompts': sum(p['prompts_submitted'] for p in participants_info),
+                'total_copies': sum(p['copies_submitted'] for p in participants_info),
+                'total_votes': sum(p['votes_submitted'] for p in participants_info),
+                'required_prompts': self.prompts_per_player * count,
+                'required_copies': self.copies_per_player * count,
+                'required_votes': self.votes_per_player * count,
+                'players_ready_for_next_phase': self.players_done_with_phase(),
+                'total_players': count,
+            },
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class SubmissionRecord:
+    """Outcome of recording a submission: updated participant and any phase change."""
+
+    participant: ParticipantState
+    phase: str
+    advanced_to: Optional[str] = None
+
+
+class PartySessionStateStore:
+    """Process-wide party session snapshots and per-session mutation locks.
+
+    Finished (COMPLETED/ABANDONED) sessions are not kept, and ``prune`` drops
+    snapshots nobody has reloaded for ``IDLE_STATE_SECONDS``, so memory follows
+    the live sessions rather than every session this worker ever touched.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all snapshots; they are rebuilt from the database on next use."""
+        self._states: Dict[UUID, PartySessionState] = {}
+        self._locks: Dict[UUID, asyncio.Lock] = {}
+
+    def lock(self, session_id: UUID) -> asyncio.Lock:
+        """Lock serializing this worker's mutations of one session."""
+        return self._locks.setdefault(session_id, asyncio.Lock())
+
+    def _drop_idle_lock(self, session_id: UUID) -> None:
+        # A held lock stays so its waiters keep serializing; the version CAS guards writes regardless
+        lock = self._locks.get(session_id)
+        if lock is not None and not lock.locked():
+            del self._locks[session_id]
+
+    def invalidate(self, session_id: UUID) -> None:
+        """Forget a snapshot after a write that did not go through the state."""
+        self._states.pop(session_id, None)
+        self._drop_idle_lock(session_id)
+
+    def forget(self, session_id: UUID) -> None:
+        """Drop a deleted session entirely."""
+        self.invalidate(session_id)
+
+    def retire_if_finished(self, session_id: UUID) -> None:
+        """Evict a session whose snapshot reached COMPLETED or ABANDONED."""
+        state = self._states.get(session_id)
+        if state is not None and state.status in FINISHED_STATUSES:
+            self.invalidate(session_id)
+
+    def prune(self, max_idle_seconds: float = IDLE_STATE_SECONDS) -> int:
+        """Drop snapshots not reloaded for ``max_idle_seconds`` and idle orphan locks; returns snapshots dropped."""
+        cutoff = time.monotonic() - max_idle_seconds
+        stale = [session_id for session_id, state in self._states.items() if state.loaded_at < cutoff]
+        for session_id in stale:
+            self.invalidate(session_id)
+        for session_id in [session_id for session_id in self._locks if session_id not in self._states]:
+            self._drop_idle_lock(session_id)
+        return len(stale)
+
+    def peek(self, session_id: UUID) -> Optional[PartySessionState]:
+        return self._states.get(session_id)
+
+    def apply_participant(self, session_id: UUID, player_id: UUID, **values) -> None:
+        """Mirror a committed participant write (e.g. connection status) into the snapshot."""
+        state = self._states.get(session_id)
+        participant = state.participant(player_id) if state else None
+        if participant is None:
+            return
+        for field, value in values.items():
+            setattr(participant, field, value)
+
+    async def get(
+        self,
+        db: AsyncSession,
+        session_id: UUID,
+        max_age_seconds: Optional[float] = None,
+    ) -> Optional[PartySessionState]:
+        """Return the session snapshot, reloading it when missing or older than ``max_age_seconds``."""
+        if max_age_seconds is None:
+            max_age_seconds = get_settings().party_state_refresh_seconds
+        state = self._states.get(session_id)
+        if state is not None and time.monotonic() - state.loaded_at < max_age_seconds:
+            return state
+        return await self.load(db, session_id)
+
+    async def load(self, db: AsyncSession, session_id: UUID) -> Optional[PartySessionState]:
+        """Rebuild a snapshot from the database."""
+        session = (await db.execute(
+            select(PartySession)
+            .where(PartySession.session_id == session_id)
+            .execution_options(populate_existing=True)
+        )).scalar_one_or_none()
+        if session is None:
+            self.forget(session_id)
+            return None
+
+        rows = (await db.execute(
+            select(PartyParticipant, QFPlayer)
+            .join(QFPlayer, PartyParticipant.player_id == QFPlayer.player_id)
+            .where(PartyParticipant.session_id == session_id)
+            .order_by(PartyParticipant.joined_at)
+            .execution_options(populate_existing=True)
+        )).all()
+
+        state = PartySessionState(session, [ParticipantState(p, player) for p, player in rows])
+        if state.status in FINISHED_STATUSES:
+            # Served once for the final results, never cached
+            self.invalidate(session_id)
+        else:
+            self._states[session_id] = state
+        return state
+
+
+# Global singleton instance
+_party_state_store = PartySessionStateStore()
+
+
+def get_party_state_store() -> PartySessionStateStore:
+    """Get the global PartySessionStateStore singleton."""
+    return _party_state_store
@@ -5,6 +5,7 @@ from datetime import datetime, UTC
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.services.qf.party_state import get_party_state_store
 from backend.services.qf.websocket_notification_service import (
     WebSocketNotificationService,
     get_websocket_notification_service,
@@ -24,6 +25,8 @@ class PartyWebSocketManager:
     def __init__(self, websocket_service: WebSocketNotificationService | None = None) -> None:
         self._websocket_service = websocket_service or get_websocket_notification_service()
 
+    LOBBY_CHANNEL = "party_lobby"
+
     @staticmethod
     def _channel_key(session_id: UUID) -> str:
         return f"party_session:{session_id}"
@@ -69,6 +72,13 @@ class PartyWebSocketManager:
                 participant.last_activity_at = datetime.now(UTC)
                 participant.disconnected_at = None
                 await db.commit()
+                get_party_state_store().apply_participant(
+                    session_id,
+                    player_id,
+                    connection_status=participant.connection_status,
+                    last_activity_at=participant.last_activity_at,
+                    disconnected_at=None,
+                )
                 logger.info(f"Updated participant {player_id} to connected status")
 
         connection_count = self._websocket_service.get_connection_count(self._channel_key(session_id))
@@ -118,6 +128,13 @@ class PartyWebSocketManager:
                 participant.disconnected_at = datetime.now(UTC)
                 participant.last_activity_at = datetime.now(UTC)
                 await db.commit()
+                get_party_state_store().apply_participant(
+                    session_id,
+                    player_id,
+                    connection_status=participant.connection_status,
+                    last_activity_at=participant.last_activity_at,
+                    disconnected_at=participant.disconnected_at,
+                )
                 logger.info(f"Updated participant {player_id} to disconnected status")
 
         if self._websocket_service.get_connection_count(channel_key) == 0:
@@ -395,6 +412,34 @@ class PartyWebSocketManager:
         await self.broadcast_to_session(session_id, notification)
         logger.debug(f"Sent session update to session {session_id}")
 
+    async def connect_lobby(self, player_id: UUID, websocket: "WebSocket") -> None:
+        """Subscribe a player browsing the party list to lobby updates."""
+        await self._websocket_service.connect(self.LOBBY_CHANNEL, str(player_id), websocket, context='lobby')
+
+    async def disconnect_lobby(self, player_id: UUID) -> None:
+        """Unsubscribe a player from lobby updates."""
+        await self._websocket_service.disconnect(self.LOBBY_CHANNEL, str(player_id))
+
+    async def notify_lobby_update(self, action: str, party: dict) -> None:
+        """Push one party list change to lobby viewers.
+
+        Args:
+            action: 'upsert' (party listed or changed) or 'remove' (no longer joinable)
+            party: Party summary, or just its session_id for removals
+        """
+        if not self._websocket_service.get_connection_count(self.LOBBY_CHANNEL):
+            return
+
+        notification = {
+            'type': 'lobby_update',
+            'action': action,
+            'party': party,
+            'timestamp': datetime.now(UTC).isoformat(),
+        }
+
+        await self._websocket_service.broadcast(self.LOBBY_CHANNEL, notification)
+        logger.debug(f"Sent lobby {action} for session {party.get('session_id')}")
+
     def get_connection_count(self, session_id: UUID) -> int:
         """Get number of connected players in a session.
 
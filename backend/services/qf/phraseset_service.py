@@ -17,6 +17,7 @@ from backend.models.qf.vote import Vote
 from backend.services.qf.phraseset_activity_service import ActivityService
 from backend.services.qf.scoring_service import QFScoringService
 from backend.services.qf.helpers import upsert_result_view
+from backend.services.qf.practice_sampler import get_practice_sampler
 from backend.services.ai.ai_service import AI_PLAYER_EMAIL_DOMAIN
 
 logger = logging.getLogger(__name__)
@@ -794,7 +795,20 @@ class PhrasesetService:
         """Get a random finalized phraseset for practice mode.
 
         Returns a phraseset that the player was NOT involved in (prompt, copy, or vote).
+        Picks come from the in-memory practice sampler; the SQL scan only runs when
+        the sampler keeps colliding with the player's own phrasesets.
         """
+        phraseset = await get_practice_sampler().sample(self.db, player_id)
+        if phraseset is None:
+            phraseset = await self._select_random_practice_phraseset_sql(player_id)
+
+        if not phraseset:
+            raise ValueError("No phrasesets available for practice")
+
+        return await self._build_practice_payload(phraseset)
+
+    async def _select_random_practice_phraseset_sql(self, player_id: UUID) -> Optional[Phraseset]:
+        """Fallback: pick a random eligible finalized phraseset with a full SQL scan."""
         from sqlalchemy import func, or_
 
         # Get all phraseset IDs where player was involved
@@ -844,11 +858,10 @@ class PhrasesetService:
         query = query.order_by(func.random()).limit(1)
 
         result = await self.db.execute(query)
-        phraseset = result.scalar_one_or_none()
-
-        if not phraseset:
-            raise ValueError("No phrasesets available for practice")
+        return result.scalar_one_or_none()
 
+    async def _build_practice_payload(self, phraseset: Phraseset) -> dict:
+        """Build the practice-mode response for a finalized phraseset."""
         # Load contributor rounds to get usernames
         prompt_round, copy1_round, copy2_round = await self._load_contributor_rounds(phraseset)
 
@@ -0,0 +1,195 @@
+"""In-memory sampler for practice-mode phrasesets.
+
+Finalized phrasesets are kept in a dense, append-only array so a random pick is
+a single random offset. Each player gets an exclusion bitmap over that array
+(phrasesets they prompted, copied, or voted on); bitmaps are built once from
+history and refreshed incrementally as new phrasesets are appended. Callers
+fall back to the SQL path when repeated picks collide with the exclusion set.
+"""
+from __future__ import annotations
+
+import logging
+import random
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.qf.phraseset import Phraseset
+from backend.models.qf.round import Round
+from backend.models.qf.vote import Vote
+
+logger = logging.getLogger(__name__)
+
+
+class PlayerExclusion:
+    """Bitmap of dense phraseset indexes a player was involved in."""
+
+    __slots__ = ("bits", "covered")
+
+    def __init__(self):
+        self.bits = bytearray()
+        # Number of leading sampler indexes whose involvement has been checked
+        self.covered = 0
+
+    def add(self, index: int) -> None:
+        byte_index = index >> 3
+        if byte_index >= len(self.bits):
+            self.bits.extend(b"\x00" * (byte_index + 1 - len(self.bits)))
+        self.bits[byte_index] |= 1 << (index & 7)
+
+    def __contains__(self, index: int) -> bool:
+        byte_index = index >> 3
+        return byte_index < len(self.bits) and bool(self.bits[byte_index] & (1 << (index & 7)))
+
+
+class PracticePhrasesetSampler:
+    """Process-wide dense index of finalized phrasesets for practice mode."""
+
+    def __init__(
+        self,
+        refresh_interval_seconds: float = 30.0,
+        max_attempts: int = 8,
+        max_cached_players: int = 2048,
+    ):
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.max_attempts = max_attempts
+        self.max_cached_players = max_cached_players
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all in-memory state; the next call reloads from the database."""
+        self._ids: list[UUID] = []
+        self._positions: dict[UUID, int] = {}
+        self._dead: set[int] = set()
+        self._exclusions: OrderedDict[UUID, PlayerExclusion] = OrderedDict()
+        self._watermark: Optional[datetime] = None
+        self._loaded = False
+        self._last_sync = 0.0
+
+    @property
+    def size(self) -> int:
+        return len(self._ids)
+
+    def _append(self, phraseset_id: UUID) -> None:
+        if phraseset_id not in self._positions:
+            self._positions[phraseset_id] = len(self._ids)
+            self._ids.append(phraseset_id)
+
+    def record_finalized(self, phraseset_id: UUID) -> None:
+        """Append a newly finalized phraseset to the index."""
+        if self._loaded:
+            self._append(phraseset_id)
+
+    async def _sync(self, db: AsyncSession) -> None:
+        """Append phrasesets finalized since the last sync (covers other workers)."""
+        query = (
+            select(Phraseset.phraseset_id, Phraseset.finalized_at)
+            .where(Phraseset.status == "finalized")
+            .order_by(Phraseset.finalized_at, Phraseset.phraseset_id)
+        )
+        if self._watermark is not None:
+            query = query.where(Phraseset.finalized_at >= self._watermark)
+
+        result = await db.execute(query)
+        for phraseset_id, finalized_at in result.all():
+            self._append(phraseset_id)
+            if finalized_at is not None and (self._watermark is None or finalized_at > self._watermark):
+                self._watermark = finalized_at
+
+        self._loaded = True
+        self._last_sync = time.monotonic()
+
+    async def _ensure_fresh(self, db: AsyncSession) -> None:
+        if not self._loaded or time.monotonic() - self._last_sync >= self.refresh_interval_seconds:
+            await self._sync(db)
+
+    @staticmethod
+    def _involvement_query(player_id: UUID, phraseset_ids: Optional[Iterable[UUID]] = None):
+        """Union of phrasesets the player prompted, copied, or voted on."""
+        player_rounds = select(Round.round_id).where(Round.player_id == player_id)
+        prompt_query = select(Phraseset.phraseset_id).where(Phraseset.prompt_round_id.in_(player_rounds))
+        copy1_query = select(Phraseset.phraseset_id).where(Phraseset.copy_round_1_id.in_(player_rounds))
+        copy2_query = select(Phraseset.phraseset_id).where(Phraseset.copy_round_2_id.in_(player_rounds))
+        vote_query = select(Vote.phraseset_id).where(Vote.player_id == player_id)
+
+        if phraseset_ids is not None:
+            ids = list(phraseset_ids)
+            prompt_query = prompt_query.where(Phraseset.phraseset_id.in_(ids))
+            copy1_query = copy1_query.where(Phraseset.phraseset_id.in_(ids))
+            copy2_query = copy2_query.where(Phraseset.phraseset_id.in_(ids))
+            vote_query = vote_query.where(Vote.phraseset_id.in_(ids))
+
+        return union(prompt_query, copy1_query, copy2_query, vote_query)
+
+    async def _get_exclusion(self, db: AsyncSession, player_id: UUID) -> PlayerExclusion:
+        """Return the player's exclusion bitmap, covering every indexed phraseset."""
+        exclusion = self._exclusions.get(player_id)
+        target = len(self._ids)
+
+        if exclusion is None:
+            exclusion = PlayerExclusion()
+            result = await db.execute(self._involvement_query(player_id))
+            involved_ids = [row[0] for row in result.all()]
+        elif exclusion.covered < target:
+            pending = self._ids[exclusion.covered:target]
+            result = await db.execute(self._involvement_query(player_id, pending))
+            involved_ids = [row[0] for row in result.all()]
+        else:
+            self._exclusions.move_to_end(player_id)
+            return exclusion
+
+        for phraseset_id in involved_ids:
+            index = self._positions.get(phraseset_id)
+            if index is not None:
+                exclusion.add(index)
+        exclusion.covered = max(exclusion.covered, target)
+
+        self._exclusions[player_id] = exclusion
+        self._exclusions.move_to_end(player_id)
+        while len(self._exclusions) > self.max_cached_players:
+            self._exclusions.popitem(last=False)
+        return exclusion
+
+    async def sample(self, db: AsyncSession, player_id: UUID) -> Optional[Phraseset]:
+        """Pick a random finalized phraseset the player was not involved in.
+
+        Returns None when ``max_attempts`` random picks collide with the player's
+        exclusions (or the index is empty), so the caller can fall back to SQL.
+        """
+        await self._ensure_fresh(db)
+        if not self._ids:
+            return None
+
+        exclusion = await self._get_exclusion(db, player_id)
+        size = len(self._ids)
+
+        for _ in range(self.max_attempts):
+            index = random.randrange(size)
+            if index in self._dead or index in exclusion:
+                continue
+
+            phraseset = await db.get(Phraseset, self._ids[index])
+            if phraseset is None:
+                self._dead.add(index)
+                continue
+            if phraseset.status != "finalized":
+                # Recorded before its finalizing transaction committed
+                continue
+            return phraseset
+
+        logger.debug(f"Practice sampler exhausted {self.max_attempts} attempts for {player_id=}")
+        return None
+
+
+# Global singleton instance
+_practice_sampler = PracticePhrasesetSampler()
+
+
+def get_practice_sampler() -> PracticePhrasesetSampler:
+    """Get the global PracticePhrasesetSampler singleton."""
+    return _practice_sampler
@@ -0,0 +1,198 @@
+"""In-memory prompt catalogue with per-player "seen" bitsets.
+
+Enabled prompts are loaded once into a dense array; each player's seen prompts
+(prompt, copy or vote rounds touching that prompt) are kept as an integer
+bitset over the same indexes. Picking a random unseen prompt and counting
+unseen prompts become bitwise operations instead of anti-join queries.
+"""
+from __future__ import annotations
+
+import logging
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.qf.prompt import Prompt
+from backend.services.qf.round_service_helpers import PromptQueryBuilder
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CataloguePrompt:
+    """Immutable prompt entry held by the catalogue."""
+
+    prompt_id: UUID
+    text: str
+
+
+class _SeenPrompts:
+    """Seen-prompt bitset for one player."""
+
+    __slots__ = ("mask", "loaded_at")
+
+    def __init__(self, mask: int, loaded_at: float):
+        self.mask = mask
+        self.loaded_at = loaded_at
+
+
+class PromptCatalogue:
+    """Process-wide catalogue of enabled prompts and per-player seen bitsets."""
+
+    def __init__(
+        self,
+        refresh_interval_seconds: float = 300.0,
+        seen_ttl_seconds: float = 300.0,
+        max_cached_players: int = 4096,
+        max_random_probes: int = 16,
+    ):
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.seen_ttl_seconds = seen_ttl_seconds
+        self.max_cached_players = max_cached_players
+        self.max_random_probes = max_random_probes
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all in-memory state; the next call reloads from the database."""
+        self._prompts: list[CataloguePrompt] = []
+        self._positions: dict[UUID, int] = {}
+        self._text_positions: dict[str, int] = {}
+        self._enabled_mask = 0
+        self._seen: OrderedDict[UUID, _SeenPrompts] = OrderedDict()
+        self._loaded_at: Optional[float] = None
+
+    def invalidate(self) -> None:
+        """Force the prompt list to reload on next use (e.g. after seeding)."""
+        self._loaded_at = None
+
+    @property
+    def size(self) -> int:
+        return self._enabled_mask.bit_count()
+
+    async def _load_prompts(self, db: AsyncSession) -> None:
+        """Load enabled prompts, keeping existing dense indexes stable."""
+        result = await db.execute(
+            select(Prompt.prompt_id, Prompt.text).where(Prompt.enabled == True).order_by(Prompt.created_at)
+        )
+        known_count = len(self._prompts)
+        enabled_mask = 0
+        for prompt_id, prompt_text in result.all():
+            index = self._positions.get(prompt_id)
+            if index is None:
+                index = len(self._prompts)
+                self._positions[prompt_id] = index
+                self._text_positions[prompt_text] = index
+                self._prompts.append(CataloguePrompt(prompt_id, prompt_text))
+            enabled_mask |= 1 << index
+        self._enabled_mask = enabled_mask
+        self._loaded_at = time.monotonic()
+
+        if len(self._prompts) != known_count and self._seen:
+            # Cached bitsets cannot know about new indexes; reload them lazily
+            self._seen.clear()
+
+    async def _ensure_prompts(self, db: AsyncSession, force: bool = False) -> None:
+        if force or self._loaded_at is None or time.monotonic() - self._loaded_at >= self.refresh_interval_seconds:
+            await self._load_prompts(db)
+
+    async def _get_seen_mask(self, db: AsyncSession, player_id: UUID) -> int:
+        """Return the player's seen bitset, loading it from history when missing or stale."""
+        entry = self._seen.get(player_id)
+        now = time.monotonic()
+        if entry is not None and now - entry.loaded_at < self.seen_ttl_seconds:
+            self._seen.move_to_end(player_id)
+            return entry.mask
+
+        result = await db.execute(PromptQueryBuilder.build_seen_prompt_ids_query(player_id))
+        mask = 0
+        for (prompt_id,) in result.all():
+            index = self._positions.get(prompt_id)
+            if index is not None:
+                mask |= 1 << index
+
+        # Keep marks recorded while the history query was in flight
+        current = self._seen.get(player_id)
+        if current is not None:
+            mask |= current.mask
+
+        self._seen[player_id] = _SeenPrompts(mask, now)
+        self._seen.move_to_end(player_id)
+        while len(self._seen) > self.max_cached_players:
+            self._seen.popitem(last=False)
+        return mask
+
+    def mark_seen(
+        self,
+        player_id: UUID,
+        prompt_id: Optional[UUID] = None,
+        prompt_text: Optional[str] = None,
+    ) -> None:
+        """Record that a player has seen a prompt (prompt, copy or vote round created).
+
+        Vote rounds only carry the denormalized prompt text, so the prompt may be
+        identified by either its id or its (unique) text.
+        """
+        if prompt_id is not None:
+            index = self._positions.get(prompt_id)
+        elif prompt_text is not None:
+            index = self._text_positions.get(prompt_text)
+        else:
+            return
+        entry = self._seen.get(player_id)
+        if index is None or entry is None:
+            # Unknown prompts/players are picked up by the next history load
+            return
+        entry.mask |= 1 << index
+
+    def _pick_unseen(self, available: int) -> Optional[CataloguePrompt]:
+        """Pick a uniformly random set bit from ``available``."""
+        if not available:
+            return None
+
+        upper = available.bit_length()
+        for _ in range(self.max_random_probes):
+            index = random.randrange(upper)
+            if (available >> index) & 1:
+                return self._prompts[index]
+
+        # Sparse bitset: choose among the set bits directly
+        target = random.randrange(available.bit_count())
+        while True:
+            lowest = available & -available
+            if target == 0:
+                return self._prompts[lowest.bit_length() - 1]
+            available ^= lowest
+            target -= 1
+
+    async def select_unseen_prompt(self, db: AsyncSession, player_id: UUID) -> Optional[CataloguePrompt]:
+        """Return a random enabled prompt the player has not seen, or None."""
+        await self._ensure_prompts(db)
+        seen = await self._get_seen_mask(db, player_id)
+        prompt = self._pick_unseen(self._enabled_mask & ~seen)
+        if prompt is None:
+            # New prompts may have been added since the last load; retry once against fresh data
+            await self._ensure_prompts(db, force=True)
+            seen = await self._get_seen_mask(db, player_id)
+            prompt = self._pick_unseen(self._enabled_mask & ~seen)
+        return prompt
+
+    async def count_unseen_prompts(self, db: AsyncSession, player_id: UUID) -> int:
+        """Number of enabled prompts the player has not seen."""
+        await self._ensure_prompts(db)
+        seen = await self._get_seen_mask(db, player_id)
+        return (self._enabled_mask & ~seen).bit_count()
+
+
+# Global singleton instance
+_prompt_catalogue = PromptCatalogue()
+
+
+def get_prompt_catalogue() -> PromptCatalogue:
+    """Get the global PromptCatalogue singleton."""
+    return _prompt_catalogue
@@ -1,6 +1,7 @@
 """Auto-seed prompt library if empty."""
 from backend.database import AsyncSessionLocal
 from backend.models.qf.prompt import Prompt
+from backend.services.qf.prompt_catalogue import get_prompt_catalogue
 from sqlalchemy import select, func, update, case
 import logging
 import csv
@@ -134,6 +135,7 @@ async def sync_prompts_with_database():
                     logger.info(f"Disabling prompt: '{text[:50]}...' ({category})")
             
             await db.commit()
+            get_prompt_catalogue().invalidate()
             
             # Log summary
             if added_count > 0 or enabled_count > 0 or disabled_count > 0:
@@ -0,0 +1,54 @@
+"""Gameplay events that drive QuipFlip quest progress.
+
+Game services build these inside their own transaction and hand them to
+``QuestService.record_events`` right before committing, so quest updates are
+written in the same commit as the action that earned them.
+"""
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from uuid import UUID
+
+from backend.services.quest_service_base import QuestEvent
+
+
+@dataclass(frozen=True)
+class PromptSubmitted(QuestEvent):
+    """A player submitted the phrase for a prompt round."""
+
+
+@dataclass(frozen=True)
+class CopySubmitted(QuestEvent):
+    """A player submitted the phrase for a copy round."""
+
+
+@dataclass(frozen=True)
+class VoteSubmitted(QuestEvent):
+    """A player voted on a phraseset."""
+
+    correct: bool = False
+
+
+@dataclass(frozen=True)
+class FeedbackSubmitted(QuestEvent):
+    """A player left feedback on a prompt for the first time."""
+
+
+@dataclass(frozen=True)
+class PhrasesetFinalized(QuestEvent):
+    """A phraseset was finalized; ``player_id`` is the original (prompt) player."""
+
+    phraseset_id: Optional[UUID] = None
+    vote_count: int = 0
+    original_phrase: str = ""
+    copy1_player_id: Optional[UUID] = None
+    copy_phrase_1: str = ""
+    copy2_player_id: Optional[UUID] = None
+    copy_phrase_2: str = ""
+
+    @property
+    def player_ids(self) -> Tuple[UUID, ...]:
+        return tuple(
+            player_id
+            for player_id in (self.player_id, self.copy1_player_id, self.copy2_player_id)
+            if player_id is not None
+        )
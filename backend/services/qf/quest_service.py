@@ -9,16 +9,28 @@ from typing import List, Optional, Dict, Any, Type
 from backend.models.qf.quest import QFQuest, QuestTemplate, QuestType, QuestStatus, QuestCategory
 from backend.models.qf.player import QFPlayer
 from backend.models.qf.vote import Vote
-from backend.models.qf.round import Round
 from backend.models.qf.prompt import Prompt
-from backend.models.qf.phraseset import Phraseset
 from backend.models.qf.prompt_feedback import PromptFeedback
-from backend.services.quest_service_base import QuestServiceBase
+from backend.services.qf.quest_events import (
+    CopySubmitted,
+    FeedbackSubmitted,
+    PhrasesetFinalized,
+    PromptSubmitted,
+    VoteSubmitted,
+)
+from backend.services.quest_service_base import QuestEvent, QuestServiceBase
 from backend.services.transaction_service import TransactionService
 from backend.utils.model_registry import GameType
 
 logger = logging.getLogger(__name__)
 
+HOT_STREAK_QUEST_TYPES = [QuestType.HOT_STREAK_5, QuestType.HOT_STREAK_10, QuestType.HOT_STREAK_20]
+ROUND_COMPLETION_QUEST_TYPES = [
+    QuestType.ROUND_COMPLETION_5,
+    QuestType.ROUND_COMPLETION_10,
+    QuestType.ROUND_COMPLETION_20,
+]
+
 
 # Quest configuration mapping
 QUEST_CONFIGS = {
@@ -225,285 +237,110 @@ class QuestService(QuestServiceBase):
         else:  # Milestone quests
             return {"current": 0, "target": target}
 
-    # Game-specific quest tracking methods
-    async def check_and_update_vote_streak(self, player_id: UUID, vote_correct: bool) -> None:
-        """Check and update hot streak quest after a vote."""
-        streak_quest_types = [
-            QuestType.HOT_STREAK_5,
-            QuestType.HOT_STREAK_10,
-            QuestType.HOT_STREAK_20,
-        ]
-        
-        if vote_correct:
-            await self.update_streak_quest(player_id, streak_quest_types, streak_broken=False)
-        else:
-            await self.update_streak_quest(player_id, streak_quest_types, streak_broken=True)
-
-    async def check_deceptive_copy(self, phraseset_id: UUID) -> None:
-        """Check if any player earned the deceptive copy bonus."""
-        # Get phraseset
-        result = await self.db.execute(
-            select(Phraseset).where(Phraseset.phraseset_id == phraseset_id)
-        )
-        phraseset = result.scalar_one_or_none()
-
-        if not phraseset or phraseset.status != "finalized":
-            return
-
-        # Get vote counts by querying the votes table
-        votes_result = await self.db.execute(
-            select(Vote.voted_phrase, func.count(Vote.vote_id).label('vote_count'))
-            .where(Vote.phraseset_id == phraseset_id)
-            .group_by(Vote.voted_phrase)
-        )
-        vote_counts = {phrase: count for phrase, count in votes_result.all()}
-        
-        # Calculate total votes
-        total_votes = sum(vote_counts.values())
-        if total_votes == 0:
-            return
-
-        # Get player IDs from the rounds
-        copy1_result = await self.db.execute(
-            select(Round.player_id).where(Round.round_id == phraseset.copy_round_1_id)
-        )
-        copy1_player_id = copy1_result.scalar_one_or_none()
-        
-        copy2_result = await self.db.execute(
-            select(Round.player_id).where(Round.round_id == phraseset.copy_round_2_id)
-        )
-        copy2_player_id = copy2_result.scalar_one_or_none()
-
-        # Check both copy players
-        copy_data = [
-            (copy1_player_id, phraseset.copy_phrase_1),
-            (copy2_player_id, phraseset.copy_phrase_2),
-        ]
-        
-        for copy_player_id, copy_phrase in copy_data:
-            if not copy_player_id:
-                continue
-
-            copy_votes = vote_counts.get(copy_phrase, 0)
-            vote_percentage = (copy_votes / total_votes) * 100
-
-            if vote_percentage >= 75:
-                # Check if player has active quest
-                quest_result = await self.db.execute(
-                    select(QFQuest).where(
-                        and_(
-                            QFQuest.player_id == copy_player_id,
-                            QFQuest.quest_type == QuestType.DECEPTIVE_COPY.value,
-                            QFQuest.status == QuestStatus.ACTIVE.value
-                        )
-                    )
-                )
-                quest = quest_result.scalar_one_or_none()
-
-                if not quest:
-                    # Create and complete quest
-                    quest = await self._create_quest(copy_player_id, QuestType.DECEPTIVE_COPY)
-
-                if quest.status == QuestStatus.ACTIVE.value:
-                    quest.status = QuestStatus.COMPLETED.value
-                    quest.completed_at = datetime.now(UTC)
-                    quest.progress["percentage"] = vote_percentage
-                    self.db.add(quest)
-                    logger.info(
-                        f"Deceptive copy quest completed for player {copy_player_id}, "
-                        f"percentage={vote_percentage:.1f}%"
-                    )
-
-        await self.db.commit()
-
-    async def check_obvious_original(self, phraseset_id: UUID) -> None:
-        """Check if the original prompt player earned the obvious original bonus."""
-        # Get phraseset
-        result = await self.db.execute(
-            select(Phraseset).where(Phraseset.phraseset_id == phraseset_id)
-        )
-        phraseset = result.scalar_one_or_none()
-
-        if not phraseset or phraseset.status != "finalized":
-            return
-
-        # Get vote counts by querying the votes table
-        votes_result = await self.db.execute(
-            select(Vote.voted_phrase, func.count(Vote.vote_id).label('vote_count'))
-            .where(Vote.phraseset_id == phraseset_id)
-            .group_by(Vote.voted_phrase)
-        )
-        vote_counts = {phrase: count for phrase, count in votes_result.all()}
-        
-        # Calculate total votes
-        total_votes = sum(vote_counts.values())
-        if total_votes == 0:
-            return
-
-        # Get original player ID from the prompt round
-        original_result = await self.db.execute(
-            select(Round.player_id).where(Round.round_id == phraseset.prompt_round_id)
-        )
-        original_player_id = original_result.scalar_one_or_none()
-        
-        if not original_player_id:
-            return
-
-        original_votes = vote_counts.get(phraseset.original_phrase, 0)
-        vote_percentage = (original_votes / total_votes) * 100
-
-        if vote_percentage >= 85:
-            # Check if player has active quest
-            quest_result = await self.db.execute(
-                select(QFQuest).where(
-                    and_(
-                        QFQuest.player_id == original_player_id,
-                        QFQuest.quest_type == QuestType.OBVIOUS_ORIGINAL.value,
-                        QFQuest.status == QuestStatus.ACTIVE.value
-                    )
-                )
+    # Game-specific quest tracking
+    async def _apply_event(self, event: QuestEvent) -> None:
+        """Route a gameplay event to the quests it advances."""
+        now = datetime.now(UTC)
+        if isinstance(event, PromptSubmitted):
+            self._track_round_completion(event.player_id, now)
+            self._advance_counters(event.player_id, [QuestType.MILESTONE_PROMPTS_50])
+            self._track_balanced_activity(event.player_id, "prompts", now)
+        elif isinstance(event, CopySubmitted):
+            self._advance_counters(event.player_id, [QuestType.MILESTONE_COPIES_100])
+            self._track_balanced_activity(event.player_id, "copies", now)
+        elif isinstance(event, VoteSubmitted):
+            self._advance_streaks(event.player_id, HOT_STREAK_QUEST_TYPES, streak_broken=not event.correct)
+            self._advance_counters(event.player_id, [QuestType.MILESTONE_VOTES_100])
+            self._track_balanced_activity(event.player_id, "votes", now)
+        elif isinstance(event, FeedbackSubmitted):
+            self._advance_counters(
+                event.player_id, [QuestType.FEEDBACK_CONTRIBUTOR_10, QuestType.FEEDBACK_CONTRIBUTOR_50]
             )
-            quest = quest_result.scalar_one_or_none()
-
-            if not quest:
-                # Create and complete quest
-                quest = await self._create_quest(original_player_id, QuestType.OBVIOUS_ORIGINAL)
-
-            if quest.status == QuestStatus.ACTIVE.value:
-                quest.status = QuestStatus.COMPLETED.value
-                quest.completed_at = datetime.now(UTC)
-                quest.progress["percentage"] = vote_percentage
-                self.db.add(quest)
-                logger.info(
-                    f"Obvious original quest completed for player {original_player_id}, "
-                    f"percentage={vote_percentage:.1f}%"
-                )
-
-            await self.db.commit()
+        elif isinstance(event, PhrasesetFinalized):
+            await self._track_finalized_phraseset(event, now)
+        else:
+            logger.warning(f"Unhandled quest event {event!r}")
 
-    async def increment_round_completion(self, player_id: UUID) -> None:
-        """Track round completion for activity quests."""
-        now = datetime.now(UTC)
+    def _track_round_completion(self, player_id: UUID, now: datetime) -> None:
+        """Track round completion for activity quests over a sliding 24 hour window."""
         window_start = now - timedelta(hours=24)
+        for quest_type in ROUND_COMPLETION_QUEST_TYPES:
+            quest = self._active_quest(player_id, quest_type)
+            if quest is None:
+                continue
 
-        # Get active round completion quests
-        result = await self.db.execute(
-            select(QFQuest).where(
-                and_(
-                    QFQuest.player_id == player_id,
-                    QFQuest.status == QuestStatus.ACTIVE.value,
-                    QFQuest.quest_type.in_([
-                        QuestType.ROUND_COMPLETION_5.value,
-                        QuestType.ROUND_COMPLETION_10.value,
-                        QuestType.ROUND_COMPLETION_20.value,
-                    ])
-                )
-            )
-        )
-        quests = list(result.scalars().all())
-
-        for quest in quests:
             progress = quest.progress
-            config = QUEST_CONFIGS[QuestType(quest.quest_type)]
-
-            # Add current timestamp
-            timestamps = progress.get("round_timestamps", [])
-            timestamps.append(now.isoformat())
-
-            # Filter to 24-hour window
-            valid_timestamps = [
-                ts for ts in timestamps
-                if datetime.fromisoformat(ts) >= window_start
-            ]
+            timestamps = progress.get("round_timestamps", []) + [now.isoformat()]
+            valid_timestamps = [ts for ts in timestamps if datetime.fromisoformat(ts) >= window_start]
 
             progress["round_timestamps"] = valid_timestamps
             progress["rounds_completed"] = len(valid_timestamps)
             progress["window_start"] = window_start.isoformat()
 
-            # Check if quest completed
-            if progress["rounds_completed"] >= config["target"]:
-                quest.status = QuestStatus.COMPLETED.value
-                quest.completed_at = now
-                logger.info(f"Quest {quest.quest_type} completed for {player_id=}")
+            if progress["rounds_completed"] >= QUEST_CONFIGS[quest_type]["target"]:
+                self._complete_quest(quest, now)
 
-            quest.progress = progress
-            self.db.add(quest)
-
-        await self.db.commit()
-
-    async def check_balanced_player(self, player_id: UUID) -> None:
-        """Check balanced player quest progress."""
-        # Get active balanced player quest
-        result = await self.db.execute(
-            select(QFQuest).where(
-                and_(
-                    QFQuest.player_id == player_id,
-                    QFQuest.quest_type == QuestType.BALANCED_PLAYER.value,
-                    QFQuest.status == QuestStatus.ACTIVE.value
-                )
-            )
-        )
-        quest = result.scalar_one_or_none()
+    def _track_balanced_activity(self, player_id: UUID, activity: str, now: datetime) -> None:
+        """Count prompts, copies and votes for the balanced player quest over a sliding 24 hour window.
 
-        if not quest:
+        Only the most recent ``target`` timestamps per activity are kept, which
+        is all that is needed to decide whether the target is met in the window.
+        """
+        quest = self._active_quest(player_id, QuestType.BALANCED_PLAYER)
+        if quest is None:
             return
 
-        now = datetime.now(UTC)
+        progress = quest.progress
+        targets = progress.get("target") or {"prompts": 1, "copies": 2, "votes": 10}
         window_start = now - timedelta(hours=24)
+        key = f"{activity}_timestamps"
 
-        # Count rounds in 24h window
-        prompts_result = await self.db.execute(
-            select(func.count()).select_from(Round).where(
-                and_(
-                    Round.player_id == player_id,
-                    Round.round_type == "prompt",
-                    Round.status == "submitted",
-                    Round.created_at >= window_start
-                )
-            )
-        )
-        prompts = prompts_result.scalar() or 0
+        timestamps = progress.get(key, []) + [now.isoformat()]
+        timestamps = [ts for ts in timestamps if datetime.fromisoformat(ts) >= window_start]
+        progress[key] = timestamps[-targets[activity]:]
+        progress["window_start"] = window_start.isoformat()
+        for name in targets:
+            recent = [ts for ts in progress.get(f"{name}_timestamps", []) if datetime.fromisoformat(ts) >= window_start]
+            progress[name] = len(recent)
 
-        copies_result = await self.db.execute(
-            select(func.count()).select_from(Round).where(
-                and_(
-                    Round.player_id == player_id,
-                    Round.round_type == "copy",
-                    Round.status == "submitted",
-                    Round.created_at >= window_start
-                )
-            )
-        )
-        copies = copies_result.scalar() or 0
+        if all(progress[name] >= target for name, target in targets.items()):
+            self._complete_quest(quest, now)
 
+    async def _track_finalized_phraseset(self, event: PhrasesetFinalized, now: datetime) -> None:
+        """Award deceptive copy, obvious original and popular phraseset quests."""
         votes_result = await self.db.execute(
-            select(func.count()).select_from(Vote).where(
-                and_(
-                    Vote.player_id == player_id,
-                    Vote.created_at >= window_start
-                )
-            )
+            select(Vote.voted_phrase, func.count(Vote.vote_id))
+            .where(Vote.phraseset_id == event.phraseset_id)
+            .group_by(Vote.voted_phrase)
         )
-        votes = votes_result.scalar() or 0
-
-        # Update progress
-        progress = quest.progress
-        progress.update({
-            "prompts": prompts,
-            "copies": copies,
-            "votes": votes,
-            "window_start": window_start.isoformat(),
-        })
+        vote_counts = {phrase: count for phrase, count in votes_result.all()}
+        total_votes = sum(vote_counts.values())
 
-        # Check if completed
-        if prompts >= 1 and copies >= 2 and votes >= 10:
-            quest.status = QuestStatus.COMPLETED.value
-            quest.completed_at = now
-            logger.info(f"Balanced player quest completed for {player_id=}")
+        if total_votes:
+            awards = [
+                (event.copy1_player_id, event.copy_phrase_1, QuestType.DECEPTIVE_COPY),
+                (event.copy2_player_id, event.copy_phrase_2, QuestType.DECEPTIVE_COPY),
+                (event.player_id, event.original_phrase, QuestType.OBVIOUS_ORIGINAL),
+            ]
+            for player_id, phrase, quest_type in awards:
+                if player_id is None:
+                    continue
+                vote_percentage = (vote_counts.get(phrase, 0) / total_votes) * 100
+                if vote_percentage < QUEST_CONFIGS[quest_type]["target"]:
+                    continue
+
+                quest = await self._get_or_create_active_quest(player_id, quest_type)
+                if quest is not None:
+                    quest.progress["percentage"] = vote_percentage
+                    self._complete_quest(quest, now)
 
-        quest.progress = progress
-        self.db.add(quest)
-        await self.db.commit()
+        if event.vote_count >= QUEST_CONFIGS[QuestType.MILESTONE_PHRASESET_20VOTES]["target"]:
+            for player_id in event.player_ids:
+                quest = await self._get_or_create_active_quest(player_id, QuestType.MILESTONE_PHRASESET_20VOTES)
+                if quest is not None:
+                    quest.progress["phraseset_id"] = str(event.phraseset_id)
+                    quest.progress["vote_count"] = event.vote_count
+                    self._complete_quest(quest, now)
 
     async def check_login_streak(self, player_id: UUID) -> None:
         """Update login streak quest."""
@@ -564,54 +401,3 @@ class QuestService(QuestServiceBase):
         quest.progress = progress
         self.db.add(quest)
         await self.db.commit()
-
-    # Convenience methods using the base class functionality
-    async def increment_feedback_count(self, player_id: UUID) -> None:
-        """Track feedback contributions using incremental updates."""
-        quest_types = [QuestType.FEEDBACK_CONTRIBUTOR_10, QuestType.FEEDBACK_CONTRIBUTOR_50]
-        await self.increment_progress_counter(player_id, quest_types)
-
-    async def check_milestone_votes(self, player_id: UUID) -> None:
-        """Check milestone vote quest using incremental tracking."""
-        await self.increment_progress_counter(player_id, [QuestType.MILESTONE_VOTES_100])
-
-    async def check_milestone_prompts(self, player_id: UUID) -> None:
-        """Check milestone prompt quest using incremental tracking."""
-        await self.increment_progress_counter(player_id, [QuestType.MILESTONE_PROMPTS_50])
-
-    async def check_milestone_copies(self, player_id: UUID) -> None:
-        """Check milestone copy quest using incremental tracking."""
-        await self.increment_progress_counter(player_id, [QuestType.MILESTONE_COPIES_100])
-
-    async def check_milestone_phraseset_20votes(
-        self, player_id: UUID, phraseset_id: UUID, vote_count: int
-    ) -> None:
-        """Check if a phraseset reached 20 votes."""
-        if vote_count < 20:
-            return
-
-        # Get active quest
-        result = await self.db.execute(
-            select(QFQuest).where(
-                and_(
-                    QFQuest.player_id == player_id,
-                    QFQuest.quest_type == QuestType.MILESTONE_PHRASESET_20VOTES.value,
-                    QFQuest.status == QuestStatus.ACTIVE.value
-                )
-            )
-        )
-        quest = result.scalar_one_or_none()
-
-        if not quest:
-            quest = await self._create_quest(player_id, QuestType.MILESTONE_PHRASESET_20VOTES)
-
-        if quest.status == QuestStatus.ACTIVE.value:
-            quest.status = QuestStatus.COMPLETED.value
-            quest.completed_at = datetime.now(UTC)
-            quest.progress["phraseset_id"] = str(phraseset_id)
-            quest.progress["vote_count"] = vote_count
-            self.db.add(quest)
-            await self.db.commit()
-            logger.info(
-                f"Phraseset 20 votes milestone completed for {player_id=}"
-            )
@@ -4,6 +4,7 @@ import logging
 
 from backend.utils import queue_client
 from backend.config import get_settings
+from backend.services.qf.copy_assignment_index import get_copy_assignment_index
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -17,9 +18,10 @@ class QFQueueService:
     """Service for managing game queues."""
 
     @staticmethod
-    def add_prompt_round_to_queue(prompt_round_id: UUID):
+    def add_prompt_round_to_queue(prompt_round_id: UUID, owner_id: UUID | None = None):
         """Add prompt to queue waiting for copy players."""
         queue_client.push(PROMPT_QUEUE, {"prompt_round_id": str(prompt_round_id)})
+        get_copy_assignment_index().note_queued(prompt_round_id, owner_id)
         new_length = queue_client.length(PROMPT_QUEUE)
         logger.info(f"[Queue Push] Added prompt to queue: {prompt_round_id} (queue now has {new_length} items)")
 
@@ -30,7 +32,9 @@ class QFQueueService:
         item = queue_client.pop(PROMPT_QUEUE)
         if item:
             logger.info(f"[Queue Pop] Retrieved prompt from queue: {item['prompt_round_id']} (queue had {queue_length_before} items)")
-            return UUID(item["prompt_round_id"])
+            prompt_round_id = UUID(item["prompt_round_id"])
+            get_copy_assignment_index().note_dequeued([prompt_round_id])
+            return prompt_round_id
         logger.info(f"[Queue Pop] No items in queue (length was {queue_length_before})")
         return None
 
@@ -49,6 +53,7 @@ class QFQueueService:
             return []
 
         prompt_ids = [UUID(item["prompt_round_id"]) for item in items]
+        get_copy_assignment_index().note_dequeued(prompt_ids)
         logger.info(
             f"[Queue Pop] Retrieved {len(prompt_ids)} prompts from queue (requested {count}, queue had "
             f"{queue_length_before} items)"
@@ -60,6 +65,7 @@ class QFQueueService:
         """Remove specific prompt from queue (for abandoned rounds)."""
         item = {"prompt_round_id": str(prompt_round_id)}
         removed = queue_client.remove(PROMPT_QUEUE, item)
+        get_copy_assignment_index().note_dequeued([prompt_round_id])
         if removed:
             logger.info(f"Removed prompt from queue: {prompt_round_id}")
         return removed
@@ -83,6 +89,7 @@ class QFQueueService:
             item = {"prompt_round_id": str(prompt_round_id)}
             if queue_client.remove(PROMPT_QUEUE, item):
                 removed_count += 1
+        get_copy_assignment_index().note_dequeued(prompt_round_ids)
 
         if removed_count > 0:
             logger.info(f"[Queue Cleanup] Removed {removed_count} prompts from queue")
@@ -101,6 +108,7 @@ class QFQueueService:
         if count > 0:
             queue_client.clear(PROMPT_QUEUE)
             logger.info(f"[Queue Clear] Cleared {count} items from prompt queue")
+        get_copy_assignment_index().note_all_dequeued()
         return count
 
     @staticmethod
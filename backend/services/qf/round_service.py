@@ -18,7 +18,10 @@ from backend.models.qf.phraseset import Phraseset
 from backend.models.qf.player_abandoned_prompt import PlayerAbandonedPrompt
 from backend.services.transaction_service import TransactionService
 from backend.services.qf.queue_service import QFQueueService
+from backend.services.qf.copy_assignment_index import get_copy_assignment_index
 from backend.services.qf.phraseset_activity_service import ActivityService
+from backend.services.qf.quest_events import CopySubmitted, PromptSubmitted
+from backend.services.qf.prompt_catalogue import CataloguePrompt, get_prompt_catalogue
 from backend.services.phrase_validator import get_phrase_validator
 from backend.config import get_settings
 from backend.utils import ensure_utc
@@ -32,6 +35,7 @@ from backend.utils.exceptions import (
     AlreadyInRoundError,
 )
 from backend.services.ai.ai_service import AIServiceError
+from backend.services.ai.pregeneration_pool import get_pregeneration_pool
 from backend.services.qf.round_service_helpers import (
     generate_ai_hints_background,
     revalidate_ai_hints_background,
@@ -49,13 +53,12 @@ logger = logging.getLogger(__name__)
 class QFRoundService:
     """Service for managing game rounds."""
 
-    AVAILABLE_PROMPTS_CACHE_TTL_SECONDS = 15
     _queue_rehydration_lock: asyncio.Lock | None = None
 
     def __init__(self, db: AsyncSession):
         self.db = db
         self.settings = get_settings()
-        self._available_prompts_cache: dict[UUID, tuple[int, datetime]] = {}
+        self._available_prompts_cache: dict[UUID, int] = {}
         self.phrase_validator = get_phrase_validator()
         self.activity_service = ActivityService(db)
         from backend.services import AIService
@@ -113,7 +116,7 @@ class QFRoundService:
     async def _create_prompt_round(
         self,
         player: QFPlayer,
-        prompt: Prompt,
+        prompt: CataloguePrompt,
         transaction_service: TransactionService,
     ) -> Round:
         """Create a prompt round and commit it in a single transaction."""
@@ -156,6 +159,7 @@ class QFRoundService:
 
         await self._increment_prompt_usage(prompt.prompt_id)
         await self.db.commit()
+        get_prompt_catalogue().mark_seen(player.player_id, prompt.prompt_id)
 
         return round_object
 
@@ -171,19 +175,12 @@ class QFRoundService:
         if result.rowcount == 0:
             raise RuntimeError("Failed to update prompt usage count")
 
-    async def _select_prompt_for_player(self, player: QFPlayer) -> Prompt:
-        """Fetch a random prompt the player has not seen yet."""
-        import random
-
-        prompt_stmt = PromptQueryBuilder.build_unseen_prompts_query(player.player_id)
-        result = await self.db.execute(prompt_stmt)
-        prompts = result.scalars().all()
-
-        if not prompts:
+    async def _select_prompt_for_player(self, player: QFPlayer) -> CataloguePrompt:
+        """Pick a random prompt the player has not seen yet from the in-memory catalogue."""
+        prompt = await get_prompt_catalogue().select_unseen_prompt(self.db, player.player_id)
+        if prompt is None:
             raise NoPromptsAvailableError("no_unseen_prompts_available")
-
-        # Randomly select one prompt from the batch (much faster than ORDER BY random())
-        return random.choice(prompts)
+        return prompt
 
     async def submit_prompt_phrase(
             self,
@@ -231,7 +228,7 @@ class QFRoundService:
         player_data.active_round_id = None
 
         # Add to queue
-        QFQueueService.add_prompt_round_to_queue(round_object.round_id)
+        QFQueueService.add_prompt_round_to_queue(round_object.round_id, player.player_id)
 
         await self.activity_service.record_activity(
             activity_type="prompt_submitted",
@@ -243,21 +240,19 @@ class QFRoundService:
             },
         )
 
+        # Quest progress is evaluated in memory and written by the same commit
+        from backend.services.qf.quest_service import QuestService
+        await QuestService(self.db).record_events([PromptSubmitted(player.player_id)])
+
         await self.db.commit()
         await self.db.refresh(round_object)
 
-        # Immediately kick off AI copy generation without blocking the response
-        asyncio.create_task(generate_ai_hints_background(round_object.round_id))
-
-        # Track quest progress for round completion
-        from backend.services.qf.quest_service import QuestService
-        quest_service = QuestService(self.db)
-        try:
-            await quest_service.increment_round_completion(player.player_id)
-            await quest_service.check_milestone_prompts(player.player_id)
-            await quest_service.check_balanced_player(player.player_id)
-        except Exception as e:
-            logger.error(f"Failed to update quest progress for prompt round: {e}", exc_info=True)
+        # Pre-generate the impostor/hint cache in the background so hints and backups become cache reads
+        if self.settings.ai_pregeneration_enabled:
+            get_pregeneration_pool().enqueue(round_object.round_id)
+        else:
+            # Immediately kick off AI copy generation without blocking the response
+            asyncio.create_task(generate_ai_hints_background(round_object.round_id))
 
         # Invalidate dashboard cache to ensure fresh data
         from backend.utils.cache import dashboard_cache
@@ -297,6 +292,7 @@ class QFRoundService:
         )
 
         is_second_copy = prompt_round_id is not None and not force_prompt_round
+        claimed_from_queue: tuple[UUID, UUID] | None = None
 
         if is_second_copy:
             # Second copy: use the provided prompt_round_id
@@ -353,19 +349,26 @@ class QFRoundService:
                 prompt_round = await self._get_next_valid_prompt_round(
                     player, self.settings.copy_round_max_attempts
                 )
+                claimed_from_queue = (prompt_round.round_id, prompt_round.player_id)
 
             copy_cost, _is_discounted, system_contribution = self._calculate_copy_round_cost()
 
-        copy_slot = await self.determine_copy_slot(prompt_round.round_id)
-
-        round_object = await self._create_copy_round(
-            player,
-            prompt_round,
-            copy_cost,
-            system_contribution,
-            copy_slot,
-            transaction_service,
-        )
+        try:
+            copy_slot = await self.determine_copy_slot(prompt_round.round_id)
+
+            round_object = await self._create_copy_round(
+                player,
+                prompt_round,
+                copy_cost,
+                system_contribution,
+                copy_slot,
+                transaction_service,
+            )
+        except Exception:
+            if claimed_from_queue:
+                # Release the claim so other players can still copy this prompt
+                QFQueueService.add_prompt_round_to_queue(*claimed_from_queue)
+            raise
 
         from backend.utils.cache import dashboard_cache
 
@@ -428,125 +431,69 @@ class QFRoundService:
 
         await self.db.commit()
         await self.db.refresh(round_object)
+        get_prompt_catalogue().mark_seen(player.player_id, prompt_round.prompt_id)
 
         return round_object
 
     async def _get_next_valid_prompt_round(self, player: QFPlayer, max_attempts: int) -> Round:
         """
-        Retrieve and lock the next eligible prompt round for the player.
-
-        Uses an adaptive retry strategy:
-        - Stale/not-found entries don't count fully against max_attempts
-        - After 5 consecutive stale entries, triggers queue rehydration
-        - This prevents the queue from containing stale IDs that block valid prompts
+        Claim the oldest waiting prompt round the player is eligible to copy.
+
+        Eligibility (own prompt, already copied, abandon cooldown) is answered by the
+        in-memory copy assignment index, so ineligible prompts stay in the queue
+        untouched. The chosen prompt is claimed by removing it from the shared queue,
+        which arbitrates between workers; a lost claim just moves on to the next
+        candidate. The abandon cooldown of the claimed prompt alone is re-checked in
+        the database, since another worker may have recorded the abandonment. If nothing is claimable, the queue is rehydrated and the index
+        reconciled once before giving up.
         """
+        index = get_copy_assignment_index()
+        for reconciled in (False, True):
+            if reconciled:
+                await self.ensure_prompt_queue_populated()
+                await index.reconcile(self.db)
+            else:
+                stale_ids = await index.ensure_fresh(self.db)
+                if stale_ids:
+                    QFQueueService.remove_prompt_rounds_from_queue(stale_ids)
+
+            tried_prompt_ids: set[UUID] = set()
+            while len(tried_prompt_ids) < max_attempts:
+                prompt_round_id = index.next_eligible(player.player_id, tried_prompt_ids)
+                if prompt_round_id is None:
+                    break
+                tried_prompt_ids.add(prompt_round_id)
+
+                if not QFQueueService.remove_prompt_round_from_queue(prompt_round_id):
+                    # Claimed by another worker (or no longer queued)
+                    continue
+
+                prompt_round = await self._lock_prompt_round_for_update(prompt_round_id)
+                if (
+                    not prompt_round
+                    or prompt_round.status != "submitted"
+                    or prompt_round.phraseset_status in {"flagged_pending", "flagged_removed"}
+                ):
+                    logger.warning(f"Dropping stale prompt {prompt_round_id} from copy assignment index")
+                    index.discard([prompt_round_id])
+                    continue
+
+                abandoned_at = await self._recent_abandonment_at(player.player_id, prompt_round_id)
+                if abandoned_at is not None:
+                    # Abandoned through another worker since this index was reconciled
+                    index.note_abandoned(prompt_round_id, player.player_id, ensure_utc(abandoned_at))
+                    QFQueueService.add_prompt_round_to_queue(prompt_round_id, prompt_round.player_id)
+                    continue
+
+                logger.debug(f"Claimed prompt {prompt_round_id} for player {player.player_id} "
+                             f"after {len(tried_prompt_ids)} candidate(s)")
+                return prompt_round
 
-        attempts = 0
-        stale_count = 0  # Track consecutive stale/not-found entries
-        candidate_prompt_round_ids: list[UUID] = []
-        prefetched_rounds: dict[UUID, Round] = {}
-        tried_prompt_ids: set[UUID] = set()  # Track prompts we've already tried in this request
-
-        while attempts < max_attempts:
-            if not candidate_prompt_round_ids:
-                # Check if we've hit too many stale entries - trigger rehydration
-                if stale_count >= 5:
-                    logger.warning(f"Found {stale_count} consecutive stale entries, rehydrating queue")
-                    await self.ensure_prompt_queue_populated()
-                    stale_count = 0  # Reset counter after rehydration
-
-                candidate_prompt_round_ids = await self._pop_prompt_batch(max_attempts - attempts)
-                # Filter out prompts we've already tried in this request to prevent cycling.
-                # Filtered prompts will be requeued at the end (success or failure).
-                candidate_prompt_round_ids = [
-                    pid for pid in candidate_prompt_round_ids if pid not in tried_prompt_ids]
-
-                if not candidate_prompt_round_ids:
-                    logger.warning(f"No new prompts available (attempt {attempts + 1}, tried "
-                                   f"{len(tried_prompt_ids)} unique prompts), rehydrating queue")
-                    await self.ensure_prompt_queue_populated()
-                    candidate_prompt_round_ids = await self._pop_prompt_batch(max_attempts - attempts)
-                    # Filter again after rehydration
-                    candidate_prompt_round_ids = [
-                        pid for pid in candidate_prompt_round_ids if pid not in tried_prompt_ids]
-
-                    if not candidate_prompt_round_ids:
-                        logger.error(
-                            f"No new prompts available after rehydration. Queue length: "
-                            f"{QFQueueService.get_prompt_rounds_waiting()}, already tried {len(tried_prompt_ids)} "
-                            f"unique prompts")
-                        # Requeue everything we tried before raising
-                        for tried_prompt_id in tried_prompt_ids:
-                            QFQueueService.add_prompt_round_to_queue(tried_prompt_id)
-                        raise NoPromptsAvailableError("No prompts available")
-
-                await self._prefetch_prompt_rounds(
-                    candidate_prompt_round_ids, prefetched_rounds
-                )
-
-            prompt_round_id = candidate_prompt_round_ids.pop(0)
-            prompt_round = prefetched_rounds.get(prompt_round_id)
-            attempts += 1
-            logger.debug(f"Attempt {attempts}/{max_attempts} for player {player.player_id} using prompt "
-                        f"{prompt_round_id}")
-
-            if not prompt_round:
-                stale_count += 1
-                logger.warning(f"Prompt round not found in DB: {prompt_round_id} ({attempts=}, {stale_count=})")
-                # Don't count stale entries as heavily - only count as 0.5 attempts
-                if stale_count % 2 == 1:  # Every other stale entry, don't count attempt
-                    attempts -= 1
-                continue
-
-            # Reset stale counter when we find a valid DB entry
-            stale_count = 0
-
-            if prompt_round.phraseset_status in {"flagged_pending", "flagged_removed"}:
-                logger.debug(f"{prompt_round_id=} is flagged (status={prompt_round.phraseset_status}), "
-                             f"skipping for copy queue ({attempts=})")
-                # Don't requeue flagged prompts and don't mark as tried
-                continue
-
-            # Mark this prompt as tried (after flagged check)
-            tried_prompt_ids.add(prompt_round_id)
-
-            should_skip, should_requeue = await self._should_skip_prompt_round(
-                player, prompt_round
-            )
-            if should_skip:
-                # Don't requeue immediately - we'll requeue all tried prompts at the end
-                # This prevents infinite cycling through the same unavailable prompts
-                continue
-
-            locked_prompt_round = await self._lock_prompt_round_for_update(prompt_round_id)
-            if not locked_prompt_round:
-                # Couldn't lock this prompt, but don't requeue yet - wait until end
-                continue
-
-            logger.debug(f"Found valid prompt {prompt_round_id} for player {player.player_id} on attempt {attempts}")
-
-            # Success! Requeue remaining candidates and all tried prompts (except the one we're using)
-            tried_prompt_ids.discard(prompt_round_id)  # Don't requeue the one we're using
-            for remaining_prompt_round_id in candidate_prompt_round_ids:
-                QFQueueService.add_prompt_round_to_queue(remaining_prompt_round_id)
-            for tried_prompt_id in tried_prompt_ids:
-                QFQueueService.add_prompt_round_to_queue(tried_prompt_id)
-
-            return locked_prompt_round
-
-        # Failed to find a valid prompt - requeue everything we tried
-        for remaining_prompt_round_id in candidate_prompt_round_ids:
-            QFQueueService.add_prompt_round_to_queue(remaining_prompt_round_id)
-        for tried_prompt_id in tried_prompt_ids:
-            QFQueueService.add_prompt_round_to_queue(tried_prompt_id)
-
-        logger.error(
-            f"Could not find valid prompt for player {player.player_id} after {max_attempts} attempts. "
-            f"{QFQueueService.get_prompt_rounds_waiting()=}, tried {len(tried_prompt_ids)} unique prompts, {stale_count=}"
-        )
-        raise NoPromptsAvailableError(
-            "Could not find a valid prompt after multiple attempts"
+        logger.info(
+            f"No eligible prompt for player {player.player_id}: "
+            f"{index.size} waiting, {QFQueueService.get_prompt_rounds_waiting()} queued"
         )
+        raise NoPromptsAvailableError("No prompts available")
 
     async def _get_specific_prompt_round_for_copy(
         self,
@@ -576,36 +523,15 @@ class QFRoundService:
 
         return prompt_round
 
-    async def _should_skip_prompt_round(self, player: QFPlayer, prompt_round: Round) -> tuple[bool, bool]:
-        """Return whether a prompt should be skipped/requeued for copy selection."""
-
-        # Skip prompts already copied twice or otherwise ineligible.
-        if prompt_round.status != "submitted":
-            return True, False
-
-        if prompt_round.player_id == player.player_id:
-            return True, False
-
-        # Enforce abandoned-prompt cooldown.
-        if await self._player_abandoned_prompt_recently(player.player_id, prompt_round.round_id):
-            return True, False
-
-        return False, False
-
-    async def _player_abandoned_prompt_recently(self, player_id: UUID, prompt_round_id: UUID) -> bool:
-        """Check whether player abandoned this prompt within the configured cooldown."""
-
-        result = await self.db.execute(
-            select(PlayerAbandonedPrompt.id)
+    async def _recent_abandonment_at(self, player_id: UUID, prompt_round_id: UUID) -> datetime | None:
+        """When the player abandoned this prompt within the cooldown, if they did."""
+        cutoff = datetime.now(UTC) - timedelta(hours=self.settings.abandoned_prompt_cooldown_hours)
+        return await self.db.scalar(
+            select(func.max(PlayerAbandonedPrompt.abandoned_at))
             .where(PlayerAbandonedPrompt.player_id == player_id)
             .where(PlayerAbandonedPrompt.prompt_round_id == prompt_round_id)
-            .where(
-                PlayerAbandonedPrompt.abandoned_at
-                >= datetime.now(UTC) - timedelta(hours=self.settings.abandoned_prompt_cooldown_hours)
-            )
-            .limit(1)
+            .where(PlayerAbandonedPrompt.abandoned_at > cutoff)
         )
-        return result.scalar_one_or_none() is not None
 
     async def _lock_prompt_round_for_update(self, prompt_round_id: UUID) -> Round | None:
         """Reload a prompt round; SQLite constraints arbitrate the claim."""
@@ -617,22 +543,6 @@ class QFRoundService:
         )
         return result.scalar_one_or_none()
 
-    async def _prefetch_prompt_rounds(
-        self,
-        prompt_round_ids: list[UUID],
-        prefetched_rounds: dict[UUID, Round],
-    ) -> None:
-        """Bulk-load prompt rounds into the local cache used by copy assignment."""
-
-        if not prompt_round_ids:
-            return
-
-        result = await self.db.execute(
-            select(Round).where(Round.round_id.in_(prompt_round_ids))
-        )
-        for round_object in result.scalars().all():
-            prefetched_rounds[round_object.round_id] = round_object
-
     async def _lock_round_for_update(self, round_id: UUID) -> Round | None:
         """Reload a versioned round before applying a state transition."""
 
@@ -741,7 +651,7 @@ class QFRoundService:
                 )
 
                 if prompt_round.copy2_player_id is None:
-                    QFQueueService.add_prompt_round_to_queue(prompt_round.round_id)
+                    QFQueueService.add_prompt_round_to_queue(prompt_round.round_id, prompt_round.player_id)
 
         phraseset = None
         copy_player_id = player.player_id
@@ -753,8 +663,14 @@ class QFRoundService:
                     prompt_round.round_id, phraseset.phraseset_id
                 )
 
+        from backend.services.qf.quest_service import QuestService
+        await QuestService(self.db).record_events([CopySubmitted(player.player_id)])
+
         await self.db.commit()
 
+        if round_object.prompt_round_id:
+            get_copy_assignment_index().note_copy_submitted(round_object.prompt_round_id, copy_player_id)
+
         if phraseset and prompt_round:
             try:
                 from backend.services.qf.notification_service import NotificationService
@@ -914,6 +830,7 @@ class QFRoundService:
         await self.db.refresh(round_object)
 
         if prompt_round_id:
+            get_copy_assignment_index().note_abandoned(prompt_round_id, player.player_id)
             QFQueueService.add_prompt_round_to_queue(prompt_round_id)
 
         from backend.utils.cache import dashboard_cache
@@ -988,6 +905,8 @@ class QFRoundService:
         await self.db.flush()
         await self.db.commit()
         await self.db.refresh(flag)
+        get_copy_assignment_index().discard([prompt_round.round_id])
+        get_pregeneration_pool().cancel(prompt_round.round_id)
 
         from backend.utils.cache import dashboard_cache
 
@@ -1042,6 +961,9 @@ class QFRoundService:
         await self.db.flush()
 
         QFQueueService.add_phraseset_to_queue(phraseset.phraseset_id)
+        get_copy_assignment_index().discard([prompt_round.round_id])
+        # Both copy slots are filled; speculative hint/backup generation is no longer needed
+        get_pregeneration_pool().cancel(prompt_round.round_id)
 
         return phraseset
 
@@ -1081,6 +1003,7 @@ class QFRoundService:
         elif round_object.round_type == "copy":
             await RoundTimeoutHelper.handle_copy_timeout(
                 self.db, round_object, self.settings, transaction_service, QFQueueService)
+            get_copy_assignment_index().note_abandoned(round_object.prompt_round_id, round_object.player_id)
 
         elif round_object.round_type == "vote":
             await RoundTimeoutHelper.handle_vote_timeout(round_object, self.settings, transaction_service)
@@ -1099,8 +1022,8 @@ class QFRoundService:
         """
         Get count of prompts available for copy rounds, excluding player's own prompts.
 
-        Optimized version that uses a single efficient query instead of multiple
-        complex subqueries to reduce database load.
+        Answered from the in-memory copy assignment index (reconciled with the
+        database periodically) instead of an anti-join query per dashboard poll.
 
         Excludes:
         - Player's own prompts
@@ -1108,30 +1031,21 @@ class QFRoundService:
         - Flagged prompts
         - Prompts the player abandoned in the last 24 hours (cooldown)
         """
-        now = datetime.now(UTC)
-
         cached = self._available_prompts_cache.get(player_id)
-        if cached:
-            value, expires_at = cached
-            if now < expires_at:
-                return value
+        if cached is not None:
+            return cached
 
-        cutoff_time = now - timedelta(hours=self.settings.abandoned_prompt_cooldown_hours)
-
-        result = await self.db.execute(
-            PromptQueryBuilder.build_available_prompts_count_query(),
-            {"player_id_clean": str(player_id).replace('-', '').lower(), "cutoff_time": cutoff_time})
-
-        available_count = result.scalar() or 0
-        self._available_prompts_cache[player_id] = (
-            available_count,
-            now + timedelta(seconds=self.AVAILABLE_PROMPTS_CACHE_TTL_SECONDS),
-        )
+        index = get_copy_assignment_index()
+        stale_ids = await index.ensure_fresh(self.db)
+        if stale_ids:
+            QFQueueService.remove_prompt_rounds_from_queue(stale_ids)
 
+        available_count = index.count_eligible(player_id)
+        self._available_prompts_cache[player_id] = available_count
         return available_count
 
     def invalidate_available_prompts_cache(self, player_id: UUID | None = None) -> None:
-        """Invalidate cached available prompt counts."""
+        """Invalidate request-scoped available prompt counts."""
         if player_id:
             self._available_prompts_cache.pop(player_id, None)
         else:
@@ -1149,11 +1063,6 @@ class QFRoundService:
 
         return await self._rehydrate_prompt_queue() > 0
 
-    async def _pop_prompt_batch(self, count: int) -> list[UUID]:
-        """Pop up to ``count`` prompt IDs from the queue."""
-
-        return QFQueueService.get_next_prompt_round_batch(count)
-
     async def _rehydrate_prompt_queue(self) -> int:
         """
         Rebuild the prompt queue from submitted prompt rounds waiting on copies.
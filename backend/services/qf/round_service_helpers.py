@@ -1,13 +1,11 @@
 from uuid import UUID
 import logging
-from sqlalchemy import select, func, text, or_, union, bindparam
-from sqlalchemy.types import DateTime, String
+from sqlalchemy import select, func, or_, union
 from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, UTC, timedelta
 
 from backend.models.qf.round import Round
-from backend.models.qf.prompt import Prompt
 from backend.models.qf.phraseset import Phraseset
 from backend.models.qf.player_abandoned_prompt import PlayerAbandonedPrompt
 from backend.models.qf.player import QFPlayer
@@ -19,8 +17,8 @@ class PromptQueryBuilder:
     """Helper class for building complex prompt-related queries."""
     
     @staticmethod
-    def build_unseen_prompts_query(player_id: UUID) -> select:
-        """Build query to find prompts the player hasn't seen yet."""
+    def build_seen_prompt_ids_query(player_id: UUID) -> select:
+        """Build query for prompt ids the player has seen via prompt, copy, or vote rounds."""
         copy_round_alias = aliased(Round)
         copy_prompt_round_alias = aliased(Round)
         vote_round_alias = aliased(Round)
@@ -61,71 +59,7 @@ class PromptQueryBuilder:
             .where(vote_prompt_round_alias.prompt_id.is_not(None))
         )
 
-        seen_prompts_subquery = (
-            union(
-                prompt_round_seen,
-                copy_round_seen,
-                vote_round_seen,
-            ).subquery()
-        )
-
-        base_stmt = select(Prompt).where(Prompt.enabled == True)
-
-        # Return a batch of unseen prompts for random selection in Python
-        # This is MUCH faster than ORDER BY random() in the database
-        return (
-            base_stmt.outerjoin(
-                seen_prompts_subquery,
-                seen_prompts_subquery.c.prompt_id == Prompt.prompt_id,
-            )
-            .where(seen_prompts_subquery.c.prompt_id.is_(None))
-            .order_by(Prompt.prompt_id)  # Deterministic ordering for consistent query plans
-            .limit(20)  # Fetch batch for random selection
-        )
-
-    @staticmethod
-    def build_available_prompts_count_query() -> text:
-        """Build optimized query for counting available prompts for a player."""
-        query = text("""
-                WITH player_prompt_rounds AS (
-                    SELECT r.round_id
-                    FROM qf_rounds r
-                    WHERE LOWER(REPLACE(CAST(r.player_id AS TEXT), '-', '')) = :player_id_clean
-                    AND r.round_type = 'prompt'
-                    AND r.status = 'submitted'
-                ),
-                player_copy_rounds AS (
-                    SELECT r.prompt_round_id
-                    FROM qf_rounds r
-                    WHERE LOWER(REPLACE(CAST(r.player_id AS TEXT), '-', '')) = :player_id_clean
-                    AND r.round_type = 'copy'
-                    AND r.status = 'submitted'
-                ),
-                player_abandoned_cooldown AS (
-                    SELECT pap.prompt_round_id
-                    FROM qf_player_abandoned_prompts pap
-                    WHERE LOWER(REPLACE(CAST(pap.player_id AS TEXT), '-', '')) = :player_id_clean
-                    AND pap.abandoned_at > :cutoff_time
-                ),
-                all_available_prompts AS (
-                    SELECT r.round_id
-                    FROM qf_rounds r
-                    LEFT JOIN qf_phrasesets p ON p.prompt_round_id = r.round_id
-                    WHERE r.round_type = 'prompt'
-                    AND r.status = 'submitted'
-                    AND (r.phraseset_status IS NULL OR r.phraseset_status NOT IN ('flagged_pending','flagged_removed'))
-                    AND p.phraseset_id IS NULL
-                )
-                SELECT COUNT(*) as available_count
-                FROM all_available_prompts a
-                WHERE NOT EXISTS (SELECT 1 FROM player_prompt_rounds ppr WHERE ppr.round_id = a.round_id)
-                AND NOT EXISTS (SELECT 1 FROM player_copy_rounds pcr WHERE pcr.prompt_round_id = a.round_id)
-                AND NOT EXISTS (SELECT 1 FROM player_abandoned_cooldown pac WHERE pac.prompt_round_id = a.round_id)
-            """)
-        return query.bindparams(
-            bindparam("player_id_clean", type_=String),
-            bindparam("cutoff_time", type_=DateTime(timezone=True)),
-        )
+        return union(prompt_round_seen, copy_round_seen, vote_round_seen)
 
     @staticmethod
     def build_queue_rehydration_query() -> select:
@@ -434,6 +368,10 @@ async def generate_ai_hints_background(prompt_round_id: UUID) -> None:
                 logger.warning(f"{prompt_round_id=} not found for background AI hint generation")
                 return
 
+            if prompt_round.status != "submitted" or prompt_round.copy2_player_id is not None:
+                logger.debug(f"Skipping AI hint generation for {prompt_round_id=}; copies no longer needed")
+                return
+
             await ai_service.generate_and_cache_impostor_phrases(prompt_round)
             await background_db.commit()
         except AICopyError as exc:
@@ -25,6 +25,7 @@ from backend.models.qf.vote import Vote
 from backend.models.qf.round import Round
 from backend.services.ai.ai_service import AI_PLAYER_EMAIL_DOMAIN
 from backend.config import get_settings
+from backend.utils.shared_store import get_shared_store
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +68,28 @@ def _get_redis_client() -> "Redis | None":
     return _redis_client
 
 
+async def _cache_get(cache_key: str) -> str | None:
+    """Read a leaderboard cache value from Redis, else from the shared host store."""
+    client = _get_redis_client()
+    if client is not None:
+        return await client.get(cache_key)
+    store = get_shared_store()
+    if store is not None:
+        return await asyncio.to_thread(store.get, cache_key)
+    return None
+
+
+async def _cache_set(cache_key: str, value: str, expiration_seconds: int) -> None:
+    """Write a leaderboard cache value to Redis, else to the shared host store."""
+    client = _get_redis_client()
+    if client is not None:
+        await client.set(cache_key, value, ex=expiration_seconds)
+        return
+    store = get_shared_store()
+    if store is not None:
+        await asyncio.to_thread(store.set, cache_key, value, expiration_seconds)
+
+
 def _normalize_cached_entries(entries: list[dict[str, Any]], entry_type: str) -> list[dict[str, Any]]:
     """Normalize cached leaderboard entries by converting player_id strings to UUIDs.
 
@@ -93,18 +116,14 @@ def _normalize_cached_entries(entries: list[dict[str, Any]], entry_type: str) ->
 
 
 async def _load_cached_leaderboard(cache_key: str, cache_type: str) -> tuple[dict[str, list[dict[str, Any]]], datetime] | None:
-    """Fetch cached role-based leaderboard data from Redis, if available.
+    """Fetch cached role-based leaderboard data from the shared cache, if available.
 
     Args:
-        cache_key: The Redis cache key to fetch from
+        cache_key: The cache key to fetch from
         cache_type: Type description for logging (e.g., "weekly", "all-time")
     """
-    client = _get_redis_client()
-    if client is None:
-        return None
-
     try:
-        raw_value = await client.get(cache_key)
+        raw_value = await _cache_get(cache_key)
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.error(f"Failed to read {cache_type} leaderboard cache: {exc}")
         return None
@@ -144,17 +163,16 @@ async def _store_leaderboard_cache(
     cache_type: str,
     expiration_seconds: int,
 ) -> None:
-    """Persist role-based leaderboard results to Redis for reuse across workers.
+    """Persist role-based leaderboard results to the shared cache for reuse across workers.
 
     Args:
         role_leaderboards: Dictionary of role names to leaderboard entries (includes 'gross_earnings')
         generated_at: Timestamp when the leaderboard was generated
-        cache_key: The Redis cache key to store to
+        cache_key: The cache key to store to
         cache_type: Type description for logging (e.g., "weekly", "all-time")
         expiration_seconds: Cache TTL in seconds
     """
-    client = _get_redis_client()
-    if client is None:
+    if _get_redis_client() is None and get_shared_store() is None:
         return
 
     payload: dict[str, Any] = {
@@ -181,7 +199,7 @@ async def _store_leaderboard_cache(
             payload[payload_key] = cache_entries
 
     try:
-        await client.set(cache_key, json.dumps(payload), ex=expiration_seconds)
+        await _cache_set(cache_key, json.dumps(payload), expiration_seconds)
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.error(f"Failed to write {cache_type} leaderboard cache: {exc}")
 
@@ -30,19 +30,25 @@ from backend.models.qf.result_view import QFResultView
 from backend.services.transaction_service import TransactionService
 from backend.services.qf.phraseset_activity_service import ActivityService
 from backend.services.qf.helpers import upsert_result_view
+from backend.services.qf.practice_sampler import get_practice_sampler
+from backend.services.qf.quest_events import PhrasesetFinalized, VoteSubmitted
+from backend.services.qf.prompt_catalogue import get_prompt_catalogue
 from backend.config import get_settings
 from backend.utils.model_registry import GameType
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Phraseset statuses in which votes are still accepted
+ACCEPTING_VOTE_STATUSES = ("open", "active", "closing")
+
 
 class QFVoteService:
     """Service for managing voting."""
 
     _finalization_lock: asyncio.Lock | None = None
     _last_finalization_check: float = 0.0
-    _ACCEPTING_VOTE_STATUSES = ("open", "active", "closing")
+    _ACCEPTING_VOTE_STATUSES = ACCEPTING_VOTE_STATUSES
     _OPEN_VOTE_STATUSES = ("open", "active")
 
     def __init__(self, db: AsyncSession):
@@ -477,11 +483,13 @@ class QFVoteService:
         self,
         player: QFPlayer,
         transaction_service: TransactionService,
+        phraseset_id: UUID | None = None,
     ) -> tuple[Round, Phraseset]:
         """
         Start a vote round.
 
-        - Get available phraseset (with priority)
+        - Get available phraseset (with priority), or use ``phraseset_id`` when the
+          caller already chose one (party mode)
         - Deduct $1 immediately
         - Create round with 60s timer
         - Return round and phraseset with randomized word order
@@ -490,7 +498,12 @@ class QFVoteService:
         """
         player_id = player.player_id
         # Database constraints revalidate the selected candidate at write time.
-        phraseset = await self.get_available_phrasesets_for_player(player_id)
+        if phraseset_id is not None:
+            phraseset = await self.db.get(Phraseset, phraseset_id)
+            if not phraseset or phraseset.status not in self._ACCEPTING_VOTE_STATUSES:
+                raise NoPhrasesetsAvailableError("Quip is no longer accepting votes")
+        else:
+            phraseset = await self.get_available_phrasesets_for_player(player_id)
         if not phraseset:
             raise NoPhrasesetsAvailableError("No quips available for voting")
 
@@ -539,6 +552,8 @@ class QFVoteService:
                 raise AlreadyInRoundError("active_round_exists") from exc
             raise
 
+        get_prompt_catalogue().mark_seen(player_id, prompt_text=phraseset.prompt_text)
+
         # Invalidate dashboard cache to ensure fresh data
         from backend.utils.cache import dashboard_cache
         dashboard_cache.invalidate_player_data(player.player_id)
@@ -822,6 +837,10 @@ class QFVoteService:
         # Note: This may trigger _finalize_phraseset which also defers commits
         await self.check_and_finalize(phraseset, transaction_service, auto_commit=False)
 
+        # Quest progress is evaluated in memory and written by the commit below
+        from backend.services.qf.quest_service import QuestService
+        await QuestService(self.db).record_events([VoteSubmitted(player.player_id, correct=correct)])
+
         # Single atomic commit for all operations
         await self.db.commit()
         await self.db.refresh(vote)
@@ -837,19 +856,6 @@ class QFVoteService:
         except Exception as e:
             logger.error(f"Failed to send vote notification: {e}", exc_info=True)
 
-        # Track quest progress for votes (runs after commit)
-        from backend.services.qf.quest_service import QuestService
-        quest_service = QuestService(self.db)
-        try:
-            # Update vote streak quest
-            await quest_service.check_and_update_vote_streak(player.player_id, correct)
-            # Check milestone vote quest
-            await quest_service.check_milestone_votes(player.player_id)
-            # Check balanced player quest
-            await quest_service.check_balanced_player(player.player_id)
-        except Exception as e:
-            logger.error(f"Failed to update quest progress for vote: {e}", exc_info=True)
-
         # Invalidate dashboard cache to ensure fresh data
         from backend.utils.cache import dashboard_cache
         dashboard_cache.invalidate_player_data(player.player_id)
@@ -1001,11 +1007,14 @@ class QFVoteService:
 
         # Fetch all rounds in a single query
         round_cost_map = {}
+        round_player_map = {}
         if valid_round_ids:
             result = await self.db.execute(
-                select(Round.round_id, Round.cost).where(Round.round_id.in_(valid_round_ids))
+                select(Round.round_id, Round.cost, Round.player_id).where(Round.round_id.in_(valid_round_ids))
             )
-            round_cost_map = {round_id: cost for round_id, cost in result.all()}
+            for round_id, cost, player_id in result.all():
+                round_cost_map[round_id] = cost
+                round_player_map[round_id] = player_id
 
         # Map costs to roles
         round_costs = {
@@ -1016,31 +1025,45 @@ class QFVoteService:
 
         # Create prize transactions for each contributor
         # Split payout: 70% of net to wallet, 30% to vault
-        for role in ["original", "copy1", "copy2"]:
+        paid_roles = [
+            role for role in ["original", "copy1", "copy2"]
+            if payouts[role]["player_id"] is not None and payouts[role]["payout"] > 0
+        ]
+        existing_players = set()
+        if paid_roles:
+            # Verify players exist before creating transactions
+            result = await self.db.execute(
+                select(QFPlayer.player_id).where(
+                    QFPlayer.player_id.in_([payouts[role]["player_id"] for role in paid_roles])
+                )
+            )
+            existing_players = {player_id.hex for player_id in result.scalars()}
+
+        prize_movements = []
+        for role in paid_roles:
             payout_info = payouts[role]
-            if payout_info["player_id"] is not None and payout_info["payout"] > 0:
-                # Verify player exists before creating transaction
-                player_exists = await self.db.get(QFPlayer, payout_info["player_id"])
-                if not player_exists:
-                    logger.warning(
-                        f"Skipping prize payout for {role}: player {payout_info['player_id']} not found. "
-                        f"This suggests orphaned data in rounds table."
-                    )
-                    continue
+            if UUID(str(payout_info["player_id"])).hex not in existing_players:
+                logger.warning(
+                    f"Skipping prize payout for {role}: player {payout_info['player_id']} not found. "
+                    f"This suggests orphaned data in rounds table."
+                )
+                continue
 
-                # Use split payout to handle wallet/vault distribution
-                await transaction_service.create_split_payout(
+            prize_movements.extend(
+                transaction_service.split_payout_movements(
                     player_id=payout_info["player_id"],
                     gross_amount=payout_info["payout"],
                     cost=round_costs.get(role, 0),
                     trans_type="prize_payout",
                     reference_id=phraseset.phraseset_id,
-                    auto_commit=False,  # Defer commit to caller
-                    skip_lock=False,
                     idempotency_prefix=(
                         f"qf:prize:{phraseset.phraseset_id}:{role}"
                     ),
                 )
+            )
+        if prize_movements:
+            # All contributors' wallet and vault legs in one statement pair (commit deferred to caller)
+            await transaction_service.apply_movements(prize_movements)
 
         refunded_vote_rounds = await self._refund_active_vote_rounds(phraseset, transaction_service)
 
@@ -1054,6 +1077,8 @@ class QFVoteService:
         if prompt_round:
             prompt_round.phraseset_status = "finalized"
 
+        get_practice_sampler().record_finalized(phraseset.phraseset_id)
+
         await self.activity_service.record_activity(
             activity_type="finalized",
             phraseset_id=phraseset.phraseset_id,
@@ -1065,29 +1090,24 @@ class QFVoteService:
             },
         )
 
+        # Quest awards for the contributors are written with the finalization
+        from backend.services.qf.quest_service import QuestService
+        await QuestService(self.db).record_events([
+            PhrasesetFinalized(
+                round_player_map.get(phraseset.prompt_round_id),
+                phraseset_id=phraseset.phraseset_id,
+                vote_count=phraseset.vote_count,
+                original_phrase=phraseset.original_phrase,
+                copy1_player_id=round_player_map.get(phraseset.copy_round_1_id),
+                copy_phrase_1=phraseset.copy_phrase_1,
+                copy2_player_id=round_player_map.get(phraseset.copy_round_2_id),
+                copy_phrase_2=phraseset.copy_phrase_2,
+            )
+        ])
+
         if auto_commit:
             await self.db.commit()
 
-        # Check quest progress for finalized phraseset
-        # Note: Quest checks run after commit to avoid blocking the transaction
-        from backend.services.qf.quest_service import QuestService
-        quest_service = QuestService(self.db)
-        try:
-            # Check deceptive copy and obvious original quests
-            await quest_service.check_deceptive_copy(phraseset.phraseset_id)
-            await quest_service.check_obvious_original(phraseset.phraseset_id)
-
-            # Check if any player's phraseset reached 20 votes milestone
-            if phraseset.vote_count >= 20:
-                # Check for all contributors
-                for player_id in [phraseset.original_player_id, phraseset.copy1_player_id, phraseset.copy2_player_id]:
-                    if player_id:
-                        await quest_service.check_milestone_phraseset_20votes(
-                            player_id, phraseset.phraseset_id, phraseset.vote_count
-                        )
-        except Exception as e:
-            logger.error(f"Failed to update quest progress for finalized phraseset: {e}", exc_info=True)
-
         try:
             await scoring_service.refresh_weekly_leaderboard()
         except Exception:  # pragma: no cover - defensive logging only
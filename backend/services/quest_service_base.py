@@ -2,8 +2,9 @@
 
 import logging
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime, UTC
-from typing import List, Optional, Dict, Any, Type
+from typing import List, Optional, Dict, Any, Iterable, Tuple, Type
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,6 +24,18 @@ class QuestServiceError(RuntimeError):
     """Base exception for quest service errors."""
 
 
+@dataclass(frozen=True)
+class QuestEvent:
+    """A gameplay event that may advance one player's quests."""
+
+    player_id: UUID
+
+    @property
+    def player_ids(self) -> Tuple[UUID, ...]:
+        """Players whose active quests the event can touch."""
+        return (self.player_id,)
+
+
 class QuestServiceBase(ABC):
     """Base service for managing player quests and achievements."""
 
@@ -33,6 +46,8 @@ class QuestServiceBase(ABC):
             db: Database session
         """
         self.db = db
+        # player_id -> quest_type -> active quest, filled by _load_active_quests
+        self._active_quests: Dict[UUID, Dict[str, QuestBase]] = {}
 
     @property
     @abstractmethod
@@ -336,90 +351,137 @@ class QuestServiceBase(ABC):
         """Get initial progress structure for a quest type."""
         pass
 
-    # Common incremental progress tracking methods
-    async def increment_progress_counter(self, player_id: UUID, quest_types: List[Any], increment: int = 1) -> None:
-        """Increment progress counters for milestone-style quests."""
-        if not quest_types:
-            return
+    # Event-driven progress tracking
+    async def record_events(self, events: Iterable[QuestEvent], *, auto_commit: bool = False) -> None:
+        """Apply gameplay events to the affected players' active quests.
 
-        quest_type_values = [qt.value for qt in quest_types]
-        
-        # Get active quests of the specified types
-        quests_result = await self.db.execute(
-            select(self.quest_model).where(
-                and_(
-                    self.quest_model.player_id == player_id,
-                    self.quest_model.status == QuestStatus.ACTIVE.value,
-                    self.quest_model.quest_type.in_(quest_type_values)
-                )
-            )
-        )
-        quests = list(quests_result.scalars().all())
-
-        for quest in quests:
-            quest_type = self._string_to_quest_type(quest.quest_type)
-            config = self.quest_configs.get(quest_type)
-            if not config:
-                continue
+        Active quests for every player touched by ``events`` are loaded with one
+        query (and cached on this service instance), then each event is
+        evaluated in memory. The resulting writes are flushed inside a SAVEPOINT
+        of the caller's transaction, so they commit together with the game
+        action; pass ``auto_commit=True`` when there is no surrounding transaction.
 
-            progress = quest.progress
-            current = progress.get("current", 0)
-            progress["current"] = current + increment
-
-            if progress["current"] >= config["target"]:
-                quest.status = QuestStatus.COMPLETED.value
-                quest.completed_at = datetime.now(UTC)
-                logger.info(f"Quest {quest.quest_type} completed for {self.game_type.value} {player_id=}")
+        Quest tracking never fails the game action: a failing quest statement
+        only rolls back the savepoint, and the error is logged.
+        """
+        events = list(events)
+        if not events:
+            return
 
-            quest.progress = progress
-            self.db.add(quest)
+        # Pending game writes are flushed outside the savepoint so their errors reach the caller
+        await self.db.flush()
+        try:
+            async with self.db.begin_nested():
+                await self._load_active_quests({player_id for event in events for player_id in event.player_ids})
+                for event in events:
+                    await self._apply_event(event)
+                await self.db.flush()
+        except Exception:
+            # The savepoint rollback expired the quest rows; reload them on next use
+            self._active_quests.clear()
+            logger.exception(f"Failed to record {len(events)} {self.game_type.value} quest event(s)")
 
-        if quests:
+        if auto_commit:
             await self.db.commit()
 
-    async def update_streak_quest(self, player_id: UUID, quest_types: List[Any], streak_broken: bool = False) -> None:
-        """Update streak-based quests."""
-        if not quest_types:
+    @abstractmethod
+    async def _apply_event(self, event: QuestEvent) -> None:
+        """Advance the cached active quests affected by a single event."""
+        pass
+
+    async def _load_active_quests(self, player_ids: Iterable[UUID]) -> None:
+        """Cache the active quests of players not loaded yet, in a single query."""
+        missing = [player_id for player_id in player_ids if player_id not in self._active_quests]
+        if not missing:
             return
 
-        quest_type_values = [qt.value for qt in quest_types]
-        
+        for player_id in missing:
+            self._active_quests[player_id] = {}
         result = await self.db.execute(
             select(self.quest_model).where(
                 and_(
-                    self.quest_model.player_id == player_id,
+                    self.quest_model.player_id.in_(missing),
                     self.quest_model.status == QuestStatus.ACTIVE.value,
-                    self.quest_model.quest_type.in_(quest_type_values)
                 )
             )
         )
-        quests = list(result.scalars().all())
+        for quest in result.scalars().all():
+            self._active_quests[quest.player_id][quest.quest_type] = quest
+
+    def _active_quest(self, player_id: UUID, quest_type: Any) -> Optional[QuestBase]:
+        """Return a cached active quest (``_load_active_quests`` must have run)."""
+        return self._active_quests.get(player_id, {}).get(quest_type.value)
+
+    async def _get_or_create_active_quest(self, player_id: UUID, quest_type: Any) -> Optional[QuestBase]:
+        """Return the active quest of a type, creating it when the player never had one."""
+        quest = self._active_quest(player_id, quest_type)
+        if quest is not None:
+            return quest
+
+        quest = await self._create_quest(player_id, quest_type)
+        if quest.status != QuestStatus.ACTIVE.value:
+            return None
+        self._active_quests.setdefault(player_id, {})[quest.quest_type] = quest
+        return quest
 
-        for quest in quests:
-            quest_type = self._string_to_quest_type(quest.quest_type)
+    def _complete_quest(self, quest: QuestBase, now: Optional[datetime] = None) -> None:
+        """Mark a quest completed and drop it from the active cache."""
+        quest.status = QuestStatus.COMPLETED.value
+        quest.completed_at = now or datetime.now(UTC)
+        self._active_quests.get(quest.player_id, {}).pop(quest.quest_type, None)
+        logger.info(f"Quest {quest.quest_type} completed for {self.game_type.value} player_id={quest.player_id}")
+
+    def _advance_counters(self, player_id: UUID, quest_types: List[Any], increment: int = 1) -> None:
+        """Increment cached milestone-style counters."""
+        for quest_type in quest_types:
+            quest = self._active_quest(player_id, quest_type)
             config = self.quest_configs.get(quest_type)
-            if not config:
+            if quest is None or not config:
                 continue
 
-            progress = quest.progress
+            quest.progress["current"] = quest.progress.get("current", 0) + increment
+            if quest.progress["current"] >= config["target"]:
+                self._complete_quest(quest)
+
+    def _advance_streaks(self, player_id: UUID, quest_types: List[Any], streak_broken: bool = False) -> None:
+        """Extend or reset cached streak quests."""
+        for quest_type in quest_types:
+            quest = self._active_quest(player_id, quest_type)
+            config = self.quest_configs.get(quest_type)
+            if quest is None or not config:
+                continue
 
+            progress = quest.progress
             if streak_broken:
                 progress["current_streak"] = 0
-            else:
-                progress["current_streak"] = progress.get("current_streak", 0) + 1
-                progress["highest_streak"] = max(
-                    progress.get("highest_streak", 0),
-                    progress["current_streak"]
-                )
+                continue
+
+            progress["current_streak"] = progress.get("current_streak", 0) + 1
+            progress["highest_streak"] = max(progress.get("highest_streak", 0), progress["current_streak"])
+            if progress["current_streak"] >= config["target"]:
+                self._complete_quest(quest)
+
+    # Common incremental progress tracking methods
+    async def increment_progress_counter(
+        self, player_id: UUID, quest_types: List[Any], increment: int = 1, *, auto_commit: bool = True
+    ) -> None:
+        """Increment progress counters for milestone-style quests."""
+        if not quest_types:
+            return
 
-                # Check if quest completed
-                if progress["current_streak"] >= config["target"]:
-                    quest.status = QuestStatus.COMPLETED.value
-                    quest.completed_at = datetime.now(UTC)
-                    logger.info(f"Quest {quest.quest_type} completed for {self.game_type.value} {player_id=}")
+        await self._load_active_quests([player_id])
+        self._advance_counters(player_id, quest_types, increment)
+        if auto_commit:
+            await self.db.commit()
 
-            quest.progress = progress
-            self.db.add(quest)
+    async def update_streak_quest(
+        self, player_id: UUID, quest_types: List[Any], streak_broken: bool = False, *, auto_commit: bool = True
+    ) -> None:
+        """Update streak-based quests."""
+        if not quest_types:
+            return
 
-        if quests:
+        await self._load_active_quests([player_id])
+        self._advance_streaks(player_id, quest_types, streak_broken)
+        if auto_commit:
             await self.db.commit()
@@ -0,0 +1,158 @@
+"""In-process cache of refresh-token sessions.
+
+Maps hot refresh-token hashes to their owner and state (bounded LRU), so a
+refresh storm after a deploy or a mobile wake does not re-read
+``refresh_tokens`` for every request. Revocations made by this process are
+recorded here immediately; rotation itself is still decided by one conditional
+UPDATE in the database, so a token revoked by another worker can never be
+rotated again.
+
+When a token is rotated, the replacement is remembered for
+``refresh_rotation_grace_seconds``: a concurrent refresh by the same client
+with the old token (e.g. two tabs waking together) receives the same
+replacement instead of being logged out.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Dict, Optional
+
+from backend.config import get_settings
+
+# Concurrent refreshes of the same token are serialized on one of these locks
+_LOCK_STRIPES = 64
+
+
+def hash_refresh_token(raw_token: str) -> str:
+    return hashlib.sha256(raw_token.encode("utf-8")).hexdigest()
+
+
+@dataclass(slots=True)
+class RotatedTo:
+    """The token that replaced a rotated one, kept for the grace window."""
+
+    raw_token: str
+    token_hash: str
+    rotated_at: float
+
+
+@dataclass(slots=True)
+class RefreshSession:
+    """Cached state of one refresh token."""
+
+    token_hash: str
+    player_id: uuid.UUID
+    expires_at: datetime
+    revoked: bool = False
+    cached_at: float = 0.0
+    rotated_to: Optional[RotatedTo] = None
+
+    def is_active(self, now: Optional[datetime] = None) -> bool:
+        expires_at = self.expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=UTC)
+        return not self.revoked and expires_at > (now or datetime.now(UTC))
+
+
+class RefreshSessionCache:
+    """Bounded LRU of refresh sessions keyed by token hash."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all cached sessions."""
+        self._sessions: OrderedDict[str, RefreshSession] = OrderedDict()
+        self._by_player: Dict[uuid.UUID, set[str]] = {}
+        self._locks = [asyncio.Lock() for _ in range(_LOCK_STRIPES)]
+
+    def lock(self, token_hash: str) -> asyncio.Lock:
+        """Lock serializing this process's refreshes of one token."""
+        return self._locks[int(token_hash[:8], 16) % _LOCK_STRIPES]
+
+    def get(self, token_hash: str) -> Optional[RefreshSession]:
+        session = self._sessions.get(token_hash)
+        if session is not None:
+            self._sessions.move_to_end(token_hash)
+        return session
+
+    def get_fresh(self, token_hash: str) -> Optional[RefreshSession]:
+        """Cached session if it is still within the cache TTL (revoked entries never go stale)."""
+        session = self.get(token_hash)
+        if session is None or session.revoked:
+            return session
+        if time.monotonic() - session.cached_at >= get_settings().refresh_session_cache_ttl_seconds:
+            return None
+        return session
+
+    def put(self, token_hash: str, player_id: uuid.UUID, expires_at: datetime, *, revoked: bool = False) -> RefreshSession:
+        session = RefreshSession(
+            token_hash=token_hash,
+            player_id=player_id,
+            expires_at=expires_at,
+            revoked=revoked,
+            cached_at=time.monotonic(),
+        )
+        self._sessions[token_hash] = session
+        self._sessions.move_to_end(token_hash)
+        self._by_player.setdefault(player_id, set()).add(token_hash)
+        self._evict()
+        return session
+
+    def note_rotation(self, old_session: RefreshSession, new_raw_token: str, new_hash: str) -> None:
+        """Record that ``old_session`` was revoked and replaced by a new token."""
+        old_session.revoked = True
+        old_session.rotated_to = RotatedTo(new_raw_token, new_hash, time.monotonic())
+        self._sessions[old_session.token_hash] = old_session
+        self._by_player.setdefault(old_session.player_id, set()).add(old_session.token_hash)
+        self._evict()
+
+    def grace_replacement(self, session: Optional[RefreshSession]) -> Optional[RotatedTo]:
+        """The replacement token if ``session`` was rotated within the grace window and it is still active."""
+        if session is None or session.rotated_to is None:
+            return None
+        rotated = session.rotated_to
+        if time.monotonic() - rotated.rotated_at >= get_settings().refresh_rotation_grace_seconds:
+            # Past the grace window: forget the replacement's raw value
+            session.rotated_to = None
+            return None
+        replacement = self._sessions.get(rotated.token_hash)
+        if replacement is None or not replacement.is_active():
+            return None
+        return rotated
+
+    def mark_revoked(self, token_hash: str) -> None:
+        session = self._sessions.get(token_hash)
+        if session is not None:
+            session.revoked = True
+            session.rotated_to = None
+
+    def revoke_player(self, player_id: uuid.UUID) -> None:
+        """Mark every cached session of a player revoked."""
+        for token_hash in self._by_player.get(player_id, ()):
+            self.mark_revoked(token_hash)
+
+    def _evict(self) -> None:
+        max_entries = get_settings().refresh_session_cache_size
+        while len(self._sessions) > max_entries:
+            token_hash, session = self._sessions.popitem(last=False)
+            hashes = self._by_player.get(session.player_id)
+            if hashes is not None:
+                hashes.discard(token_hash)
+                if not hashes:
+                    self._by_player.pop(session.player_id, None)
+
+
+# Global singleton instance
+_refresh_session_cache = RefreshSessionCache()
+
+
+def get_refresh_session_cache() -> RefreshSessionCache:
+    """Get the global RefreshSessionCache singleton."""
+    return _refresh_session_cache
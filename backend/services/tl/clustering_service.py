@@ -5,10 +5,12 @@ Manages semantic cluster assignment, maintenance, and pruning.
 import logging
 import math
 from typing import List, Tuple
+from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, text
-from backend.models.tl import TLCluster, TLAnswer
+from sqlalchemy import select, text, update
+from backend.models.tl import TLCluster, TLAnswer, TLPrompt
 from backend.services.tl.matching_service import TLMatchingService
+from backend.services.tl.prompt_sampler import get_prompt_sampler
 
 logger = logging.getLogger(__name__)
 
@@ -349,6 +351,22 @@ async def _create_cluster_raw(
         raise
 
 
+async def _store_active_answer_count(
+    db: AsyncSession, prompt_id: str, active_count: int, corpus_changed: bool = False
+) -> None:
+    """Write the exact active corpus size to the prompt and the prompt sampler."""
+    values = {"active_answer_count": active_count}
+    if corpus_changed:
+        values["corpus_version"] = TLPrompt.corpus_version + 1
+    await db.execute(
+        update(TLPrompt)
+        .where(TLPrompt.prompt_id == prompt_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    get_prompt_sampler().update_answer_count(UUID(str(prompt_id)), active_count)
+
+
 async def prune_corpus(db: AsyncSession, prompt_id: str, keep_count: int = 1000) -> Tuple[int, int]:
     """Prune inactive answers to maintain corpus cap.
 
@@ -378,6 +396,7 @@ async def prune_corpus(db: AsyncSession, prompt_id: str, keep_count: int = 1000)
 
         if len(active_answers) <= keep_count:
             logger.debug(f"✅ Corpus within cap ({len(active_answers)} <= {keep_count})")
+            await _store_active_answer_count(db, prompt_id, len(active_answers))
             return 0, len(active_answers)
 
         # Group answers by cluster to preserve diversity
@@ -428,6 +447,7 @@ async def prune_corpus(db: AsyncSession, prompt_id: str, keep_count: int = 1000)
             )
 
         await db.flush()
+        await _store_active_answer_count(db, prompt_id, len(active_answers) - removed, corpus_changed=removed > 0)
         logger.debug(f"✅ Pruned {removed} answers, remaining={len(active_answers) - removed}")
         return removed, len(active_answers) - removed
     except Exception as e:
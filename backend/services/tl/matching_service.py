@@ -5,13 +5,13 @@ Handles embedding generation, cosine similarity calculations, and answer matchin
 import logging
 import numpy as np
 from typing import List, Optional, Dict, Tuple
-from openai import AsyncOpenAI
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from backend.config import get_settings
 from backend.database import AsyncSessionLocal
 from backend.models.phrase_embedding import PhraseEmbedding
+from backend.services.ai.llm_gateway import get_llm_gateway
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +25,8 @@ class TLMatchingService:
         if not settings.openai_api_key:
             raise ValueError("OPENAI_API_KEY is required for ThinkLink")
 
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        # Shared pooled client; avoids a new connection pool per service instance
+        self.gateway = get_llm_gateway()
         self.embedding_model = settings.embedding_model
         # In-memory cache for session performance (supplements DB cache)
         self.embedding_cache: Dict[str, List[float]] = {}
@@ -97,8 +98,7 @@ class TLMatchingService:
         """Root method that contacts OpenAI for embeddings."""
         try:
             logger.info(f"📞 Generating embedding for: {text[:50]}...")
-            response = await self.client.embeddings.create(model=self.embedding_model, input=text, dimensions=1536)
-            return response.data[0].embedding
+            return await self.gateway.embed(text, model=self.embedding_model, dimensions=1536)
         except Exception as e:
             logger.error(f"❌ Failed to generate embedding: {e}")
             raise
@@ -252,6 +252,43 @@ class TLMatchingService:
             logger.error(f"❌ Failed batch cosine similarity: {e}")
             return [0.0] * len(candidate_vecs)
 
+    @staticmethod
+    def find_snapshot_matches(
+        guess_text: str,
+        guess_embedding: List[float],
+        snapshot,
+        threshold: float = 0.55
+    ) -> List[Dict]:
+        """Find matching answers in a cached ``PromptSnapshot`` (one matrix-vector product).
+
+        Args:
+            guess_text: Guess text (for logging)
+            guess_embedding: Guess embedding
+            snapshot: PromptSnapshot with a normalized embedding matrix
+            threshold: Minimum similarity threshold
+
+        Returns:
+            List of matched answers with {answer_id, text, similarity, cluster_id}
+        """
+        similarities = snapshot.similarities(guess_embedding)
+        matches = [
+            {
+                "answer_id": snapshot.answer_ids[index],
+                "text": snapshot.answer_texts[index],
+                "similarity": float(similarities[index]),
+                "cluster_id": snapshot.answer_cluster_ids[index],
+            }
+            for index in np.flatnonzero(similarities > threshold)
+        ]
+        matches.sort(key=lambda x: x["similarity"], reverse=True)
+
+        best = f"{float(similarities.max()):.4f}" if len(similarities) else "n/a"
+        logger.info(
+            f"🎯 Found {len(matches)} matches for '{guess_text[:30]}...' "
+            f"(threshold={threshold}, best={best}, snapshot_answers={snapshot.answer_count})"
+        )
+        return matches
+
     async def check_self_similarity(self, guess_text: str, prior_guesses: List[str]) -> Tuple[bool, Optional[float]]:
         """Check if guess is too similar to player's prior guesses.
 
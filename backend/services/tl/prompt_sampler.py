@@ -0,0 +1,136 @@
+"""In-memory weighted sampler for ThinkLink prompts.
+
+Prompts are weighted by their active answer corpus size (``TLPrompt.active_answer_count``,
+kept current on answer insert/delete and by corpus pruning), so fuller semantic
+spaces are preferred. The weights live in a Vose alias table: a pick is one
+random slot plus one coin flip, and the table is rebuilt lazily only after
+weights change. Weights are reloaded from the prompt table periodically to pick
+up changes made by other workers; round start never scans ``tl_answer``.
+"""
+from __future__ import annotations
+
+import logging
+import random
+import time
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.tl import TLPrompt
+
+logger = logging.getLogger(__name__)
+
+
+def build_alias_table(weights: list[float]) -> tuple[list[float], list[int]]:
+    """Build Vose alias tables (probability, alias) for non-negative weights."""
+    count = len(weights)
+    total = float(sum(weights))
+    if count == 0 or total <= 0:
+        return [], []
+
+    scaled = [weight * count / total for weight in weights]
+    probability = [0.0] * count
+    alias = list(range(count))
+    small = [index for index, value in enumerate(scaled) if value < 1.0]
+    large = [index for index, value in enumerate(scaled) if value >= 1.0]
+
+    while small and large:
+        less = small.pop()
+        more = large.pop()
+        probability[less] = scaled[less]
+        alias[less] = more
+        scaled[more] = scaled[more] + scaled[less] - 1.0
+        (small if scaled[more] < 1.0 else large).append(more)
+
+    # Leftovers are 1.0 up to floating point error
+    for index in large + small:
+        probability[index] = 1.0
+    return probability, alias
+
+
+class TLPromptSampler:
+    """Process-wide alias-method sampler over active prompts."""
+
+    def __init__(self, refresh_interval_seconds: float = 30.0):
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all in-memory state; the next call reloads from the database."""
+        self._ids: list[UUID] = []
+        self._positions: dict[UUID, int] = {}
+        self._weights: list[float] = []
+        self._probability: list[float] = []
+        self._alias: list[int] = []
+        self._dirty = False
+        self._loaded = False
+        self._last_sync = 0.0
+
+    @property
+    def size(self) -> int:
+        return len(self._ids)
+
+    @staticmethod
+    def _weight(active_answer_count: int) -> float:
+        # Empty corpuses stay selectable so they can start growing
+        return float(max(1, active_answer_count or 0))
+
+    async def _sync(self, db: AsyncSession) -> None:
+        """Reload prompt weights from the prompt table."""
+        result = await db.execute(
+            select(TLPrompt.prompt_id, TLPrompt.active_answer_count).where(TLPrompt.is_active == True)
+        )
+        rows = result.all()
+        self._ids = [prompt_id for prompt_id, _ in rows]
+        self._positions = {prompt_id: index for index, prompt_id in enumerate(self._ids)}
+        self._weights = [self._weight(count) for _, count in rows]
+        self._dirty = True
+        self._loaded = True
+        self._last_sync = time.monotonic()
+        logger.debug(f"Loaded {len(self._ids)} ThinkLink prompt weights")
+
+    async def _ensure_fresh(self, db: AsyncSession) -> None:
+        if not self._loaded or time.monotonic() - self._last_sync >= self.refresh_interval_seconds:
+            await self._sync(db)
+
+    def update_answer_count(self, prompt_id: UUID, active_answer_count: int) -> None:
+        """Record a prompt's new corpus size (rebuilds the alias table on the next pick)."""
+        index = self._positions.get(prompt_id)
+        if index is None:
+            return
+        weight = self._weight(active_answer_count)
+        if self._weights[index] != weight:
+            self._weights[index] = weight
+            self._dirty = True
+
+    def discard(self, prompt_id: UUID) -> None:
+        """Stop picking a prompt that was deactivated or deleted until the next reload."""
+        index = self._positions.get(prompt_id)
+        if index is not None and self._weights[index]:
+            self._weights[index] = 0.0
+            self._dirty = True
+
+    async def sample(self, db: AsyncSession) -> Optional[UUID]:
+        """Pick an active prompt id with probability proportional to its weight."""
+        await self._ensure_fresh(db)
+        if self._dirty:
+            self._probability, self._alias = build_alias_table(self._weights)
+            self._dirty = False
+        if not self._probability:
+            return None
+
+        index = random.randrange(len(self._probability))
+        if random.random() >= self._probability[index]:
+            index = self._alias[index]
+        return self._ids[index]
+
+
+# Global singleton instance
+_prompt_sampler = TLPromptSampler()
+
+
+def get_prompt_sampler() -> TLPromptSampler:
+    """Get the global TLPromptSampler singleton."""
+    return _prompt_sampler
@@ -3,14 +3,14 @@
 Manages prompt corpus, seeding, and selection for rounds.
 """
 import logging
-import random
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
 from sqlalchemy.orm import load_only
 
 from backend.models.tl import TLPrompt, TLAnswer
 from backend.services.tl.matching_service import TLMatchingService
+from backend.services.tl.prompt_sampler import get_prompt_sampler
 
 logger = logging.getLogger(__name__)
 
@@ -27,51 +27,82 @@ class TLPromptService:
         self.matching = matching_service or TLMatchingService()
 
     @staticmethod
-    async def get_random_active_prompt(db: AsyncSession) -> Optional[TLPrompt]:
+    async def get_random_active_prompt(db: AsyncSession, max_attempts: int = 3) -> Optional[TLPrompt]:
         """Select a random active prompt (weighted by corpus size).
 
         Prefer prompts with fuller answer corpus for better semantic space.
+        Picks come from the in-memory alias sampler over cached answer counts,
+        so only the chosen prompt row is read.
 
         Args:
             db: Database session
+            max_attempts: Picks to try when a sampled prompt was deactivated meanwhile
 
         Returns:
             TLPrompt or None if no active prompts available
         """
         try:
             logger.info("🎲 Selecting random active prompt...")
+            sampler = get_prompt_sampler()
+
+            for _ in range(max_attempts):
+                prompt_id = await sampler.sample(db)
+                if prompt_id is None:
+                    logger.warning("⚠️  No active prompts available")
+                    return None
+
+                # Use load_only to avoid loading embedding column (pgvector deserialization issue)
+                result = await db.execute(
+                    select(TLPrompt)
+                    .options(load_only(TLPrompt.prompt_id, TLPrompt.text, TLPrompt.is_active, TLPrompt.ai_seeded,
+                                       TLPrompt.created_at, TLPrompt.active_answer_count,
+                                       TLPrompt.corpus_version))
+                    .where(TLPrompt.prompt_id == prompt_id)
+                )
+                selected_prompt = result.scalars().first()
+                if selected_prompt is None or not selected_prompt.is_active:
+                    sampler.discard(prompt_id)
+                    continue
 
-            # Get all active prompts with answer counts
-            # Use load_only to avoid loading embedding column (pgvector deserialization issue)
-            result = await db.execute(
-                select(TLPrompt, func.count(TLAnswer.answer_id).label('answer_count'))
-                .options(load_only(TLPrompt.prompt_id, TLPrompt.text, TLPrompt.is_active, TLPrompt.ai_seeded,
-                                   TLPrompt.created_at))
-                .outerjoin(TLAnswer)
-                .where(TLPrompt.is_active == True)
-                .group_by(TLPrompt.prompt_id)
-            )
-            rows = result.all()
-
-            if not rows:
-                logger.warning("⚠️  No active prompts available")
-                return None
-
-            # Extract prompts and answer counts
-            prompts_with_counts = [(row[0], row[1]) for row in rows]
-
-            # Weighted selection by answer count (prefer fuller corpuses)
-            prompts = [p for p, _ in prompts_with_counts]
-            weights = [count for _, count in prompts_with_counts]
-            # Ensure weights are positive (use 1 as minimum to allow selection)
-            weights = [max(1, w) for w in weights]
-            selected_prompt = random.choices(prompts, weights=weights, k=1)[0]
-            logger.info(f"✅ Selected prompt: '{selected_prompt.text[:50]}...' (id={selected_prompt.prompt_id})")
-            return selected_prompt
+                logger.info(f"✅ Selected prompt: '{selected_prompt.text[:50]}...' (id={selected_prompt.prompt_id})")
+                return selected_prompt
+
+            logger.warning(f"⚠️  No active prompt found after {max_attempts} picks")
+            return None
         except Exception as e:
             logger.error(f"❌ Prompt selection failed: {e}")
             return None
 
+    @staticmethod
+    async def refresh_answer_counts(db: AsyncSession, prompt_ids: Iterable[str]) -> None:
+        """Recount active answers for prompts after bulk changes to their corpus.
+
+        Args:
+            db: Database session
+            prompt_ids: Prompts whose corpus changed
+        """
+        prompt_ids = list(prompt_ids)
+        if not prompt_ids:
+            return
+
+        active_count = (
+            select(func.count(TLAnswer.answer_id))
+            .where(TLAnswer.prompt_id == TLPrompt.prompt_id, TLAnswer.is_active == True)
+            .scalar_subquery()
+        )
+        await db.execute(
+            update(TLPrompt)
+            .where(TLPrompt.prompt_id.in_(prompt_ids))
+            .values(active_answer_count=active_count, corpus_version=TLPrompt.corpus_version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(
+            select(TLPrompt.prompt_id, TLPrompt.active_answer_count).where(TLPrompt.prompt_id.in_(prompt_ids))
+        )
+        sampler = get_prompt_sampler()
+        for prompt_id, count in result.all():
+            sampler.update_answer_count(prompt_id, count)
+
     async def seed_prompts_from_list(self, db: AsyncSession, prompt_texts: List[str]) -> Tuple[int, int]:
         """Seed prompts from a list of text strings.
 
@@ -14,6 +14,7 @@ from backend.services.tl.matching_service import TLMatchingService
 from backend.services.tl.clustering_service import TLClusteringService
 from backend.services.tl.scoring_service import TLScoringService
 from backend.services.tl.prompt_service import TLPromptService
+from backend.services.tl.snapshot_service import get_snapshot_store
 from backend.services.phrase_validator import get_phrase_validator
 from backend.config import get_settings
 
@@ -122,7 +123,7 @@ class TLRoundService:
         Steps:
         1. Verify player has >= entry_cost coins
         2. Select random active prompt
-        3. Build snapshot (up to 1000 active answers + clusters)
+        3. Reference the prompt's current snapshot (up to 1000 active answers + clusters)
         4. Deduct entry cost transaction
         5. Create TLRound record
 
@@ -152,28 +153,19 @@ class TLRoundService:
             if not prompt:
                 return None, None, "no_prompts_available"
 
-            # Get active answers for snapshot
-            answers = await self.prompt_svc.get_active_answers_for_prompt(db, str(prompt.prompt_id), limit=1000)
-            logger.info(f"📊 Snapshot: {len(answers)} active answers")
-
-            # Build snapshot data
-            snapshot_answer_ids = [str(a.answer_id) for a in answers]
-            snapshot_cluster_ids = list(set([str(a.cluster_id) for a in answers if a.cluster_id]))
-
-            # Calculate total snapshot weight (sum of all cluster weights)
-            total_weight = await self.scoring_svc.calculate_total_weight(
-                db,
-                snapshot_cluster_ids,
-                snapshot_answer_ids=snapshot_answer_ids,
-            )
+            # Shared snapshot for the prompt's current corpus version (built once per version)
+            snapshot = await get_snapshot_store().get_current(db, prompt)
+            logger.info(f"📊 Snapshot v{snapshot.corpus_version}: {snapshot.answer_count} active answers")
 
             # Create round
             round = TLRound(
                 player_id=player_id,
                 prompt_id=str(prompt.prompt_id),
-                snapshot_answer_ids=snapshot_answer_ids,
-                snapshot_cluster_ids=snapshot_cluster_ids,
-                snapshot_total_weight=total_weight,
+                snapshot_id=snapshot.snapshot_id,
+                snapshot_answer_ids=[],
+                snapshot_cluster_ids=[],
+                snapshot_answer_count=snapshot.answer_count,
+                snapshot_total_weight=snapshot.total_weight,
                 matched_clusters=[],
                 strikes=0,
                 status='active',
@@ -197,7 +189,9 @@ class TLRoundService:
             db.add(transaction)
             await db.flush()
 
-            logger.info(f"✅ Round started: {round.round_id} ({prompt.text[:50]=}..., {total_weight=:.2f})")
+            logger.info(
+                f"✅ Round started: {round.round_id} ({prompt.text[:50]=}..., {snapshot.total_weight=:.2f})"
+            )
             return round, prompt.text, None
 
         except Exception as e:
@@ -317,12 +311,18 @@ class TLRoundService:
                 return {}, "too_similar", similarity_note
 
             # Find matches in snapshot
-            snapshot_answers = await _build_snapshot_answers(db, round.snapshot_answer_ids)
-            matches = await self.matching_svc.find_matches(
-                guess_text,
-                guess_embedding,
-                snapshot_answers,
-            )
+            if round.snapshot_id:
+                snapshot = await get_snapshot_store().get(db, round.snapshot_id)
+                matches = self.matching_svc.find_snapshot_matches(guess_text, guess_embedding, snapshot) \
+                    if snapshot else []
+            else:
+                # Legacy round with copied snapshot ids
+                snapshot_answers = await _build_snapshot_answers(db, round.snapshot_answer_ids)
+                matches = await self.matching_svc.find_matches(
+                    guess_text,
+                    guess_embedding,
+                    snapshot_answers,
+                )
 
             # Process matches
             was_match = len(matches) > 0
@@ -15,6 +15,12 @@ from backend.config import get_settings
 logger = logging.getLogger(__name__)
 
 
+def answer_weight(answer_players_count: int | None) -> float:
+    """Scoring weight of one answer: player count capped at 20, log scaled per spec."""
+    capped_count = min(answer_players_count or 0, 20)
+    return 1.0 + math.log(1.0 + float(capped_count))
+
+
 class TLScoringService:
     """Service for ThinkLink scoring and payouts."""
 
@@ -38,6 +44,9 @@ class TLScoringService:
             Coverage percentage (0-1)
         """
         try:
+            if tl_round.snapshot_id:
+                return await self._calculate_snapshot_coverage(db, tl_round)
+
             snapshot_cluster_ids = list(set(tl_round.snapshot_cluster_ids or []))
             snapshot_answer_ids = tl_round.snapshot_answer_ids or []
 
@@ -78,6 +87,25 @@ class TLScoringService:
             logger.error(f"❌ Coverage calculation failed: {e}")
             return 0.0
 
+    @staticmethod
+    async def _calculate_snapshot_coverage(db: AsyncSession, tl_round: TLRound) -> float:
+        """Coverage against the round's shared snapshot (cluster weights are precomputed)."""
+        from backend.services.tl.snapshot_service import get_snapshot_store
+
+        snapshot = await get_snapshot_store().get(db, tl_round.snapshot_id)
+        total_weight = float(tl_round.snapshot_total_weight or 0.0) or (snapshot.total_weight if snapshot else 0.0)
+        if snapshot is None or total_weight <= 0.0:
+            logger.info("🎯 No snapshot clusters - coverage = 0%")
+            return 0.0
+
+        matched_weight = snapshot.matched_weight(tl_round.matched_clusters or [])
+        coverage = max(0.0, min(1.0, matched_weight / total_weight))
+        logger.info(
+            f"📊 Coverage: {coverage:.1%} "
+            f"(matched_weight={matched_weight:.2f} / total={total_weight:.2f})"
+        )
+        return coverage
+
     async def calculate_total_weight(
         self,
         db: AsyncSession,
@@ -186,11 +214,8 @@ class TLScoringService:
 
         cluster_weights: dict[str, float] = {}
         for cluster_id, answer_players_count in rows:
-            # Cap player count at 20, apply log scaling per spec
-            capped_count = min(answer_players_count or 0, 20)
-            answer_weight = 1.0 + math.log(1.0 + float(capped_count))
             key = str(cluster_id)
-            cluster_weights[key] = cluster_weights.get(key, 0.0) + answer_weight
+            cluster_weights[key] = cluster_weights.get(key, 0.0) + answer_weight(answer_players_count)
 
         return cluster_weights
 
@@ -247,13 +272,19 @@ class TLScoringService:
             tl_round: Completed TLRound
         """
         try:
-            if not tl_round.snapshot_answer_ids:
+            snapshot_answer_ids = tl_round.snapshot_answer_ids
+            if tl_round.snapshot_id:
+                from backend.services.tl.snapshot_service import get_snapshot_store
+
+                snapshot = await get_snapshot_store().get(db, tl_round.snapshot_id)
+                snapshot_answer_ids = list(snapshot.answer_ids) if snapshot else []
+            if not snapshot_answer_ids:
                 return
 
             # Increment shows for all snapshot answers
             await db.execute(
                 update(TLAnswer)
-                .where(TLAnswer.answer_id.in_(tl_round.snapshot_answer_ids))
+                .where(TLAnswer.answer_id.in_(snapshot_answer_ids))
                 .values(shows=TLAnswer.shows + 1)
             )
 
@@ -263,14 +294,14 @@ class TLScoringService:
                     update(TLAnswer)
                     .where(
                         TLAnswer.cluster_id.in_(tl_round.matched_clusters),
-                        TLAnswer.answer_id.in_(tl_round.snapshot_answer_ids)
+                        TLAnswer.answer_id.in_(snapshot_answer_ids)
                     )
                     .values(contributed_matches=TLAnswer.contributed_matches + 1)
                 )
 
             await db.flush()
             logger.info(
-                f"✅ Updated stats: shows +1 for {len(tl_round.snapshot_answer_ids)} answers, "
+                f"✅ Updated stats: shows +1 for {len(snapshot_answer_ids)} answers, "
                 f"contributed_matches +1 for matched answers in {len(tl_round.matched_clusters or [])} clusters"
             )
         except Exception as e:
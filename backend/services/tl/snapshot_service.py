@@ -0,0 +1,230 @@
+"""Versioned, immutable answer snapshots for ThinkLink prompts.
+
+A snapshot freezes up to ``SNAPSHOT_ANSWER_LIMIT`` active answers of a prompt
+together with their cluster weights. It is built once per prompt corpus version
+(``TLPrompt.corpus_version`` is bumped whenever answers are added, removed,
+pruned or re-clustered), stored as a ``TLSnapshot`` row, and shared by every
+round started on that version: rounds only reference ``snapshot_id``.
+
+Each worker keeps recently used snapshots in memory with the answer embeddings
+as a row-normalized matrix, so round start needs no answer scan and a guess is
+scored with one matrix-vector product.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Optional
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import String, select, type_coerce
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.tl import TLAnswer, TLPrompt, TLSnapshot
+from backend.services.tl.scoring_service import answer_weight
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_ANSWER_LIMIT = 1000
+
+
+def _embedding_array(value) -> Optional[np.ndarray]:
+    """Decode an embedding read as text (pgvector literal or JSON array), list or array."""
+    if value is None:
+        return None
+    if isinstance(value, (bytes, str)):
+        value = json.loads(value)
+    return np.asarray(value, dtype=np.float32)
+
+
+def _normalized_matrix(embeddings: list[Optional[np.ndarray]]) -> np.ndarray:
+    """Stack embeddings into unit-length rows; missing or zero vectors become zero rows."""
+    dimension = next((len(vector) for vector in embeddings if vector is not None), 0)
+    matrix = np.zeros((len(embeddings), dimension), dtype=np.float32)
+    for index, vector in enumerate(embeddings):
+        if vector is not None and len(vector) == dimension:
+            matrix[index] = vector
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True) if dimension else np.zeros((len(embeddings), 1))
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    matrix.setflags(write=False)
+    return matrix
+
+
+@dataclass(frozen=True, eq=False)
+class PromptSnapshot:
+    """In-memory, read-only view of a ``TLSnapshot`` with its embedding matrix."""
+
+    snapshot_id: UUID
+    prompt_id: UUID
+    corpus_version: int
+    answer_ids: tuple[str, ...]
+    answer_texts: tuple[str, ...]
+    answer_cluster_ids: tuple[Optional[str], ...]
+    cluster_weights: dict[str, float]
+    total_weight: float
+    # Unit-length embedding rows aligned with answer_ids
+    matrix: np.ndarray
+
+    @property
+    def answer_count(self) -> int:
+        return len(self.answer_ids)
+
+    @property
+    def cluster_ids(self) -> list[str]:
+        return list(self.cluster_weights)
+
+    def similarities(self, embedding) -> np.ndarray:
+        """Cosine similarity (clamped to [0, 1]) of every snapshot answer to ``embedding``."""
+        if not self.answer_ids or self.matrix.shape[1] == 0:
+            return np.zeros(len(self.answer_ids), dtype=np.float32)
+        query = _embedding_array(embedding)
+        norm = float(np.linalg.norm(query)) if query is not None else 0.0
+        if norm == 0.0 or len(query) != self.matrix.shape[1]:
+            return np.zeros(len(self.answer_ids), dtype=np.float32)
+        return np.clip(self.matrix @ (query / norm), 0.0, 1.0)
+
+    def matched_weight(self, cluster_ids: Iterable[str]) -> float:
+        """Total weight of the given clusters within this snapshot."""
+        return sum(self.cluster_weights.get(str(cluster_id), 0.0) for cluster_id in set(cluster_ids))
+
+
+class TLSnapshotStore:
+    """Builds, persists and caches prompt snapshots (process-wide, LRU bounded)."""
+
+    def __init__(self, max_cached: int = 256):
+        self.max_cached = max_cached
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all cached snapshots."""
+        self._snapshots: OrderedDict[UUID, PromptSnapshot] = OrderedDict()
+
+    def _remember(self, snapshot: PromptSnapshot) -> PromptSnapshot:
+        self._snapshots[snapshot.snapshot_id] = snapshot
+        self._snapshots.move_to_end(snapshot.snapshot_id)
+        while len(self._snapshots) > self.max_cached:
+            self._snapshots.popitem(last=False)
+        return snapshot
+
+    @staticmethod
+    def _answer_columns():
+        # Read embeddings as text to bypass pgvector result processing (JSON-stored legacy rows)
+        return (
+            TLAnswer.answer_id,
+            TLAnswer.text,
+            TLAnswer.cluster_id,
+            TLAnswer.answer_players_count,
+            type_coerce(TLAnswer.embedding, String).label("embedding"),
+        )
+
+    @staticmethod
+    def _materialize(row: TLSnapshot, answers: list) -> PromptSnapshot:
+        """Combine a snapshot row with its answer rows (in snapshot order)."""
+        by_id = {str(answer.answer_id): answer for answer in answers}
+        ordered = [by_id.get(str(answer_id)) for answer_id in row.answer_ids]
+        return PromptSnapshot(
+            snapshot_id=row.snapshot_id,
+            prompt_id=row.prompt_id,
+            corpus_version=row.corpus_version,
+            answer_ids=tuple(str(answer_id) for answer_id in row.answer_ids),
+            answer_texts=tuple(answer.text if answer else "" for answer in ordered),
+            answer_cluster_ids=tuple(
+                str(answer.cluster_id) if answer and answer.cluster_id else None for answer in ordered
+            ),
+            cluster_weights=dict(row.cluster_weights or {}),
+            total_weight=float(row.total_weight or 0.0),
+            matrix=_normalized_matrix([_embedding_array(answer.embedding) if answer else None for answer in ordered]),
+        )
+
+    async def _build(self, db: AsyncSession, prompt: TLPrompt, version: int) -> PromptSnapshot:
+        """Freeze the prompt's active corpus as a new snapshot row."""
+        result = await db.execute(
+            select(*self._answer_columns())
+            .where(TLAnswer.prompt_id == prompt.prompt_id, TLAnswer.is_active == True)
+            .order_by(TLAnswer.created_at, TLAnswer.answer_id)
+            .limit(SNAPSHOT_ANSWER_LIMIT)
+        )
+        answers = result.all()
+
+        cluster_weights: dict[str, float] = {}
+        for answer in answers:
+            if answer.cluster_id:
+                key = str(answer.cluster_id)
+                cluster_weights[key] = cluster_weights.get(key, 0.0) + answer_weight(answer.answer_players_count)
+
+        row = TLSnapshot(
+            prompt_id=prompt.prompt_id,
+            corpus_version=version,
+            answer_ids=[str(answer.answer_id) for answer in answers],
+            cluster_weights=cluster_weights,
+            total_weight=sum(cluster_weights.values()),
+        )
+        try:
+            async with db.begin_nested():
+                db.add(row)
+        except IntegrityError:
+            # Another worker built this version first
+            result = await db.execute(
+                select(TLSnapshot).where(
+                    TLSnapshot.prompt_id == prompt.prompt_id,
+                    TLSnapshot.corpus_version == version,
+                )
+            )
+            row = result.scalars().one()
+
+        logger.info(
+            f"📸 Built snapshot v{version} for prompt {prompt.prompt_id}: "
+            f"{len(row.answer_ids)} answers, {len(row.cluster_weights)} clusters"
+        )
+        return self._materialize(row, answers)
+
+    async def _load(self, db: AsyncSession, row: TLSnapshot) -> PromptSnapshot:
+        """Rehydrate a persisted snapshot (answers may have been pruned since)."""
+        result = await db.execute(select(*self._answer_columns()).where(TLAnswer.prompt_id == row.prompt_id))
+        return self._remember(self._materialize(row, result.all()))
+
+    async def get_current(self, db: AsyncSession, prompt: TLPrompt) -> PromptSnapshot:
+        """Return the snapshot for the prompt's current corpus version, building it if needed."""
+        version = prompt.corpus_version or 0
+        result = await db.execute(
+            select(TLSnapshot).where(
+                TLSnapshot.prompt_id == prompt.prompt_id,
+                TLSnapshot.corpus_version == version,
+            )
+        )
+        row = result.scalars().first()
+        if row is None:
+            return self._remember(await self._build(db, prompt, version))
+
+        cached = self._snapshots.get(row.snapshot_id)
+        if cached is not None:
+            self._snapshots.move_to_end(row.snapshot_id)
+            return cached
+        return await self._load(db, row)
+
+    async def get(self, db: AsyncSession, snapshot_id: UUID) -> Optional[PromptSnapshot]:
+        """Return a snapshot by id (rounds keep scoring against the version they started on)."""
+        snapshot_id = UUID(str(snapshot_id))
+        cached = self._snapshots.get(snapshot_id)
+        if cached is not None:
+            self._snapshots.move_to_end(snapshot_id)
+            return cached
+
+        row = await db.get(TLSnapshot, snapshot_id)
+        if row is None:
+            logger.warning(f"⚠️  Snapshot {snapshot_id} not found")
+            return None
+        return await self._load(db, row)
+
+
+# Global singleton instance
+_snapshot_store = TLSnapshotStore()
+
+
+def get_snapshot_store() -> TLSnapshotStore:
+    """Get the global TLSnapshotStore singleton."""
+    return _snapshot_store
@@ -1,13 +1,25 @@
-"""Transaction service for atomic balance updates."""
+"""Transaction service for atomic balance updates.
+
+A ledger write is one guarded ``UPDATE ... RETURNING`` of the balance plus one
+``INSERT ... ON CONFLICT (idempotency_key) DO NOTHING RETURNING`` of the ledger
+row. Replays are detected by the conflict (the balance change is then undone)
+instead of probing the key up front, and ``apply_movements`` writes any number
+of credits (e.g. every payout of a finalized set) with the same statement pair.
+"""
 from __future__ import annotations
 
 import logging
 import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import select, update
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import String, case, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as postgres_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from backend.models.transaction_base import TransactionBase
 from backend.utils.exceptions import InsufficientBalanceError
@@ -17,6 +29,22 @@ from backend.utils.model_registry import GameType, get_transaction_model
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class LedgerMovement:
+    """One balance movement for ``TransactionService.apply_movements``."""
+
+    player_id: UUID
+    amount: int
+    trans_type: str
+    reference_id: UUID | None = None
+    wallet_type: str = "wallet"
+    idempotency_key: str | None = None
+
+
+def _uuid_hex(value: UUID | str) -> str:
+    return value.hex if isinstance(value, UUID) else str(value).replace("-", "").lower()
+
+
 class TransactionService:
     """Service for managing player transactions."""
 
@@ -109,12 +137,125 @@ class TransactionService:
         )
         return result.scalar_one_or_none()
 
-    async def _resolve_ir_set_id(self, reference_id: UUID | str | None) -> UUID | None:
-        """Resolve an IR reference to a real backronym set when possible."""
+    async def _load_transactions(self, keys: Sequence[str]) -> dict[str, TransactionBase]:
+        result = await self.db.execute(
+            select(self.transaction_model).where(self.transaction_model.idempotency_key.in_(list(keys)))
+        )
+        return {transaction.idempotency_key: transaction for transaction in result.scalars()}
+
+    def _movement_key(self, movement: LedgerMovement) -> str:
+        return movement.idempotency_key or self._build_idempotency_key(
+            player_id=movement.player_id,
+            amount=movement.amount,
+            trans_type=movement.trans_type,
+            reference_id=movement.reference_id,
+            wallet_type=movement.wallet_type,
+        )
+
+    def _validate_movement_replay(self, transaction: TransactionBase, movement: LedgerMovement) -> None:
+        self._validate_replay(
+            transaction,
+            player_id=movement.player_id,
+            amount=movement.amount,
+            trans_type=movement.trans_type,
+            reference_id=movement.reference_id,
+            wallet_type=movement.wallet_type,
+        )
 
-        if reference_id is None:
+    def _sync_player_data(self, player_id: UUID, wallet: int, vault: int) -> None:
+        """Reflect new balances on an already loaded player data row without a reload."""
+        identity_map = self.db.sync_session.identity_map
+        for ident in (player_id, str(player_id)):
+            instance = identity_map.get(self.db.sync_session.identity_key(self.player_data_model, ident))
+            if instance is not None:
+                set_committed_value(instance, "wallet", wallet)
+                set_committed_value(instance, "vault", vault)
+                return
+
+    async def _update_balance(
+        self,
+        player_id: UUID,
+        amount: int,
+        wallet_type: str,
+        *,
+        guard: bool = True,
+    ) -> tuple[int, int] | None:
+        """Apply one movement to the balance; returns (wallet, vault) or None if no row was updated."""
+        balance_column = (
+            self.player_data_model.vault
+            if wallet_type == "vault"
+            else self.player_data_model.wallet
+        )
+        stmt = update(self.player_data_model).where(self.player_data_model.player_id == player_id)
+        if guard and amount < 0:
+            stmt = stmt.where(balance_column + amount >= 0)
+        stmt = (
+            stmt.values({balance_column: balance_column + amount})
+            .returning(self.player_data_model.wallet, self.player_data_model.vault)
+            .execution_options(synchronize_session=False)
+        )
+
+        row = (await self.db.execute(stmt)).first()
+        if row is None:
             return None
+        self._sync_player_data(player_id, row.wallet, row.vault)
+        return row.wallet, row.vault
+
+    async def _update_balances(self, deltas: dict[str, list[int]], *, sign: int = 1) -> dict[str, tuple[int, int]]:
+        """Apply per-player (wallet, vault) deltas keyed by UUID hex in one statement."""
+        player_key = func.lower(func.replace(func.cast(self.player_data_model.player_id, String), "-", ""))
+        values = {}
+        for index, column in enumerate((self.player_data_model.wallet, self.player_data_model.vault)):
+            column_deltas = {key: sign * delta[index] for key, delta in deltas.items() if delta[index]}
+            if column_deltas:
+                values[column] = column + case(column_deltas, value=player_key, else_=0)
+        if not values:
+            values[self.player_data_model.wallet] = self.player_data_model.wallet
+
+        result = await self.db.execute(
+            update(self.player_data_model)
+            .where(self.player_data_model.player_id.in_(list(deltas)))
+            .values(values)
+            .returning(
+                self.player_data_model.player_id,
+                self.player_data_model.wallet,
+                self.player_data_model.vault,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        balances = {}
+        for player_id, wallet, vault in result.all():
+            balances[_uuid_hex(player_id)] = (wallet, vault)
+            self._sync_player_data(player_id, wallet, vault)
+        return balances
+
+    def _ledger_row(self, movement: LedgerMovement, key: str, wallet_after: int, vault_after: int) -> dict:
+        row = {
+            "transaction_id": uuid.uuid4(),
+            "player_id": movement.player_id,
+            "amount": movement.amount,
+            "type": movement.trans_type,
+            "reference_id": movement.reference_id,
+            "wallet_type": movement.wallet_type,
+            "wallet_balance_after": wallet_after,
+            "vault_balance_after": vault_after,
+            "idempotency_key": key,
+            "created_at": datetime.now(UTC),
+        }
+        if self._is_ir_ledger():
+            row.update(
+                transaction_type=movement.trans_type,
+                vault_contribution=movement.amount if movement.wallet_type == "vault" else 0,
+                entry_id=None,
+                set_id=self._ir_set_id_expression(movement.reference_id),
+            )
+        return row
 
+    @staticmethod
+    def _ir_set_id_expression(reference_id: UUID | str | None):
+        """Inline lookup linking an IR ledger row to its backronym set, when the reference is one."""
+        if reference_id is None:
+            return None
         if isinstance(reference_id, str):
             try:
                 reference_id = UUID(reference_id)
@@ -123,10 +264,22 @@ class TransactionService:
 
         from backend.models.ir.backronym_set import BackronymSet
 
-        result = await self.db.execute(
-            select(BackronymSet.set_id).where(BackronymSet.set_id == reference_id)
+        return select(BackronymSet.set_id).where(BackronymSet.set_id == reference_id).scalar_subquery()
+
+    async def _insert_ledger_rows(self, rows: list[dict]) -> dict[str, TransactionBase]:
+        """Insert ledger rows, skipping idempotency keys that already exist."""
+        bind = self.db.get_bind()
+        dialect_name = (bind.dialect.name if bind is not None else "").lower()
+        insert_stmt = sqlite_insert if "sqlite" in dialect_name else postgres_insert
+
+        stmt = (
+            insert_stmt(self.transaction_model)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["idempotency_key"])
+            .returning(self.transaction_model)
         )
-        return result.scalar_one_or_none()
+        result = await self.db.scalars(stmt)
+        return {transaction.idempotency_key: transaction for transaction in result.all()}
 
     async def create_transaction(
         self,
@@ -141,133 +294,134 @@ class TransactionService:
     ) -> TransactionBase:
         """Create a transaction and update player balance atomically."""
 
-        movement_key = idempotency_key or self._build_idempotency_key(
+        movement = LedgerMovement(
             player_id=player_id,
             amount=amount,
             trans_type=trans_type,
             reference_id=reference_id,
             wallet_type=wallet_type,
+            idempotency_key=idempotency_key,
         )
+        movement_key = self._movement_key(movement)
 
-        existing = await self.db.execute(
-            select(self.transaction_model).where(
-                self.transaction_model.idempotency_key == movement_key
-            )
-        )
-        existing_transaction = existing.scalar_one_or_none()
-        if existing_transaction:
-            self._validate_replay(
-                existing_transaction,
-                player_id=player_id,
-                amount=amount,
-                trans_type=trans_type,
-                reference_id=reference_id,
-                wallet_type=wallet_type,
-            )
-            return existing_transaction
-
-        async def _create_transaction_impl() -> TransactionBase:
-            balance_column = (
-                self.player_data_model.vault
-                if wallet_type == "vault"
-                else self.player_data_model.wallet
-            )
-            values = {
-                "wallet": self.player_data_model.wallet if wallet_type == "vault" else self.player_data_model.wallet + amount,
-                "vault": self.player_data_model.vault if wallet_type != "vault" else self.player_data_model.vault + amount,
-            }
-            stmt = update(self.player_data_model).where(self.player_data_model.player_id == player_id)
-            if amount < 0:
-                stmt = stmt.where(balance_column + amount >= 0)
-            stmt = stmt.values(**values)
-
-            result = await self.db.execute(stmt)
-            if result.rowcount != 1:
-                player = await self._load_player_data(player_id)
-                if not player:
-                    raise ValueError(f"Player not found: {player_id}")
-
-                current_balance = player.vault if wallet_type == "vault" else player.wallet
-                raise InsufficientBalanceError(
-                    f"Insufficient {wallet_type} balance: {current_balance} + {amount} would be negative"
-                )
+        balances = await self._update_balance(player_id, amount, wallet_type)
+        if balances is None:
+            # A replayed debit may legitimately find the balance already spent
+            existing_transaction = (await self._load_transactions([movement_key])).get(movement_key)
+            if existing_transaction:
+                self._validate_movement_replay(existing_transaction, movement)
+                return existing_transaction
 
             player = await self._load_player_data(player_id)
             if not player:
-                raise ValueError(f"Player not found after update: {player_id}")
-
-            if self._is_ir_ledger():
-                set_id = await self._resolve_ir_set_id(reference_id)
-                transaction = self.transaction_model(
-                    transaction_id=uuid.uuid4(),
-                    player_id=player_id,
-                    amount=amount,
-                    type=trans_type,
-                    transaction_type=trans_type,
-                    reference_id=reference_id,
-                    wallet_type=wallet_type,
-                    wallet_balance_after=player.wallet,
-                    vault_balance_after=player.vault,
-                    vault_contribution=amount if wallet_type == "vault" else 0,
-                    entry_id=None,
-                    set_id=set_id,
-                    idempotency_key=movement_key,
-                )
-            else:
-                transaction = self.transaction_model(
-                    transaction_id=uuid.uuid4(),
-                    player_id=player_id,
-                    amount=amount,
-                    type=trans_type,
-                    reference_id=reference_id,
-                    wallet_type=wallet_type,
-                    wallet_balance_after=player.wallet,
-                    vault_balance_after=player.vault,
-                    idempotency_key=movement_key,
-                )
-
-            self.db.add(transaction)
-            await self.db.flush()
-
-            logger.info(
-                "Transaction created: %s amount=%s type=%s wallet_type=%s new_wallet=%s new_vault=%s",
-                player_id,
-                amount,
-                trans_type,
-                wallet_type,
-                player.wallet,
-                player.vault,
-            )
-            return transaction
-
-        try:
-            async with self.db.begin_nested():
-                transaction = await _create_transaction_impl()
-        except IntegrityError:
-            existing = await self.db.execute(
-                select(self.transaction_model).where(
-                    self.transaction_model.idempotency_key == movement_key
-                )
+                raise ValueError(f"Player not found: {player_id}")
+
+            current_balance = player.vault if wallet_type == "vault" else player.wallet
+            raise InsufficientBalanceError(
+                f"Insufficient {wallet_type} balance: {current_balance} + {amount} would be negative"
             )
-            existing_transaction = existing.scalar_one_or_none()
-            if existing_transaction:
-                self._validate_replay(
-                    existing_transaction,
-                    player_id=player_id,
-                    amount=amount,
-                    trans_type=trans_type,
-                    reference_id=reference_id,
-                    wallet_type=wallet_type,
-                )
-                return existing_transaction
-            raise
+
+        wallet, vault = balances
+        inserted = await self._insert_ledger_rows([self._ledger_row(movement, movement_key, wallet, vault)])
+        transaction = inserted.get(movement_key)
+        if transaction is None:
+            # Replay: the movement is already recorded, so undo this balance change
+            await self._update_balance(player_id, -amount, wallet_type, guard=False)
+            existing_transaction = (await self._load_transactions([movement_key]))[movement_key]
+            self._validate_movement_replay(existing_transaction, movement)
+            return existing_transaction
+
+        logger.info(
+            "Transaction created: %s amount=%s type=%s wallet_type=%s new_wallet=%s new_vault=%s",
+            player_id,
+            amount,
+            trans_type,
+            wallet_type,
+            wallet,
+            vault,
+        )
 
         if auto_commit:
             await self.db.commit()
-            await self.db.refresh(transaction)
 
         return transaction
 
+    async def apply_movements(
+        self,
+        movements: Sequence[LedgerMovement],
+        auto_commit: bool = False,
+    ) -> list[TransactionBase]:
+        """Apply many credits with one balance UPDATE and one ledger INSERT.
+
+        Intended for payout fan-out such as finalizing a phraseset or backronym
+        set. Movements are idempotent like ``create_transaction``; replayed ones
+        return their recorded transaction.
+
+        Returns:
+            Transactions in the same order as ``movements``
+        """
+        if any(movement.amount < 0 for movement in movements):
+            raise ValueError("apply_movements only applies credits; use create_transaction for debits")
+
+        keys = [self._movement_key(movement) for movement in movements]
+        pending: dict[str, LedgerMovement] = {}
+        for movement, key in zip(movements, keys):
+            pending.setdefault(key, movement)
+        if not pending:
+            return []
+
+        transactions = await self._apply_new_movements(pending)
+        for movement, key in zip(movements, keys):
+            self._validate_movement_replay(transactions[key], movement)
+
+        if auto_commit:
+            await self.db.commit()
+
+        return [transactions[key] for key in keys]
+
+    async def _apply_new_movements(self, pending: dict[str, LedgerMovement]) -> dict[str, TransactionBase]:
+        deltas: dict[str, list[int]] = {}
+        for movement in pending.values():
+            delta = deltas.setdefault(_uuid_hex(movement.player_id), [0, 0])
+            delta[1 if movement.wallet_type == "vault" else 0] += movement.amount
+
+        balances = await self._update_balances(deltas)
+        missing = deltas.keys() - balances.keys()
+        if missing:
+            raise ValueError(f"Player not found: {', '.join(sorted(missing))}")
+
+        # Walk each player's movements forward from the balance before this batch
+        running = {
+            key: [balances[key][0] - delta[0], balances[key][1] - delta[1]]
+            for key, delta in deltas.items()
+        }
+        rows = []
+        for key, movement in pending.items():
+            balance = running[_uuid_hex(movement.player_id)]
+            balance[1 if movement.wallet_type == "vault" else 0] += movement.amount
+            rows.append(self._ledger_row(movement, key, balance[0], balance[1]))
+
+        inserted = await self._insert_ledger_rows(rows)
+        if len(inserted) == len(pending):
+            logger.info(f"Applied {len(inserted)} ledger movements for {len(deltas)} players")
+            return inserted
+
+        # Some movements were already recorded: undo this batch and apply only the new ones
+        await self.db.execute(
+            delete(self.transaction_model)
+            .where(self.transaction_model.idempotency_key.in_(list(inserted)))
+            .execution_options(synchronize_session=False)
+        )
+        for transaction in inserted.values():
+            self.db.expunge(transaction)
+        await self._update_balances(deltas, sign=-1)
+
+        existing = await self._load_transactions([key for key in pending if key not in inserted])
+        fresh = {key: movement for key, movement in pending.items() if key not in existing}
+        if fresh:
+            existing.update(await self._apply_new_movements(fresh))
+        return existing
+
     async def debit_wallet(
         self,
         player_id: UUID,
@@ -366,6 +520,37 @@ class TransactionService:
             auto_commit=auto_commit,
         )
 
+    @staticmethod
+    def split_payout_movements(
+        player_id: UUID,
+        gross_amount: int,
+        cost: int,
+        trans_type: str,
+        reference_id: UUID | None = None,
+        idempotency_prefix: str | None = None,
+    ) -> list[LedgerMovement]:
+        """Ledger legs of a payout with a 70/30 wallet/vault split of net earnings."""
+
+        wallet_key = f"{idempotency_prefix}:wallet" if idempotency_prefix else None
+        net_earnings = gross_amount - cost
+        if net_earnings <= 0:
+            return [
+                LedgerMovement(player_id, gross_amount, trans_type, reference_id, "wallet", wallet_key),
+            ]
+
+        vault_amount = int(net_earnings * 0.3)
+        return [
+            LedgerMovement(player_id, gross_amount - vault_amount, trans_type, reference_id, "wallet", wallet_key),
+            LedgerMovement(
+                player_id,
+                vault_amount,
+                "vault_rake",
+                reference_id,
+                "vault",
+                f"{idempotency_prefix}:vault" if idempotency_prefix else None,
+            ),
+        ]
+
     async def create_split_payout(
         self,
         player_id: UUID,
@@ -379,63 +564,25 @@ class TransactionService:
     ) -> tuple[TransactionBase | None, TransactionBase | None]:
         """Create payout with a 70/30 wallet/vault split."""
 
-        net_earnings = gross_amount - cost
-        if net_earnings <= 0:
-            wallet_txn = await self.create_transaction(
-                player_id=player_id,
-                amount=gross_amount,
-                trans_type=trans_type,
-                reference_id=reference_id,
-                auto_commit=auto_commit,
-                skip_lock=True,
-                wallet_type="wallet",
-                idempotency_key=(
-                    f"{idempotency_prefix}:wallet" if idempotency_prefix else None
-                ),
-            )
-            return wallet_txn, None
-
-        vault_amount = int(net_earnings * 0.3)
-        wallet_amount = gross_amount - vault_amount
-
-        wallet_txn = await self.create_transaction(
+        movements = self.split_payout_movements(
             player_id=player_id,
-            amount=wallet_amount,
+            gross_amount=gross_amount,
+            cost=cost,
             trans_type=trans_type,
             reference_id=reference_id,
-            auto_commit=False,
-            skip_lock=True,
-            wallet_type="wallet",
-            idempotency_key=(
-                f"{idempotency_prefix}:wallet" if idempotency_prefix else None
-            ),
+            idempotency_prefix=idempotency_prefix,
         )
-        vault_txn = await self.create_transaction(
-            player_id=player_id,
-            amount=vault_amount,
-            trans_type="vault_rake",
-            reference_id=reference_id,
-            auto_commit=False,
-            skip_lock=True,
-            wallet_type="vault",
-            idempotency_key=(
-                f"{idempotency_prefix}:vault" if idempotency_prefix else None
-            ),
-        )
-
-        if auto_commit:
-            await self.db.commit()
-            await self.db.refresh(wallet_txn)
-            await self.db.refresh(vault_txn)
+        transactions = await self.apply_movements(movements, auto_commit=auto_commit)
+        wallet_txn = transactions[0]
+        vault_txn = transactions[1] if len(transactions) > 1 else None
 
         logger.info(
-            "Split payout created: %s gross=%s cost=%s net=%s wallet=%s vault=%s",
+            "Split payout created: %s gross=%s cost=%s wallet=%s vault=%s",
             player_id,
             gross_amount,
             cost,
-            net_earnings,
-            wallet_amount,
-            vault_amount,
+            wallet_txn.amount,
+            vault_txn.amount if vault_txn else 0,
         )
 
         return wallet_txn, vault_txn
@@ -15,7 +15,7 @@ async def run_party_maintenance() -> None:
     """Run periodic party session maintenance tasks.
 
     This function should be called periodically (e.g., every hour) to:
-    1. Mark stale/expired party sessions as abandoned
+    1. Mark stale/expired party sessions as abandoned (chunked, resumable bulk updates)
     2. Preserve disconnected participants for reconnect
     3. Free up database resources
 
@@ -3,11 +3,12 @@ from backend.config import get_settings
 from backend.utils.queue_client import QueueClient
 from backend.utils.lock_client import LockClient
 from backend.utils.datetime_helpers import ensure_utc
+from backend.utils.shared_store import get_shared_store
 
 settings = get_settings()
 
 # Create singleton instances
-queue_client = QueueClient(settings.redis_url if settings.redis_url else None)
-lock_client = LockClient(settings.redis_url if settings.redis_url else None)
+queue_client = QueueClient(settings.redis_url if settings.redis_url else None, shared_store=get_shared_store())
+lock_client = LockClient(settings.redis_url if settings.redis_url else None, shared_store=get_shared_store())
 
 __all__ = ["queue_client", "lock_client", "ensure_utc"]
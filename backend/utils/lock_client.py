@@ -1,16 +1,26 @@
-"""Lock client abstraction - Redis or threading fallback."""
-from typing import Optional
+"""Lock client abstraction - Redis, shared SQLite leases, or threading fallback."""
+from __future__ import annotations
+
+from typing import Optional, TYPE_CHECKING
 from threading import Lock as ThreadLock
 from contextlib import contextmanager
 import logging
+import time
+import uuid
+
+if TYPE_CHECKING:
+    from backend.utils.shared_store import SharedStore
 
 logger = logging.getLogger(__name__)
 
+# Poll interval while waiting for a lease held by another worker process
+LEASE_POLL_INTERVAL_SECONDS = 0.01
+
 
 class LockClient:
-    """Abstraction for distributed locks - uses Redis if available, else threading."""
+    """Abstraction for distributed locks - uses Redis if available, else shared leases or threading."""
 
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(self, redis_url: Optional[str] = None, shared_store: Optional[SharedStore] = None):
         self.backend = "memory"
         self._memory_locks: dict[str, ThreadLock] = {}
         self._memory_locks_lock = ThreadLock()
@@ -27,6 +37,11 @@ class LockClient:
         else:
             logger.info("Using threading locks (Redis URL not provided)")
 
+        if self.backend == "memory" and shared_store is not None:
+            self.shared_store = shared_store
+            self.backend = "sqlite"
+            logger.info("Using shared SQLite leases for locks")
+
     @contextmanager
     def lock(self, lock_name: str, timeout: int = 10):
         """
@@ -49,6 +64,19 @@ class LockClient:
                     lock.release()
                 except Exception:
                     pass  # Lock may have expired
+        elif self.backend == "sqlite":
+            # The lease expires after ``timeout`` seconds, like the Redis lock, so a
+            # crashed worker cannot hold it forever.
+            owner = uuid.uuid4().hex
+            deadline = time.monotonic() + timeout
+            while not self.shared_store.acquire_lease(lock_name, owner, timeout):
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Could not acquire lock: {lock_name}")
+                time.sleep(LEASE_POLL_INTERVAL_SECONDS)
+            try:
+                yield
+            finally:
+                self.shared_store.release_lease(lock_name, owner)
         else:
             # Get or create thread lock
             with self._memory_locks_lock:
@@ -67,7 +95,7 @@ class LockClient:
 
     def reset(self) -> None:
         """Reset unheld in-memory locks between deterministic test cases."""
-        if self.backend == "redis":
+        if self.backend != "memory":
             return
         with self._memory_locks_lock:
             self._memory_locks = {
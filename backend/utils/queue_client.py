@@ -1,17 +1,22 @@
-"""Queue client abstraction - Redis or in-memory fallback."""
+"""Queue client abstraction - Redis, shared SQLite store, or in-memory fallback."""
+from __future__ import annotations
+
 import json
-from typing import Optional, List
+from typing import Optional, List, TYPE_CHECKING
 from queue import Queue, Empty
 from threading import Lock
 import logging
 
+if TYPE_CHECKING:
+    from backend.utils.shared_store import SharedStore
+
 logger = logging.getLogger(__name__)
 
 
 class QueueClient:
-    """Abstraction for queues - uses Redis if available, else in-memory."""
+    """Abstraction for queues - uses Redis if available, else a shared store or in-memory."""
 
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(self, redis_url: Optional[str] = None, shared_store: Optional[SharedStore] = None):
         self.backend = "memory"
         self._memory_queues: dict[str, Queue] = {}
         self._memory_lock = Lock()
@@ -28,10 +33,17 @@ class QueueClient:
         else:
             logger.info("Using in-memory queues (Redis URL not provided)")
 
+        if self.backend == "memory" and shared_store is not None:
+            self.shared_store = shared_store
+            self.backend = "sqlite"
+            logger.info("Using shared SQLite store for queues")
+
     def push(self, queue_name: str, item: dict):
         """Add item to end of queue."""
         if self.backend == "redis":
             self.redis.rpush(queue_name, json.dumps(item))
+        elif self.backend == "sqlite":
+            self.shared_store.list_push(queue_name, json.dumps(item))
         else:
             with self._memory_lock:
                 if queue_name not in self._memory_queues:
@@ -43,6 +55,9 @@ class QueueClient:
         if self.backend == "redis":
             result = self.redis.lpop(queue_name)
             return json.loads(result) if result else None
+        elif self.backend == "sqlite":
+            result = self.shared_store.list_pop(queue_name)
+            return json.loads(result) if result else None
         else:
             with self._memory_lock:
                 if queue_name not in self._memory_queues:
@@ -66,6 +81,8 @@ class QueueClient:
                 pipe.lpop(queue_name)
             results = pipe.execute()
             items.extend(json.loads(r) for r in results if r is not None)
+        elif self.backend == "sqlite":
+            items.extend(json.loads(r) for r in self.shared_store.list_pop_many(queue_name, count))
         else:
             with self._memory_lock:
                 queue = self._memory_queues.get(queue_name)
@@ -83,6 +100,8 @@ class QueueClient:
         """Get queue length."""
         if self.backend == "redis":
             return self.redis.llen(queue_name)
+        elif self.backend == "sqlite":
+            return self.shared_store.list_length(queue_name)
         else:
             with self._memory_lock:
                 if queue_name not in self._memory_queues:
@@ -94,6 +113,9 @@ class QueueClient:
         if self.backend == "redis":
             result = self.redis.lindex(queue_name, index)
             return json.loads(result) if result else None
+        elif self.backend == "sqlite":
+            result = self.shared_store.list_index(queue_name, index)
+            return json.loads(result) if result else None
         else:
             with self._memory_lock:
                 queue = self._memory_queues.get(queue_name)
@@ -111,6 +133,8 @@ class QueueClient:
             # Redis LREM removes all occurrences
             removed = self.redis.lrem(queue_name, 1, json.dumps(item))
             return removed > 0
+        elif self.backend == "sqlite":
+            return self.shared_store.list_remove(queue_name, json.dumps(item))
         else:
             with self._memory_lock:
                 queue = self._memory_queues.get(queue_name)
@@ -132,6 +156,8 @@ class QueueClient:
         """Clear all items from a queue."""
         if self.backend == "redis":
             self.redis.delete(queue_name)
+        elif self.backend == "sqlite":
+            self.shared_store.list_clear(queue_name)
         else:
             with self._memory_lock:
                 if queue_name in self._memory_queues:
@@ -140,7 +166,7 @@ class QueueClient:
 
     def reset(self) -> None:
         """Reset in-memory state between deterministic test cases."""
-        if self.backend == "redis":
+        if self.backend != "memory":
             return
         with self._memory_lock:
             self._memory_queues.clear()
@@ -7,8 +7,10 @@ import math
 import time
 from collections import deque
 from threading import Lock
-from typing import Optional, Tuple
+from typing import Optional, Tuple, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from backend.utils.shared_store import SharedStore
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +18,12 @@ logger = logging.getLogger(__name__)
 class RateLimiter:
     """Track request counts in a rolling window per identifier."""
 
-    def __init__(self, redis_url: Optional[str] = None, namespace: str = "rate_limit"):
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        namespace: str = "rate_limit",
+        shared_store: Optional[SharedStore] = None,
+    ):
         self.namespace = namespace
         self.backend = "memory"
         self._memory_lock = Lock()
@@ -40,6 +47,11 @@ class RateLimiter:
         else:
             logger.info("Using in-memory rate limiting (Redis URL not provided)")
 
+        if self.backend == "memory" and shared_store is not None:
+            self.shared_store = shared_store
+            self.backend = "sqlite"
+            logger.info("Using shared SQLite store for rate limiting")
+
     def _full_key(self, identifier: str) -> str:
         return f"{self.namespace}:{identifier}"
 
@@ -71,6 +83,14 @@ class RateLimiter:
                 self._tracked_keys.add(key)
             return count <= limit, retry_after
 
+        if self.backend == "sqlite":
+            loop = asyncio.get_running_loop()
+            count, ttl = await loop.run_in_executor(None, self.shared_store.incr, key, window_seconds)
+            retry_after = None
+            if count > limit:
+                retry_after = window_seconds if ttl < 0 else ttl
+            return count <= limit, retry_after
+
         now = time.monotonic()
         cutoff = now - window_seconds
         retry_after = None
@@ -117,6 +137,10 @@ class RateLimiter:
                     self._tracked_keys.clear()
             return
 
+        if self.backend == "sqlite":
+            self.shared_store.delete_prefix(full_prefix or f"{self.namespace}:")
+            return
+
         with self._memory_lock:
             if full_prefix:
                 to_remove = [k for k in self._memory_hits if k.startswith(full_prefix)]
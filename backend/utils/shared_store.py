@@ -0,0 +1,259 @@
+"""Host-local shared state for multi-worker deployments without Redis.
+
+Queues, locks, rate limits and small caches fall back to per-process memory when
+``redis_url`` is unset, which silently splits them once more than one uvicorn
+worker runs. ``SharedStore`` keeps that state in a dedicated SQLite file in WAL
+mode instead, so every worker process on the host sees the same lists, TTL keys,
+counters and leases. Each mutating operation runs in a ``BEGIN IMMEDIATE``
+transaction, which serialises writers across processes.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+SHARED_STORE_FILENAME = "shared_state.sqlite3"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS shared_lists (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        value TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_shared_lists_name_seq ON shared_lists (name, seq)",
+    """
+    CREATE TABLE IF NOT EXISTS shared_keys (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL,
+        expires_at REAL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS shared_leases (
+        name TEXT PRIMARY KEY,
+        owner TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    )
+    """,
+)
+
+
+class SharedStore:
+    """Atomic lists, TTL keys, counters and leases in a WAL-mode SQLite file."""
+
+    def __init__(self, path: str, busy_timeout_ms: int = 5000):
+        self.path = path
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        for statement in _SCHEMA:
+            connection.execute(statement)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection (sqlite3 connections are not shareable)."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            connection.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _transaction(self):
+        return _ImmediateTransaction(self._connection())
+
+    # ------------------------------------------------------------------
+    # Lists
+    # ------------------------------------------------------------------
+
+    def list_push(self, name: str, value: str) -> None:
+        self._connection().execute("INSERT INTO shared_lists (name, value) VALUES (?, ?)", (name, value))
+
+    def list_pop_many(self, name: str, count: int) -> list[str]:
+        """Atomically remove and return up to ``count`` values from the front of a list."""
+        if count <= 0:
+            return []
+        with self._transaction() as connection:
+            rows = connection.execute(
+                "SELECT seq, value FROM shared_lists WHERE name = ? ORDER BY seq LIMIT ?", (name, count)
+            ).fetchall()
+            if rows:
+                connection.executemany("DELETE FROM shared_lists WHERE seq = ?", [(seq,) for seq, _ in rows])
+        return [value for _, value in rows]
+
+    def list_pop(self, name: str) -> Optional[str]:
+        values = self.list_pop_many(name, 1)
+        return values[0] if values else None
+
+    def list_length(self, name: str) -> int:
+        row = self._connection().execute("SELECT COUNT(*) FROM shared_lists WHERE name = ?", (name,)).fetchone()
+        return row[0]
+
+    def list_index(self, name: str, index: int) -> Optional[str]:
+        if index < 0:
+            return None
+        row = self._connection().execute(
+            "SELECT value FROM shared_lists WHERE name = ? ORDER BY seq LIMIT 1 OFFSET ?", (name, index)
+        ).fetchone()
+        return row[0] if row else None
+
+    def list_remove(self, name: str, value: str) -> bool:
+        """Remove the first occurrence of ``value``; True if this caller removed it."""
+        cursor = self._connection().execute(
+            """
+            DELETE FROM shared_lists WHERE seq = (
+                SELECT seq FROM shared_lists WHERE name = ? AND value = ? ORDER BY seq LIMIT 1
+            )
+            """,
+            (name, value),
+        )
+        return cursor.rowcount > 0
+
+    def list_clear(self, name: str) -> None:
+        self._connection().execute("DELETE FROM shared_lists WHERE name = ?", (name,))
+
+    # ------------------------------------------------------------------
+    # TTL keys and counters
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[str]:
+        row = self._connection().execute(
+            "SELECT value FROM shared_keys WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time()),
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[float] = None) -> None:
+        now = time.time()
+        expires_at = now + ttl_seconds if ttl_seconds else None
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM shared_keys WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+            connection.execute(
+                "INSERT OR REPLACE INTO shared_keys (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self._connection().executemany("DELETE FROM shared_keys WHERE key = ?", [(key,) for key in keys])
+
+    def delete_prefix(self, prefix: str) -> None:
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        self._connection().execute("DELETE FROM shared_keys WHERE key LIKE ? ESCAPE '\\'", (f"{escaped}%",))
+
+    def incr(self, key: str, window_seconds: float) -> tuple[int, int]:
+        """Increment a fixed-window counter; returns (count, seconds until the window resets)."""
+        now = time.time()
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT value, expires_at FROM shared_keys WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                count, expires_at = 1, now + window_seconds
+            else:
+                count, expires_at = int(row[0]) + 1, row[1]
+            connection.execute(
+                "INSERT OR REPLACE INTO shared_keys (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, str(count), expires_at),
+            )
+        ttl = math.ceil(expires_at - now) if expires_at is not None else -1
+        return count, ttl
+
+    # ------------------------------------------------------------------
+    # Leases
+    # ------------------------------------------------------------------
+
+    def acquire_lease(self, name: str, owner: str, ttl_seconds: float) -> bool:
+        """Take the named lease unless another owner holds an unexpired one."""
+        now = time.time()
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT owner, expires_at FROM shared_leases WHERE name = ?", (name,)
+            ).fetchone()
+            if row is not None and row[0] != owner and row[1] > now:
+                return False
+            connection.execute(
+                "INSERT OR REPLACE INTO shared_leases (name, owner, expires_at) VALUES (?, ?, ?)",
+                (name, owner, now + ttl_seconds),
+            )
+        return True
+
+    def release_lease(self, name: str, owner: str) -> bool:
+        cursor = self._connection().execute(
+            "DELETE FROM shared_leases WHERE name = ? AND owner = ?", (name, owner)
+        )
+        return cursor.rowcount > 0
+
+    def clear(self) -> None:
+        """Remove every list, key and lease (tests and maintenance only)."""
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM shared_lists")
+            connection.execute("DELETE FROM shared_keys")
+            connection.execute("DELETE FROM shared_leases")
+
+
+class _ImmediateTransaction:
+    """Context manager running a block inside ``BEGIN IMMEDIATE``."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.connection.execute("COMMIT")
+        else:
+            self.connection.execute("ROLLBACK")
+
+
+def resolve_shared_store_path(settings) -> Optional[str]:
+    """Return the shared store file to use, or None for per-process memory.
+
+    An explicit ``shared_store_path`` always wins. Otherwise the store is only
+    enabled when several workers run without Redis, since a single worker's
+    memory is already shared by every request it serves.
+    """
+    if settings.shared_store_path:
+        return settings.shared_store_path
+    if settings.redis_url or settings.crowdcraft_workers <= 1:
+        return None
+    return os.path.join(settings.crowdcraft_runtime_root, SHARED_STORE_FILENAME)
+
+
+_shared_store: Optional[SharedStore] = None
+_shared_store_resolved = False
+
+
+def get_shared_store() -> Optional[SharedStore]:
+    """Get the global SharedStore singleton (None when not configured)."""
+    global _shared_store, _shared_store_resolved
+
+    if not _shared_store_resolved:
+        from backend.config import get_settings
+
+        path = resolve_shared_store_path(get_settings())
+        if path:
+            try:
+                _shared_store = SharedStore(path)
+                logger.info(f"Using shared SQLite store for cross-worker state: {path}")
+            except Exception as exc:
+                logger.warning(f"Shared store unavailable at {path}, using per-process memory: {exc}")
+                _shared_store = None
+        _shared_store_resolved = True
+    return _shared_store
@@ -2041,6 +2041,8 @@ export interface MMVoteRoundState {
   image_id: string;
   image_url: string;
   thumbnail_url?: string | null;
+  image_srcset?: string | null;
+  image_placeholder?: string | null;
   attribution_text?: string | null;
   captions: Caption[];
   cost: number;
@@ -212,7 +212,10 @@ export const CaptionRound: React.FC = () => {
         <div className="flex flex-col md:flex-row gap-6 md:items-start">
           <img
             src={round.image_url}
+            srcSet={round.image_srcset ?? undefined}
+            sizes="(min-width: 768px) 50vw, 100vw"
             alt={round.attribution_text || 'Meme image'}
+            style={round.image_placeholder ? { backgroundImage: `url(${round.image_placeholder})`, backgroundSize: 'cover' } : undefined}
             className="w-full md:w-1/2 rounded-tile border-2 border-ccl-navy max-h-96 object-contain bg-white"
           />
           <div className="flex-1 space-y-4">
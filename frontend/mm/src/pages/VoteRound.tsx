@@ -155,7 +155,10 @@ export const VoteRound: React.FC = () => {
           <div className="w-full md:w-1/2">
             <img
               src={round.image_url}
+              srcSet={round.image_srcset ?? undefined}
+              sizes="(min-width: 768px) 50vw, 100vw"
               alt={round.attribution_text || 'Meme image'}
+              style={round.image_placeholder ? { backgroundImage: `url(${round.image_placeholder})`, backgroundSize: 'cover' } : undefined}
               className="w-full rounded-tile border-2 border-ccl-navy max-h-96 object-contain bg-white"
             />
             {hasVoted && result && (
@@ -65,10 +65,12 @@ def pytest_collection_modifyitems(items):
             elif filename.startswith("test_tl_"):
                 item.add_marker(pytest.mark.owner_tl)
             elif filename in {
+                "test_access_log.py",
                 "test_migration_chain.py",
                 "test_code_quality_improvements.py",
                 "test_datetime_helpers.py",
                 "test_rate_limiting.py",
+                "test_shared_store.py",
                 "test_simple_cache.py",
                 "test_timezone_awareness.py",
                 "test_verification_contract.py",
@@ -99,11 +101,35 @@ def isolate_process_globals(request, monkeypatch):
     random.seed(seed)
 
     from backend.services import phrase_validator
+    from backend.services.ai.llm_gateway import get_llm_gateway
+    from backend.services.ai.pregeneration_pool import get_pregeneration_pool
+    from backend.services.qf.practice_sampler import get_practice_sampler
+    from backend.services.qf.prompt_catalogue import get_prompt_catalogue
+    from backend.services.qf.copy_assignment_index import get_copy_assignment_index
+    from backend.services.qf.party_eligibility_index import get_party_eligibility_index
+    from backend.services.ir.open_set_index import get_ir_open_set_index
+    from backend.services.refresh_session_cache import get_refresh_session_cache
+    from backend.services.qf.party_lobby_index import get_party_lobby_index
+    from backend.services.qf.party_state import get_party_state_store
     from backend.services.tl import dependencies as tl_dependencies
+    from backend.services.tl.prompt_sampler import get_prompt_sampler
+    from backend.services.tl.snapshot_service import get_snapshot_store
     from backend.utils import lock_client, queue_client
     from backend.utils.cache import dashboard_cache
 
     phrase_validator._phrase_validator = None
+    get_practice_sampler().reset()
+    get_prompt_catalogue().reset()
+    get_copy_assignment_index().reset()
+    get_party_eligibility_index().reset()
+    get_party_state_store().reset()
+    get_party_lobby_index().reset()
+    get_ir_open_set_index().reset()
+    get_refresh_session_cache().reset()
+    get_prompt_sampler().reset()
+    get_snapshot_store().reset()
+    get_llm_gateway().reset()
+    get_pregeneration_pool().reset()
     dashboard_cache.clear()
     queue_client.reset()
     lock_client.reset()
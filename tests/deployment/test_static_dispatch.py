@@ -118,3 +118,91 @@ def test_static_dispatch_rejects_foreign_game_websockets(tmp_path):
         with pytest.raises(WebSocketDisconnect):
             with client.websocket_connect("/mm/ws"):
                 pass
+
+
+@pytest.mark.asyncio
+async def test_static_dispatch_negotiates_precompressed_assets(tmp_path):
+    settings = _make_settings(tmp_path)
+    bundle = "console.log('chunk');\n" * 200
+    (Path(settings.crowdcraft_static_root) / "qf" / "assets" / "chunk-abc123.js").write_text(bundle, encoding="utf-8")
+    app = _build_app(settings)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://quipflip.crowdcraftlabs.com") as client:
+        compressed = await client.get("/assets/chunk-abc123.js", headers={"accept-encoding": "gzip"})
+        identity = await client.get("/assets/chunk-abc123.js", headers={"accept-encoding": "identity"})
+        revalidated = await client.get(
+            "/assets/chunk-abc123.js",
+            headers={"accept-encoding": "gzip", "if-none-match": compressed.headers["etag"]},
+        )
+
+    assert compressed.status_code == 200
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert compressed.text == bundle
+    assert "content-encoding" not in identity.headers
+    assert identity.text == bundle
+    assert identity.headers["etag"] != compressed.headers["etag"]
+    assert revalidated.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_static_dispatch_serves_ranges_for_large_files(tmp_path, monkeypatch):
+    from backend.runtime import static_assets
+
+    monkeypatch.setattr(static_assets, "MEMORY_MAX_FILE_BYTES", 16)
+    settings = _make_settings(tmp_path)
+    (Path(settings.crowdcraft_static_root) / "qf" / "assets" / "clip.bin").write_bytes(bytes(range(64)))
+    app = _build_app(settings)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://quipflip.crowdcraftlabs.com") as client:
+        response = await client.get("/assets/clip.bin", headers={"range": "bytes=10-19"})
+
+    assert response.status_code == 206
+    assert response.content == bytes(range(10, 20))
+    assert response.headers["etag"]
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+
+@pytest.mark.asyncio
+async def test_static_dispatch_rebuilds_switched_release_off_the_event_loop(tmp_path, monkeypatch):
+    import threading
+
+    from backend.runtime import static_assets
+
+    settings = _make_settings(tmp_path)
+    static_root = Path(settings.crowdcraft_static_root)
+    first_release = static_root.with_name("release-1")
+    static_root.rename(first_release)
+    static_root.symlink_to(first_release, target_is_directory=True)
+    app = _build_app(settings)
+
+    build_threads = []
+    build_release_manifest = static_assets.build_release_manifest
+
+    def recording_build(static_dir):
+        build_threads.append(threading.current_thread())
+        return build_release_manifest(static_dir)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://quipflip.crowdcraftlabs.com") as client:
+        # The first request builds the middleware, which preloads release-1 at startup
+        assert (await client.get("/assets/app.js")).status_code == 200
+        middleware = app.middleware_stack
+        while not hasattr(middleware, "static_store"):
+            middleware = middleware.app
+        middleware.static_store.revalidate_seconds = 0.0
+        monkeypatch.setattr(static_assets, "build_release_manifest", recording_build)
+
+        second_release = static_root.with_name("release-2")
+        _make_static_release(second_release)
+        bundle = "console.log('next');\n" * 200
+        (second_release / "qf" / "assets" / "chunk-next.js").write_text(bundle, encoding="utf-8")
+        static_root.unlink()
+        static_root.symlink_to(second_release, target_is_directory=True)
+
+        response = await client.get("/assets/chunk-next.js", headers={"accept-encoding": "br"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "br"
+    assert response.text == bundle
+    assert len(build_threads) == 1
+    assert build_threads[0] is not threading.current_thread()
@@ -0,0 +1,67 @@
+import pytest
+from datetime import datetime, timedelta, UTC
+from uuid import uuid4
+
+from backend.models.qf.round import Round
+from backend.services.qf.party_eligibility_index import PartyEligibilityIndex
+from backend.services.qf.party_session_service import PartySessionService
+
+
+def _round(player_id, round_type, prompt_round_id=None):
+    return Round(
+        round_id=uuid4(),
+        player_id=player_id,
+        round_type=round_type,
+        status='submitted',
+        cost=0,
+        expires_at=datetime.now(UTC) + timedelta(minutes=3),
+        prompt_round_id=prompt_round_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_copy_eligibility_is_built_once_and_updated_on_start(db_session, player_factory):
+    """Party prompts are assigned from per-player sets without per-candidate queries."""
+    host = await player_factory()
+    player2 = await player_factory()
+    player3 = await player_factory()
+
+    party_service = PartySessionService(db_session)
+    session = await party_service.create_session(host_player_id=host.player_id, min_players=1)
+    await party_service.add_participant(session.session_id, player2.player_id)
+    await party_service.add_participant(session.session_id, player3.player_id)
+
+    host_prompt = _round(host.player_id, 'prompt')
+    player2_prompt = _round(player2.player_id, 'prompt')
+    db_session.add_all([host_prompt, player2_prompt])
+    await db_session.flush()
+    for prompt in (host_prompt, player2_prompt):
+        await party_service.link_round_to_party(
+            session_id=session.session_id,
+            player_id=prompt.player_id,
+            round_id=prompt.round_id,
+            round_type='prompt',
+            phase='PROMPT',
+        )
+    # player3 already copied the host's prompt
+    db_session.add(_round(player3.player_id, 'copy', prompt_round_id=host_prompt.round_id))
+    await db_session.commit()
+
+    index = PartyEligibilityIndex()
+    eligibility = await index.get(db_session, session.session_id, 'COPY', host.player_id)
+
+    assert eligibility.player_ids == {host.player_id, player2.player_id, player3.player_id}
+    assert eligibility.next_for(host.player_id) == player2_prompt.round_id
+    assert eligibility.next_for(player2.player_id) == host_prompt.round_id
+    assert eligibility.next_for(player3.player_id) == player2_prompt.round_id
+
+    # Later lookups in the same phase reuse the built structure
+    assert await index.get(db_session, session.session_id, 'COPY', player2.player_id) is eligibility
+
+    eligibility.note_taken(player3.player_id, player2_prompt.round_id)
+    assert eligibility.next_for(player3.player_id) is None
+    assert eligibility.remaining_for(host.player_id) == 1
+
+    # Leaving the indexed phases drops the session
+    assert await index.get(db_session, session.session_id, 'RESULTS') is None
+    assert index.peek(session.session_id) is None
@@ -0,0 +1,51 @@
+import pytest
+from sqlalchemy import update
+
+from backend.models.qf.party_session import PartySession
+from backend.services.qf.party_lobby_index import get_party_lobby_index
+from backend.services.qf.party_session_service import PartySessionService
+
+
+@pytest.mark.asyncio
+async def test_lobby_listing_follows_session_events(db_session, player_factory):
+    """Create, join and start update the in-memory listing without a rebuild."""
+    host = await player_factory()
+    guest = await player_factory()
+    party_service = PartySessionService(db_session)
+    index = get_party_lobby_index()
+
+    session = await party_service.create_session(host_player_id=host.player_id, min_players=2, max_players=3)
+    parties = await party_service.list_active_parties()
+    assert [party['session_id'] for party in parties] == [str(session.session_id)]
+    assert parties[0]['host_username'] == host.username
+    assert parties[0]['participant_count'] == 1
+
+    await party_service.add_participant(session.session_id, guest.player_id)
+    entry = index.peek(session.session_id)
+    assert entry.participant_count == 2
+    assert entry.human_count == 2
+
+    # A write that bypasses the service is only seen after reconciliation
+    await db_session.execute(
+        update(PartySession)
+        .where(PartySession.session_id == session.session_id)
+        .values(max_players=2)
+    )
+    await db_session.commit()
+    assert len(await party_service.list_active_parties()) == 1
+    await index.reconcile(db_session)
+    assert await party_service.list_active_parties() == []
+
+    await db_session.execute(
+        update(PartySession)
+        .where(PartySession.session_id == session.session_id)
+        .values(max_players=3)
+    )
+    await db_session.commit()
+    await index.reconcile(db_session)
+    assert len(await party_service.list_active_parties()) == 1
+
+    await party_service.mark_participant_ready(session.session_id, guest.player_id)
+    await party_service.start_session(session.session_id, host.player_id)
+    assert index.peek(session.session_id) is None
+    assert await party_service.list_active_parties() == []
@@ -0,0 +1,112 @@
+import pytest
+from sqlalchemy import update
+
+from backend.models.qf.party_session import PartySession
+from backend.services.qf.party_session_service import PartySessionService
+from backend.services.qf.party_state import get_party_state_store
+
+
+@pytest.mark.asyncio
+async def test_record_submission_advances_phase_in_one_write(db_session, player_factory):
+    """The final submission of a phase advances it without a separate advance call."""
+    host = await player_factory()
+    player2 = await player_factory()
+    party_service = PartySessionService(db_session)
+
+    session = await party_service.create_session(
+        host_player_id=host.player_id,
+        min_players=2,
+        prompts_per_player=1,
+        copies_per_player=1,
+        votes_per_player=1,
+    )
+    await party_service.add_participant(session.session_id, player2.player_id)
+    await party_service.mark_participant_ready(session.session_id, player2.player_id)
+    started = await party_service.start_session(session.session_id, host.player_id)
+    started_version = started.version
+
+    first = await party_service.record_submission(session.session_id, host.player_id, 'prompt')
+    assert first.participant.prompts_submitted == 1
+    assert first.advanced_to is None
+
+    status = await party_service.get_session_status(session.session_id)
+    assert status['progress']['players_ready_for_next_phase'] == 1
+    assert status['progress']['total_prompts'] == 1
+
+    second = await party_service.record_submission(session.session_id, player2.player_id, 'prompt')
+    assert second.phase == 'PROMPT'
+    assert second.advanced_to == 'COPY'
+
+    state = get_party_state_store().peek(session.session_id)
+    assert state.current_phase == 'COPY'
+    assert state.phase_expires_at is not None
+
+    persisted = await db_session.get(PartySession, session.session_id, populate_existing=True)
+    assert persisted.current_phase == 'COPY'
+    assert persisted.version == state.version > started_version
+
+
+@pytest.mark.asyncio
+async def test_record_submission_reloads_after_concurrent_write(db_session, player_factory):
+    """A version bump from another worker forces a reload instead of overwriting it."""
+    host = await player_factory()
+    party_service = PartySessionService(db_session)
+
+    session = await party_service.create_session(
+        host_player_id=host.player_id,
+        min_players=1,
+        prompts_per_player=2,
+    )
+    await party_service.start_session(session.session_id, host.player_id)
+    state = await party_service.get_session_state(session.session_id)
+    known_version = state.version
+
+    # Simulate another worker writing the session behind this worker's snapshot
+    await db_session.execute(
+        update(PartySession)
+        .where(PartySession.session_id == session.session_id)
+        .values(version=known_version + 5)
+    )
+    await db_session.commit()
+
+    record = await party_service.record_submission(session.session_id, host.player_id, 'prompt')
+    assert record.participant.prompts_submitted == 1
+    assert get_party_state_store().peek(session.session_id).version == known_version + 6
+
+
+@pytest.mark.asyncio
+async def test_finished_and_idle_sessions_are_evicted(db_session, player_factory):
+    """Completed sessions and snapshots nobody reloads do not stay in memory."""
+    host = await player_factory()
+    party_service = PartySessionService(db_session)
+    store = get_party_state_store()
+
+    session = await party_service.create_session(
+        host_player_id=host.player_id,
+        min_players=1,
+        prompts_per_player=1,
+        copies_per_player=1,
+        votes_per_player=1,
+    )
+    await party_service.start_session(session.session_id, host.player_id)
+    for round_type in ('prompt', 'copy'):
+        await party_service.record_submission(session.session_id, host.player_id, round_type)
+    assert store.peek(session.session_id).current_phase == 'VOTE'
+
+    record = await party_service.record_submission(session.session_id, host.player_id, 'vote')
+    assert record.advanced_to == 'RESULTS'
+    assert store.peek(session.session_id) is None
+    assert session.session_id not in store._locks
+
+    # A finished session is still served, just not cached
+    state = await party_service.get_session_state(session.session_id)
+    assert state.status == 'COMPLETED'
+    assert store.peek(session.session_id) is None
+
+    open_session = await party_service.create_session(host_player_id=(await player_factory()).player_id)
+    await party_service.get_session_state(open_session.session_id)
+    store.lock(open_session.session_id)
+    assert store.prune(max_idle_seconds=60) == 0
+    assert store.prune(max_idle_seconds=0) == 1
+    assert store.peek(open_session.session_id) is None
+    assert open_session.session_id not in store._locks
@@ -0,0 +1,149 @@
+"""Tests for the structured API access log pipeline."""
+import json
+import logging
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from backend.middleware.access_log import (
+    AccessLogMiddleware,
+    AccessLogPipeline,
+    RouteLatencyRegistry,
+)
+
+
+def _build_app(tmp_path, sample_rate: float = 1.0):
+    target = logging.FileHandler(tmp_path / "api.log", encoding="utf-8")
+    pipeline = AccessLogPipeline(target, queue_size=100, batch_size=10)
+    access_logger = logging.getLogger(f"test.access.{tmp_path.name}")
+    access_logger.handlers.clear()
+    access_logger.addHandler(pipeline.handler)
+    access_logger.setLevel(logging.INFO)
+    access_logger.propagate = False
+    registry = RouteLatencyRegistry()
+
+    app = FastAPI()
+    app.middleware("http")(
+        AccessLogMiddleware(
+            access_logger,
+            registry,
+            polling_path_suffixes=("/dashboard",),
+            polling_sample_rate=sample_rate,
+        )
+    )
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"item_id": item_id}
+
+    @app.get("/player/dashboard")
+    async def dashboard():
+        return {"ok": True}
+
+    return app, pipeline, registry, tmp_path / "api.log"
+
+
+def _read_lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_one_json_record_per_request(tmp_path):
+    """Each request produces a single structured record and a route histogram entry."""
+    app, pipeline, registry, log_path = _build_app(tmp_path)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/items/7?expand=true", headers={"user-agent": "pytest-agent"})
+        assert response.status_code == 200
+        missing = await client.get("/items/not-a-number")
+        assert missing.status_code == 422
+
+    assert pipeline.queue.qsize() == 2
+    pipeline.flush()
+
+    records = _read_lines(log_path)
+    assert len(records) == 2
+    first, second = records
+    assert first["method"] == "GET"
+    assert first["path"] == "/items/7"
+    assert first["route"] == "/items/{item_id}"
+    assert first["query"] == "expand=true"
+    assert first["status"] == 200
+    assert first["user_agent"] == "pytest-agent"
+    assert first["level"] == "INFO"
+    assert second["status"] == 422
+    assert second["level"] == "WARNING"
+
+    histogram = registry.get("GET /items/{item_id}")
+    assert histogram is not None
+    assert histogram.count == 2
+
+
+@pytest.mark.asyncio
+async def test_unmatched_paths_share_one_histogram(tmp_path):
+    """404 probes and other unrouted paths do not grow the registry per distinct path."""
+    app, pipeline, registry, _ = _build_app(tmp_path)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        for probe in ("/wp-login.php", "/.env", "/assets/app-3f9a.js"):
+            assert (await client.get(probe)).status_code == 404
+
+    pipeline.flush()
+    assert list(registry.snapshot()) == ["GET <unmatched>"]
+    assert registry.get("GET <unmatched>").count == 3
+
+
+@pytest.mark.asyncio
+async def test_polling_success_is_sampled_but_still_measured(tmp_path):
+    """2xx responses on polling endpoints are sampled out of the log, not the histograms."""
+    app, pipeline, registry, log_path = _build_app(tmp_path, sample_rate=0.0)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        for _ in range(5):
+            assert (await client.get("/player/dashboard")).status_code == 200
+        assert (await client.get("/items/1")).status_code == 200
+
+    pipeline.flush()
+    records = _read_lines(log_path)
+    assert [record["path"] for record in records] == ["/items/1"]
+    assert registry.get("GET /player/dashboard").count == 5
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    """A saturated queue drops records and counts them."""
+    target = logging.FileHandler(tmp_path / "api.log", encoding="utf-8")
+    pipeline = AccessLogPipeline(target, queue_size=2, batch_size=10)
+    access_logger = logging.getLogger("test.access.drops")
+    access_logger.handlers.clear()
+    access_logger.addHandler(pipeline.handler)
+    access_logger.propagate = False
+
+    for i in range(5):
+        access_logger.warning("message %s", i)
+
+    assert pipeline.queue.qsize() == 2
+    assert pipeline.handler.dropped == 3
+
+    pipeline.flush()
+    records = _read_lines(tmp_path / "api.log")
+    assert [record["message"] for record in records] == ["message 0", "message 1"]
+
+
+def test_background_writer_flushes_on_stop(tmp_path):
+    """Stopping the pipeline writes everything already queued."""
+    target = logging.FileHandler(tmp_path / "api.log", encoding="utf-8")
+    pipeline = AccessLogPipeline(target, queue_size=100, batch_size=3, flush_interval_seconds=0.05)
+    access_logger = logging.getLogger("test.access.thread")
+    access_logger.handlers.clear()
+    access_logger.addHandler(pipeline.handler)
+    access_logger.propagate = False
+
+    pipeline.start()
+    for i in range(7):
+        access_logger.warning("message %s", i)
+    pipeline.stop()
+
+    records = _read_lines(tmp_path / "api.log")
+    assert len(records) == 7
+    assert pipeline.batches_written >= 3
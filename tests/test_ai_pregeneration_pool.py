@@ -0,0 +1,87 @@
+"""Tests for speculative impostor-phrase pre-generation."""
+import asyncio
+import uuid
+
+import pytest
+
+from backend.services.ai.pregeneration_pool import ImpostorPregenerationPool
+
+
+class _RecordingGenerator:
+    def __init__(self):
+        self.started: list[uuid.UUID] = []
+        self.finished: list[uuid.UUID] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, prompt_round_id: uuid.UUID) -> None:
+        self.started.append(prompt_round_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await self.release.wait()
+            self.finished.append(prompt_round_id)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_pool_bounds_concurrency_and_pending_budget():
+    generator = _RecordingGenerator()
+    pool = ImpostorPregenerationPool(concurrency=2, max_pending=3, generate=generator)
+    round_ids = [uuid.uuid4() for _ in range(4)]
+
+    assert [pool.enqueue(round_id) for round_id in round_ids] == [True, True, True, False]
+    assert pool.enqueue(round_ids[0]) is True  # already tracked, not double-scheduled
+    assert pool.dropped == 1
+
+    await asyncio.sleep(0)
+    assert generator.in_flight == 2
+
+    generator.release.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert sorted(generator.finished) == sorted(round_ids[:3])
+    assert generator.max_in_flight == 2
+    assert pool.pending_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_running_and_queued_generation():
+    generator = _RecordingGenerator()
+    pool = ImpostorPregenerationPool(concurrency=1, max_pending=10, generate=generator)
+    running, queued = uuid.uuid4(), uuid.uuid4()
+
+    pool.enqueue(running)
+    pool.enqueue(queued)
+    await asyncio.sleep(0)
+    assert generator.started == [running]
+
+    assert pool.cancel(running) is True
+    assert pool.cancel(queued) is True
+    assert pool.cancel(uuid.uuid4()) is False
+
+    generator.release.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert generator.finished == []
+    assert generator.started == [running]
+    assert pool.pending_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_generation_failures_are_contained():
+    async def failing(_prompt_round_id):
+        raise RuntimeError("provider unavailable")
+
+    pool = ImpostorPregenerationPool(generate=failing)
+    round_id = uuid.uuid4()
+    pool.enqueue(round_id)
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    assert pool.pending_count() == 0
+    assert pool.enqueue(round_id) is True
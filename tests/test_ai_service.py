@@ -154,7 +154,7 @@ class TestAICopyGeneration:
     """Test AI copy phrase generation."""
 
     @pytest.mark.asyncio
-    @patch('backend.services.ai.openai_api.generate_copy')
+    @patch('backend.services.ai.llm_gateway.LLMGateway.complete')
     @patch.dict('os.environ', {'OPENAI_API_KEY': 'sk-test'})
     async def test_generate_copy_with_openai(
             self, mock_openai, db_session, mock_prompt_round
@@ -173,7 +173,7 @@ class TestAICopyGeneration:
         mock_openai.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch('backend.services.ai.gemini_api.generate_copy')
+    @patch('backend.services.ai.llm_gateway.LLMGateway.complete')
     @patch.dict('os.environ', {'GEMINI_API_KEY': 'test-key'}, clear=True)
     async def test_generate_copy_with_gemini(
             self, mock_gemini, db_session, mock_prompt_round, mock_validator
@@ -200,7 +200,7 @@ class TestAICopyGeneration:
             mock_gemini.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch('backend.services.ai.openai_api.generate_copy')
+    @patch('backend.services.ai.llm_gateway.LLMGateway.complete')
     @patch.dict('os.environ', {'OPENAI_API_KEY': 'sk-test'})
     async def test_generate_copy_validation_failure(
             self, mock_openai, db_session, mock_prompt_round
@@ -216,7 +216,7 @@ class TestAICopyGeneration:
                 await service.get_impostor_phrase(prompt_round=mock_prompt_round)
 
     @pytest.mark.asyncio
-    @patch('backend.services.ai.openai_api.generate_copy')
+    @patch('backend.services.ai.llm_gateway.LLMGateway.complete')
     @patch.dict('os.environ', {'OPENAI_API_KEY': 'sk-test'})
     async def test_generate_copy_api_failure(
             self, mock_openai, db_session, mock_prompt_round
@@ -275,7 +275,7 @@ class TestAIMetrics:
     """Test AI metrics tracking."""
 
     @pytest.mark.asyncio
-    @patch('backend.services.ai.openai_api.generate_copy')
+    @patch('backend.services.ai.llm_gateway.LLMGateway.complete')
     @patch.dict('os.environ', {'OPENAI_API_KEY': 'sk-test'})
     async def test_metrics_recorded_on_success(
             self, mock_openai, db_session, mock_prompt_round
@@ -303,7 +303,7 @@ class TestAIMetrics:
         assert metric.validation_passed is True
 
     @pytest.mark.asyncio
-    @patch('backend.services.ai.openai_api.generate_copy')
+    @patch('backend.services.ai.llm_gateway.LLMGateway.complete')
     @patch.dict('os.environ', {'OPENAI_API_KEY': 'sk-test'})
     async def test_metrics_recorded_on_failure(
             self, mock_openai, db_session, mock_prompt_round
@@ -380,7 +380,7 @@ class TestAIHintGeneration:
         return prompt_round
 
     @pytest.mark.asyncio
-    @patch("backend.services.ai.openai_api.generate_copy")
+    @patch("backend.services.ai.llm_gateway.LLMGateway.complete")
     async def test_generate_copy_hints_returns_cached_phrases(
             self,
             mock_openai,
@@ -422,7 +422,7 @@ class TestAIHintGeneration:
         assert metrics[0].success is True
 
     @pytest.mark.asyncio
-    @patch("backend.services.ai.openai_api.generate_copy")
+    @patch("backend.services.ai.llm_gateway.LLMGateway.complete")
     async def test_get_hints_reuses_cache(
             self,
             mock_openai,
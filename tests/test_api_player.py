@@ -129,3 +129,12 @@ async def test_health_endpoint(test_app):
     data = response.json()
     assert data["status"] == "ok"
     assert "database" in data
+
+
+@pytest.mark.asyncio
+async def test_latency_endpoint_requires_admin(test_app):
+    """GET /latencyz exposes per-route internals, so it is not public."""
+    async with AsyncClient(transport=ASGITransport(app=test_app), base_url="http://test") as client:
+        response = await client.get("/latencyz")
+
+    assert response.status_code == 401
@@ -20,6 +20,9 @@ from backend.models import (
     Quest,
     Phraseset,
 )
+from backend.models.maintenance_cursor import MaintenanceCursor
+from backend.config import get_settings
+from backend.services.chunked_job_runner import ChunkedJobRunner, ChunkOutcome
 from backend.utils.passwords import hash_password
 
 
@@ -811,6 +814,69 @@ class TestRunAllCleanupTasks:
         assert results["inactive_guests"] >= 1
 
 
+class TestChunkedCleanup:
+    """Test chunked, resumable execution of cleanup jobs."""
+
+    @pytest.mark.asyncio
+    async def test_runner_resumes_from_persisted_cursor(self, db_session):
+        """A run stopped by its time budget should resume where it left off."""
+        items = list(range(5))
+        seen: list[int] = []
+
+        async def process(cursor, limit):
+            start = int(cursor or 0)
+            batch = items[start:start + limit]
+            seen.extend(batch)
+            end = start + len(batch)
+            return ChunkOutcome(processed=len(batch), next_cursor=str(end) if end < len(items) else None)
+
+        paused = await ChunkedJobRunner(db_session, chunk_size=2, time_budget_seconds=0).run("test_job", process)
+        assert paused.completed is False
+        assert paused.processed == 2
+        stored = await db_session.get(MaintenanceCursor, "test_job")
+        assert stored.cursor == "2"
+
+        resumed = await ChunkedJobRunner(
+            db_session, chunk_size=2, time_budget_seconds=60, pause_seconds=0,
+        ).run("test_job", process)
+        assert resumed.resumed_from == "2"
+        assert resumed.completed is True
+        assert resumed.chunks == 2
+        assert len(resumed.chunk_seconds) == 2
+        assert seen == items
+
+        await db_session.refresh(stored)
+        assert stored.cursor is None
+
+    @pytest.mark.asyncio
+    async def test_guest_cleanup_spans_multiple_chunks(self, db_session, monkeypatch):
+        """Guest cleanup should delete every candidate when they span several chunks."""
+        monkeypatch.setattr(get_settings(), "cleanup_chunk_size", 2)
+        monkeypatch.setattr(get_settings(), "cleanup_chunk_pause_seconds", 0)
+        cleanup_service = QFCleanupService(db_session)
+
+        for index in range(5):
+            db_session.add(Player(
+                player_id=uuid4(),
+                username=f"ChunkGuest{index}",
+                username_canonical=f"chunkguest{index}",
+                email=f"chunkguest{index}@example.com",
+                password_hash=hash_password("guest123"),
+                is_guest=True,
+                created_at=datetime.now(UTC) - timedelta(days=10),
+                last_login_date=datetime.now(UTC) - timedelta(days=10),
+            ))
+        await db_session.commit()
+
+        deleted_count = await cleanup_service.cleanup_inactive_guest_players(hours_old=168)
+
+        assert deleted_count == 5
+        result = await db_session.execute(select(Player).where(Player.username.like("ChunkGuest%")))
+        assert result.scalars().all() == []
+        cursor = await db_session.get(MaintenanceCursor, "qf_inactive_guest_cleanup")
+        assert cursor is None or cursor.cursor is None
+
+
 class TestRecycledSuffixDetection:
     """Test the _has_recycled_suffix helper method."""
 
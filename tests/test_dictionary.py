@@ -0,0 +1,47 @@
+"""Tests for the memory-mapped dictionary index."""
+
+from backend.services.dictionary import CompactDictionary, build_dictionary_index
+
+
+def _write_source(path, words):
+    path.write_text("\n".join(words) + "\n")
+
+
+def test_index_supports_membership_len_and_sorted_iteration(tmp_path):
+    source = tmp_path / "dictionary.txt"
+    _write_source(source, ["zebra", "cat", "apple", "Cat", "be", "tables"])
+
+    dictionary = CompactDictionary(source, tmp_path / "dictionary.idx")
+
+    assert len(dictionary) == 5
+    assert list(dictionary) == ["APPLE", "BE", "CAT", "TABLES", "ZEBRA"]
+    assert "CAT" in dictionary
+    assert "ZEBRA" in dictionary
+    assert "DOG" not in dictionary
+    assert "CA" not in dictionary
+    assert "" not in dictionary
+    assert "CAFÉ" not in dictionary
+    assert sorted(dictionary.short_word(i) for i in range(dictionary.short_word_count)) == ["APPLE", "CAT", "ZEBRA"]
+
+
+def test_stale_index_is_rebuilt_when_source_changes(tmp_path):
+    source = tmp_path / "dictionary.txt"
+    index_path = tmp_path / "dictionary.idx"
+    _write_source(source, ["cat"])
+    build_dictionary_index(source, index_path)
+
+    _write_source(source, ["cat", "dog"])
+    dictionary = CompactDictionary(source, index_path)
+
+    assert "DOG" in dictionary
+    assert len(dictionary) == 2
+
+
+def test_prebuilt_index_is_used_without_source(tmp_path):
+    source = tmp_path / "dictionary.txt"
+    index_path = tmp_path / "dictionary.idx"
+    _write_source(source, ["cat"])
+    build_dictionary_index(source, index_path)
+    source.unlink()
+
+    assert "CAT" in CompactDictionary(source, index_path)
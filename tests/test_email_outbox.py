@@ -0,0 +1,134 @@
+"""Tests for outbox-based email delivery."""
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from backend.config import get_settings
+from backend.models.email_outbox import EmailOutbox
+from backend.services.email_outbox import MAGIC_LINK_EMAIL, PLAIN_EMAIL, EmailOutboxDispatcher, enqueue_email
+from backend.services.magic_link_mailer import MagicLinkMailer, MagicLinkMailerError
+from backend.utils.datetime_helpers import ensure_utc
+
+
+class _FlakyMailer:
+    """Fails a fixed number of sends, recording whether a transaction was open."""
+
+    def __init__(self, db, failures: int):
+        self.db = db
+        self.failures = failures
+        self.sent: list[str] = []
+        self.transaction_open_during_send: list[bool] = []
+
+    async def send_email(self, *, to_email: str, subject: str, body: str) -> None:
+        self.transaction_open_during_send.append(self.db.in_transaction())
+        if self.failures:
+            self.failures -= 1
+            raise MagicLinkMailerError("smtp_delivery_failed")
+        self.sent.append(to_email)
+
+    async def send_magic_link(self, *, to_email: str, link_url: str, expires_at: datetime) -> None:
+        await self.send_email(to_email=to_email, subject="Sign in", body=link_url)
+
+
+@pytest.mark.asyncio
+async def test_outbox_retries_with_backoff_outside_transactions(db_session):
+    """A failed send is rescheduled with backoff and delivered by a later dispatch."""
+
+    email = enqueue_email(
+        db_session,
+        kind=PLAIN_EMAIL,
+        to_email="outbox@example.com",
+        payload={"subject": "Hello", "body": "Body"},
+    )
+    await db_session.commit()
+
+    mailer = _FlakyMailer(db_session, failures=1)
+    dispatcher = EmailOutboxDispatcher(db_session, mailer)
+
+    assert await dispatcher.deliver(email.email_id) == "pending"
+    await db_session.refresh(email)
+    assert email.attempts == 1
+    assert email.last_error == "smtp_delivery_failed"
+    retry_delay = ensure_utc(email.next_attempt_at) - datetime.now(UTC)
+    assert timedelta(seconds=0) < retry_delay <= timedelta(seconds=get_settings().email_outbox_retry_base_seconds)
+
+    # Not due yet, so the background dispatch leaves it alone
+    assert await dispatcher.dispatch_due() == 0
+
+    await db_session.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.email_id == email.email_id)
+        .values(next_attempt_at=datetime.now(UTC) - timedelta(seconds=1))
+    )
+    await db_session.commit()
+    assert await dispatcher.dispatch_due() == 1
+
+    await db_session.refresh(email)
+    assert email.status == "sent"
+    assert email.payload == {}
+    assert mailer.sent == ["outbox@example.com"]
+    assert mailer.transaction_open_during_send == [False, False]
+
+
+@pytest.mark.asyncio
+async def test_outbox_drops_expired_links_and_prunes_finished_rows(db_session):
+    """Expired links are never mailed, given-up rows lose their link, and finished rows are pruned."""
+
+    now = datetime.now(UTC)
+    expired = enqueue_email(
+        db_session,
+        kind=MAGIC_LINK_EMAIL,
+        to_email="expired@example.com",
+        payload={"link_url": "https://example.com/magic-link?token=old", "expires_at": (now - timedelta(minutes=1)).isoformat()},
+    )
+    failing = enqueue_email(
+        db_session,
+        kind=MAGIC_LINK_EMAIL,
+        to_email="failing@example.com",
+        payload={"link_url": "https://example.com/magic-link?token=new", "expires_at": (now + timedelta(minutes=15)).isoformat()},
+    )
+    await db_session.commit()
+
+    mailer = _FlakyMailer(db_session, failures=1)
+    dispatcher = EmailOutboxDispatcher(db_session, mailer)
+    assert await dispatcher.deliver(expired.email_id) == "failed"
+    await db_session.refresh(expired)
+    assert expired.payload == {}
+    assert expired.last_error == "link_expired"
+    assert mailer.transaction_open_during_send == []
+
+    dispatcher.settings = get_settings().model_copy(update={"email_outbox_max_attempts": 1})
+    assert await dispatcher.deliver(failing.email_id) == "failed"
+    await db_session.refresh(failing)
+    assert failing.payload == {}
+
+    # Only finished rows past the retention window are deleted
+    await db_session.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.email_id == expired.email_id)
+        .values(created_at=now - timedelta(hours=get_settings().email_outbox_retention_hours + 1))
+    )
+    await db_session.commit()
+    assert await dispatcher.prune() == 1
+    assert await db_session.get(EmailOutbox, expired.email_id, populate_existing=True) is None
+    assert await db_session.get(EmailOutbox, failing.email_id) is not None
+
+
+@pytest.mark.asyncio
+async def test_mailer_writes_drop_file_without_smtp(tmp_path):
+    """Without SMTP, the loopback drop directory receives the rendered message."""
+
+    settings = get_settings().model_copy(update={"smtp_host": "", "email_drop_dir": str(tmp_path)})
+    await MagicLinkMailer(settings).send_magic_link(
+        to_email="drop@example.com",
+        link_url="https://example.com/magic-link?token=abc",
+        expires_at=datetime.now(UTC),
+    )
+
+    [message_file] = list(tmp_path.glob("*.eml"))
+    content = message_file.read_text()
+    assert "To: drop@example.com" in content
+    assert "token=abc" in content
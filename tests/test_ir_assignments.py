@@ -11,6 +11,7 @@ from backend.models.ir.backronym_entry import BackronymEntry
 from backend.models.ir.player_data import IRPlayerData
 from backend.models.ir.transaction import IRTransaction
 from backend.services.ir.assignment_service import IRAssignmentError, IRAssignmentService
+from backend.services.ir.open_set_index import get_ir_open_set_index
 from backend.services.ir.player_service import IRPlayerService
 from backend.services.phrase_validator import PhraseValidator
 from backend.utils.passwords import hash_password
@@ -126,6 +127,61 @@ async def test_assign_reserves_at_most_five_players_per_open_set(db_session):
     ) == 5
 
 
+
+@pytest.mark.asyncio
+async def test_open_set_index_matches_database_after_rebuild(db_session):
+    players = [await _create_player(db_session) for _ in range(3)]
+    service = IRAssignmentService(db_session)
+    index = get_ir_open_set_index()
+
+    assignment, set_obj = await service.assign(players[0].player_id)
+    await service.assign(players[1].player_id)
+    await service.submit(
+        players[0].player_id, set_obj.set_id, assignment.assignment_token, _valid_words(set_obj)
+    )
+
+    slots = index.peek(set_obj.set_id)
+    assert (slots.entry_count, len(slots.reserved), slots.free_slots) == (1, 1, 3)
+    assert await index.find(db_session, players[0].player_id) is None
+
+    # A restarted worker rebuilds the same slot counts from the database
+    index.reset()
+    assert await index.find(db_session, players[2].player_id) == set_obj.set_id
+    rebuilt = index.peek(set_obj.set_id)
+    assert (rebuilt.entry_count, rebuilt.reserved, rebuilt.players) == (
+        1,
+        {players[1].player_id},
+        {players[0].player_id, players[1].player_id},
+    )
+
+    await service.set_service.transition_to_voting(set_obj.set_id)
+    assert index.peek(set_obj.set_id) is None
+
+@pytest.mark.asyncio
+async def test_assign_confirms_slot_against_other_workers_reservations(db_session):
+    players = [await _create_player(db_session) for _ in range(6)]
+    service = IRAssignmentService(db_session)
+    index = get_ir_open_set_index()
+
+    _, set_obj = await service.assign(players[0].player_id)
+    set_id = set_obj.set_id
+    for player in players[1:4]:
+        await service.assign(player.player_id)
+    assert index.peek(set_id).free_slots == 1
+
+    # Another worker reserves the last slot; this worker's index has not seen it
+    db_session.add(IRAssignment(player_id=players[4].player_id, set_id=set_id, status="assigned"))
+    await db_session.commit()
+
+    _, late_set = await service.assign(players[5].player_id)
+
+    assert late_set.set_id != set_id
+    assert index.peek(set_id).free_slots == 0
+    assert await db_session.scalar(
+        select(func.count(IRAssignment.assignment_id)).where(IRAssignment.set_id == set_id)
+    ) == 5
+
+
 @pytest.mark.asyncio
 async def test_transition_expires_unsubmitted_assignments(db_session):
     players = [await _create_player(db_session) for _ in range(2)]
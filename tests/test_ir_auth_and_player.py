@@ -1,6 +1,7 @@
 """Tests for IR authentication and player services."""
 import pytest
 import uuid
+from datetime import UTC, datetime
 from backend.services import AuthService, GameType
 from backend.services import IRPlayerService
 from backend.utils.passwords import hash_password, verify_password
@@ -241,6 +242,56 @@ async def test_ir_auth_refresh_token(db_session):
     assert len(new_access_token) > 0
 
 
+
+@pytest.mark.asyncio
+async def test_refresh_rotation_grace_and_revocation(db_session):
+    """A just-rotated token replays its replacement; revocations apply immediately."""
+    from sqlalchemy import update
+    from backend.models.refresh_token import RefreshToken
+    from backend.services.auth_service import AuthError
+    from backend.services.refresh_session_cache import hash_refresh_token
+
+    auth_service = AuthService(db_session, GameType.IR)
+    player, _, first_token = await _register_ir_player(
+        auth_service, f"grace{uuid.uuid4().hex[:8]}@example.com", "TestPassword123!"
+    )
+
+    _, _, second_token, _ = await auth_service.exchange_refresh_token(first_token)
+    # Concurrent refresh with the old token from the same client
+    replay_player, replay_access, replay_token, _ = await auth_service.exchange_refresh_token(first_token)
+    assert replay_token == second_token
+    assert replay_player.player_id == player.player_id
+    assert replay_access
+
+    await auth_service.revoke_refresh_token(second_token)
+    for token in (first_token, second_token):
+        with pytest.raises(AuthError):
+            await auth_service.exchange_refresh_token(token)
+
+    # A revocation written by another worker is honoured despite the cached session
+    _, third_token, _ = await auth_service.issue_tokens(player)
+    await db_session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.token_hash == hash_refresh_token(third_token))
+        .values(revoked_at=datetime.now(UTC))
+    )
+    await db_session.commit()
+    with pytest.raises(AuthError):
+        await auth_service.exchange_refresh_token(third_token)
+
+    # A logout written by another worker ends the grace window for the replacement too
+    await db_session.refresh(player)
+    _, fourth_token, _ = await auth_service.issue_tokens(player)
+    _, _, fifth_token, _ = await auth_service.exchange_refresh_token(fourth_token)
+    await db_session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.token_hash == hash_refresh_token(fifth_token))
+        .values(revoked_at=datetime.now(UTC))
+    )
+    await db_session.commit()
+    with pytest.raises(AuthError):
+        await auth_service.exchange_refresh_token(fourth_token)
+
 @pytest.mark.asyncio
 async def test_ir_auth_verify_access_token(db_session):
     """Test verifying access tokens."""
@@ -272,3 +272,91 @@ async def test_ir_insufficient_balance_blocking(db_session):
 
     print(f"✅ Insufficient balance blocking test passed!")
     print(f"   - Player with 50 IC cannot debit 100 IC (insufficient balance)")
+
+
+@pytest.mark.asyncio
+async def test_ir_pending_results_recorded_at_finalization(db_session):
+    """Finalizing a set records per-player payouts; claiming clears them from the pending list."""
+    auth_service = AuthService(db_session, GameType.IR)
+    set_service = IRBackronymSetService(db_session)
+    vote_service = IRVoteService(db_session)
+    result_service = IRResultViewService(db_session)
+
+    backronym_set = await set_service.create_set(mode="standard")
+    entries = []
+    for i in range(5):
+        player, _ = await _register_ir_player(
+            auth_service, f"pending{i}{uuid.uuid4().hex[:4]}@example.com", "TestPassword123!"
+        )
+        entries.append(await set_service.add_entry(
+            set_id=backronym_set.set_id,
+            player_id=player.player_id,
+            backronym_text=[f"word{j}_{i}" for j in range(len(backronym_set.word))],
+        ))
+
+    voter, _ = await _register_ir_player(
+        auth_service, f"pendingvoter{uuid.uuid4().hex[:4]}@example.com", "TestPassword123!"
+    )
+    await vote_service.submit_vote(
+        set_id=backronym_set.set_id,
+        player_id=voter.player_id,
+        chosen_entry_id=entries[0].entry_id,
+        is_participant=False,
+    )
+    await set_service.finalize_set(str(backronym_set.set_id))
+
+    pending = await result_service.get_pending_results(voter.player_id)
+    assert [item["set_id"] for item in pending] == [str(backronym_set.set_id)]
+    assert pending[0]["payout_amount"] > 0
+
+    claimed = await result_service.claim_result(voter.player_id, str(backronym_set.set_id))
+    assert claimed["payout_amount"] == pending[0]["payout_amount"]
+    assert claimed["first_viewed_at"] is not None
+    assert await result_service.get_pending_results(voter.player_id) == []
+
+
+@pytest.mark.asyncio
+async def test_ir_payouts_snapshotted_once_at_finalization(db_session, monkeypatch):
+    """Result reads are served from the finalization snapshot, never recomputed."""
+    from backend.models.ir.payout_snapshot import IRPayoutSnapshot
+    from backend.services.ir.scoring_service import IRScoringService
+
+    auth_service = AuthService(db_session, GameType.IR)
+    set_service = IRBackronymSetService(db_session)
+    vote_service = IRVoteService(db_session)
+    result_service = IRResultViewService(db_session)
+
+    backronym_set = await set_service.create_set(mode="standard")
+    entries = []
+    for i in range(5):
+        player, _ = await _register_ir_player(
+            auth_service, f"snapshot{i}{uuid.uuid4().hex[:4]}@example.com", "TestPassword123!"
+        )
+        entries.append(await set_service.add_entry(
+            set_id=backronym_set.set_id,
+            player_id=player.player_id,
+            backronym_text=[f"word{j}_{i}" for j in range(len(backronym_set.word))],
+        ))
+    voter, _ = await _register_ir_player(
+        auth_service, f"snapshotvoter{uuid.uuid4().hex[:4]}@example.com", "TestPassword123!"
+    )
+    await vote_service.submit_vote(
+        set_id=backronym_set.set_id,
+        player_id=voter.player_id,
+        chosen_entry_id=entries[0].entry_id,
+        is_participant=False,
+    )
+    await set_service.finalize_set(str(backronym_set.set_id))
+
+    snapshot = await db_session.get(IRPayoutSnapshot, backronym_set.set_id)
+    assert snapshot is not None
+    assert str(voter.player_id) in snapshot.payouts["voter_payouts"]
+
+    async def fail_recompute(self, set_id):
+        raise AssertionError("payouts recomputed after finalization")
+
+    monkeypatch.setattr(IRScoringService, "calculate_payouts", fail_recompute)
+    details = await result_service.get_result_details(voter.player_id, str(backronym_set.set_id))
+    assert details["full_payouts"] == snapshot.payouts
+    assert details["payout_amount"] == snapshot.payouts["voter_payouts"][str(voter.player_id)]
+    assert details["winning_entry_id"] == str(entries[0].entry_id)
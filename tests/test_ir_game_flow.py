@@ -289,3 +289,63 @@ async def test_ir_player_insufficient_balance(db_session, ir_player_factory):
             transaction_type="ir_backronym_entry",
             reference_id=None
         )
+
+
+@pytest.mark.asyncio
+async def test_ir_backup_cycle_fills_stalled_set_in_one_pass(db_session, ir_player_factory, monkeypatch):
+    """Backup cycle generates the whole deficit in one request and applies it in bulk."""
+    from datetime import UTC, datetime, timedelta
+
+    from sqlalchemy import select
+
+    from backend.models.ir.backronym_vote import BackronymVote
+    from backend.services import AIService
+    from backend.services.ai.ir_backup_orchestrator import IRBackupOrchestrator
+
+    set_service = IRBackronymSetService(db_session)
+    player = await ir_player_factory()
+    backronym_set = await set_service.create_set(mode="standard")
+    letters = len(backronym_set.word)
+    await set_service.add_entry(
+        set_id=str(backronym_set.set_id),
+        player_id=str(player.player_id),
+        backronym_text=[f"HUMAN{'X' * i}" for i in range(letters)],
+    )
+    backronym_set.created_at = datetime.now(UTC) - timedelta(hours=1)
+    await db_session.commit()
+
+    ai_service = AIService(db_session, allow_no_provider=True)
+    requested_counts = []
+
+    async def fake_generate_backronyms(word, count):
+        requested_counts.append((word, count))
+        return [["AI"] * len(word) for _ in range(count)]
+
+    monkeypatch.setattr(ai_service, "generate_backronyms", fake_generate_backronyms)
+
+    await IRBackupOrchestrator(ai_service).run_backup_cycle()
+
+    await db_session.refresh(backronym_set)
+    assert (backronym_set.word, 4) in requested_counts
+    assert backronym_set.entry_count == 5
+    assert backronym_set.status == "voting"
+
+    details = await set_service.get_set_details(str(backronym_set.set_id))
+    entry_players = {str(entry["player_id"]) for entry in details["entries"]}
+    assert len(entry_players) == 5
+
+    # Once voting stalls, AI votes come from accounts that wrote none of the entries
+    backronym_set.first_participant_joined_at = datetime.now(UTC) - timedelta(hours=1)
+    await db_session.commit()
+
+    async def fake_generate_vote(word, backronyms):
+        return 0
+
+    monkeypatch.setattr(ai_service, "generate_backronym_vote", fake_generate_vote)
+    await IRBackupOrchestrator(ai_service).run_backup_cycle()
+
+    voters = {str(vote.player_id) for vote in (await db_session.execute(
+        select(BackronymVote).where(BackronymVote.set_id == backronym_set.set_id)
+    )).scalars()}
+    assert len(voters) == 5
+    assert voters.isdisjoint(entry_players)
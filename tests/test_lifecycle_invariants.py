@@ -13,7 +13,7 @@ from backend.migrations.versions.b1d2c3e4f5a6_add_lifecycle_invariants import (
 )
 from backend.models.qf.party_session import PartySession
 from backend.models.qf.transaction import QFTransaction
-from backend.services.transaction_service import TransactionService
+from backend.services.transaction_service import LedgerMovement, TransactionService
 from backend.utils.idempotency import build_idempotency_key
 from backend.utils.model_registry import GameType
 
@@ -199,6 +199,54 @@ async def test_split_payout_keys_distinguish_contributor_roles(
     assert int(count) == 4
 
 
+@pytest.mark.asyncio
+async def test_apply_movements_batches_credits_and_skips_replays(
+    db_session,
+    player_factory,
+):
+    """A payout batch moves each balance once and tracks per-leg balances, even when partly replayed."""
+
+    first_player = await player_factory()
+    second_player = await player_factory()
+    service = TransactionService(db_session, GameType.QF)
+    reference_id = uuid.uuid4()
+
+    replayed = await service.create_transaction(
+        first_player.player_id,
+        30,
+        "prize_payout",
+        reference_id=reference_id,
+        idempotency_key=f"qf:batch:{reference_id}:first",
+    )
+    movements = [
+        LedgerMovement(first_player.player_id, 30, "prize_payout", reference_id,
+                       idempotency_key=f"qf:batch:{reference_id}:first"),
+        LedgerMovement(first_player.player_id, 12, "vault_rake", reference_id, "vault"),
+        LedgerMovement(second_player.player_id, 20, "prize_payout", reference_id),
+        LedgerMovement(second_player.player_id, 5, "vault_rake", reference_id, "vault"),
+    ]
+    transactions = await service.apply_movements(movements, auto_commit=True)
+
+    assert transactions[0].transaction_id == replayed.transaction_id
+    assert [txn.amount for txn in transactions] == [30, 12, 20, 5]
+    assert (transactions[2].wallet_balance_after, transactions[2].vault_balance_after) == (5020, 0)
+    assert (transactions[3].wallet_balance_after, transactions[3].vault_balance_after) == (5020, 5)
+
+    await db_session.refresh(first_player)
+    await db_session.refresh(second_player)
+    assert (first_player.wallet, first_player.vault) == (5030, 12)
+    assert (second_player.wallet, second_player.vault) == (5020, 5)
+    count = await db_session.scalar(
+        select(func.count(QFTransaction.transaction_id)).where(
+            QFTransaction.reference_id == reference_id,
+        )
+    )
+    assert int(count) == 4
+
+    with pytest.raises(ValueError, match="only applies credits"):
+        await service.apply_movements([LedgerMovement(first_player.player_id, -1, "round_entry")])
+
+
 @pytest.mark.asyncio
 async def test_versioned_party_session_rejects_stale_update(db_session, test_engine, player_factory):
     """Versioned lifecycle rows should reject stale concurrent writes."""
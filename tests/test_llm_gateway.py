@@ -0,0 +1,197 @@
+"""Tests for the pooled LLM gateway against a stub OpenAI-compatible server."""
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from backend.config import get_settings
+from backend.services.ai import llm_gateway
+from backend.services.ai.llm_gateway import GeminiError, LLMGateway, LLMGatewayError, OpenAIAPIError
+
+
+class _StubOpenAIServer:
+    """Minimal OpenAI-compatible endpoint served through an httpx transport."""
+
+    def __init__(self, delay: float = 0.0, status_code: int = 200):
+        self.delay = delay
+        self.status_code = status_code
+        self.requests: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.requests.append({"path": request.url.path, "body": body})
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, json={"error": {"message": "stub failure"}})
+        if request.url.path.endswith("/chat/completions"):
+            return httpx.Response(200, json=_chat_completion(f"echo: {body['messages'][-1]['content']}"))
+        if request.url.path.endswith("/embeddings"):
+            dimensions = body.get("dimensions", 3)
+            return httpx.Response(200, json=_embedding([0.5] * dimensions))
+        return httpx.Response(404)
+
+
+def _chat_completion(content: str) -> dict:
+    return {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "stub-model",
+        "choices": [{
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": content},
+        }],
+    }
+
+
+def _embedding(vector: list[float]) -> dict:
+    return {
+        "object": "list",
+        "model": "stub-embedding",
+        "data": [{"object": "embedding", "index": 0, "embedding": vector}],
+        "usage": {"prompt_tokens": 1, "total_tokens": 1},
+    }
+
+
+@pytest.fixture
+def configure(monkeypatch):
+    """Point the gateway at the stub server with the given concurrency."""
+    def _configure(max_concurrency: int = 8):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        monkeypatch.setenv("AI_OPENAI_BASE_URL", "http://llm-stub.test/v1")
+        monkeypatch.setenv("AI_OPENAI_MAX_CONCURRENCY", str(max_concurrency))
+        get_settings.cache_clear()
+
+    yield _configure
+    get_settings.cache_clear()
+
+
+def _gateway(server: _StubOpenAIServer) -> LLMGateway:
+    return LLMGateway(openai_http_client=httpx.AsyncClient(transport=httpx.MockTransport(server)))
+
+
+@pytest.mark.asyncio
+async def test_complete_and_embed_share_one_pooled_client(configure):
+    configure()
+    server = _StubOpenAIServer()
+    gateway = _gateway(server)
+
+    assert await gateway.complete("hello", provider="openai", model="stub-model") == "echo: hello"
+    client = gateway._openai_client
+    assert await gateway.embed("hello", dimensions=4) == [0.5, 0.5, 0.5, 0.5]
+
+    assert gateway._openai_client is client
+    assert [request["path"] for request in server.requests] == ["/v1/chat/completions", "/v1/embeddings"]
+    assert server.requests[0]["body"]["model"] == "stub-model"
+    await gateway.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_caps_in_flight_requests(configure):
+    configure(max_concurrency=2)
+    server = _StubOpenAIServer(delay=0.02)
+    gateway = _gateway(server)
+
+    results = await asyncio.gather(*(gateway.complete(f"p{i}", provider="openai") for i in range(6)))
+
+    assert results == [f"echo: p{i}" for i in range(6)]
+    assert server.max_in_flight == 2
+    await gateway.aclose()
+
+
+@pytest.mark.asyncio
+async def test_timeouts_and_http_errors_raise_provider_errors(configure):
+    configure()
+    slow_gateway = _gateway(_StubOpenAIServer(delay=1.0))
+    with pytest.raises(OpenAIAPIError, match="timed out"):
+        await slow_gateway.complete("slow", provider="openai", timeout=0.05)
+
+    failing_gateway = _gateway(_StubOpenAIServer(status_code=400))
+    with pytest.raises(OpenAIAPIError, match="OpenAI API error"):
+        await failing_gateway.embed("bad")
+
+    with pytest.raises(LLMGatewayError, match="Unknown AI provider"):
+        await failing_gateway.complete("x", provider="mystery")
+
+    await slow_gateway.aclose()
+    await failing_gateway.aclose()
+
+
+@pytest.mark.asyncio
+async def test_missing_api_key_is_reported_without_network(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "")
+    get_settings.cache_clear()
+    try:
+        with pytest.raises(OpenAIAPIError, match="OPENAI_API_KEY"):
+            await LLMGateway().complete("hello", provider="openai")
+    finally:
+        get_settings.cache_clear()
+
+
+class _SlowGeminiModels:
+    """Stand-in for the sync Gemini SDK that streams one chunk every 20ms, forever."""
+
+    def __init__(self):
+        self.http_timeouts: list[int] = []
+        self.live_threads = 0
+        self.max_live_threads = 0
+        self._lock = threading.Lock()
+
+    def generate_content_stream(self, *, model, contents, config):
+        self.http_timeouts.append(config.http_options.timeout)
+        with self._lock:
+            self.live_threads += 1
+            self.max_live_threads = max(self.max_live_threads, self.live_threads)
+        try:
+            while True:
+                time.sleep(0.02)
+                yield SimpleNamespace(text="x")
+        finally:
+            with self._lock:
+                self.live_threads -= 1
+
+
+@pytest.mark.asyncio
+async def test_gemini_timeout_stops_the_worker_thread_before_releasing_the_slot(monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.setenv("AI_GEMINI_MAX_CONCURRENCY", "1")
+    get_settings.cache_clear()
+    fake_types = SimpleNamespace(
+        Content=lambda **kwargs: kwargs,
+        Part=SimpleNamespace(from_text=lambda text: text),
+        GenerateContentConfig=lambda **kwargs: SimpleNamespace(**kwargs),
+        ThinkingConfig=lambda **kwargs: kwargs,
+        HttpOptions=lambda timeout: SimpleNamespace(timeout=timeout),
+    )
+    monkeypatch.setattr(llm_gateway, "genai", SimpleNamespace())
+    monkeypatch.setattr(llm_gateway, "types", fake_types)
+    models = _SlowGeminiModels()
+    gateway = LLMGateway()
+    gateway._gemini_client = SimpleNamespace(models=models)
+
+    try:
+        results = await asyncio.gather(
+            *(gateway.complete(f"p{i}", provider="gemini", timeout=0.1) for i in range(3)),
+            return_exceptions=True,
+        )
+    finally:
+        get_settings.cache_clear()
+
+    assert all(isinstance(result, GeminiError) for result in results)
+    assert models.http_timeouts == [100, 100, 100]
+    assert models.max_live_threads == 1
+    assert models.live_threads == 0
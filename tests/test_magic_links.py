@@ -12,6 +12,8 @@ from backend.models.account import Account
 from backend.models.magic_link import MagicLink
 from backend.models.player import Player
 from backend.models.qf.player_data import QFPlayerData
+from backend.models.qf.transaction import QFTransaction
+from backend.services.player_merge_plan import PlayerReassignmentPlan
 
 
 API_BASE_URL = "http://test/qf"
@@ -359,3 +361,37 @@ async def test_magic_link_rejects_spoofed_frontend_origin(test_app, db_session,
         assert request_response.status_code == 400
         assert request_response.json()["detail"] == "invalid_frontend_origin"
         assert not sent_links
+
+
+@pytest.mark.asyncio
+async def test_reassignment_plan_only_touches_tables_with_guest_rows(db_session, player_factory):
+    """The precomputed plan matches the live schema and updates only tables the guest used."""
+
+    guest = await player_factory()
+    saved = await player_factory()
+    db_session.add(
+        QFTransaction(
+            player_id=guest.player_id,
+            amount=25,
+            type="daily_bonus",
+            wallet_balance_after=25,
+        )
+    )
+    await db_session.flush()
+
+    plan = PlayerReassignmentPlan.from_metadata()
+    assert ("qf_transactions", "player_id") in {(t.table, t.column) for t in plan.targets}
+    assert not any(t.table in {"accounts", "refresh_tokens"} for t in plan.targets)
+    problems = await db_session.run_sync(lambda session: plan.validate(session.connection()))
+    assert not [problem for problem in problems if "missing" in problem]
+    assert plan.validated
+
+    tables = await plan.execute(db_session, guest.player_id, saved.player_id)
+    assert tables == ["qf_transactions"]
+
+    moved = await db_session.scalar(
+        select(QFTransaction.player_id).where(QFTransaction.amount == 25, QFTransaction.type == "daily_bonus")
+    )
+    assert moved == saved.player_id
+    assert await plan.execute(db_session, guest.player_id, saved.player_id) == []
+
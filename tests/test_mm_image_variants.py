@@ -0,0 +1,128 @@
+"""Tests for derived Meme Mint image variants."""
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from PIL import Image as PILImage
+
+from backend.models.mm.image import MMImage
+from backend.routers.mm import images
+from backend.services.mm import image_variants
+
+
+def _write_variants(root, key, width, formats):
+    (root / key).mkdir(parents=True, exist_ok=True)
+    for fmt in formats:
+        (root / key / f"{width}.{fmt}").write_bytes(f"{fmt}-bytes".encode())
+
+
+def test_display_urls_fall_back_to_original_without_variants():
+    image = MMImage(source_url="/api/mm/images/image001.png", thumbnail_url=None, variants=None)
+
+    urls = image_variants.image_display_urls(image)
+
+    assert urls["image_url"] == "/api/mm/images/image001.png"
+    assert urls["image_srcset"] is None
+    assert urls["image_placeholder"] is None
+
+
+def test_display_urls_use_variants_when_present(tmp_path, monkeypatch):
+    monkeypatch.setattr(image_variants, "VARIANTS_DIR", tmp_path)
+    for width in (320, 640, 1280):
+        _write_variants(tmp_path, "image001-abc", width, ["webp"])
+    image = MMImage(
+        source_url="/api/mm/images/image001.png",
+        variants={
+            "key": "image001-abc",
+            "widths": [320, 640, 1280],
+            "formats": ["webp"],
+            "placeholder": "data:image/webp;base64,AAAA",
+        },
+    )
+
+    urls = image_variants.image_display_urls(image)
+
+    assert urls["image_url"] == "/api/mm/images/variants/image001-abc/1280"
+    assert urls["thumbnail_url"] == "/api/mm/images/variants/image001-abc/320"
+    assert urls["image_srcset"].startswith("/api/mm/images/variants/image001-abc/320 320w, ")
+    assert urls["image_placeholder"] == "data:image/webp;base64,AAAA"
+
+
+@pytest.mark.asyncio
+async def test_missing_variants_fall_back_to_github_originals(tmp_path, monkeypatch):
+    """A deploy without built variant files serves the originals, redirected to GitHub."""
+    monkeypatch.setattr(image_variants, "VARIANTS_DIR", tmp_path)
+    monkeypatch.setattr(images.settings, "serve_images_from_github", True)
+    image = MMImage(
+        source_url="/api/mm/images/image001.png",
+        thumbnail_url="/api/mm/images/variants/image001-abc/320",
+        variants={"key": "image001-abc", "widths": [320, 640, 1280], "formats": ["webp"], "placeholder": None},
+    )
+
+    urls = image_variants.image_display_urls(image)
+
+    assert urls["image_url"] == "/api/mm/images/image001.png"
+    assert urls["thumbnail_url"] is None
+    assert urls["image_srcset"] is None
+
+    app = FastAPI()
+    app.include_router(images.router)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        original = await client.get("/images/image001.png")
+    assert original.status_code == 302
+    assert original.headers["location"] == f"{images.settings.github_images_base_url}/mm_images/image001.png"
+
+    # Once the variants are built on this deploy they are used even in GitHub mode
+    for width in (320, 640, 1280):
+        _write_variants(tmp_path, "image001-abc", width, ["webp"])
+    assert image_variants.image_display_urls(image)["image_url"] == "/api/mm/images/variants/image001-abc/1280"
+
+
+@pytest.mark.asyncio
+async def test_variant_route_negotiates_format(tmp_path, monkeypatch):
+    monkeypatch.setattr(image_variants, "VARIANTS_DIR", tmp_path)
+    _write_variants(tmp_path, "image001-abc", 640, ["avif", "webp"])
+    app = FastAPI()
+    app.include_router(images.router)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        avif = await client.get("/images/variants/image001-abc/640", headers={"accept": "image/avif,image/webp,*/*"})
+        webp = await client.get("/images/variants/image001-abc/640", headers={"accept": "image/webp,*/*"})
+        fallback = await client.get("/images/variants/image001-abc/640", headers={"accept": "*/*"})
+        missing = await client.get("/images/variants/image001-abc/320")
+        invalid = await client.get("/images/variants/..%2Fsecret/320")
+
+    assert avif.headers["content-type"] == "image/avif"
+    assert avif.content == b"avif-bytes"
+    assert avif.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert avif.headers["vary"] == "Accept"
+    assert webp.headers["content-type"] == "image/webp"
+    assert fallback.headers["content-type"] == "image/webp"
+    assert missing.status_code == 404
+    assert invalid.status_code in {400, 404}
+
+
+def test_build_image_variants_writes_widths_and_placeholder(tmp_path):
+    source = tmp_path / "image001.png"
+    PILImage.new("RGB", (800, 600), color=(200, 40, 40)).save(source)
+
+    variants = image_variants.build_image_variants(source, output_dir=tmp_path / "variants")
+
+    assert variants["widths"] == [320, 640, 800]
+    assert variants["placeholder"].startswith("data:image/webp;base64,")
+    assert (tmp_path / "variants" / variants["key"] / "320.webp").is_file()
+
+
+def test_build_image_variants_rebuild_overwrites_existing_files(tmp_path):
+    source = tmp_path / "image001.png"
+    PILImage.new("RGB", (400, 300), color=(40, 200, 40)).save(source)
+    output_dir = tmp_path / "variants"
+    key = image_variants.variant_key(source)
+    _write_variants(output_dir, key, 320, ["webp"])
+
+    image_variants.build_image_variants(source, output_dir=output_dir)
+    assert (output_dir / key / "320.webp").read_bytes() == b"webp-bytes"
+
+    image_variants.build_image_variants(source, output_dir=output_dir, rebuild=True)
+    with PILImage.open(output_dir / key / "320.webp") as rebuilt:
+        assert rebuilt.size == (320, 240)
@@ -265,3 +265,89 @@ async def test_phraseset_excludes_non_selected_copy_rounds(db_session):
     details = await service.get_phraseset_details(phraseset_id, selected_copy_1.player_id)
     assert details["your_role"] == "copy"
     assert details["your_phrase"] == "BLISS"
+
+
+async def _create_finalized_phraseset(db_session, prompt_player, copy_one, copy_two, voter=None):
+    now = datetime.now(UTC)
+    prompt_round = Round(
+        round_id=uuid4(),
+        player_id=prompt_player.player_id,
+        round_type="prompt",
+        status="submitted",
+        created_at=now,
+        expires_at=now + timedelta(minutes=5),
+        cost=100,
+        prompt_text="the best snack is",
+        submitted_phrase="POPCORN",
+        phraseset_status="finalized",
+    )
+    copy_round_1 = _copy_round(copy_one.player_id, prompt_round.round_id, "PRETZELS")
+    copy_round_2 = _copy_round(copy_two.player_id, prompt_round.round_id, "NACHOS")
+    db_session.add_all([prompt_round, copy_round_1, copy_round_2])
+    await db_session.flush()
+
+    phraseset = Phraseset(
+        phraseset_id=uuid4(),
+        prompt_round_id=prompt_round.round_id,
+        copy_round_1_id=copy_round_1.round_id,
+        copy_round_2_id=copy_round_2.round_id,
+        prompt_text=prompt_round.prompt_text,
+        original_phrase=prompt_round.submitted_phrase,
+        copy_phrase_1=copy_round_1.copy_phrase,
+        copy_phrase_2=copy_round_2.copy_phrase,
+        status="finalized",
+        vote_count=1 if voter else 0,
+        created_at=now,
+        finalized_at=now,
+        total_pool=200,
+    )
+    db_session.add(phraseset)
+    await db_session.flush()
+    if voter:
+        db_session.add(Vote(
+            vote_id=uuid4(),
+            phraseset_id=phraseset.phraseset_id,
+            player_id=voter.player_id,
+            voted_phrase="POPCORN",
+            correct=True,
+            payout=20,
+            created_at=now,
+        ))
+    await db_session.commit()
+    return phraseset
+
+
+@pytest.mark.asyncio
+async def test_practice_sampler_excludes_player_involvement(db_session):
+    """Practice picks never return a phraseset the player prompted, copied or voted on."""
+    from backend.services.qf.practice_sampler import get_practice_sampler
+
+    players = [_base_player(f"practice_{index}") for index in range(5)]
+    prompt_player, copy_one, copy_two, voter, outsider = players
+    db_session.add_all(players)
+    await db_session.commit()
+
+    first = await _create_finalized_phraseset(db_session, prompt_player, copy_one, copy_two, voter=voter)
+    service = PhrasesetService(db_session)
+
+    for player in (prompt_player, copy_one, copy_two, voter):
+        with pytest.raises(ValueError):
+            await service.get_random_practice_phraseset(player.player_id)
+
+    practice = await service.get_random_practice_phraseset(outsider.player_id)
+    assert practice["phraseset_id"] == first.phraseset_id
+    assert practice["prompt_player"] == "practice_0"
+    assert [vote["voter_username"] for vote in practice["votes"]] == ["practice_3"]
+
+    # A phraseset finalized after the index was loaded is appended and the voter's
+    # exclusion bitmap is refreshed incrementally.
+    second = await _create_finalized_phraseset(db_session, outsider, copy_one, copy_two, voter=prompt_player)
+    sampler = get_practice_sampler()
+    sampler.record_finalized(second.phraseset_id)
+    assert sampler.size == 2
+
+    for _ in range(5):
+        voter_pick = await service.get_random_practice_phraseset(voter.player_id)
+        assert voter_pick["phraseset_id"] == second.phraseset_id
+    with pytest.raises(ValueError):
+        await service.get_random_practice_phraseset(prompt_player.player_id)
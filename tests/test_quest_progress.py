@@ -3,9 +3,12 @@
 import uuid
 
 import pytest
+from sqlalchemy import select, text
 
 from backend.models.qf.player import QFPlayer
 from backend.models.qf.quest import QFQuest, QuestType, QuestStatus
+from backend.services.qf.quest_events import CopySubmitted, PromptSubmitted, VoteSubmitted
+from backend.services.qf.quest_service import QuestService
 
 
 @pytest.mark.asyncio
@@ -42,3 +45,103 @@ async def test_quest_progress_updates_are_persisted(db_session):
     await db_session.refresh(quest)
 
     assert quest.progress["current"] == 5
+
+
+async def _quests_by_type(db_session, player_id):
+    result = await db_session.execute(select(QFQuest).where(QFQuest.player_id == player_id))
+    return {quest.quest_type: quest for quest in result.scalars().all()}
+
+
+@pytest.mark.asyncio
+async def test_quest_events_are_written_by_the_callers_commit(db_session, player_factory):
+    """Events are evaluated in memory and only persisted when the caller commits."""
+    player = await player_factory()
+    player_id = player.player_id
+    quest_service = QuestService(db_session)
+    await quest_service.initialize_quests_for_player(player_id)
+
+    # The quest writes belong to the game action's transaction and roll back with it
+    await db_session.refresh(player)
+    player.wallet += 10
+    await quest_service.record_events([
+        PromptSubmitted(player_id),
+        CopySubmitted(player_id),
+        VoteSubmitted(player_id, correct=True),
+        VoteSubmitted(player_id, correct=True),
+    ])
+    await db_session.rollback()
+
+    db_session.expire_all()
+    quests = await _quests_by_type(db_session, player_id)
+    assert quests[QuestType.MILESTONE_VOTES_100.value].progress["current"] == 0
+
+    quest_service = QuestService(db_session)
+    await quest_service.record_events([
+        PromptSubmitted(player_id),
+        CopySubmitted(player_id),
+        VoteSubmitted(player_id, correct=True),
+        VoteSubmitted(player_id, correct=True),
+    ])
+    await db_session.commit()
+
+    db_session.expire_all()
+    quests = await _quests_by_type(db_session, player_id)
+    assert quests[QuestType.MILESTONE_VOTES_100.value].progress["current"] == 2
+    assert quests[QuestType.MILESTONE_PROMPTS_50.value].progress["current"] == 1
+    assert quests[QuestType.MILESTONE_COPIES_100.value].progress["current"] == 1
+    assert quests[QuestType.HOT_STREAK_5.value].progress["current_streak"] == 2
+    assert quests[QuestType.ROUND_COMPLETION_5.value].progress["rounds_completed"] == 1
+    balanced = quests[QuestType.BALANCED_PLAYER.value].progress
+    assert (balanced["prompts"], balanced["copies"], balanced["votes"]) == (1, 1, 2)
+
+
+@pytest.mark.asyncio
+async def test_quest_events_complete_quests_in_one_batch(db_session, player_factory):
+    """A streak broken and rebuilt in one batch completes once the target is reached."""
+    player_id = (await player_factory()).player_id
+    quest_service = QuestService(db_session)
+    await quest_service.initialize_quests_for_player(player_id)
+
+    events = [VoteSubmitted(player_id, correct=True)] * 3
+    events.append(VoteSubmitted(player_id, correct=False))
+    events.extend([VoteSubmitted(player_id, correct=True)] * 5)
+    events.extend([PromptSubmitted(player_id), CopySubmitted(player_id), CopySubmitted(player_id)])
+    await quest_service.record_events(events, auto_commit=True)
+
+    db_session.expire_all()
+    quests = await _quests_by_type(db_session, player_id)
+    streak = quests[QuestType.HOT_STREAK_5.value]
+    assert streak.status == QuestStatus.COMPLETED.value
+    assert streak.progress["highest_streak"] == 5
+    assert quests[QuestType.BALANCED_PLAYER.value].status == QuestStatus.ACTIVE.value
+    assert quests[QuestType.BALANCED_PLAYER.value].progress["votes"] == 9
+
+    await QuestService(db_session).record_events([VoteSubmitted(player_id, correct=True)], auto_commit=True)
+    db_session.expire_all()
+    quests = await _quests_by_type(db_session, player_id)
+    assert quests[QuestType.BALANCED_PLAYER.value].status == QuestStatus.COMPLETED.value
+
+
+@pytest.mark.asyncio
+async def test_failed_quest_statement_does_not_abort_the_game_transaction(db_session, player_factory, monkeypatch):
+    """A quest write that errors is rolled back to its savepoint; the caller still commits."""
+    player = await player_factory()
+    player_id = player.player_id
+    quest_service = QuestService(db_session)
+    await quest_service.initialize_quests_for_player(player_id)
+
+    async def failing_apply(event):
+        await db_session.execute(text("UPDATE no_such_quest_table SET progress = 1"))
+
+    monkeypatch.setattr(quest_service, "_apply_event", failing_apply)
+    await db_session.refresh(player)
+    expected_wallet = player.wallet + 25
+    player.wallet = expected_wallet
+    await quest_service.record_events([PromptSubmitted(player_id)])
+    await db_session.commit()
+
+    db_session.expire_all()
+    refreshed = await db_session.get(QFPlayer, player_id)
+    assert refreshed.wallet == expected_wallet
+    quests = await _quests_by_type(db_session, player_id)
+    assert quests[QuestType.MILESTONE_PROMPTS_50.value].progress["current"] == 0
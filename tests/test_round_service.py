@@ -4,6 +4,7 @@ Comprehensive tests for RoundService.
 Tests round creation, lifecycle, expiration, and phraseset creation.
 """
 
+import asyncio
 import pytest
 from datetime import datetime, timedelta, UTC
 import uuid
@@ -23,6 +24,7 @@ from backend.services import GameType, QFRoundService
 from backend.services import AIService
 from backend.services import TransactionService
 from backend.services import QFQueueService
+from backend.services.qf.copy_assignment_index import get_copy_assignment_index
 from backend.services import QFVoteService
 from backend.utils.exceptions import (
     AlreadyInRoundError,
@@ -430,6 +432,45 @@ class TestPromptRoundCreation:
             )
 
 
+    async def test_prompt_catalogue_marks_started_prompts_seen(
+        self,
+        db_session,
+        player_with_balance,
+    ):
+        """Prompts started through the service are excluded without re-reading history."""
+        from backend.services.qf.prompt_catalogue import get_prompt_catalogue
+
+        round_service = QFRoundService(db_session)
+        transaction_service = TransactionService(db_session, GameType.QF)
+
+        await db_session.execute(update(Prompt).values(enabled=False))
+        prompts = [
+            Prompt(prompt_id=uuid.uuid4(), text=f"Catalogue prompt {i} {uuid.uuid4()}", category="fun", enabled=True)
+            for i in range(3)
+        ]
+        db_session.add_all(prompts)
+        await db_session.commit()
+
+        catalogue = get_prompt_catalogue()
+        assert await catalogue.count_unseen_prompts(db_session, player_with_balance.player_id) == 3
+
+        started_prompt_ids = set()
+        for expected_remaining in (2, 1, 0):
+            round_object = await round_service.start_prompt_round(player_with_balance, transaction_service)
+            started_prompt_ids.add(round_object.prompt_id)
+            assert await catalogue.count_unseen_prompts(db_session, player_with_balance.player_id) == expected_remaining
+
+            # Clear the active round so the next start is allowed
+            round_object.status = "abandoned"
+            player_data = await db_session.get(QFPlayerData, player_with_balance.player_id)
+            player_data.active_round_id = None
+            await db_session.commit()
+
+        assert started_prompt_ids == {prompt.prompt_id for prompt in prompts}
+        with pytest.raises(NoPromptsAvailableError):
+            await round_service.start_prompt_round(player_with_balance, transaction_service)
+
+
 class TestPromptSubmission:
     """Test prompt phrase submission."""
 
@@ -460,6 +501,36 @@ class TestPromptSubmission:
         await db_session.refresh(player_with_balance)
         assert player_with_balance.active_round_id is None
 
+    @pytest.mark.asyncio
+    async def test_submit_prompt_phrase_schedules_hints_without_pregeneration(
+        self, db_session, player_with_balance, test_prompt, monkeypatch
+    ):
+        """With pre-generation disabled, submission still starts hint generation directly."""
+        from backend.services.qf import round_service as round_service_module
+
+        scheduled = []
+
+        async def record_hints(prompt_round_id):
+            scheduled.append(prompt_round_id)
+
+        monkeypatch.setattr(round_service_module, "generate_ai_hints_background", record_hints)
+        round_service = QFRoundService(db_session)
+        monkeypatch.setattr(round_service.settings, "ai_pregeneration_enabled", False)
+        transaction_service = TransactionService(db_session, GameType.QF)
+
+        round_obj = await round_service.start_prompt_round(player_with_balance, transaction_service)
+        with patch.object(round_service_module, "get_pregeneration_pool") as pool:
+            await round_service.submit_prompt_phrase(
+                round_obj.round_id,
+                "Joyful Celebration",
+                player_with_balance,
+                transaction_service,
+            )
+            pool.return_value.enqueue.assert_not_called()
+        await asyncio.sleep(0)
+
+        assert scheduled == [round_obj.round_id]
+
     @pytest.mark.asyncio
     async def test_submit_prompt_phrase_invalid_format(self, db_session, player_with_balance, test_prompt):
         """Should reject invalid phrase formats."""
@@ -653,6 +724,93 @@ class TestCopyRoundCreation:
         assert copy_round.prompt_round_id == prompt_round.round_id
         assert copy_round.original_phrase == "CELEBRATION"
 
+    @pytest.mark.asyncio
+    async def test_start_copy_round_skips_ineligible_prompts_without_dequeuing(
+        self, db_session, player_with_balance, test_prompt
+    ):
+        """Ineligible prompts ahead in the queue stay queued; only the claimed prompt leaves."""
+        round_service = QFRoundService(db_session)
+        transaction_service = TransactionService(db_session, GameType.QF)
+
+        other_owner = await _create_player(db_session, prefix="eligible_prompt_owner")
+        own_prompt, other_prompt = (
+            Round(
+                round_id=uuid.uuid4(),
+                player_id=owner_id,
+                round_type="prompt",
+                status="submitted",
+                prompt_id=test_prompt.prompt_id,
+                prompt_text=test_prompt.text,
+                submitted_phrase=phrase,
+                cost=settings.prompt_cost,
+                expires_at=datetime.now(UTC) + timedelta(minutes=3),
+            )
+            for owner_id, phrase in (
+                (player_with_balance.player_id, "OWN PHRASE"),
+                (other_owner.player_id, "CELEBRATION"),
+            )
+        )
+        db_session.add_all([own_prompt, other_prompt])
+        await db_session.commit()
+
+        drain_prompt_queue()
+        QFQueueService.add_prompt_round_to_queue(own_prompt.round_id)
+        QFQueueService.add_prompt_round_to_queue(other_prompt.round_id)
+
+        copy_round, _ = await round_service.start_copy_round(player_with_balance, transaction_service)
+
+        assert copy_round.prompt_round_id == other_prompt.round_id
+        assert QFQueueService.get_prompt_rounds_waiting() == 1
+        assert QFQueueService.remove_prompt_round_from_queue(own_prompt.round_id) is True
+
+    @pytest.mark.asyncio
+    async def test_start_copy_round_honours_abandonment_recorded_by_another_worker(
+        self, db_session, player_with_balance, test_prompt
+    ):
+        """An abandonment missing from this worker's index still blocks the claim and requeues the prompt."""
+        round_service = QFRoundService(db_session)
+        transaction_service = TransactionService(db_session, GameType.QF)
+
+        prompt_owner = await _create_player(db_session, prefix="abandoned_prompt_owner")
+        abandoned_prompt, fresh_prompt = (
+            Round(
+                round_id=uuid.uuid4(),
+                player_id=prompt_owner.player_id,
+                round_type="prompt",
+                status="submitted",
+                prompt_id=test_prompt.prompt_id,
+                prompt_text=test_prompt.text,
+                submitted_phrase=phrase,
+                cost=settings.prompt_cost,
+                expires_at=datetime.now(UTC) + timedelta(minutes=3),
+            )
+            for phrase in ("ABANDONED", "CELEBRATION")
+        )
+        db_session.add_all([abandoned_prompt, fresh_prompt])
+        await db_session.commit()
+
+        drain_prompt_queue()
+        QFQueueService.add_prompt_round_to_queue(abandoned_prompt.round_id)
+        QFQueueService.add_prompt_round_to_queue(fresh_prompt.round_id)
+        await get_copy_assignment_index().reconcile(db_session)
+
+        # Written by another worker after this worker's index was reconciled
+        db_session.add(
+            PlayerAbandonedPrompt(
+                player_id=player_with_balance.player_id,
+                prompt_round_id=abandoned_prompt.round_id,
+            )
+        )
+        await db_session.commit()
+
+        copy_round, _ = await round_service.start_copy_round(player_with_balance, transaction_service)
+
+        assert copy_round.prompt_round_id == fresh_prompt.round_id
+        assert QFQueueService.remove_prompt_round_from_queue(abandoned_prompt.round_id) is True
+        assert (
+            get_copy_assignment_index().next_eligible(player_with_balance.player_id, set()) is None
+        )
+
 
 class TestAbandonRound:
     """Tests for abandoning active rounds."""
@@ -0,0 +1,104 @@
+"""Tests for the host-local shared store used by multi-worker deployments."""
+import pytest
+
+from backend.utils.lock_client import LockClient
+from backend.utils.queue_client import QueueClient
+from backend.utils.rate_limiter import RateLimiter
+from backend.utils.shared_store import SharedStore, resolve_shared_store_path
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / "shared_state.sqlite3")
+
+
+def test_queue_is_shared_between_store_instances(store_path):
+    """Two clients on the same file behave like one FIFO queue (as separate workers would)."""
+    worker_a = QueueClient(shared_store=SharedStore(store_path))
+    worker_b = QueueClient(shared_store=SharedStore(store_path))
+    assert worker_a.backend == "sqlite"
+
+    for index in range(4):
+        worker_a.push("queue:test", {"id": index})
+
+    assert worker_b.length("queue:test") == 4
+    assert worker_b.peek("queue:test", 1) == {"id": 1}
+    assert worker_b.pop("queue:test") == {"id": 0}
+    assert worker_a.remove("queue:test", {"id": 2}) is True
+    assert worker_b.remove("queue:test", {"id": 2}) is False
+    assert worker_a.pop_many("queue:test", 5) == [{"id": 1}, {"id": 3}]
+    assert worker_b.pop("queue:test") is None
+
+
+def test_ttl_keys_and_counters(store_path, monkeypatch):
+    store = SharedStore(store_path)
+    clock = {"now": 1000.0}
+    monkeypatch.setattr("backend.utils.shared_store.time.time", lambda: clock["now"])
+
+    store.set("leaderboard:weekly", "payload", ttl_seconds=60)
+    assert store.get("leaderboard:weekly") == "payload"
+
+    assert store.incr("rate_limit:a", 10) == (1, 10)
+    assert store.incr("rate_limit:a", 10) == (2, 10)
+
+    clock["now"] += 61
+    assert store.get("leaderboard:weekly") is None
+    assert store.incr("rate_limit:a", 10) == (1, 10)
+
+
+def test_leases_exclude_other_owners_until_released_or_expired(store_path, monkeypatch):
+    worker_a = SharedStore(store_path)
+    worker_b = SharedStore(store_path)
+    clock = {"now": 1000.0}
+    monkeypatch.setattr("backend.utils.shared_store.time.time", lambda: clock["now"])
+
+    assert worker_a.acquire_lease("lock:x", "a", ttl_seconds=5) is True
+    assert worker_b.acquire_lease("lock:x", "b", ttl_seconds=5) is False
+    assert worker_b.release_lease("lock:x", "b") is False
+
+    clock["now"] += 6
+    assert worker_b.acquire_lease("lock:x", "b", ttl_seconds=5) is True
+    assert worker_b.release_lease("lock:x", "b") is True
+    assert worker_a.acquire_lease("lock:x", "a", ttl_seconds=5) is True
+
+
+def test_lock_client_times_out_while_another_worker_holds_the_lease(store_path):
+    holder = LockClient(shared_store=SharedStore(store_path))
+    waiter = LockClient(shared_store=SharedStore(store_path))
+    assert waiter.backend == "sqlite"
+
+    with holder.lock("lock:round", timeout=5):
+        with pytest.raises(TimeoutError):
+            with waiter.lock("lock:round", timeout=0.05):
+                pass
+
+    with waiter.lock("lock:round", timeout=1):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_counts_across_workers(store_path):
+    worker_a = RateLimiter(shared_store=SharedStore(store_path))
+    worker_b = RateLimiter(shared_store=SharedStore(store_path))
+
+    assert await worker_a.check("player", limit=2, window_seconds=60) == (True, None)
+    assert await worker_b.check("player", limit=2, window_seconds=60) == (True, None)
+    allowed, retry_after = await worker_a.check("player", limit=2, window_seconds=60)
+    assert allowed is False
+    assert 0 < retry_after <= 60
+
+    worker_b.reset()
+    assert await worker_a.check("player", limit=2, window_seconds=60) == (True, None)
+
+
+def test_shared_store_only_enabled_for_multiple_workers_without_redis(monkeypatch):
+    from backend.config import Settings
+
+    def settings(**overrides):
+        values = {"redis_url": "", "crowdcraft_workers": 1, "shared_store_path": "", **overrides}
+        return Settings(**values)
+
+    assert resolve_shared_store_path(settings()) is None
+    assert resolve_shared_store_path(settings(crowdcraft_workers=4, redis_url="redis://localhost")) is None
+    assert resolve_shared_store_path(settings(crowdcraft_workers=4)).endswith("shared_state.sqlite3")
+    assert resolve_shared_store_path(settings(shared_store_path="/tmp/explicit.db")) == "/tmp/explicit.db"
@@ -18,21 +18,10 @@ def _deterministic_embedding(text: str, dimensions: int = 1536) -> list[float]:
     return [rng.uniform(-1, 1) for _ in range(dimensions)]
 
 
-class _FakeEmbeddingResponse:
-    def __init__(self, embedding: list[float]) -> None:
-        self.data = [type("Data", (), {"embedding": embedding})()]
-
-
-class _FakeOpenAIEmbeddings:
-    async def create(self, *, model: str, input: str, dimensions: int = 1536):
-        del model
-        return _FakeEmbeddingResponse(_deterministic_embedding(input, dimensions=dimensions))
-
-
-class _FakeOpenAIClient:
-    def __init__(self, *args, **kwargs) -> None:
-        del args, kwargs
-        self.embeddings = _FakeOpenAIEmbeddings()
+class _FakeLLMGateway:
+    async def embed(self, text: str, *, model: str | None = None, dimensions: int | None = None, timeout=None):
+        del model, timeout
+        return _deterministic_embedding(text, dimensions=dimensions or 1536)
 
 
 class TestMatchingService:
@@ -42,10 +31,10 @@ class TestMatchingService:
     def matching_service(self, monkeypatch):
         """Create a MatchingService instance.
 
-        Use a deterministic fake OpenAI client so the suite never hits the network.
+        Use a deterministic fake LLM gateway so the suite never hits the network.
         """
         monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
-        monkeypatch.setattr("backend.services.tl.matching_service.AsyncOpenAI", _FakeOpenAIClient)
+        monkeypatch.setattr("backend.services.tl.matching_service.get_llm_gateway", _FakeLLMGateway)
         get_settings.cache_clear()
         try:
             yield TLMatchingService()
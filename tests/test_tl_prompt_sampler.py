@@ -0,0 +1,88 @@
+"""Tests for the ThinkLink weighted prompt sampler and cached answer counts."""
+
+import random
+import uuid
+from collections import Counter
+
+import pytest
+from sqlalchemy import select
+
+from backend.models.tl.answer import TLAnswer
+from backend.models.tl.prompt import TLPrompt
+from backend.services.tl.clustering_service import prune_corpus
+from backend.services.tl.prompt_sampler import TLPromptSampler, build_alias_table
+
+
+def _vector(seed: float = 0.0) -> list[float]:
+    return [seed] * 1536
+
+
+def test_alias_table_matches_weights():
+    """Alias picks follow the weight distribution and never choose zero weights."""
+    weights = [1.0, 0.0, 3.0, 6.0]
+    probability, alias = build_alias_table(weights)
+    rng = random.Random(7)
+
+    counts = Counter()
+    for _ in range(20000):
+        index = rng.randrange(len(probability))
+        if rng.random() >= probability[index]:
+            index = alias[index]
+        counts[index] += 1
+
+    assert counts[1] == 0
+    assert counts[3] / 20000 == pytest.approx(0.6, abs=0.02)
+    assert counts[2] / 20000 == pytest.approx(0.3, abs=0.02)
+    assert build_alias_table([0.0, 0.0]) == ([], [])
+
+
+@pytest.mark.asyncio
+async def test_answer_counts_are_maintained_and_sampled(db_session):
+    """Inserting and pruning answers keeps the cached count that drives selection."""
+    prompt = TLPrompt(
+        prompt_id=uuid.uuid4(),
+        text=f"Name something sticky {uuid.uuid4().hex[:6]}",
+        embedding=_vector(0.1),
+        is_active=True,
+        ai_seeded=False,
+    )
+    db_session.add(prompt)
+    await db_session.flush()
+
+    db_session.add_all([
+        TLAnswer(
+            prompt_id=prompt.prompt_id,
+            text=f"Answer {index}",
+            embedding=_vector(0.2),
+            answer_players_count=1,
+            shows=index,
+            contributed_matches=0,
+            is_active=True,
+        )
+        for index in range(5)
+    ])
+    await db_session.flush()
+
+    result = await db_session.execute(
+        select(TLPrompt.active_answer_count).where(TLPrompt.prompt_id == prompt.prompt_id)
+    )
+    assert result.scalar_one() == 5
+
+    sampler = TLPromptSampler()
+    await sampler._sync(db_session)
+    index = sampler._positions[prompt.prompt_id]
+    assert sampler._weights[index] == 5.0
+
+    removed, remaining = await prune_corpus(db_session, str(prompt.prompt_id), keep_count=2)
+    assert (removed, remaining) == (3, 2)
+    result = await db_session.execute(
+        select(TLPrompt.active_answer_count).where(TLPrompt.prompt_id == prompt.prompt_id)
+    )
+    assert result.scalar_one() == 2
+
+    sampler.update_answer_count(prompt.prompt_id, 2)
+    assert sampler._weights[index] == 2.0
+
+    sampler.discard(prompt.prompt_id)
+    for _ in range(50):
+        assert await sampler.sample(db_session) != prompt.prompt_id
@@ -0,0 +1,140 @@
+"""Tests for shared, versioned ThinkLink prompt snapshots."""
+
+import math
+import uuid
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import func, select
+
+from backend.models.tl.answer import TLAnswer
+from backend.models.tl.cluster import TLCluster
+from backend.models.tl.player_data import TLPlayerData
+from backend.models.tl.prompt import TLPrompt
+from backend.models.tl.snapshot import TLSnapshot
+from backend.services.tl.matching_service import TLMatchingService
+from backend.services.tl.prompt_service import TLPromptService
+from backend.services.tl.round_service import TLRoundService
+from backend.services.tl.scoring_service import TLScoringService
+from backend.services.tl.snapshot_service import TLSnapshotStore
+
+
+def _axis(index: int) -> list[float]:
+    vector = [0.0] * 1536
+    vector[index] = 1.0
+    return vector
+
+
+async def _seed_prompt(db_session):
+    prompt = TLPrompt(
+        prompt_id=uuid.uuid4(),
+        text=f"Name something in a kitchen {uuid.uuid4().hex[:6]}",
+        embedding=_axis(0),
+        is_active=True,
+        ai_seeded=False,
+    )
+    db_session.add(prompt)
+    await db_session.flush()
+
+    clusters = [
+        TLCluster(cluster_id=uuid.uuid4(), prompt_id=prompt.prompt_id, centroid_embedding=_axis(index + 1), size=1)
+        for index in range(2)
+    ]
+    db_session.add_all(clusters)
+    await db_session.flush()
+
+    db_session.add_all([
+        TLAnswer(
+            prompt_id=prompt.prompt_id,
+            text=text,
+            embedding=_axis(index + 1),
+            cluster_id=clusters[index].cluster_id,
+            answer_players_count=players,
+            shows=0,
+            contributed_matches=0,
+            is_active=True,
+        )
+        for index, (text, players) in enumerate([("Fridge", 3), ("Spoon", 0)])
+    ])
+    await db_session.flush()
+    await db_session.refresh(prompt)
+    return prompt, clusters
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_built_once_per_corpus_version(db_session):
+    """Rounds on the same corpus version share one snapshot; new answers produce a new one."""
+    prompt, clusters = await _seed_prompt(db_session)
+    assert prompt.corpus_version == 2
+
+    store = TLSnapshotStore()
+    first = await store.get_current(db_session, prompt)
+    again = await store.get_current(db_session, prompt)
+    assert again is first
+    assert first.answer_count == 2
+    assert first.total_weight == pytest.approx(1.0 + math.log(4.0) + 1.0)
+
+    # A fresh worker rehydrates the persisted row instead of rebuilding it
+    loaded = await TLSnapshotStore().get(db_session, first.snapshot_id)
+    assert loaded.answer_ids == first.answer_ids
+    assert loaded.answer_cluster_ids == first.answer_cluster_ids
+
+    db_session.add(TLAnswer(
+        prompt_id=prompt.prompt_id,
+        text="Kettle",
+        embedding=_axis(3),
+        answer_players_count=1,
+        shows=0,
+        contributed_matches=0,
+        is_active=True,
+    ))
+    await db_session.flush()
+    await db_session.refresh(prompt)
+
+    second = await store.get_current(db_session, prompt)
+    assert second.snapshot_id != first.snapshot_id
+    assert second.answer_count == 3
+    result = await db_session.execute(
+        select(func.count()).select_from(TLSnapshot).where(TLSnapshot.prompt_id == prompt.prompt_id)
+    )
+    assert result.scalar_one() == 2
+
+
+@pytest.mark.asyncio
+async def test_snapshot_matches_and_coverage(db_session, monkeypatch):
+    """Guesses are matched against the cached matrix and scored with precomputed weights."""
+    prompt, clusters = await _seed_prompt(db_session)
+    store = TLSnapshotStore()
+    snapshot = await store.get_current(db_session, prompt)
+
+    matches = TLMatchingService.find_snapshot_matches("refrigerator", _axis(1), snapshot)
+    assert [match["text"] for match in matches] == ["Fridge"]
+    assert matches[0]["cluster_id"] == str(clusters[0].cluster_id)
+    assert TLMatchingService.find_snapshot_matches("nothing", _axis(40), snapshot) == []
+
+    monkeypatch.setattr("backend.services.tl.snapshot_service._snapshot_store", store)
+    round_obj = type("Round", (), {
+        "snapshot_id": snapshot.snapshot_id,
+        "snapshot_total_weight": snapshot.total_weight,
+        "matched_clusters": [str(clusters[0].cluster_id)],
+    })()
+    coverage = await TLScoringService().calculate_coverage(db_session, round_obj)
+    assert coverage == pytest.approx((1.0 + math.log(4.0)) / snapshot.total_weight)
+
+
+@pytest.mark.asyncio
+async def test_start_round_references_snapshot(db_session, player_factory):
+    """New rounds store a snapshot reference instead of copying answer and cluster ids."""
+    player = await player_factory()
+    db_session.add(TLPlayerData(player_id=player.player_id, wallet=1000, vault=0))
+    await db_session.flush()
+    await _seed_prompt(db_session)
+
+    service = TLRoundService(Mock(), Mock(), Mock(), TLPromptService(Mock()))
+    round_obj, _, error = await service.start_round(db_session, player.player_id)
+
+    assert error is None
+    assert round_obj.snapshot_id is not None
+    assert round_obj.snapshot_answer_ids == []
+    assert round_obj.snapshot_cluster_ids == []
+    assert round_obj.snapshot_size == 2